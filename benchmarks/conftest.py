@@ -0,0 +1,117 @@
+"""Pytest configuration for Autodoctor benchmarks.
+
+Benchmarks are not part of the default test run (``testpaths`` only lists
+``tests``). Run them explicitly, for example::
+
+    pytest benchmarks --bench-sizes 100,1000 --bench-output-dir /tmp/bench
+"""
+
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+
+from benchmarks.timing import BenchmarkRecorder
+from tests.conftest import (  # noqa: F401
+    auto_enable_custom_integrations,
+    scrub_editable_path_hook_placeholder,
+)
+
+pytest_plugins = ["pytest_homeassistant_custom_component"]
+
+_DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent / "results"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register benchmark command line options."""
+    group = parser.getgroup("autodoctor-benchmarks")
+    group.addoption(
+        "--bench-sizes",
+        default="100,1000,5000",
+        help="Comma-separated automation counts to benchmark.",
+    )
+    group.addoption(
+        "--bench-runtime-sizes",
+        default="10,50,200",
+        help="Comma-separated automation counts for runtime-health benchmarks.",
+    )
+    group.addoption(
+        "--bench-densities",
+        default="0.5,1,4",
+        help="Comma-separated trigger density multipliers for runtime health.",
+    )
+    group.addoption(
+        "--bench-rounds",
+        type=int,
+        default=3,
+        help="Timed rounds per stage; the first round runs with cold caches.",
+    )
+    group.addoption(
+        "--bench-output-dir",
+        default=str(_DEFAULT_OUTPUT_DIR),
+        help="Directory that receives one <suite>.json file per suite.",
+    )
+
+
+def _option_values(
+    config: pytest.Config, name: str, cast: Callable[[str], float]
+) -> list:
+    """Split a comma-separated command line option into typed values."""
+    raw = str(config.getoption(name))
+    return [cast(part) for part in raw.split(",") if part.strip()]
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize size and density fixtures from the command line options."""
+    config = metafunc.config
+    if "install_size" in metafunc.fixturenames:
+        sizes = _option_values(config, "--bench-sizes", int)
+        metafunc.parametrize("install_size", sizes, ids=[f"n{s}" for s in sizes])
+    if "runtime_size" in metafunc.fixturenames:
+        sizes = _option_values(config, "--bench-runtime-sizes", int)
+        metafunc.parametrize("runtime_size", sizes, ids=[f"n{s}" for s in sizes])
+    if "event_density" in metafunc.fixturenames:
+        densities = _option_values(config, "--bench-densities", float)
+        metafunc.parametrize(
+            "event_density", densities, ids=[f"d{d:g}" for d in densities]
+        )
+
+
+@pytest.fixture
+def bench_rounds(request: pytest.FixtureRequest) -> int:
+    """Return the configured number of timed rounds."""
+    return max(1, int(request.config.getoption("--bench-rounds")))
+
+
+@pytest.fixture(scope="session")
+def bench_recorders() -> dict[str, BenchmarkRecorder]:
+    """Session-wide recorders, keyed by suite name."""
+    return {}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _write_bench_results(
+    request: pytest.FixtureRequest,
+    bench_recorders: dict[str, BenchmarkRecorder],
+) -> Generator[None]:
+    """Write every suite's results as JSON once the session finishes."""
+    yield
+    output_dir = Path(str(request.config.getoption("--bench-output-dir")))
+    for suite, recorder in bench_recorders.items():
+        if recorder.cases:
+            path = recorder.write(output_dir / f"{suite}.json")
+            print(f"\nBenchmark results for {suite} written to {path}")
+
+
+@pytest.fixture
+def bench_recorder(
+    bench_recorders: dict[str, BenchmarkRecorder],
+) -> Callable[[str], BenchmarkRecorder]:
+    """Return a factory that yields the shared recorder for a suite."""
+
+    def _get(suite: str) -> BenchmarkRecorder:
+        if suite not in bench_recorders:
+            bench_recorders[suite] = BenchmarkRecorder(suite)
+        return bench_recorders[suite]
+
+    return _get
@@ -0,0 +1,497 @@
+"""Seeded generators for synthetic Home Assistant installs.
+
+The shapes mirror what Autodoctor sees on real systems: most automations are
+small state/numeric triggers, a sizeable share are instantiated from a handful
+of blueprints, and a minority nest ``choose``/``repeat``/``if`` blocks with
+templates. A small fraction of references are deliberately broken so the
+suggestion and fix paths are exercised too.
+
+Trigger histories for the runtime-health benchmarks come from the same
+module: each automation follows one of a few seeded firing patterns so the
+detectors see periodic, bursty, weekday-only, sparse and shifting behaviour.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+# Domain mix roughly matching a mid-size install, with the states each
+# synthetic entity reports.
+_DOMAIN_WEIGHTS: dict[str, int] = {
+    "sensor": 40,
+    "binary_sensor": 15,
+    "light": 10,
+    "switch": 8,
+    "climate": 2,
+    "cover": 3,
+    "media_player": 2,
+    "person": 1,
+    "input_boolean": 4,
+    "input_select": 2,
+    "lock": 1,
+    "fan": 2,
+}
+
+_DOMAIN_STATES: dict[str, list[str]] = {
+    "sensor": ["12.5", "20.1", "unknown"],
+    "binary_sensor": ["on", "off"],
+    "light": ["on", "off"],
+    "switch": ["on", "off"],
+    "climate": ["heat", "cool", "off"],
+    "cover": ["open", "closed"],
+    "media_player": ["playing", "paused", "idle"],
+    "person": ["home", "not_home"],
+    "input_boolean": ["on", "off"],
+    "input_select": ["Home", "Away", "Night"],
+    "lock": ["locked", "unlocked"],
+    "fan": ["on", "off"],
+}
+
+_ROOMS = [
+    "kitchen",
+    "living_room",
+    "bedroom",
+    "office",
+    "hallway",
+    "garage",
+    "bathroom",
+    "garden",
+    "basement",
+    "attic",
+]
+
+# Services registered for the synthetic install, with the data fields each one
+# advertises in its description.
+SERVICES: dict[str, dict[str, dict[str, Any]]] = {
+    "light": {
+        "turn_on": {
+            "brightness": {"selector": {"number": {"min": 0, "max": 255}}},
+            "transition": {"selector": {"number": {"min": 0, "max": 300}}},
+            "effect": {"selector": {"select": {"options": ["colorloop", "random"]}}},
+        },
+        "turn_off": {"transition": {"selector": {"number": {"min": 0, "max": 300}}}},
+        "toggle": {},
+    },
+    "switch": {"turn_on": {}, "turn_off": {}, "toggle": {}},
+    "fan": {
+        "turn_on": {"percentage": {"selector": {"number": {"min": 0, "max": 100}}}},
+        "turn_off": {},
+    },
+    "cover": {"open_cover": {}, "close_cover": {}},
+    "climate": {
+        "set_temperature": {
+            "temperature": {"selector": {"number": {"min": 5, "max": 35}}},
+            "hvac_mode": {"selector": {"select": {"options": ["heat", "cool", "off"]}}},
+        },
+        "set_hvac_mode": {
+            "hvac_mode": {
+                "required": True,
+                "selector": {"select": {"options": ["heat", "cool", "off"]}},
+            }
+        },
+    },
+    "lock": {"lock": {}, "unlock": {}},
+    "input_boolean": {"turn_on": {}, "turn_off": {}},
+    "notify": {
+        "notify": {
+            "message": {"required": True, "selector": {"text": {}}},
+            "title": {"selector": {"text": {}}},
+        }
+    },
+    "homeassistant": {"update_entity": {}},
+}
+
+_ACTIONABLE_DOMAINS = ("light", "switch", "fan", "cover", "lock", "input_boolean")
+
+_ON_OFF_SERVICES = {
+    "light": ("turn_on", "turn_off"),
+    "switch": ("turn_on", "turn_off"),
+    "fan": ("turn_on", "turn_off"),
+    "cover": ("open_cover", "close_cover"),
+    "lock": ("lock", "unlock"),
+    "input_boolean": ("turn_on", "turn_off"),
+}
+
+
+@dataclass(frozen=True)
+class SyntheticInstall:
+    """A generated install: entity states plus automation configs."""
+
+    states: dict[str, str]
+    automations: list[dict[str, Any]]
+    entities_by_domain: dict[str, list[str]]
+
+
+def service_descriptions() -> dict[str, dict[str, Any]]:
+    """Return descriptions in the shape ``async_get_all_descriptions`` yields."""
+    return {
+        domain: {
+            service: {"fields": dict(fields)} for service, fields in services.items()
+        }
+        for domain, services in SERVICES.items()
+    }
+
+
+def _build_entities(
+    rng: random.Random, entity_count: int
+) -> tuple[dict[str, str], dict[str, list[str]]]:
+    """Create ``entity_count`` entity IDs spread over the weighted domains."""
+    domains = list(_DOMAIN_WEIGHTS)
+    weights = list(_DOMAIN_WEIGHTS.values())
+    states: dict[str, str] = {}
+    by_domain: dict[str, list[str]] = {domain: [] for domain in domains}
+    counter = 0
+    # Every domain gets at least one entity so small installs stay usable.
+    seeded = iter(domains)
+    while len(states) < max(entity_count, len(domains)):
+        domain = next(seeded, None) or rng.choices(domains, weights)[0]
+        room = rng.choice(_ROOMS)
+        entity_id = f"{domain}.{room}_{domain}_{counter}"
+        counter += 1
+        states[entity_id] = rng.choice(_DOMAIN_STATES[domain])
+        by_domain[domain].append(entity_id)
+    return states, by_domain
+
+
+class _AutomationFactory:
+    """Builds automation configs against a fixed entity population."""
+
+    def __init__(
+        self,
+        rng: random.Random,
+        by_domain: dict[str, list[str]],
+        broken_ratio: float,
+    ) -> None:
+        self._rng = rng
+        self._by_domain = by_domain
+        self._broken_ratio = broken_ratio
+
+    def entity(self, domain: str) -> str:
+        """Pick an entity, occasionally returning a typo of a real one."""
+        entity_id = self._rng.choice(self._by_domain[domain])
+        if self._rng.random() < self._broken_ratio:
+            # Drop one character from the object id to mimic a typo.
+            prefix, name = entity_id.split(".", 1)
+            cut = self._rng.randrange(len(name))
+            return f"{prefix}.{name[:cut]}{name[cut + 1 :]}"
+        return entity_id
+
+    def state_trigger(self) -> dict[str, Any]:
+        domain = self._rng.choice(["binary_sensor", "light", "switch", "person"])
+        return {
+            "trigger": "state",
+            "entity_id": self.entity(domain),
+            "to": self._rng.choice(_DOMAIN_STATES[domain]),
+        }
+
+    def numeric_trigger(self) -> dict[str, Any]:
+        return {
+            "trigger": "numeric_state",
+            "entity_id": self.entity("sensor"),
+            "above": self._rng.randint(10, 30),
+        }
+
+    def template_trigger(self) -> dict[str, Any]:
+        sensor = self.entity("sensor")
+        return {
+            "trigger": "template",
+            "value_template": (
+                f"{{{{ states('{sensor}') | float(0) > {self._rng.randint(10, 30)} }}}}"
+            ),
+        }
+
+    def condition(self) -> dict[str, Any]:
+        kind = self._rng.random()
+        if kind < 0.5:
+            domain = self._rng.choice(["input_boolean", "binary_sensor", "person"])
+            return {
+                "condition": "state",
+                "entity_id": self.entity(domain),
+                "state": self._rng.choice(_DOMAIN_STATES[domain]),
+            }
+        if kind < 0.8:
+            return {
+                "condition": "numeric_state",
+                "entity_id": self.entity("sensor"),
+                "below": self._rng.randint(20, 40),
+            }
+        select = self.entity("input_select")
+        return {
+            "condition": "template",
+            "value_template": f"{{{{ is_state('{select}', 'Home') }}}}",
+        }
+
+    def service_action(self) -> dict[str, Any]:
+        domain = self._rng.choice(_ACTIONABLE_DOMAINS)
+        service = self._rng.choice(_ON_OFF_SERVICES[domain])
+        action: dict[str, Any] = {
+            "action": f"{domain}.{service}",
+            "target": {"entity_id": self.entity(domain)},
+        }
+        if domain == "light" and service == "turn_on":
+            action["data"] = {"brightness": self._rng.randint(1, 255)}
+        return action
+
+    def notify_action(self) -> dict[str, Any]:
+        sensor = self.entity("sensor")
+        return {
+            "action": "notify.notify",
+            "data": {
+                "title": "Autodoctor benchmark",
+                "message": f"Value is {{{{ states('{sensor}') }}}}",
+            },
+        }
+
+    def nested_actions(self, depth: int) -> list[dict[str, Any]]:
+        """Return actions with ``choose``/``repeat``/``if`` nesting."""
+        if depth <= 0:
+            return [self.service_action()]
+        kind = self._rng.choice(["choose", "repeat", "if"])
+        if kind == "choose":
+            return [
+                {
+                    "choose": [
+                        {
+                            "conditions": [self.condition()],
+                            "sequence": self.nested_actions(depth - 1),
+                        }
+                        for _ in range(self._rng.randint(2, 4))
+                    ],
+                    "default": [self.service_action()],
+                }
+            ]
+        if kind == "repeat":
+            return [
+                {
+                    "repeat": {
+                        "count": self._rng.randint(2, 5),
+                        "sequence": [
+                            *self.nested_actions(depth - 1),
+                            {"delay": {"seconds": 1}},
+                        ],
+                    }
+                }
+            ]
+        return [
+            {
+                "if": [self.condition()],
+                "then": self.nested_actions(depth - 1),
+                "else": [self.service_action()],
+            }
+        ]
+
+    def simple(self, index: int) -> dict[str, Any]:
+        triggers = [
+            self._rng.choice([self.state_trigger, self.numeric_trigger])()
+            for _ in range(self._rng.randint(1, 3))
+        ]
+        return {
+            "id": f"bench_simple_{index}",
+            "alias": f"Benchmark simple {index}",
+            "triggers": triggers,
+            "conditions": [self.condition() for _ in range(self._rng.randint(0, 2))],
+            "actions": [self.service_action() for _ in range(self._rng.randint(1, 3))],
+        }
+
+    def blueprint(self, index: int) -> dict[str, Any]:
+        """Return a config as it looks after a motion-light blueprint resolves."""
+        motion = self.entity("binary_sensor")
+        light = self.entity("light")
+        return {
+            "id": f"bench_blueprint_{index}",
+            "alias": f"Benchmark blueprint {index}",
+            "variables": {
+                "motion_entity": motion,
+                "light_target": {"entity_id": light},
+                "no_motion_wait": 120,
+            },
+            "triggers": [
+                {"trigger": "state", "entity_id": motion, "from": "off", "to": "on"}
+            ],
+            "actions": [
+                {"action": "light.turn_on", "target": {"entity_id": light}},
+                {
+                    "wait_for_trigger": [
+                        {
+                            "trigger": "state",
+                            "entity_id": motion,
+                            "from": "on",
+                            "to": "off",
+                        }
+                    ]
+                },
+                {"delay": "{{ no_motion_wait | int }}"},
+                {"action": "light.turn_off", "target": {"entity_id": light}},
+            ],
+        }
+
+    def complex(self, index: int) -> dict[str, Any]:
+        return {
+            "id": f"bench_complex_{index}",
+            "alias": f"Benchmark complex {index}",
+            "mode": "queued",
+            "triggers": [self.state_trigger(), self.template_trigger()],
+            "conditions": [self.condition(), self.condition()],
+            "actions": [
+                *self.nested_actions(self._rng.randint(1, 3)),
+                self.notify_action(),
+            ],
+        }
+
+
+def generate_install(
+    automation_count: int,
+    entity_count: int,
+    *,
+    seed: int = 0,
+    blueprint_ratio: float = 0.3,
+    complex_ratio: float = 0.2,
+    broken_ratio: float = 0.02,
+) -> SyntheticInstall:
+    """Generate a deterministic install for the given sizes."""
+    rng = random.Random(seed)
+    states, by_domain = _build_entities(rng, entity_count)
+    factory = _AutomationFactory(rng, by_domain, broken_ratio)
+
+    automations: list[dict[str, Any]] = []
+    for index in range(automation_count):
+        roll = rng.random()
+        if roll < blueprint_ratio:
+            automations.append(factory.blueprint(index))
+        elif roll < blueprint_ratio + complex_ratio:
+            automations.append(factory.complex(index))
+        else:
+            automations.append(factory.simple(index))
+
+    return SyntheticInstall(
+        states=states, automations=automations, entities_by_domain=by_domain
+    )
+
+
+def _periodic(
+    rng: random.Random, start: datetime, days: int, density: float
+) -> list[datetime]:
+    """Fire at a few fixed times of day with minute-level jitter."""
+    slots = [rng.randrange(24 * 60) for _ in range(max(1, round(2 * density)))]
+    events: list[datetime] = []
+    for day in range(days):
+        base = start + timedelta(days=day)
+        events.extend(
+            base + timedelta(minutes=slot + rng.uniform(-3, 3)) for slot in slots
+        )
+    return events
+
+
+def _weekday_only(
+    rng: random.Random, start: datetime, days: int, density: float
+) -> list[datetime]:
+    """Periodic firing restricted to Monday-Friday."""
+    return [
+        event for event in _periodic(rng, start, days, density) if event.weekday() < 5
+    ]
+
+
+def _bursty(
+    rng: random.Random, start: datetime, days: int, density: float
+) -> list[datetime]:
+    """Clusters of rapid-fire triggers a few times a day."""
+    events: list[datetime] = []
+    for day in range(days):
+        base = start + timedelta(days=day)
+        for _ in range(rng.randint(1, max(1, round(3 * density)))):
+            burst_start = base + timedelta(minutes=rng.randrange(24 * 60))
+            events.extend(
+                burst_start + timedelta(seconds=rng.uniform(0, 300))
+                for _ in range(rng.randint(3, 10))
+            )
+    return events
+
+
+def _sparse(
+    rng: random.Random, start: datetime, days: int, density: float
+) -> list[datetime]:
+    """Poisson arrivals averaging well under one trigger per day."""
+    rate_per_minute = 0.3 * density / (24 * 60)
+    events: list[datetime] = []
+    minutes = rng.expovariate(rate_per_minute)
+    while minutes < days * 24 * 60:
+        events.append(start + timedelta(minutes=minutes))
+        minutes += rng.expovariate(rate_per_minute)
+    return events
+
+
+def _changepoint(
+    rng: random.Random, start: datetime, days: int, density: float
+) -> list[datetime]:
+    """Steady Poisson rate that shifts abruptly two thirds of the way in."""
+    split = (days * 2) // 3
+    before_rate = 6 * density / (24 * 60)
+    after_rate = before_rate * rng.choice([0.1, 4.0])
+    events: list[datetime] = []
+    minutes = 0.0
+    while minutes < days * 24 * 60:
+        rate = before_rate if minutes < split * 24 * 60 else after_rate
+        minutes += rng.expovariate(rate)
+        events.append(start + timedelta(minutes=minutes))
+    return events[:-1]
+
+
+TRIGGER_PATTERNS: dict[
+    str, Callable[[random.Random, datetime, int, float], list[datetime]]
+] = {
+    "periodic": _periodic,
+    "bursty": _bursty,
+    "weekday_only": _weekday_only,
+    "sparse": _sparse,
+    "changepoint": _changepoint,
+}
+
+
+@dataclass(frozen=True)
+class SyntheticTriggerHistory:
+    """Trigger timestamps per automation plus the configs that reference them."""
+
+    events: dict[str, list[datetime]]
+    patterns: dict[str, str]
+    automations: list[dict[str, Any]]
+
+    @property
+    def event_count(self) -> int:
+        """Return the total number of generated trigger events."""
+        return sum(len(events) for events in self.events.values())
+
+
+def generate_trigger_history(
+    automation_count: int,
+    *,
+    now: datetime,
+    days: int = 90,
+    density: float = 1.0,
+    seed: int = 0,
+) -> SyntheticTriggerHistory:
+    """Generate ``days`` of trigger history ending at ``now``.
+
+    Patterns are assigned round-robin so every size covers every shape;
+    ``density`` scales how often each pattern fires.
+    """
+    rng = random.Random(seed)
+    start = now - timedelta(days=days)
+    pattern_names = list(TRIGGER_PATTERNS)
+    events: dict[str, list[datetime]] = {}
+    patterns: dict[str, str] = {}
+    automations: list[dict[str, Any]] = []
+    for index in range(automation_count):
+        pattern = pattern_names[index % len(pattern_names)]
+        automation_id = f"bench_runtime_{index}"
+        entity_id = f"automation.{automation_id}"
+        stream = TRIGGER_PATTERNS[pattern](rng, start, days, density)
+        events[entity_id] = sorted(event for event in stream if event < now)
+        patterns[entity_id] = pattern
+        automations.append({"id": automation_id, "alias": f"Runtime {pattern} {index}"})
+    return SyntheticTriggerHistory(
+        events=events, patterns=patterns, automations=automations
+    )
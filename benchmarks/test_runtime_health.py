@@ -0,0 +1,186 @@
+"""Scan latency, memory and query counts for runtime-health scoring.
+
+Each case writes seeded synthetic trigger streams (see
+``benchmarks/synthetic.py``) into a temporary ``RuntimeEventStore`` and then
+times a full ``RuntimeHealthMonitor.validate_automations`` scan alongside the
+stages it is built from. Cases span automation count and event density, and
+``runtime_health.json`` carries a ``scaling`` section per stage so the curves
+can be plotted directly.
+"""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from benchmarks.synthetic import generate_trigger_history
+from benchmarks.timing import (
+    BenchmarkRecorder,
+    count_sqlite_statements,
+    track_peak_memory,
+)
+from custom_components.autodoctor.bocpd_detector import BOCPDDetector
+from custom_components.autodoctor.const import (
+    DEFAULT_RUNTIME_HEALTH_BASELINE_DAYS,
+    DEFAULT_RUNTIME_HEALTH_HOUR_RATIO_DAYS,
+    DEFAULT_RUNTIME_HEALTH_WARMUP_SAMPLES,
+)
+from custom_components.autodoctor.runtime_event_store import (
+    RUNTIME_EVENT_STORE_SCHEMA_VERSION,
+    RuntimeEventStore,
+)
+from custom_components.autodoctor.runtime_monitor import (
+    _RAW_EVENT_RETENTION_DAYS,
+    RuntimeHealthMonitor,
+)
+
+SUITE = "runtime_health"
+
+_NOW = datetime(2026, 3, 2, 12, 0, tzinfo=UTC)
+_HISTORY_DAYS = 90
+
+
+async def test_runtime_health_scan(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    runtime_size: int,
+    event_density: float,
+    bench_rounds: int,
+    bench_recorder: Callable[[str], BenchmarkRecorder],
+) -> None:
+    """Time a runtime-health scan and its stages over synthetic histories."""
+    history = generate_trigger_history(
+        runtime_size,
+        now=_NOW,
+        days=_HISTORY_DAYS,
+        density=event_density,
+        seed=runtime_size,
+    )
+    store = RuntimeEventStore(tmp_path / "autodoctor_runtime.db")
+    store.ensure_schema(target_version=RUNTIME_EVENT_STORE_SCHEMA_VERSION)
+    store.set_metadata(
+        "observation:start_at", (_NOW - timedelta(days=_HISTORY_DAYS)).isoformat()
+    )
+    for automation_id, events in history.events.items():
+        store.bulk_import(automation_id, events)
+    # Match a store that has been through maintenance: older history is hourly.
+    store.compact_trigger_events(raw_retention_days=_RAW_EVENT_RETENTION_DAYS, now=_NOW)
+
+    monitor = RuntimeHealthMonitor(
+        hass,
+        baseline_days=DEFAULT_RUNTIME_HEALTH_BASELINE_DAYS,
+        min_coverage_days=1,
+        warmup_samples=DEFAULT_RUNTIME_HEALTH_WARMUP_SAMPLES,
+        hour_ratio_days=DEFAULT_RUNTIME_HEALTH_HOUR_RATIO_DAYS,
+        runtime_event_store=store,
+        now_factory=lambda: _NOW,
+    )
+    case = bench_recorder(SUITE).case(
+        f"automations_{runtime_size}_density_{event_density:g}",
+        automations=runtime_size,
+        density=event_density,
+        events=history.event_count,
+        days=_HISTORY_DAYS,
+    )
+
+    recent_start = _NOW - timedelta(hours=24)
+    baseline_start = recent_start - timedelta(days=monitor.baseline_days)
+    automation_ids = list(history.events)
+
+    try:
+        fetched = await case.async_time_stage(
+            "fetch_trigger_history",
+            lambda: monitor._async_fetch_trigger_history_from_store(
+                automation_ids=automation_ids, start=baseline_start, end=_NOW
+            ),
+            rounds=bench_rounds,
+            items=runtime_size,
+        )
+        activity_index = case.time_stage(
+            "build_activity_index",
+            lambda: monitor._build_activity_index(fetched),
+            rounds=bench_rounds,
+            items=history.event_count,
+        )
+
+        baselines = {
+            automation_id: [t for t in events if baseline_start <= t < recent_start]
+            for automation_id, events in fetched.items()
+        }
+
+        def _build_all_training_rows() -> dict[str, list[dict[str, float]]]:
+            return {
+                automation_id: RuntimeHealthMonitor._build_training_rows_from_events(
+                    automation_id=automation_id,
+                    baseline_events=baseline_events,
+                    baseline_start=baseline_start,
+                    baseline_end=recent_start,
+                    expected_daily=len(baseline_events) / monitor.baseline_days,
+                    all_events_by_automation=fetched,
+                    cold_start_days=monitor.cold_start_days,
+                    hour_ratio_days=monitor.hour_ratio_days,
+                    activity_index=activity_index,
+                )
+                for automation_id, baseline_events in baselines.items()
+            }
+
+        training_rows = case.time_stage(
+            "build_training_rows_from_events",
+            _build_all_training_rows,
+            rounds=bench_rounds,
+            items=runtime_size,
+        )
+
+        detector = BOCPDDetector()
+        case.time_stage(
+            "bocpd_score_current",
+            lambda: [
+                detector.score_current(automation_id, rows)
+                for automation_id, rows in training_rows.items()
+            ],
+            rounds=bench_rounds,
+            items=sum(len(rows) for rows in training_rows.values()),
+        )
+        overdue = case.time_stage(
+            "predict_overdue",
+            lambda: [
+                monitor._predict_overdue(
+                    automation_events=events,
+                    now=_NOW,
+                    baseline_start=baseline_start,
+                    automation_id=automation_id,
+                )
+                for automation_id, events in fetched.items()
+            ],
+            rounds=bench_rounds,
+            items=runtime_size,
+        )
+
+        await case.async_time_stage(
+            "validate_automations",
+            lambda: monitor.validate_automations(history.automations),
+            rounds=bench_rounds,
+            items=runtime_size,
+        )
+        # Memory and query counts come from a separate pass because tracing
+        # allocations would distort the timed rounds.
+        with (
+            track_peak_memory() as peak,
+            count_sqlite_statements(store) as queries,
+        ):
+            await monitor.validate_automations(history.automations)
+        case.annotate(
+            "validate_automations",
+            peak_memory_kib=peak.peak_kib,
+            sqlite_statements=queries.total,
+            sqlite_statements_by_verb=queries.by_verb,
+            run_stats=monitor.get_last_run_stats(),
+        )
+    finally:
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(store.close)
+
+    assert len(fetched) == runtime_size
+    assert len(overdue) == runtime_size
+    assert queries.total >= runtime_size
@@ -0,0 +1,134 @@
+"""Stage-by-stage timings for the static validation pipeline.
+
+Each case synthesizes an install (see ``benchmarks/synthetic.py``) and times
+the same stages ``_async_run_validators`` runs, plus issue formatting for the
+websocket API. Results land in ``<output-dir>/validation_pipeline.json``.
+"""
+
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.core import ServiceCall as HAServiceCall
+
+from benchmarks.synthetic import SERVICES, generate_install, service_descriptions
+from benchmarks.timing import BenchmarkRecorder
+from custom_components.autodoctor.analyzer import AutomationAnalyzer
+from custom_components.autodoctor.jinja_validator import JinjaValidator
+from custom_components.autodoctor.knowledge_base import StateKnowledgeBase
+from custom_components.autodoctor.reachability_validator import (
+    ReachabilityValidator,
+)
+from custom_components.autodoctor.service_validator import ServiceCallValidator
+from custom_components.autodoctor.validator import ValidationEngine
+from custom_components.autodoctor.websocket_api import _format_issues_with_fixes
+
+SUITE = "validation_pipeline"
+
+# Entity population used for each automation count; other sizes scale at
+# ten entities per automation with a 10k floor.
+_ENTITY_COUNTS = {100: 10_000, 1000: 25_000, 5000: 50_000}
+
+
+def entity_count_for(automation_count: int) -> int:
+    """Return the synthetic entity count paired with an automation count."""
+    return _ENTITY_COUNTS.get(automation_count, max(10_000, automation_count * 10))
+
+
+async def _noop_service_handler(call: HAServiceCall) -> None:
+    """Accept any service call."""
+
+
+async def test_validation_pipeline_stages(
+    hass: HomeAssistant,
+    install_size: int,
+    bench_rounds: int,
+    bench_recorder: Callable[[str], BenchmarkRecorder],
+) -> None:
+    """Time each validation stage against a synthetic install."""
+    entity_count = entity_count_for(install_size)
+    install = generate_install(install_size, entity_count, seed=install_size)
+    for entity_id, state in install.states.items():
+        hass.states.async_set(entity_id, state)
+    for domain, services in SERVICES.items():
+        for service in services:
+            hass.services.async_register(domain, service, _noop_service_handler)
+    await hass.async_block_till_done()
+
+    analyzer = AutomationAnalyzer()
+    validator = ValidationEngine(StateKnowledgeBase(hass))
+    jinja_validator = JinjaValidator(hass)
+    service_validator = ServiceCallValidator(hass)
+    service_validator._service_descriptions = service_descriptions()
+    reachability_validator = ReachabilityValidator()
+
+    automations = install.automations
+    case = bench_recorder(SUITE).case(
+        f"automations_{install_size}",
+        automations=install_size,
+        entities=entity_count,
+        seed=install_size,
+    )
+
+    refs = case.time_stage(
+        "extract_state_references",
+        lambda: [
+            ref
+            for automation in automations
+            for ref in analyzer.extract_state_references(automation)
+        ],
+        rounds=bench_rounds,
+        items=len(automations),
+    )
+    state_issues = case.time_stage(
+        "validate_all",
+        lambda: validator.validate_all(refs),
+        rounds=bench_rounds,
+        items=len(refs),
+    )
+    jinja_issues = case.time_stage(
+        "jinja_validate_automations",
+        lambda: jinja_validator.validate_automations(automations),
+        rounds=bench_rounds,
+        items=len(automations),
+    )
+    service_calls = case.time_stage(
+        "extract_service_calls",
+        lambda: [
+            call
+            for automation in automations
+            for call in analyzer.extract_service_calls(automation)
+        ],
+        rounds=bench_rounds,
+        items=len(automations),
+    )
+    service_issues = case.time_stage(
+        "validate_service_calls",
+        lambda: service_validator.validate_service_calls(service_calls),
+        rounds=bench_rounds,
+        items=len(service_calls),
+    )
+    reachability_issues = case.time_stage(
+        "reachability_validate_automations",
+        lambda: reachability_validator.validate_automations(automations),
+        rounds=bench_rounds,
+        items=len(automations),
+    )
+
+    all_issues = [
+        *state_issues,
+        *jinja_issues,
+        *service_issues,
+        *reachability_issues,
+    ]
+    formatted = case.time_stage(
+        "format_issues_with_fixes",
+        lambda: _format_issues_with_fixes(hass, all_issues),
+        rounds=bench_rounds,
+        items=len(all_issues),
+    )
+
+    assert refs
+    assert service_calls
+    # Synthetic installs contain deliberate typos, so issues must be found.
+    assert state_issues
+    assert len(formatted) == len(all_issues)
@@ -0,0 +1,241 @@
+"""Stage timing and JSON result recording for the benchmark suites."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+_T = TypeVar("_T")
+
+RESULTS_SCHEMA_VERSION = 1
+
+
+@dataclass
+class StageResult:
+    """Wall-clock samples for one stage of one benchmark case."""
+
+    name: str
+    samples: list[float] = field(default_factory=list)
+    items: int = 0
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary in milliseconds."""
+        samples_ms = [sample * 1000 for sample in self.samples]
+        summary: dict[str, Any] = {
+            "rounds": len(samples_ms),
+            "items": self.items,
+            # The first round runs with cold caches; later rounds are warm.
+            "first_ms": round(samples_ms[0], 3) if samples_ms else None,
+            "min_ms": round(min(samples_ms), 3) if samples_ms else None,
+            "median_ms": round(statistics.median(samples_ms), 3)
+            if samples_ms
+            else None,
+            "mean_ms": round(statistics.fmean(samples_ms), 3) if samples_ms else None,
+            "max_ms": round(max(samples_ms), 3) if samples_ms else None,
+        }
+        summary.update(self.extra)
+        return summary
+
+
+@dataclass
+class BenchmarkCase:
+    """One parameterization of a suite, such as a given install size."""
+
+    name: str
+    params: dict[str, Any]
+    stages: dict[str, StageResult] = field(default_factory=dict)
+
+    def time_stage(
+        self,
+        stage: str,
+        func: Callable[[], _T],
+        *,
+        rounds: int = 1,
+        items: int = 0,
+    ) -> _T:
+        """Run ``func`` ``rounds`` times, record each duration, return last result."""
+        result = self.stages.setdefault(stage, StageResult(name=stage, items=items))
+        value: Any = None
+        for _ in range(max(1, rounds)):
+            start = time.perf_counter()
+            value = func()
+            result.samples.append(time.perf_counter() - start)
+        return value
+
+    async def async_time_stage(
+        self,
+        stage: str,
+        func: Callable[[], Awaitable[_T]],
+        *,
+        rounds: int = 1,
+        items: int = 0,
+    ) -> _T:
+        """Async variant of ``time_stage`` for coroutine stages."""
+        result = self.stages.setdefault(stage, StageResult(name=stage, items=items))
+        value: Any = None
+        for _ in range(max(1, rounds)):
+            start = time.perf_counter()
+            value = await func()
+            result.samples.append(time.perf_counter() - start)
+        return value
+
+    def annotate(self, stage: str, **extra: Any) -> None:
+        """Attach extra metrics (memory, query counts, ...) to a stage."""
+        self.stages.setdefault(stage, StageResult(name=stage)).extra.update(extra)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the case."""
+        return {
+            "name": self.name,
+            "params": self.params,
+            "stages": {name: stage.to_dict() for name, stage in self.stages.items()},
+        }
+
+
+class BenchmarkRecorder:
+    """Collects benchmark cases for a suite and writes them as JSON."""
+
+    def __init__(self, suite: str) -> None:
+        """Initialize an empty recorder for ``suite``."""
+        self.suite = suite
+        self.cases: list[BenchmarkCase] = []
+
+    def case(self, name: str, **params: Any) -> BenchmarkCase:
+        """Start a new case and return it for stage timing."""
+        bench_case = BenchmarkCase(name=name, params=params)
+        self.cases.append(bench_case)
+        return bench_case
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the full result document."""
+        return {
+            "schema_version": RESULTS_SCHEMA_VERSION,
+            "suite": self.suite,
+            "environment": environment_metadata(),
+            "cases": [bench_case.to_dict() for bench_case in self.cases],
+            "scaling": self.scaling(),
+        }
+
+    def scaling(self) -> dict[str, list[dict[str, Any]]]:
+        """Return per-stage median timings alongside each case's parameters.
+
+        This is the data for scaling curves, e.g. stage time against
+        automation count or event density.
+        """
+        curves: dict[str, list[dict[str, Any]]] = {}
+        for bench_case in self.cases:
+            for name, stage in bench_case.stages.items():
+                summary = stage.to_dict()
+                curves.setdefault(name, []).append(
+                    {
+                        **bench_case.params,
+                        "median_ms": summary["median_ms"],
+                        "items": stage.items,
+                    }
+                )
+        return curves
+
+    def write(self, path: Path) -> Path:
+        """Write results to ``path``, creating parent directories as needed."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_dict(), indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        return path
+
+
+@dataclass
+class MemoryPeak:
+    """Peak traced allocation size captured by ``track_peak_memory``."""
+
+    peak_kib: float = 0.0
+
+
+@contextmanager
+def track_peak_memory() -> Iterator[MemoryPeak]:
+    """Measure peak Python allocations inside the block with ``tracemalloc``."""
+    peak = MemoryPeak()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        yield peak
+    finally:
+        _current, peak_bytes = tracemalloc.get_traced_memory()
+        peak.peak_kib = round(peak_bytes / 1024, 1)
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+@dataclass
+class QueryCount:
+    """SQL statements seen by ``count_sqlite_statements``."""
+
+    total: int = 0
+    by_verb: dict[str, int] = field(default_factory=dict)
+
+
+class _Traceable(Protocol):
+    def set_trace_callback(self, callback: Callable[[str], None] | None) -> None: ...
+
+
+@contextmanager
+def count_sqlite_statements(conn: _Traceable) -> Iterator[QueryCount]:
+    """Count statements executed on ``conn`` inside the block.
+
+    Accepts a ``sqlite3.Connection`` or a ``RuntimeEventStore``, which traces
+    its writer and pooled read connections.
+    """
+    counts = QueryCount()
+
+    def _trace(statement: str) -> None:
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+        counts.total += 1
+        counts.by_verb[verb] = counts.by_verb.get(verb, 0) + 1
+
+    conn.set_trace_callback(_trace)
+    try:
+        yield counts
+    finally:
+        conn.set_trace_callback(None)
+
+
+def _git_revision() -> str | None:
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def environment_metadata() -> dict[str, Any]:
+    """Describe where the results came from so runs can be compared."""
+    return {
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "recorded_at": datetime.now(UTC).isoformat(),
+    }
@@ -7,21 +7,29 @@ import hashlib
 import json
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlsplit
 
 import voluptuous as vol
 from aiohttp import web
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_STATE_CHANGED
+from homeassistant.const import (
+    EVENT_COMPONENT_LOADED,
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+    EVENT_STATE_CHANGED,
+)
 from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 from homeassistant.helpers.typing import ConfigType
@@ -30,21 +38,28 @@ from .analyzer import AutomationAnalyzer
 from .const import (
     CONF_HISTORY_DAYS,
     CONF_PERIODIC_SCAN_INTERVAL_HOURS,
+    CONF_PROFILING_ENABLED,
+    CONF_RUNTIME_STATE_CACHE_SIZE,
     CONF_STRICT_SERVICE_VALIDATION,
     CONF_STRICT_TEMPLATE_VALIDATION,
+    CONF_VALID_STATES_CACHE_SIZE,
     CONF_VALIDATE_ON_RELOAD,
     DEFAULT_DEBOUNCE_SECONDS,
     DEFAULT_HISTORY_DAYS,
     DEFAULT_PERIODIC_SCAN_INTERVAL_HOURS,
+    DEFAULT_PROFILING_ENABLED,
     DEFAULT_RUNTIME_HEALTH_BURST_MULTIPLIER,
     DEFAULT_RUNTIME_HEALTH_HOUR_RATIO_DAYS,
     DEFAULT_RUNTIME_HEALTH_MIN_EXPECTED_EVENTS,
     DEFAULT_RUNTIME_HEALTH_RESTART_EXCLUSION_MINUTES,
     DEFAULT_RUNTIME_HEALTH_WARMUP_SAMPLES,
+    DEFAULT_RUNTIME_STATE_CACHE_SIZE,
     DEFAULT_STRICT_SERVICE_VALIDATION,
     DEFAULT_STRICT_TEMPLATE_VALIDATION,
+    DEFAULT_VALID_STATES_CACHE_SIZE,
     DEFAULT_VALIDATE_ON_RELOAD,
     DOMAIN,
+    SIGNAL_ISSUES_UPDATED,
     VERSION,
     RuntimeHealthConfig,
 )
@@ -57,14 +72,23 @@ from .models import (
     IssueType,
     ValidationIssue,
 )
+from .profiler import DISABLED_PROFILER, ValidationProfiler
 from .reachability_validator import ReachabilityValidator
 from .reporter import IssueReporter
-from .runtime_monitor import RuntimeHealthMonitor
 from .service_validator import ServiceCallValidator
-from .suppression_store import SuppressionStore, filter_suppressed_issues
+from .suggestion_index import SuggestionIndex
+from .suppression_store import (
+    SuppressionStore,
+    filter_suppressed_issues,
+    filter_suppressed_issues_by_group,
+)
+from .validation_snapshot_store import ValidationSnapshotStore
 from .validator import ValidationEngine
 from .websocket_api import async_setup_websocket_api
 
+if TYPE_CHECKING:
+    from .runtime_monitor import RuntimeHealthMonitor
+
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = ["sensor", "binary_sensor"]
@@ -115,6 +139,95 @@ def _normalize_automation_entity_id(automation_id: str) -> str:
     )
 
 
+def _index_issues_by_automation(
+    issues: list[ValidationIssue],
+) -> dict[str, list[ValidationIssue]]:
+    """Bucket issues by normalized automation entity id, preserving order."""
+    index: dict[str, list[ValidationIssue]] = {}
+    for issue in issues:
+        key = _normalize_automation_entity_id(issue.automation_id)
+        bucket = index.get(key)
+        if bucket is None:
+            index[key] = [issue]
+        else:
+            bucket.append(issue)
+    return index
+
+
+def _flatten_issue_index(
+    index: dict[str, list[ValidationIssue]],
+) -> list[ValidationIssue]:
+    """Flatten an automation-keyed issue index back into a flat list."""
+    return [issue for bucket in index.values() for issue in bucket]
+
+
+def _store_issue_indexes(
+    data: dict[str, Any],
+    visible_index: dict[str, list[ValidationIssue]],
+    raw_index: dict[str, list[ValidationIssue]],
+) -> None:
+    """Store per-automation issue indexes and the flat lists derived from them.
+
+    Flattening is linear in the number of stored issues; callers skip it when
+    no bucket changed.
+    """
+    visible_issues = _flatten_issue_index(visible_index)
+    data.update(
+        {
+            "issues": visible_issues,  # Keep for backwards compatibility
+            "validation_issues": visible_issues,
+            "validation_issues_raw": _flatten_issue_index(raw_index),
+            "validation_issues_by_automation": visible_index,
+            "validation_issues_raw_by_automation": raw_index,
+        }
+    )
+
+
+def _get_issue_indexes(
+    data: dict[str, Any],
+) -> tuple[dict[str, list[ValidationIssue]], dict[str, list[ValidationIssue]]]:
+    """Return the stored issue indexes, building them for older in-memory state."""
+    visible_index: dict[str, list[ValidationIssue]] | None = data.get(
+        "validation_issues_by_automation"
+    )
+    raw_index: dict[str, list[ValidationIssue]] | None = data.get(
+        "validation_issues_raw_by_automation"
+    )
+    if visible_index is None or raw_index is None:
+        existing_issues: list[ValidationIssue] = data.get("validation_issues", [])
+        visible_index = _index_issues_by_automation(existing_issues)
+        raw_index = _index_issues_by_automation(
+            data.get("validation_issues_raw", existing_issues)
+        )
+        _store_issue_indexes(data, visible_index, raw_index)
+    return visible_index, raw_index
+
+
+def store_validation_issue_state(
+    data: dict[str, Any],
+    visible_issues: list[ValidationIssue],
+    raw_issues: list[ValidationIssue],
+) -> None:
+    """Store flat issue lists together with their per-automation indexes.
+
+    The indexes let single-automation revalidation replace one bucket instead
+    of re-filtering every stored issue.
+    """
+    data.update(
+        {
+            "issues": visible_issues,  # Keep for backwards compatibility
+            "validation_issues": visible_issues,
+            "validation_issues_raw": raw_issues,
+            "validation_issues_by_automation": _index_issues_by_automation(
+                visible_issues
+            ),
+            "validation_issues_raw_by_automation": _index_issues_by_automation(
+                raw_issues
+            ),
+        }
+    )
+
+
 def _is_enabled_automation_config(config: dict[str, Any]) -> bool:
     """Return True when an automation config should be included for validation."""
     return config.get("enabled", True) is not False
@@ -197,18 +310,259 @@ def _filter_group_issues_for_suppressions(
     suppression_store: SuppressionStore | None,
 ) -> tuple[dict[str, list[ValidationIssue]], int]:
     """Filter grouped issues and return visible groups with total suppressed count."""
-    visible_group_issues: dict[str, list[ValidationIssue]] = {
-        gid: [] for gid in VALIDATION_GROUP_ORDER
+    visible_group_issues, suppressed_counts = filter_suppressed_issues_by_group(
+        group_issues, suppression_store, VALIDATION_GROUP_ORDER
+    )
+    return visible_group_issues, sum(suppressed_counts.values())
+
+
+def _restore_validation_snapshot(hass: HomeAssistant, snapshot: dict[str, Any]) -> None:
+    """Populate validation state from a persisted snapshot.
+
+    Suppressions are re-applied because they may have changed since the
+    snapshot was written. Repairs are not re-reported; they persist on their own.
+    """
+    data = hass.data[DOMAIN]
+    groups_raw = cast(dict[str, dict[str, Any]], snapshot["groups"])
+    raw_group_issues = {
+        gid: cast(list[ValidationIssue], groups_raw[gid]["issues"])
+        for gid in VALIDATION_GROUP_ORDER
     }
-    total_suppressed = 0
-    for gid in VALIDATION_GROUP_ORDER:
-        visible, suppressed_count = filter_suppressed_issues(
-            group_issues.get(gid, []),
-            suppression_store,
+    visible_group_issues, _ = _filter_group_issues_for_suppressions(
+        raw_group_issues, data.get("suppression_store")
+    )
+    raw_issues = [i for gid in VALIDATION_GROUP_ORDER for i in raw_group_issues[gid]]
+    visible_issues = [
+        i for gid in VALIDATION_GROUP_ORDER for i in visible_group_issues[gid]
+    ]
+    store_validation_issue_state(data, visible_issues, raw_issues)
+    data.update(
+        {
+            "validation_last_run": snapshot.get("timestamp"),
+            "validation_groups": {
+                gid: {
+                    "issues": visible_group_issues[gid],
+                    "duration_ms": groups_raw[gid]["duration_ms"],
+                }
+                for gid in VALIDATION_GROUP_ORDER
+            },
+            "validation_groups_raw": groups_raw,
+            "validation_run_stats": snapshot.get("run_stats", {}),
+            "validation_snapshot_digests": dict(snapshot["config_digests"]),
+        }
+    )
+    _LOGGER.debug(
+        "Restored %d validation issues from snapshot taken at %s",
+        len(raw_issues),
+        snapshot.get("timestamp"),
+    )
+
+
+def _drop_automation_issues(data: dict[str, Any], automation_ids: set[str]) -> None:
+    """Remove every stored issue that belongs to one of ``automation_ids``.
+
+    Automations without stored issues are a dictionary lookup each; the flat
+    lists and groups are only rebuilt when an issue was actually dropped.
+    """
+    visible_index, raw_index = _get_issue_indexes(data)
+    dropped = False
+    for automation_id in automation_ids:
+        if visible_index.pop(automation_id, None) is not None:
+            dropped = True
+        if raw_index.pop(automation_id, None) is not None:
+            dropped = True
+    if not dropped:
+        return
+    _store_issue_indexes(data, visible_index, raw_index)
+    for key in ("validation_groups", "validation_groups_raw"):
+        groups = data.get(key)
+        if not isinstance(groups, dict):
+            continue
+        for group in cast(dict[str, dict[str, Any]], groups).values():
+            group["issues"] = [
+                issue
+                for issue in group.get("issues", [])
+                if _normalize_automation_entity_id(issue.automation_id)
+                not in automation_ids
+            ]
+
+
+def _replace_automation_group_issues(
+    data: dict[str, Any],
+    automation_id: str,
+    visible_group_issues: dict[str, list[ValidationIssue]],
+    raw_group_issues: dict[str, list[ValidationIssue]],
+    *,
+    group_ids: Iterable[str] | None = None,
+) -> None:
+    """Swap one automation's issues in the stored per-group results.
+
+    ``group_ids`` limits the swap to those groups; by default every group is
+    replaced.
+    """
+    for key, new_issues in (
+        ("validation_groups", visible_group_issues),
+        ("validation_groups_raw", raw_group_issues),
+    ):
+        groups = data.get(key)
+        if not isinstance(groups, dict):
+            continue
+        groups = cast(dict[str, dict[str, Any]], groups)
+        for gid in groups if group_ids is None else group_ids:
+            group = groups.get(gid)
+            if group is None:
+                continue
+            group["issues"] = [
+                issue
+                for issue in group.get("issues", [])
+                if _normalize_automation_entity_id(issue.automation_id) != automation_id
+            ] + list(new_issues.get(gid, []))
+
+
+_RUNTIME_HEALTH_ISSUE_TYPES = cast(
+    frozenset[IssueType], VALIDATION_GROUPS["runtime_health"]["issue_types"]
+)
+
+
+async def _async_apply_runtime_alerts(
+    hass: HomeAssistant, automation_ids: list[str]
+) -> None:
+    """Replace the runtime health issues of freshly scored automations.
+
+    Called after a runtime scoring batch changed the monitor's alerts, so the
+    stored issue state and Repairs pick them up without waiting for the next
+    full scan. Only automations whose runtime issues changed are re-reported.
+    """
+    data = hass.data.get(DOMAIN)
+    if data is None:
+        return
+    runtime_monitor = data.get("runtime_monitor")
+    reporter = data.get("reporter")
+    if runtime_monitor is None or reporter is None:
+        return
+
+    scored_ids = dict.fromkeys(
+        _normalize_automation_entity_id(aid) for aid in automation_ids
+    )
+    alerts_by_automation = _index_issues_by_automation(
+        [
+            issue
+            for issue in runtime_monitor.get_active_runtime_alerts()
+            if _normalize_automation_entity_id(issue.automation_id) in scored_ids
+        ]
+    )
+    suppression_store: SuppressionStore | None = data.get("suppression_store")
+    visible_index, raw_index = _get_issue_indexes(data)
+    changed: list[str] = []
+    for automation_id in scored_ids:
+        raw_alerts = alerts_by_automation.get(automation_id, [])
+        raw_bucket = raw_index.get(automation_id, [])
+        if [
+            issue
+            for issue in raw_bucket
+            if issue.issue_type in _RUNTIME_HEALTH_ISSUE_TYPES
+        ] == raw_alerts:
+            continue
+        visible_alerts, _ = filter_suppressed_issues(raw_alerts, suppression_store)
+        # Runtime health is the last group, so appending keeps group order.
+        for index, alerts in (
+            (visible_index, visible_alerts),
+            (raw_index, raw_alerts),
+        ):
+            bucket = [
+                issue
+                for issue in index.get(automation_id, [])
+                if issue.issue_type not in _RUNTIME_HEALTH_ISSUE_TYPES
+            ] + alerts
+            if bucket:
+                index[automation_id] = bucket
+            else:
+                index.pop(automation_id, None)
+        _replace_automation_group_issues(
+            data,
+            automation_id,
+            {"runtime_health": visible_alerts},
+            {"runtime_health": raw_alerts},
+            group_ids=("runtime_health",),
+        )
+        changed.append(automation_id)
+    if not changed:
+        return
+
+    _store_issue_indexes(data, visible_index, raw_index)
+    for automation_id in changed:
+        await reporter.async_report_automation_issues(
+            automation_id, visible_index.get(automation_id, [])
         )
-        visible_group_issues[gid] = visible
-        total_suppressed += suppressed_count
-    return visible_group_issues, total_suppressed
+
+
+def _schedule_validation_snapshot_save(
+    data: dict[str, Any], config_digests: dict[str, str]
+) -> None:
+    """Persist the stored validation results as the restart snapshot.
+
+    ``config_digests`` must describe the configs the stored results were
+    produced from, so the next startup only revalidates what changed since.
+    """
+    snapshot_store: ValidationSnapshotStore | None = data.get(
+        "validation_snapshot_store"
+    )
+    groups_raw = data.get("validation_groups_raw")
+    if snapshot_store is None or groups_raw is None:
+        return
+    data["validation_snapshot_digests"] = config_digests
+    snapshot_store.async_schedule_save(
+        timestamp=data.get("validation_last_run"),
+        groups=groups_raw,
+        run_stats=data.get("validation_run_stats", {}),
+        config_digests=config_digests,
+    )
+
+
+# Above this share of changed automations a full scan is cheaper than
+# revalidating them one by one.
+_SNAPSHOT_FULL_REVALIDATION_RATIO = 0.5
+
+
+async def _async_revalidate_changed_automations(
+    hass: HomeAssistant, previous_digests: dict[str, str]
+) -> None:
+    """Revalidate only automations whose config changed since the snapshot."""
+    data = hass.data.get(DOMAIN)
+    if data is None:
+        return
+    current_digests = _build_config_snapshot(_get_automation_configs(hass))
+    changed = sorted(
+        auto_id
+        for auto_id, digest in current_digests.items()
+        if previous_digests.get(auto_id) != digest
+    )
+    removed = {
+        f"automation.{auto_id}"
+        for auto_id in previous_digests
+        if auto_id not in current_digests
+    }
+    _LOGGER.debug(
+        "Snapshot revalidation: %d changed, %d removed of %d automations",
+        len(changed),
+        len(removed),
+        len(current_digests),
+    )
+
+    if len(changed) > max(1, len(current_digests) * _SNAPSHOT_FULL_REVALIDATION_RATIO):
+        await async_validate_all(hass)
+    else:
+        if removed:
+            _drop_automation_issues(data, removed)
+            reporter = data.get("reporter")
+            if reporter is not None:
+                for automation_id in sorted(removed):
+                    await reporter.async_report_automation_issues(automation_id, [])
+            async_dispatcher_send(hass, SIGNAL_ISSUES_UPDATED)
+        for auto_id in changed:
+            await async_validate_automation(hass, f"automation.{auto_id}")
+        _schedule_validation_snapshot_save(data, current_digests)
+    data["_automation_snapshot"] = current_digests
 
 
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -398,38 +752,69 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         DEFAULT_PERIODIC_SCAN_INTERVAL_HOURS,
     )
 
+    setup_started = time.perf_counter()
+    setup_phases: dict[str, float] = {}
+    phase_started = setup_started
+
+    def _end_phase(name: str) -> None:
+        nonlocal phase_started
+        now = time.perf_counter()
+        setup_phases[name] = round((now - phase_started) * 1000, 3)
+        phase_started = now
+
     # Initialize stores first (they need to be loaded before use)
     suppression_store = SuppressionStore(hass)
     await suppression_store.async_load()
 
     learned_states_store = LearnedStatesStore(hass)
     await learned_states_store.async_load()
+    _end_phase("stores")
+
+    profiler = ValidationProfiler(
+        enabled=bool(options.get(CONF_PROFILING_ENABLED, DEFAULT_PROFILING_ENABLED))
+    )
 
     # Initialize knowledge base with learned states store
     knowledge_base = StateKnowledgeBase(
         hass,
         history_days=history_days,
         learned_states_store=learned_states_store,
+        profiler=profiler,
+        max_cache_entries=options.get(
+            CONF_VALID_STATES_CACHE_SIZE, DEFAULT_VALID_STATES_CACHE_SIZE
+        ),
     )
     analyzer = AutomationAnalyzer()
-    validator = ValidationEngine(knowledge_base)
+    validator = ValidationEngine(knowledge_base, profiler=profiler)
     strict_template = options.get(
         CONF_STRICT_TEMPLATE_VALIDATION, DEFAULT_STRICT_TEMPLATE_VALIDATION
     )
     jinja_validator = JinjaValidator(
         hass,
         strict_template_validation=strict_template,
+        profiler=profiler,
     )
     strict_service = options.get(
         CONF_STRICT_SERVICE_VALIDATION, DEFAULT_STRICT_SERVICE_VALIDATION
     )
+    suggestion_index = SuggestionIndex(hass, profiler=profiler)
     service_validator = ServiceCallValidator(
-        hass, strict_service_validation=strict_service
+        hass,
+        strict_service_validation=strict_service,
+        suggestion_index=suggestion_index,
+        profiler=profiler,
     )
     reachability_validator = ReachabilityValidator()
+    _end_phase("components")
+
     rhc = RuntimeHealthConfig.from_options(options)
-    runtime_monitor = (
-        RuntimeHealthMonitor(
+    runtime_monitor = None
+    if rhc.enabled:
+        # Imported on demand: the monitor and its SQLite event store are only
+        # needed when runtime health monitoring is switched on.
+        from .runtime_monitor import RuntimeHealthMonitor
+
+        runtime_monitor = RuntimeHealthMonitor(
             hass,
             baseline_days=rhc.baseline_days,
             min_coverage_days=rhc.min_coverage_days,
@@ -440,18 +825,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             burst_multiplier=DEFAULT_RUNTIME_HEALTH_BURST_MULTIPLIER,
             max_alerts_per_day=rhc.max_alerts_per_day,
             startup_recovery_minutes=DEFAULT_RUNTIME_HEALTH_RESTART_EXCLUSION_MINUTES,
+            profiler=profiler,
+            max_tracked_automations=options.get(
+                CONF_RUNTIME_STATE_CACHE_SIZE, DEFAULT_RUNTIME_STATE_CACHE_SIZE
+            ),
         )
-        if rhc.enabled
-        else None
-    )
-    if rhc.enabled:
         _LOGGER.debug("Runtime health monitoring enabled")
-        if runtime_monitor is not None:
-            await runtime_monitor.async_init_event_store()
+        await runtime_monitor.async_init_event_store()
     else:
         _LOGGER.debug("Runtime health monitoring disabled")
+    _end_phase("runtime_monitor")
     reporter = IssueReporter(hass)
 
+    validation_snapshot_store = ValidationSnapshotStore(hass)
+    validation_snapshot = await validation_snapshot_store.async_load()
+    _end_phase("snapshot")
+
     hass.data[DOMAIN] = {
         "knowledge_base": knowledge_base,
         "analyzer": analyzer,
@@ -460,13 +849,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "service_validator": service_validator,
         "reachability_validator": reachability_validator,
         "runtime_monitor": runtime_monitor,
+        "runtime_scheduler": None,
         "runtime_health_enabled": rhc.enabled,
         "reporter": reporter,
         "suppression_store": suppression_store,
         "learned_states_store": learned_states_store,
+        "validation_snapshot_store": validation_snapshot_store,
+        "profiler": profiler,
         "issues": [],  # Keep for backwards compatibility
         "validation_issues": [],
         "validation_issues_raw": [],
+        "validation_issues_by_automation": {},
+        "validation_issues_raw_by_automation": {},
         "validation_last_run": None,
         "validation_groups": None,
         "validation_groups_raw": None,
@@ -474,6 +868,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "analyzed_automations": 0,
             "failed_automations": 0,
         },
+        "validation_snapshot_digests": None,
         "entry": entry,
         "debounce_task": None,
         "unsub_reload_listener": None,
@@ -481,10 +876,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "unsub_entity_registry_listener": None,
         "unsub_zone_state_listener": None,
         "unsub_area_registry_listener": None,
+        "unsub_service_registry_listener": None,
         "unsub_runtime_trigger_listener": None,
         "unsub_initial_scan": None,
+        "unsub_runtime_scheduler": None,
+        "warm_up_task": None,
+        "setup_timing": None,
     }
 
+    # Serve the last persisted result until the lazy revalidation catches up
+    if validation_snapshot is not None:
+        _restore_validation_snapshot(hass, validation_snapshot)
+
     if validate_on_reload:
         unsub = _setup_reload_listener(hass, debounce_seconds)
         hass.data[DOMAIN]["unsub_reload_listener"] = unsub
@@ -500,19 +903,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not hass.data[DOMAIN].get("card_registered"):
         await _async_register_card(hass)
         hass.data[DOMAIN]["card_registered"] = True
-
-    # Load history immediately (handles reload case where HA_STARTED already fired)
-    await knowledge_base.async_load_history()
-    _LOGGER.info("State knowledge base loaded")
+    _end_phase("platforms")
 
     if rhc.enabled and runtime_monitor is not None:
-        try:
-            await runtime_monitor.async_bootstrap_from_recorder(
-                _get_automation_configs(hass)
-            )
-        except Exception as err:
-            _LOGGER.warning("Runtime recorder bootstrap failed: %s", err)
-
         # Schedule initial validation scan after the startup recovery window
         initial_scan_delay = (DEFAULT_RUNTIME_HEALTH_RESTART_EXCLUSION_MINUTES + 1) * 60
 
@@ -526,17 +919,54 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         unsub_initial = async_call_later(hass, initial_scan_delay, _initial_scan)
         hass.data[DOMAIN]["unsub_initial_scan"] = unsub_initial
 
+        # Runtime scoring runs continuously in small batches rather than
+        # inside the periodic full scans.
+        from .runtime_scheduler import RuntimeScoringScheduler
+
+        runtime_scheduler = RuntimeScoringScheduler(
+            hass,
+            runtime_monitor,
+            interval=timedelta(hours=periodic_scan_interval_hours),
+            get_automations=lambda: _get_automation_configs(hass),
+            on_alerts_changed=partial(_async_apply_runtime_alerts, hass),
+        )
+        hass.data[DOMAIN]["runtime_scheduler"] = runtime_scheduler
+        hass.data[DOMAIN]["unsub_runtime_scheduler"] = runtime_scheduler.async_start(
+            delay=timedelta(seconds=initial_scan_delay)
+        )
+
     async def _async_load_history(_: Event) -> None:
         await knowledge_base.async_load_history()
         _LOGGER.info("State knowledge base loaded")
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_load_history)
 
+    # With runtime health enabled the post-recovery full scan refreshes every
+    # result, so a lazy pass beforehand would only duplicate work.
+    if validation_snapshot is not None and not (
+        rhc.enabled and runtime_monitor is not None
+    ):
+        snapshot_digests = cast(dict[str, str], validation_snapshot["config_digests"])
+
+        async def _async_revalidate_from_snapshot(_: Event | None = None) -> None:
+            try:
+                await _async_revalidate_changed_automations(hass, snapshot_digests)
+            except Exception as err:
+                _LOGGER.warning("Snapshot revalidation failed: %s", err)
+
+        if hass.is_running:
+            hass.async_create_task(_async_revalidate_from_snapshot())
+        else:
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STARTED, _async_revalidate_from_snapshot
+            )
+
     # Invalidate entity cache when entities are added/removed/renamed
     @callback
     def _handle_entity_registry_change(_: Event) -> None:
         try:
             validator.invalidate_entity_cache()
+            suggestion_index.invalidate_entities()
         except Exception:
             _LOGGER.debug("Entity registry change handler failed", exc_info=True)
 
@@ -578,16 +1008,60 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     hass.data[DOMAIN]["unsub_area_registry_listener"] = unsub_area_registry
 
+    # Refresh cached service descriptions only when the service registry changes
+    @callback
+    def _handle_service_registry_change(_: Event) -> None:
+        try:
+            service_validator.invalidate_descriptions()
+            suggestion_index.invalidate_services()
+        except Exception:
+            _LOGGER.debug("Service registry change handler failed", exc_info=True)
+
+    service_registry_unsubs = [
+        hass.bus.async_listen(event_type, _handle_service_registry_change)
+        for event_type in (
+            EVENT_SERVICE_REGISTERED,
+            EVENT_SERVICE_REMOVED,
+            EVENT_COMPONENT_LOADED,
+        )
+    ]
+
+    def _unsub_service_registry() -> None:
+        for unsub in service_registry_unsubs:
+            unsub()
+
+    hass.data[DOMAIN]["unsub_service_registry_listener"] = _unsub_service_registry
+
+    release_trigger_backlog: Callable[[], None] | None = None
     if rhc.enabled and runtime_monitor is not None:
+        # Live triggers are held back until the recorder bootstrap has run: it
+        # only imports into an empty event store, and recording them first
+        # would make it skip the import.
+        trigger_backlog: list[Event] | None = []
 
         @callback
         def _handle_runtime_trigger(event: Event) -> None:
+            if trigger_backlog is not None:
+                trigger_backlog.append(event)
+                return
+            _ingest_runtime_trigger(event)
+
+        @callback
+        def _release_trigger_backlog() -> None:
+            nonlocal trigger_backlog
+            backlog, trigger_backlog = trigger_backlog or [], None
+            for event in backlog:
+                _ingest_runtime_trigger(event)
+
+        @callback
+        def _ingest_runtime_trigger(event: Event) -> None:
             payload = event.data if isinstance(event.data, dict) else {}
             entity_id = payload.get("entity_id")
             if not isinstance(entity_id, str) or not entity_id.startswith(
                 "automation."
             ):
                 return
+            alerts_revision = runtime_monitor.runtime_alerts_revision
             try:
                 runtime_monitor.ingest_trigger_event(
                     entity_id,
@@ -600,19 +1074,78 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     entity_id,
                     exc_info=True,
                 )
+            if runtime_monitor.runtime_alerts_revision != alerts_revision:
+                async_dispatcher_send(hass, SIGNAL_ISSUES_UPDATED)
 
         unsub_runtime_trigger = hass.bus.async_listen(
             "automation_triggered",
             _handle_runtime_trigger,
         )
         hass.data[DOMAIN]["unsub_runtime_trigger_listener"] = unsub_runtime_trigger
+        release_trigger_backlog = _release_trigger_backlog
+
+    # Load history in the background (handles reload case where HA_STARTED
+    # already fired); validation loads it on demand if it runs first.
+    hass.data[DOMAIN]["warm_up_task"] = hass.async_create_background_task(
+        _async_warm_up(
+            hass,
+            knowledge_base,
+            runtime_monitor,
+            on_bootstrapped=release_trigger_backlog,
+        ),
+        f"{DOMAIN}_warm_up",
+    )
 
     # Listen for options updates to reload the integration
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
+    _end_phase("listeners")
+    setup_ms = round((time.perf_counter() - setup_started) * 1000, 3)
+    hass.data[DOMAIN]["setup_timing"] = {
+        "setup_ms": setup_ms,
+        "phases": setup_phases,
+        "warm_up_ms": None,
+    }
+    _LOGGER.debug("Integration setup finished in %.1f ms: %s", setup_ms, setup_phases)
     return True
 
 
+async def _async_warm_up(
+    hass: HomeAssistant,
+    knowledge_base: StateKnowledgeBase,
+    runtime_monitor: RuntimeHealthMonitor | None,
+    *,
+    on_bootstrapped: Callable[[], None] | None = None,
+) -> None:
+    """Load recorder history and bootstrap the runtime monitor after setup.
+
+    The bootstrap goes first: it only imports recorder history into an empty
+    event store, and live triggers recorded meanwhile would make it look
+    populated. ``on_bootstrapped`` releases the triggers held back until then.
+    """
+    started = time.perf_counter()
+    if runtime_monitor is not None:
+        try:
+            await runtime_monitor.async_bootstrap_from_recorder(
+                _get_automation_configs(hass)
+            )
+        except Exception as err:
+            _LOGGER.warning("Runtime recorder bootstrap failed: %s", err)
+    if on_bootstrapped is not None:
+        on_bootstrapped()
+
+    try:
+        await knowledge_base.async_load_history()
+    except Exception as err:
+        _LOGGER.warning("Failed to load state knowledge base history: %s", err)
+    else:
+        _LOGGER.info("State knowledge base loaded")
+
+    timing = hass.data.get(DOMAIN, {}).get("setup_timing")
+    if isinstance(timing, dict):
+        timing["warm_up_ms"] = round((time.perf_counter() - started) * 1000, 3)
+
+
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update by reloading the integration."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -630,6 +1163,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if debounce_task is not None and not debounce_task.done():
         debounce_task.cancel()
 
+    # Stop a history load or recorder bootstrap that is still running
+    warm_up_task = data.get("warm_up_task")
+    if warm_up_task is not None and not warm_up_task.done():
+        warm_up_task.cancel()
+
     # Remove event listeners
     for key in (
         "unsub_reload_listener",
@@ -637,8 +1175,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "unsub_entity_registry_listener",
         "unsub_zone_state_listener",
         "unsub_area_registry_listener",
+        "unsub_service_registry_listener",
         "unsub_runtime_trigger_listener",
         "unsub_initial_scan",
+        "unsub_runtime_scheduler",
     ):
         unsub = data.get(key)
         if unsub is not None:
@@ -656,6 +1196,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 err,
             )
 
+    # Write out any debounced store saves before the data is dropped
+    for key in (
+        "suppression_store",
+        "learned_states_store",
+        "validation_snapshot_store",
+    ):
+        store = data.get(key)
+        if store is None or not hasattr(store, "async_flush"):
+            continue
+        try:
+            await store.async_flush()
+        except Exception as err:
+            _LOGGER.debug("Failed to flush %s during unload: %s", key, err)
+
     if unload_ok:
         # Unregister services and clear data only on successful unload
         hass.services.async_remove(DOMAIN, "validate")
@@ -726,7 +1280,7 @@ def _setup_periodic_scan_listener(
         except Exception as err:
             _LOGGER.warning("Periodic validation scan failed: %s", err)
 
-        # Run weekly maintenance if due
+        # Run weekly maintenance if due, then the per-scan store maintenance
         data = hass.data.get(DOMAIN, {})
         runtime_monitor = data.get("runtime_monitor")
         if runtime_monitor is not None:
@@ -749,6 +1303,10 @@ def _setup_periodic_scan_listener(
                     )
             except Exception as err:
                 _LOGGER.debug("Weekly maintenance check failed: %s", err)
+            try:
+                await hass.async_add_executor_job(runtime_monitor.run_store_maintenance)
+            except Exception as err:
+                _LOGGER.debug("Store maintenance failed: %s", err)
 
     return async_track_time_interval(
         hass,
@@ -814,6 +1372,7 @@ async def _async_run_validators(
     jinja_validator = data.get("jinja_validator")
     service_validator = data.get("service_validator")
     reachability_validator = data.get("reachability_validator")
+    profiler = data.get("profiler") or DISABLED_PROFILER
 
     # Initialize per-group collectors
     group_issues: dict[str, list[ValidationIssue]] = {
@@ -862,7 +1421,11 @@ async def _async_run_validators(
             await service_validator.async_load_descriptions()
             service_calls = []
             for automation in automations:
-                service_calls.extend(analyzer.extract_service_calls(automation))
+                with profiler.span(
+                    "analyzer.extract_service_calls",
+                    f"automation.{automation.get('id', 'unknown')}",
+                ):
+                    service_calls.extend(analyzer.extract_service_calls(automation))
 
             service_issues = service_validator.validate_service_calls(service_calls)
             _LOGGER.debug(
@@ -905,13 +1468,17 @@ async def _async_run_validators(
             auto_name = automation.get("alias", auto_id)
 
             try:
-                refs = analyzer.extract_state_references(automation)
+                with profiler.span(
+                    "analyzer.extract_state_references", f"automation.{auto_id}"
+                ):
+                    refs = analyzer.extract_state_references(automation)
                 _LOGGER.debug(
                     "Automation '%s': extracted %d state references",
                     auto_name,
                     len(refs),
                 )
-                issues = validator.validate_all(refs)
+                with profiler.span("validator.validate_all", f"automation.{auto_id}"):
+                    issues = validator.validate_all(refs)
                 _LOGGER.debug(
                     "Automation '%s': found %d issues", auto_name, len(issues)
                 )
@@ -970,16 +1537,23 @@ async def _async_run_validators(
         runtime_enabled,
         type(runtime_monitor).__name__ if runtime_monitor else None,
     )
+    runtime_scheduler = data.get("runtime_scheduler")
     if runtime_enabled and runtime_monitor:
         try:
-            runtime_issues = await runtime_monitor.validate_automations(automations)
+            if runtime_scheduler is not None:
+                # Scored continuously by the scheduler; report its alerts.
+                runtime_issues = runtime_scheduler.get_active_issues(automations)
+            else:
+                runtime_issues = await runtime_monitor.validate_automations(automations)
             _LOGGER.debug(
                 "Runtime health validation: %d issues found", len(runtime_issues)
             )
             for issue in runtime_issues:
                 gid = issue_type_to_group.get(issue.issue_type, "runtime_health")
                 group_issues[gid].append(issue)
-            if hasattr(runtime_monitor, "get_last_run_stats"):
+            if runtime_scheduler is not None:
+                skip_reasons["runtime_health"] = runtime_scheduler.get_run_stats()
+            elif hasattr(runtime_monitor, "get_last_run_stats"):
                 runtime_stats = cast(
                     dict[str, int], runtime_monitor.get_last_run_stats()
                 )
@@ -997,6 +1571,8 @@ async def _async_run_validators(
         _LOGGER.debug("Runtime health: disabled")
         skip_reasons["runtime_health"]["disabled"] = 1
     group_durations["runtime_health"] = round((time.monotonic() - t0) * 1000)
+    for gid, duration_ms in group_durations.items():
+        profiler.record(f"group.{gid}", duration_ms / 1000)
 
     # Combine all issues in canonical group order for flat list
     all_issues: list[ValidationIssue] = []
@@ -1068,7 +1644,12 @@ async def async_validate_all_with_groups(hass: HomeAssistant) -> dict[str, Any]:
 
     _LOGGER.info("Validating %d automations (with groups)", len(automations))
 
+    # Only full runs are profiled; single-automation revalidation would
+    # otherwise replace the last run with a one-automation sample.
+    profiler = data.get("profiler") or DISABLED_PROFILER
+    profiler.start_run()
     result = await _async_run_validators(hass, automations)
+    profiler.finish_run(len(automations))
 
     suppression_store: SuppressionStore | None = data.get("suppression_store")
     visible_group_issues, _ = _filter_group_issues_for_suppressions(
@@ -1093,11 +1674,11 @@ async def async_validate_all_with_groups(hass: HomeAssistant) -> dict[str, Any]:
     await reporter.async_report_issues(visible_all_issues)
 
     # Update all validation state atomically
+    store_validation_issue_state(
+        hass.data[DOMAIN], visible_all_issues, result["all_issues"]
+    )
     hass.data[DOMAIN].update(
         {
-            "issues": visible_all_issues,  # Keep for backwards compatibility
-            "validation_issues": visible_all_issues,
-            "validation_issues_raw": result["all_issues"],
             "validation_last_run": result["timestamp"],
             "validation_groups": {
                 gid: {
@@ -1120,6 +1701,11 @@ async def async_validate_all_with_groups(hass: HomeAssistant) -> dict[str, Any]:
             },
         }
     )
+    async_dispatcher_send(hass, SIGNAL_ISSUES_UPDATED)
+
+    _schedule_validation_snapshot_save(
+        hass.data[DOMAIN], _build_config_snapshot(automations)
+    )
 
     return result
 
@@ -1167,36 +1753,44 @@ async def async_validate_automation(
         suppression_store,
     )
 
-    # Merge single-automation results with existing issues for OTHER automations
-    # to prevent reporter from clearing their repair entries. Reporter's
-    # _clear_resolved_issues deletes all repairs NOT in the provided list.
-    existing_issues: list[ValidationIssue] = data.get("validation_issues", [])
+    # Replace only the target automation's bucket in the per-automation issue
+    # indexes; issues of all OTHER automations are kept as-is. The flat lists
+    # are re-derived from the buckets only when the automation had or has
+    # issues, so revalidating a clean automation leaves them untouched.
     normalized_target_id = _normalize_automation_entity_id(automation_id)
-    other_issues = [
-        i
-        for i in existing_issues
-        if _normalize_automation_entity_id(i.automation_id) != normalized_target_id
-    ]
-    merged_issues = other_issues + visible_current_issues
+    visible_index, raw_index = _get_issue_indexes(data)
 
-    existing_raw_issues: list[ValidationIssue] = data.get(
-        "validation_issues_raw",
-        existing_issues,
-    )
-    other_raw_issues = [
-        i
-        for i in existing_raw_issues
-        if _normalize_automation_entity_id(i.automation_id) != normalized_target_id
-    ]
-    merged_raw_issues = other_raw_issues + result["all_issues"]
+    raw_current_issues: list[ValidationIssue] = result["all_issues"]
+    buckets_changed = False
+    for index, bucket in (
+        (visible_index, visible_current_issues),
+        (raw_index, raw_current_issues),
+    ):
+        if bucket:
+            index[normalized_target_id] = bucket
+            buckets_changed = True
+        elif index.pop(normalized_target_id, None) is not None:
+            buckets_changed = True
+    if buckets_changed:
+        _store_issue_indexes(data, visible_index, raw_index)
+        if data.get("validation_groups_raw") is not None:
+            visible_group_issues, _ = _filter_group_issues_for_suppressions(
+                result["group_issues"], suppression_store
+            )
+            _replace_automation_group_issues(
+                data,
+                normalized_target_id,
+                visible_group_issues,
+                result["group_issues"],
+            )
 
-    await reporter.async_report_issues(merged_issues)
+    # Only the revalidated automation's repair entry changes.
+    await reporter.async_report_automation_issues(
+        normalized_target_id, visible_current_issues
+    )
 
     hass.data[DOMAIN].update(
         {
-            "issues": merged_issues,
-            "validation_issues": merged_issues,
-            "validation_issues_raw": merged_raw_issues,
             "validation_last_run": result["timestamp"],
             "validation_run_stats": {
                 "analyzed_automations": result.get("analyzed_automations", 0),
@@ -1205,5 +1799,13 @@ async def async_validate_automation(
             },
         }
     )
+    async_dispatcher_send(hass, SIGNAL_ISSUES_UPDATED)
+
+    # Persist the revalidated automation so a restart does not bring back
+    # its old issues.
+    snapshot_digests: dict[str, str] | None = data.get("validation_snapshot_digests")
+    if snapshot_digests is not None:
+        snapshot_digests.update(_build_config_snapshot([automation]))
+        _schedule_validation_snapshot_save(data, snapshot_digests)
 
     return visible_current_issues
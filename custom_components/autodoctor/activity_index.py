@@ -0,0 +1,113 @@
+"""Cross-automation activity index keyed by integer 5-minute slot."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from .bounded_cache import approximate_size
+
+SLOT_SECONDS = 300
+
+
+def slot_of(timestamp: datetime | float) -> int:
+    """Return the 5-minute slot number (epoch seconds // 300) of a timestamp."""
+    epoch = timestamp.timestamp() if isinstance(timestamp, datetime) else timestamp
+    return int(epoch // SLOT_SECONDS)
+
+
+class ActivitySlotIndex:
+    """Distinct-automation trigger counts per 5-minute slot.
+
+    Each slot stores how many different automations fired in it, and each
+    automation keeps the set of slots it fired in so repeated adds are
+    idempotent. The "other automations in this slot" feature is then one
+    dict read and one set membership test.
+
+    The index is kept current from live triggers and store imports via
+    ``add``/``add_many``. ``sync`` catches up from an ascending event list
+    by visiting only events newer than the last sync for that automation.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._counts: dict[int, int] = {}
+        self._slots: dict[str, set[int]] = {}
+        self._synced_through: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, automation_id: str, timestamp: datetime | float) -> None:
+        """Record that ``automation_id`` fired at ``timestamp``."""
+        slot = slot_of(timestamp)
+        slots = self._slots.get(automation_id)
+        if slots is None:
+            slots = self._slots[automation_id] = set()
+        elif slot in slots:
+            return
+        slots.add(slot)
+        self._counts[slot] = self._counts.get(slot, 0) + 1
+
+    def add_many(
+        self, automation_id: str, timestamps: Iterable[datetime | float]
+    ) -> None:
+        """Record several triggers of one automation."""
+        for timestamp in timestamps:
+            self.add(automation_id, timestamp)
+
+    def sync(self, automation_id: str, events: list[datetime]) -> int:
+        """Add events newer than the previous sync; ``events`` must be ascending.
+
+        Returns the number of events visited.
+        """
+        if not events:
+            return 0
+        synced_through = self._synced_through.get(automation_id)
+        newest = synced_through
+        visited = 0
+        for ts in reversed(events):
+            epoch = ts.timestamp()
+            if synced_through is not None and epoch <= synced_through:
+                break
+            self.add(automation_id, epoch)
+            if newest is None or epoch > newest:
+                newest = epoch
+            visited += 1
+        if newest is not None:
+            self._synced_through[automation_id] = newest
+        return visited
+
+    def other_count(self, automation_id: str, timestamp: datetime | float) -> int:
+        """Return how many other automations fired in the slot of ``timestamp``."""
+        slot = slot_of(timestamp)
+        count = self._counts.get(slot, 0)
+        if count and slot in self._slots.get(automation_id, ()):
+            count -= 1
+        return count
+
+    def prune(self, before: datetime | float) -> int:
+        """Drop slots that end before ``before``; returns slots removed."""
+        cutoff = slot_of(before)
+        stale = [slot for slot in self._counts if slot < cutoff]
+        if not stale:
+            return 0
+        for slot in stale:
+            del self._counts[slot]
+        for automation_id, slots in list(self._slots.items()):
+            remaining = {slot for slot in slots if slot >= cutoff}
+            if remaining:
+                self._slots[automation_id] = remaining
+            else:
+                del self._slots[automation_id]
+        return len(stale)
+
+    def stats(self) -> dict[str, Any]:
+        """Return slot/automation counts and approximate memory use."""
+        return {
+            "slots": len(self._counts),
+            "automations": len(self._slots),
+            "approx_bytes": approximate_size(self._counts)
+            + approximate_size(self._slots),
+        }
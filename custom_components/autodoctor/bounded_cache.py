@@ -0,0 +1,132 @@
+"""Size-bounded caches with hit/miss/eviction accounting."""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from copy import deepcopy
+from typing import Any, TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+# Containers nested deeper than this are counted shallowly; cached values
+# here are at most a few levels deep.
+_MAX_SIZE_DEPTH = 6
+
+
+def approximate_size(
+    obj: Any, *, _depth: int = 0, _seen: set[int] | None = None
+) -> int:
+    """Return an approximate deep size of ``obj`` in bytes.
+
+    Walks dicts, lists, tuples and sets with ``sys.getsizeof`` and counts
+    each object once. Interned or shared values are therefore attributed to
+    whichever cache reaches them first, so totals are estimates.
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if _depth >= _MAX_SIZE_DEPTH:
+        return size
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += approximate_size(key, _depth=_depth + 1, _seen=seen)
+            size += approximate_size(value, _depth=_depth + 1, _seen=seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += approximate_size(item, _depth=_depth + 1, _seen=seen)
+    return size
+
+
+def mapping_stats(
+    mapping: dict[Any, Any] | None,
+    *,
+    hits: int = 0,
+    misses: int = 0,
+    evictions: int = 0,
+    max_entries: int | None = None,
+) -> dict[str, Any]:
+    """Return the diagnostics shape shared by every cache."""
+    lookups = hits + misses
+    return {
+        "entries": len(mapping) if mapping is not None else 0,
+        "max_entries": max_entries,
+        "approx_bytes": approximate_size(mapping) if mapping is not None else 0,
+        "hits": hits,
+        "misses": misses,
+        "evictions": evictions,
+        "hit_rate": round(hits / lookups, 4) if lookups else None,
+    }
+
+
+class LRUCache(OrderedDict[_K, _V]):
+    """Dict that evicts its least recently used entries beyond ``max_entries``.
+
+    Reads through ``lookup`` count hits and misses and refresh recency;
+    plain item access behaves like a normal dict so existing call sites keep
+    working. ``max_entries=None`` disables the bound but keeps the counters.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        *,
+        on_evict: Callable[[_K, _V], None] | None = None,
+    ) -> None:
+        """Initialize the cache."""
+        super().__init__()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._on_evict = on_evict
+
+    def lookup(self, key: _K) -> _V | None:
+        """Return the cached value for ``key`` and record a hit or miss."""
+        value = super().get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: _K, value: _V) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._evict()
+
+    def resize(self, max_entries: int | None) -> None:
+        """Change the bound, evicting immediately if the cache is over it."""
+        self.max_entries = max_entries
+        self._evict()
+
+    def _evict(self) -> None:
+        if self.max_entries is None:
+            return
+        while len(self) > self.max_entries:
+            key, value = self.popitem(last=False)
+            self.evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(key, value)
+
+    def copy(self) -> dict[_K, _V]:  # type: ignore[override]
+        """Return a plain dict snapshot of the entries."""
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[_K, _V]:
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry count, approximate size and hit/miss/eviction counters."""
+        return mapping_stats(
+            self,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            max_entries=self.max_entries,
+        )
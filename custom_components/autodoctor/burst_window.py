@@ -0,0 +1,116 @@
+"""Fixed-capacity ring buffer of trigger epochs for burst detection."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+DEFAULT_BURST_WINDOW_CAPACITY = 512
+
+
+class BurstWindow:
+    """Recent trigger epochs of one automation with running window counts.
+
+    Epochs are kept in arrival order in a ring of ``capacity`` slots. Two
+    cursors mark the oldest epoch inside the long window and the oldest
+    inside the short window; ``advance`` only ever moves them forward, so
+    each epoch is passed at most twice and a trigger costs amortized O(1).
+    When more than ``capacity`` triggers land inside the long window the
+    oldest are overwritten, which caps the counts rather than the memory.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_capacity",
+        "_head",
+        "_short_head",
+        "_tail",
+        "long_seconds",
+        "short_seconds",
+    )
+
+    def __init__(
+        self,
+        *,
+        long_seconds: float,
+        short_seconds: float,
+        capacity: int = DEFAULT_BURST_WINDOW_CAPACITY,
+    ) -> None:
+        """Initialize an empty window."""
+        self.long_seconds = long_seconds
+        self.short_seconds = short_seconds
+        self._capacity = max(1, int(capacity))
+        self._buffer: list[float] = []
+        # Monotonic sequence numbers; the slot of sequence n is n % capacity.
+        self._head = 0
+        self._short_head = 0
+        self._tail = 0
+
+    @classmethod
+    def from_epochs(
+        cls,
+        epochs: Iterable[float],
+        *,
+        long_seconds: float,
+        short_seconds: float,
+        capacity: int = DEFAULT_BURST_WINDOW_CAPACITY,
+    ) -> BurstWindow:
+        """Build a window from epochs in any order."""
+        window = cls(
+            long_seconds=long_seconds, short_seconds=short_seconds, capacity=capacity
+        )
+        for epoch in sorted(epochs):
+            window._push(epoch)
+        return window
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    @property
+    def long_count(self) -> int:
+        """Triggers inside the long window as of the last ``advance``."""
+        return self._tail - self._head
+
+    @property
+    def short_count(self) -> int:
+        """Triggers inside the short window as of the last ``advance``."""
+        return self._tail - self._short_head
+
+    def _at(self, sequence: int) -> float:
+        return self._buffer[sequence % self._capacity]
+
+    def _push(self, epoch: float) -> None:
+        if len(self._buffer) < self._capacity:
+            self._buffer.append(epoch)
+        else:
+            self._buffer[self._tail % self._capacity] = epoch
+        self._tail += 1
+        if self._tail - self._head > self._capacity:
+            self._head = self._tail - self._capacity
+            self._short_head = max(self._short_head, self._head)
+
+    def append(self, epoch: float) -> None:
+        """Add a trigger; out-of-order epochs fall back to a full rebuild."""
+        if self._tail > self._head and epoch < self._at(self._tail - 1):
+            epochs = [*self.epochs(), epoch]
+            self._buffer = []
+            self._head = self._short_head = self._tail = 0
+            for value in sorted(epochs):
+                self._push(value)
+            return
+        self._push(epoch)
+
+    def advance(self, now: float) -> None:
+        """Drop epochs older than the long window and move the short cursor."""
+        long_cutoff = now - self.long_seconds
+        while self._head < self._tail and self._at(self._head) < long_cutoff:
+            self._head += 1
+        short_cutoff = now - self.short_seconds
+        self._short_head = max(self._short_head, self._head)
+        while (
+            self._short_head < self._tail and self._at(self._short_head) < short_cutoff
+        ):
+            self._short_head += 1
+
+    def epochs(self) -> list[float]:
+        """Return the retained epochs, oldest first."""
+        return [self._at(sequence) for sequence in range(self._head, self._tail)]
@@ -13,13 +13,19 @@ from homeassistant.core import HomeAssistant, callback
 from .const import (
     CONF_HISTORY_DAYS,
     CONF_PERIODIC_SCAN_INTERVAL_HOURS,
+    CONF_PROFILING_ENABLED,
+    CONF_RUNTIME_STATE_CACHE_SIZE,
     CONF_STRICT_SERVICE_VALIDATION,
     CONF_STRICT_TEMPLATE_VALIDATION,
+    CONF_VALID_STATES_CACHE_SIZE,
     CONF_VALIDATE_ON_RELOAD,
     DEFAULT_HISTORY_DAYS,
     DEFAULT_PERIODIC_SCAN_INTERVAL_HOURS,
+    DEFAULT_PROFILING_ENABLED,
+    DEFAULT_RUNTIME_STATE_CACHE_SIZE,
     DEFAULT_STRICT_SERVICE_VALIDATION,
     DEFAULT_STRICT_TEMPLATE_VALIDATION,
+    DEFAULT_VALID_STATES_CACHE_SIZE,
     DEFAULT_VALIDATE_ON_RELOAD,
     DOMAIN,
     RuntimeHealthConfig,
@@ -178,6 +184,24 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     "runtime_health_max_alerts_per_day",
                     default=rhc.max_alerts_per_day,
                 ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+                vol.Optional(
+                    CONF_PROFILING_ENABLED,
+                    default=defaults.get(
+                        CONF_PROFILING_ENABLED, DEFAULT_PROFILING_ENABLED
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_VALID_STATES_CACHE_SIZE,
+                    default=defaults.get(
+                        CONF_VALID_STATES_CACHE_SIZE, DEFAULT_VALID_STATES_CACHE_SIZE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=100, max=200000)),
+                vol.Optional(
+                    CONF_RUNTIME_STATE_CACHE_SIZE,
+                    default=defaults.get(
+                        CONF_RUNTIME_STATE_CACHE_SIZE, DEFAULT_RUNTIME_STATE_CACHE_SIZE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=50, max=50000)),
             }
         )
 
@@ -29,6 +29,9 @@ DEFAULT_DEBOUNCE_SECONDS = 5
 DEFAULT_PERIODIC_SCAN_INTERVAL_HOURS = 4
 DEFAULT_STRICT_TEMPLATE_VALIDATION = False
 DEFAULT_STRICT_SERVICE_VALIDATION = False
+DEFAULT_PROFILING_ENABLED = False
+DEFAULT_VALID_STATES_CACHE_SIZE = 10000
+DEFAULT_RUNTIME_STATE_CACHE_SIZE = 2000
 DEFAULT_RUNTIME_HEALTH_ENABLED = False
 DEFAULT_RUNTIME_HEALTH_BASELINE_DAYS = 90
 DEFAULT_RUNTIME_HEALTH_MIN_COVERAGE_DAYS = 90
@@ -39,12 +42,21 @@ DEFAULT_RUNTIME_HEALTH_SENSITIVITY = "medium"
 DEFAULT_RUNTIME_HEALTH_BURST_MULTIPLIER = 4.0
 DEFAULT_RUNTIME_HEALTH_MAX_ALERTS_PER_DAY = 10
 DEFAULT_RUNTIME_HEALTH_RESTART_EXCLUSION_MINUTES = 5
+# Delay used to coalesce bursts of store changes into a single storage write
+STORE_SAVE_DELAY_SECONDS = 10
+# Dispatcher signal fired when validation issues or runtime alerts change
+SIGNAL_ISSUES_UPDATED = f"{DOMAIN}_issues_updated"
+# Upper bound on list-valued sensor attributes (recorder persists every write)
+MAX_SENSOR_ATTRIBUTE_ITEMS = 50
 # Config keys
 CONF_HISTORY_DAYS = "history_days"
 CONF_VALIDATE_ON_RELOAD = "validate_on_reload"
 CONF_PERIODIC_SCAN_INTERVAL_HOURS = "periodic_scan_interval_hours"
 CONF_STRICT_TEMPLATE_VALIDATION = "strict_template_validation"
 CONF_STRICT_SERVICE_VALIDATION = "strict_service_validation"
+CONF_PROFILING_ENABLED = "profiling_enabled"
+CONF_VALID_STATES_CACHE_SIZE = "valid_states_cache_size"
+CONF_RUNTIME_STATE_CACHE_SIZE = "runtime_state_cache_size"
 CONF_RUNTIME_HEALTH_ENABLED = "runtime_health_enabled"
 CONF_RUNTIME_HEALTH_BASELINE_DAYS = "runtime_health_baseline_days"
 CONF_RUNTIME_HEALTH_MIN_COVERAGE_DAYS = "runtime_health_min_coverage_days"
@@ -0,0 +1,58 @@
+"""Diagnostics support for Autodoctor."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import DOMAIN, VERSION
+from .profiler import DISABLED_PROFILER
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+
+def collect_cache_diagnostics(hass: HomeAssistant) -> dict[str, Any]:
+    """Return entry counts, approximate sizes and hit rates for every cache.
+
+    Sizes come from a deep ``sys.getsizeof`` walk, so this is meant for
+    on-demand diagnostics rather than regular polling.
+    """
+    data = hass.data.get(DOMAIN, {})
+    caches: dict[str, Any] = {}
+    for key in ("knowledge_base", "validator", "runtime_monitor"):
+        component = data.get(key)
+        if component is not None and hasattr(component, "get_cache_diagnostics"):
+            caches[key] = component.get_cache_diagnostics()
+    return caches
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data.get(DOMAIN, {})
+
+    runtime_monitor = data.get("runtime_monitor")
+    runtime_event_store: dict[str, Any] | None = None
+    if runtime_monitor is not None and hasattr(
+        runtime_monitor, "get_event_store_diagnostics"
+    ):
+        runtime_event_store = runtime_monitor.get_event_store_diagnostics()
+
+    profiler = data.get("profiler")
+    profile = (profiler if profiler is not None else DISABLED_PROFILER).get_last_run()
+
+    return {
+        "version": VERSION,
+        "options": dict(entry.options),
+        "validation": {
+            "last_run": data.get("validation_last_run"),
+            "run_stats": data.get("validation_run_stats", {}),
+            "issue_count": len(data.get("validation_issues_raw", [])),
+        },
+        "setup": data.get("setup_timing"),
+        "runtime_event_store": runtime_event_store,
+        "profile": profile,
+        "caches": collect_cache_diagnostics(hass),
+    }
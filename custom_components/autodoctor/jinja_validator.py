@@ -13,6 +13,7 @@ from .action_walker import condition_location as _condition_location
 from .action_walker import ensure_list as _ensure_list
 from .ha_catalog import get_known_filters, get_known_tests
 from .models import IssueType, Severity, ValidationIssue
+from .profiler import DISABLED_PROFILER, ValidationProfiler
 from .template_utils import is_template_value
 
 if TYPE_CHECKING:
@@ -33,6 +34,7 @@ class JinjaValidator:
         self,
         hass: HomeAssistant | None = None,
         strict_template_validation: bool = False,
+        profiler: ValidationProfiler | None = None,
     ) -> None:
         """Initialize the Jinja validator.
 
@@ -40,8 +42,10 @@ class JinjaValidator:
             hass: Home Assistant instance (optional, for HA-specific template env)
             strict_template_validation: If True, warn about unknown filters/tests.
                 Disable if using custom components that add custom Jinja filters.
+            profiler: Optional span recorder for per-template timings.
         """
         self.hass = hass
+        self.profiler = profiler or DISABLED_PROFILER
         self._strict_validation = strict_template_validation
         # Use a sandboxed environment for safe parsing
         self._env = SandboxedEnvironment(extensions=["jinja2.ext.loopcontrols"])
@@ -397,7 +401,8 @@ class JinjaValidator:
         Returns a list of ValidationIssues (empty if no problems).
         """
         try:
-            ast = self._env.parse(template)
+            with self.profiler.span("jinja.parse", auto_id):
+                ast = self._env.parse(template)
         except TemplateSyntaxError as err:
             error_msg = str(err.message) if err.message else str(err)
             line_info = f" (line {err.lineno})" if err.lineno else ""
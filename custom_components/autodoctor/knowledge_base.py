@@ -19,9 +19,11 @@ import logging
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast
 
-from .const import STATE_VALIDATION_WHITELIST
+from .bounded_cache import LRUCache, mapping_stats
+from .const import DEFAULT_VALID_STATES_CACHE_SIZE, STATE_VALIDATION_WHITELIST
 from .device_class_states import get_device_class_states
 from .learned_states_store import LearnedStatesStore
+from .profiler import DISABLED_PROFILER, ValidationProfiler
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -29,23 +31,40 @@ if TYPE_CHECKING:
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import entity_registry as er
 
-try:
-    # Current HA location (2021+)
-    from homeassistant.components.recorder.history import get_significant_states
-except ImportError:
+_UNRESOLVED: Any = object()
+
+# Resolved on first history load; importing the recorder history module pulls
+# in SQLAlchemy, which should not be paid for at integration import time.
+get_significant_states: Any = _UNRESOLVED
+
+
+def _resolve_get_significant_states() -> Any:
+    """Import the recorder history helper on first use and cache it."""
+    global get_significant_states
+    if get_significant_states is not _UNRESOLVED:
+        return get_significant_states
     try:
-        # Alternative location
-        from homeassistant.helpers.recorder import (
-            get_significant_states,  # pyright: ignore[reportAttributeAccessIssue, reportUnknownVariableType]
+        # Current HA location (2021+)
+        from homeassistant.components.recorder.history import (
+            get_significant_states as resolved,
         )
     except ImportError:
         try:
-            # Legacy fallback
-            from homeassistant.components.recorder import (
-                get_significant_states,  # pyright: ignore[reportAttributeAccessIssue, reportUnknownVariableType]
+            # Alternative location
+            from homeassistant.helpers.recorder import (
+                get_significant_states as resolved,  # pyright: ignore[reportAttributeAccessIssue, reportUnknownVariableType]
             )
         except ImportError:
-            get_significant_states = None
+            try:
+                # Legacy fallback
+                from homeassistant.components.recorder import (
+                    get_significant_states as resolved,  # pyright: ignore[reportAttributeAccessIssue, reportUnknownVariableType]
+                )
+            except ImportError:
+                resolved = None
+    get_significant_states = resolved
+    return resolved
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -100,6 +119,8 @@ class StateKnowledgeBase:
         history_days: int = 30,
         learned_states_store: LearnedStatesStore | None = None,
         history_timeout: int = 120,
+        profiler: ValidationProfiler | None = None,
+        max_cache_entries: int | None = DEFAULT_VALID_STATES_CACHE_SIZE,
     ) -> None:
         """Initialize the knowledge base.
 
@@ -108,12 +129,17 @@ class StateKnowledgeBase:
             history_days: Number of days of history to query
             learned_states_store: Optional store for user-learned states
             history_timeout: Timeout in seconds for history loading
+            profiler: Optional span recorder for lookup and cache-hit counters
+            max_cache_entries: Bound on cached valid-state sets (None = unbounded)
         """
         self.hass = hass
+        self.profiler = profiler or DISABLED_PROFILER
         self.history_days = history_days
         self.history_timeout = history_timeout
-        self._cache: dict[str, set[str]] = {}
+        self._cache: LRUCache[str, set[str]] = LRUCache(max_cache_entries)
         self._observed_states: dict[str, set[str]] = {}
+        self._observed_hits = 0
+        self._observed_misses = 0
         self._learned_states_store = learned_states_store
         self._lock = asyncio.Lock()
         self._zone_names: set[str] | None = None
@@ -293,8 +319,11 @@ class StateKnowledgeBase:
             Set of valid states, or None if entity doesn't exist
         """
         # Check cache first - return a copy to prevent external mutation
-        if entity_id in self._cache:
-            return self._cache[entity_id].copy()
+        cached = self._cache.lookup(entity_id)
+        if cached is not None:
+            self.profiler.count("knowledge_base.cache_hit")
+            return cached.copy()
+        self.profiler.count("knowledge_base.cache_miss")
 
         # Check if entity exists
         state = self.hass.states.get(entity_id)
@@ -398,7 +427,10 @@ class StateKnowledgeBase:
         # Add observed states from history (take snapshot to avoid race)
         observed = self._observed_states.get(entity_id)
         if observed:
+            self._observed_hits += 1
             valid_states.update(observed)
+        else:
+            self._observed_misses += 1
 
         # Always include current state as valid
         if state.state not in ("unavailable", "unknown"):
@@ -446,6 +478,17 @@ class StateKnowledgeBase:
         self._zone_names = None
         self._area_names = None
 
+    def get_cache_diagnostics(self) -> dict[str, Any]:
+        """Return size and hit-rate diagnostics for the knowledge base caches."""
+        return {
+            "valid_states": self._cache.stats(),
+            "observed_states": mapping_stats(
+                self._observed_states,
+                hits=self._observed_hits,
+                misses=self._observed_misses,
+            ),
+        }
+
     def invalidate_location_caches(self) -> None:
         """Invalidate zone/area derived caches and zone-aware entity cache entries."""
         self._zone_names = None
@@ -495,7 +538,8 @@ class StateKnowledgeBase:
 
         Uses a lock to prevent concurrent history loads from racing.
         """
-        if get_significant_states is None:
+        load_states = _resolve_get_significant_states()
+        if load_states is None:
             _LOGGER.warning(
                 "Recorder history not available - get_significant_states not found"
             )
@@ -520,7 +564,7 @@ class StateKnowledgeBase:
                 # Run blocking call in executor with timeout
                 history = await asyncio.wait_for(
                     self.hass.async_add_executor_job(
-                        get_significant_states,
+                        load_states,
                         self.hass,
                         start_time,
                         end_time,
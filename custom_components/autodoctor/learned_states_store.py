@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from homeassistant.helpers.storage import Store
 
+from .const import STORE_SAVE_DELAY_SECONDS
+
 _LOGGER = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -43,6 +46,7 @@ class LearnedStatesStore:
         )
         self._learned: dict[str, dict[str, list[str]]] = {}
         self._lock = asyncio.Lock()
+        self._save_pending = False
 
     async def async_load(self) -> None:
         """Load learned states from storage."""
@@ -51,12 +55,33 @@ class LearnedStatesStore:
             if data:
                 self._learned = data
 
-    async def _async_save(self) -> None:
-        """Save learned states to storage.
+    def _data_to_save(self) -> dict[str, dict[str, list[str]]]:
+        """Return the storage payload; called by Store when a write happens."""
+        self._save_pending = False
+        return self._learned
+
+    def _schedule_save(self) -> None:
+        """Schedule a delayed save, coalescing changes made within the delay.
 
         Note: Caller must hold _lock when calling this method.
         """
-        await self._store.async_save(self._learned)
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, STORE_SAVE_DELAY_SECONDS)
+
+    async def async_flush(self) -> None:
+        """Write any pending delayed save now (used on unload).
+
+        A failed write is re-raised and stays pending, so a later flush
+        retries it.
+        """
+        async with self._lock:
+            if not self._save_pending:
+                return
+            try:
+                await self._store.async_save(self._data_to_save())
+            except Exception:
+                self._save_pending = True
+                raise
 
     def get_learned_states(self, domain: str, integration: str) -> set[str]:
         """Get learned states for a domain/integration combination.
@@ -92,31 +117,26 @@ class LearnedStatesStore:
             integration: Integration/platform name (e.g., 'roborock')
             state: The state value to learn
         """
+        await self.async_learn_states([(domain, integration, state)])
+
+    async def async_learn_states(self, entries: Iterable[tuple[str, str, str]]) -> int:
+        """Learn several (domain, integration, state) entries with one save.
+
+        The write is deferred through Store.async_delay_save, which does no
+        I/O here; a failing delayed write is logged by Store itself.
+
+        Returns the number of newly learned states.
+        """
         async with self._lock:
-            if domain not in self._learned:
-                self._learned[domain] = {}
-
-            if integration not in self._learned[domain]:
-                self._learned[domain][integration] = []
-
-            if state not in self._learned[domain][integration]:
-                self._learned[domain][integration].append(state)
-                try:
-                    await self._async_save()
-                except Exception as err:
-                    # Rollback the mutation on save failure to maintain consistency
-                    # between in-memory state and persisted state
-                    integration_states = self._learned[domain][integration]
-                    integration_states.remove(state)
-                    if not integration_states:
-                        del self._learned[domain][integration]
-                    if not self._learned[domain]:
-                        del self._learned[domain]
-                    _LOGGER.error(
-                        "Failed to save learned state %s for %s.%s: %s",
-                        state,
-                        domain,
-                        integration,
-                        err,
-                    )
-                    raise
+            added: list[tuple[str, str, str]] = []
+            for domain, integration, state in entries:
+                if state in self._learned.get(domain, {}).get(integration, []):
+                    continue
+                self._learned.setdefault(domain, {}).setdefault(integration, []).append(
+                    state
+                )
+                added.append((domain, integration, state))
+            if not added:
+                return 0
+            self._schedule_save()
+            return len(added)
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import IntEnum, StrEnum
 from typing import Any
 
+# Shared default for issues that carry no valid-state list.
+EMPTY_VALID_STATES: tuple[str, ...] = ()
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings that repeat across many model instances."""
+    return sys.intern(value) if type(value) is str else value
+
 
 class Severity(IntEnum):
     """Issue severity levels."""
@@ -43,9 +53,13 @@ class IssueType(StrEnum):
     RUNTIME_AUTOMATION_BURST = "runtime_automation_burst"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StateReference:
-    """A reference to an entity state found in an automation."""
+    """A reference to an entity state found in an automation.
+
+    Instances are immutable; ``automation_id`` and ``location`` are interned
+    because a scan creates many references per automation.
+    """
 
     automation_id: str
     automation_name: str
@@ -57,10 +71,19 @@ class StateReference:
     # Type of reference: direct entity, group, device, area, or integration
     reference_type: str = "direct"
 
+    def __post_init__(self) -> None:
+        """Intern repeated identifier strings."""
+        object.__setattr__(self, "automation_id", _intern(self.automation_id))
+        object.__setattr__(self, "location", _intern(self.location))
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
-    """An issue found during validation."""
+    """An issue found during validation.
+
+    Issues are immutable, so the hash, ``to_dict()`` payload and suppression
+    key are computed once and reused by the dedupe and reporting paths.
+    """
 
     severity: Severity
     automation_id: str
@@ -71,19 +94,37 @@ class ValidationIssue:
     issue_type: IssueType | None = None
     confidence: str = "high"
     suggestion: str | None = None
-    valid_states: list[str] = field(default_factory=lambda: list[str]())
+    valid_states: Sequence[str] = EMPTY_VALID_STATES
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+    _dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _suppression_key: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Intern repeated identifier strings."""
+        object.__setattr__(self, "automation_id", _intern(self.automation_id))
+        object.__setattr__(self, "location", _intern(self.location))
+        if not self.valid_states:
+            object.__setattr__(self, "valid_states", EMPTY_VALID_STATES)
 
     def __hash__(self) -> int:
         """Hash for deduplication."""
-        return hash(
-            (
-                self.automation_id,
-                self.issue_type,
-                self.entity_id,
-                self.location,
-                self.message,
+        cached = self._hash
+        if cached is None:
+            cached = hash(
+                (
+                    self.automation_id,
+                    self.issue_type,
+                    self.entity_id,
+                    self.location,
+                    self.message,
+                )
             )
-        )
+            object.__setattr__(self, "_hash", cached)
+        return cached
 
     def __eq__(self, other: object) -> bool:
         """Equality based on key fields for deduplication."""
@@ -98,27 +139,38 @@ class ValidationIssue:
         )
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to serializable dictionary."""
-        return {
-            "issue_type": self.issue_type.value if self.issue_type else None,
-            "severity": self.severity.name.lower(),
-            "confidence": self.confidence,
-            "automation_id": self.automation_id,
-            "automation_name": self.automation_name,
-            "entity_id": self.entity_id,
-            "location": self.location,
-            "message": self.message,
-            "suggestion": self.suggestion,
-            "valid_states": self.valid_states,
-        }
+        """Convert to serializable dictionary.
+
+        The payload is built once; each call returns a shallow copy.
+        """
+        cached = self._dict
+        if cached is None:
+            cached = {
+                "issue_type": self.issue_type.value if self.issue_type else None,
+                "severity": self.severity.name.lower(),
+                "confidence": self.confidence,
+                "automation_id": self.automation_id,
+                "automation_name": self.automation_name,
+                "entity_id": self.entity_id,
+                "location": self.location,
+                "message": self.message,
+                "suggestion": self.suggestion,
+                "valid_states": list(self.valid_states),
+            }
+            object.__setattr__(self, "_dict", cached)
+        return dict(cached)
 
     def get_suppression_key(self) -> str:
         """Generate a unique key for suppressing this issue."""
-        issue_type = self.issue_type.value if self.issue_type else "unknown"
-        return f"{self.automation_id}:{self.entity_id}:{issue_type}"
+        cached = self._suppression_key
+        if cached is None:
+            issue_type = self.issue_type.value if self.issue_type else "unknown"
+            cached = f"{self.automation_id}:{self.entity_id}:{issue_type}"
+            object.__setattr__(self, "_suppression_key", cached)
+        return cached
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceCall:
     """A service call found in an automation action."""
 
@@ -130,6 +182,11 @@ class ServiceCall:
     data: dict[str, Any] | str | None = None
     is_template: bool = False
 
+    def __post_init__(self) -> None:
+        """Intern repeated identifier strings."""
+        object.__setattr__(self, "automation_id", _intern(self.automation_id))
+        object.__setattr__(self, "location", _intern(self.location))
+
 
 # Validation group definitions: maps group ID to label and member IssueTypes.
 # All IssueType enum members must appear in exactly one group.
@@ -0,0 +1,236 @@
+"""Incremental per-day timing summaries for overdue prediction."""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+
+# Relative error of gap quantiles read from the sketch
+DEFAULT_GAP_SKETCH_ACCURACY = 0.02
+
+# Gaps shorter than this (days) share the lowest sketch bucket
+_MIN_GAP_DAYS = 1e-9
+
+
+class GapSketch:
+    """Log-bucketed histogram of positive values with bounded relative error.
+
+    A value lands in bucket ``ceil(log_gamma(value))``, so every quantile is
+    read back within ``accuracy`` of the true value. Buckets only hold
+    counts, which makes the sketch cheap to keep and lets values be removed
+    again when they leave the baseline window.
+    """
+
+    __slots__ = ("_counts", "_gamma", "_log_gamma", "accuracy", "count")
+
+    def __init__(self, accuracy: float = DEFAULT_GAP_SKETCH_ACCURACY) -> None:
+        """Initialize an empty sketch."""
+        self.accuracy = accuracy
+        self._gamma = (1.0 + accuracy) / (1.0 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._counts: dict[int, int] = {}
+        self.count = 0
+
+    def key(self, value: float) -> int:
+        """Return the bucket a value falls into."""
+        return math.ceil(math.log(max(_MIN_GAP_DAYS, value)) / self._log_gamma)
+
+    def add(self, key: int, count: int = 1) -> None:
+        """Add ``count`` values to a bucket."""
+        self._counts[key] = self._counts.get(key, 0) + count
+        self.count += count
+
+    def discard(self, key: int, count: int = 1) -> None:
+        """Remove up to ``count`` values from a bucket."""
+        current = self._counts.get(key, 0)
+        removed = min(current, count)
+        if current - removed > 0:
+            self._counts[key] = current - removed
+        else:
+            self._counts.pop(key, None)
+        self.count -= removed
+
+    def quantile(self, quantile: float) -> float | None:
+        """Return the approximate value at ``quantile``, or None when empty."""
+        if self.count <= 0:
+            return None
+        rank = min(1.0, max(0.0, float(quantile))) * float(self.count - 1)
+        seen = 0
+        for key in sorted(self._counts):
+            seen += self._counts[key]
+            if seen > rank:
+                # Midpoint of the bucket in relative terms
+                return 2.0 * self._gamma**key / (self._gamma + 1.0)
+        return None
+
+
+@dataclass(slots=True)
+class _DaySummary:
+    first_minute: float
+    gaps: dict[int, int] = field(default_factory=dict)
+    # Bucket of the gap from the previous day's last trigger, if any
+    incoming: int | None = None
+
+
+class OverdueHistory:
+    """Closed-day timing summaries of one automation over the baseline window.
+
+    Each calendar day (UTC) is folded in once, after it is over: its first
+    trigger minute is inserted into a sorted per-weekday list and the gaps
+    between triggers go into a :class:`GapSketch`. Days that drop out of the
+    window are subtracted again. A scan therefore only touches the days
+    that closed since the previous one instead of re-sorting and
+    re-bucketing the full history.
+
+    First-trigger lists hold at most one value per week of baseline, so
+    they are kept exact; only the gaps, which grow with trigger volume, are
+    sketched.
+    """
+
+    __slots__ = ("_days", "_first_minutes", "_gaps", "_last_epoch", "closed_through")
+
+    def __init__(self, *, gap_accuracy: float = DEFAULT_GAP_SKETCH_ACCURACY) -> None:
+        """Initialize an empty history."""
+        self.closed_through: date | None = None
+        self._last_epoch: float | None = None
+        # Ordered oldest first, since days are only ever folded in order.
+        self._days: dict[date, _DaySummary] = {}
+        self._first_minutes: list[list[float]] = [[] for _ in range(7)]
+        self._gaps = GapSketch(gap_accuracy)
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def catch_up(
+        self, events: list[datetime], *, today: date, window_start: date
+    ) -> bool:
+        """Fold days closed since the last call and drop days before the window.
+
+        ``events`` must be sorted. Returns True when the summaries changed.
+        """
+        changed = False
+        last_closed = today - timedelta(days=1)
+        if self.closed_through is None or self.closed_through < last_closed:
+            first_open = window_start
+            if self.closed_through is not None:
+                first_open = max(first_open, self.closed_through + timedelta(days=1))
+            start = bisect_left(events, datetime.combine(first_open, time(), UTC))
+            end = bisect_left(events, datetime.combine(today, time(), UTC))
+            day_events: list[datetime] = []
+            for ts in events[start:end]:
+                if day_events and ts.date() != day_events[0].date():
+                    self._fold_day(day_events)
+                    day_events = []
+                day_events.append(ts)
+            if day_events:
+                self._fold_day(day_events)
+            self.closed_through = last_closed
+            changed = True
+        return self._evict_before(window_start) or changed
+
+    def _fold_day(self, day_events: list[datetime]) -> None:
+        first = day_events[0]
+        summary = _DaySummary(
+            first_minute=float(first.hour * 60 + first.minute + (first.second / 60.0))
+        )
+        previous = self._last_epoch
+        for ts in day_events:
+            epoch = ts.timestamp()
+            if previous is not None:
+                key = self._gaps.key((epoch - previous) / 86400.0)
+                self._gaps.add(key)
+                if ts is first:
+                    summary.incoming = key
+                else:
+                    summary.gaps[key] = summary.gaps.get(key, 0) + 1
+            previous = epoch
+        self._last_epoch = previous
+        self._add_day(first.date(), summary)
+
+    def _add_day(self, day: date, summary: _DaySummary) -> None:
+        self._days[day] = summary
+        insort(self._first_minutes[day.weekday()], summary.first_minute)
+
+    def _evict_before(self, window_start: date) -> bool:
+        changed = False
+        while self._days:
+            day = next(iter(self._days))
+            if day >= window_start:
+                break
+            summary = self._days.pop(day)
+            minutes = self._first_minutes[day.weekday()]
+            index = bisect_left(minutes, summary.first_minute)
+            if index < len(minutes):
+                del minutes[index]
+            for key, count in summary.gaps.items():
+                self._gaps.discard(key, count)
+            if summary.incoming is not None:
+                self._gaps.discard(summary.incoming)
+            changed = True
+        # A gap reaching back before the window is not part of it.
+        if self._days:
+            oldest = self._days[next(iter(self._days))]
+            if oldest.incoming is not None:
+                self._gaps.discard(oldest.incoming)
+                oldest.incoming = None
+                changed = True
+        return changed
+
+    def first_trigger_minutes(self, weekday: int) -> list[float]:
+        """Return first-trigger minutes of past days on ``weekday``, sorted."""
+        return list(self._first_minutes[weekday])
+
+    def gap_quantile(self, quantile: float) -> float | None:
+        """Return the approximate gap in days between consecutive triggers."""
+        return self._gaps.quantile(quantile)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable form of the summaries."""
+        return {
+            "gap_accuracy": self._gaps.accuracy,
+            "closed_through": (
+                self.closed_through.isoformat() if self.closed_through else None
+            ),
+            "last_epoch": self._last_epoch,
+            "days": [
+                [
+                    day.isoformat(),
+                    summary.first_minute,
+                    summary.incoming,
+                    [[key, count] for key, count in summary.gaps.items()],
+                ]
+                for day, summary in self._days.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> OverdueHistory:
+        """Rebuild summaries from :meth:`as_dict` output.
+
+        Raises ValueError when the data was written with another sketch
+        accuracy, since its bucket keys would not line up.
+        """
+        history = cls()
+        if float(data["gap_accuracy"]) != history._gaps.accuracy:
+            raise ValueError("Overdue history uses a different gap sketch accuracy")
+        closed_through = data.get("closed_through")
+        history.closed_through = (
+            date.fromisoformat(closed_through) if closed_through else None
+        )
+        last_epoch = data.get("last_epoch")
+        history._last_epoch = float(last_epoch) if last_epoch is not None else None
+        for raw_day, first_minute, incoming, gaps in sorted(data["days"]):
+            summary = _DaySummary(
+                first_minute=float(first_minute),
+                gaps={int(key): int(count) for key, count in gaps},
+                incoming=int(incoming) if incoming is not None else None,
+            )
+            for key, count in summary.gaps.items():
+                history._gaps.add(key, count)
+            if summary.incoming is not None:
+                history._gaps.add(summary.incoming)
+            history._add_day(date.fromisoformat(raw_day), summary)
+        return history
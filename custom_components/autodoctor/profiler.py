@@ -0,0 +1,238 @@
+"""Opt-in span recorder for profiling validation runs."""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+DEFAULT_PROFILE_TOP_N = 10
+
+# Run kinds; each keeps its own last run
+VALIDATION_RUN = "validation"
+RUNTIME_BATCH_RUN = "runtime_batch"
+
+
+@dataclass
+class _StageStats:
+    """Accumulated timings for one stage."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+        }
+
+
+class _NullSpan:
+    """Span used while profiling is disabled; does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+@dataclass
+class _Run:
+    """Timings collected by one in-progress run."""
+
+    profiler: ValidationProfiler
+    kind: str
+    started_at: datetime
+    start: float
+    stages: dict[str, _StageStats] = field(default_factory=dict)
+    automations: dict[str, dict[str, _StageStats]] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+
+
+# The run that spans and counters in the current task report to. Each asyncio
+# task has its own copy, so a full scan and a runtime batch interleaving on
+# the event loop do not mix their numbers.
+_ACTIVE_RUN: ContextVar[_Run | None] = ContextVar(
+    "autodoctor_profiler_run", default=None
+)
+
+
+class _Span:
+    """Times one stage and reports it back to the profiler on exit."""
+
+    __slots__ = ("_automation_id", "_profiler", "_stage", "_start")
+
+    def __init__(
+        self, profiler: ValidationProfiler, stage: str, automation_id: str | None
+    ) -> None:
+        self._profiler = profiler
+        self._stage = stage
+        self._automation_id = automation_id
+        self._start = 0.0
+
+    def __enter__(self) -> _Span:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._profiler.record(
+            self._stage,
+            time.perf_counter() - self._start,
+            automation_id=self._automation_id,
+        )
+
+
+class ValidationProfiler:
+    """Collects stage timings and counters for the current validation run.
+
+    Disabled profilers hand out a shared no-op span and ignore counters, so
+    instrumented code paths cost one attribute check when profiling is off.
+    Timings only count toward a run started in the same task; work outside a
+    run (single-automation revalidation, for instance) is not recorded.
+    Completed runs are kept per kind as the "last run" for the diagnostics
+    surfaces.
+    """
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        """Initialize the profiler."""
+        self.enabled = enabled
+        self._last_runs: dict[str, dict[str, Any]] = {}
+
+    def _active_run(self) -> _Run | None:
+        run = _ACTIVE_RUN.get()
+        if run is None or run.profiler is not self:
+            return None
+        return run
+
+    def span(self, stage: str, automation_id: str | None = None) -> _Span | _NullSpan:
+        """Return a context manager that times ``stage``."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, automation_id)
+
+    def record(
+        self, stage: str, elapsed: float, *, automation_id: str | None = None
+    ) -> None:
+        """Record an already-measured duration for ``stage``."""
+        if not self.enabled or (run := self._active_run()) is None:
+            return
+        stats = run.stages.get(stage)
+        if stats is None:
+            stats = run.stages[stage] = _StageStats()
+        stats.add(elapsed)
+        if automation_id:
+            per_automation = run.automations.setdefault(automation_id, {})
+            automation_stats = per_automation.get(stage)
+            if automation_stats is None:
+                automation_stats = per_automation[stage] = _StageStats()
+            automation_stats.add(elapsed)
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """Increment a named counter (cache hits, suggestion calls, ...)."""
+        if not self.enabled or (run := self._active_run()) is None:
+            return
+        run.counters[counter] = run.counters.get(counter, 0) + amount
+
+    def start_run(self, kind: str = VALIDATION_RUN) -> None:
+        """Start timing a new run in the current task.
+
+        An unfinished run of this task is discarded.
+        """
+        if not self.enabled:
+            return
+        _ACTIVE_RUN.set(
+            _Run(
+                profiler=self,
+                kind=kind,
+                started_at=datetime.now(UTC),
+                start=time.perf_counter(),
+            )
+        )
+
+    def finish_run(self, automation_count: int) -> None:
+        """Close the current task's run and keep it as the last run of its kind."""
+        if not self.enabled or (run := self._active_run()) is None:
+            return
+        _ACTIVE_RUN.set(None)
+        self._last_runs[run.kind] = {
+            "started_at": run.started_at.isoformat(),
+            "duration_ms": round((time.perf_counter() - run.start) * 1000, 3),
+            "automation_count": automation_count,
+            "stages": run.stages,
+            "automations": run.automations,
+            "counters": run.counters,
+        }
+
+    def get_last_run(self, top_n: int = DEFAULT_PROFILE_TOP_N) -> dict[str, Any]:
+        """Return the slowest stages and automations from the last runs.
+
+        ``last_run`` covers the last full validation and
+        ``last_runtime_batch`` the last staggered runtime-health batch.
+        """
+        top_n = max(1, int(top_n))
+        return {
+            "enabled": self.enabled,
+            "last_run": self._summarize(self._last_runs.get(VALIDATION_RUN), top_n),
+            "last_runtime_batch": self._summarize(
+                self._last_runs.get(RUNTIME_BATCH_RUN), top_n
+            ),
+        }
+
+    @staticmethod
+    def _summarize(last: dict[str, Any] | None, top_n: int) -> dict[str, Any] | None:
+        if last is None:
+            return None
+
+        stages: dict[str, _StageStats] = last["stages"]
+        automations: dict[str, dict[str, _StageStats]] = last["automations"]
+        slowest_stages = sorted(
+            stages.items(), key=lambda item: item[1].total, reverse=True
+        )[:top_n]
+        automation_totals = sorted(
+            (
+                (automation_id, sum(s.total for s in per_stage.values()), per_stage)
+                for automation_id, per_stage in automations.items()
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:top_n]
+        return {
+            "started_at": last["started_at"],
+            "duration_ms": last["duration_ms"],
+            "automation_count": last["automation_count"],
+            "slowest_stages": [
+                {"stage": stage, **stats.to_dict()} for stage, stats in slowest_stages
+            ],
+            "slowest_automations": [
+                {
+                    "automation_id": automation_id,
+                    "total_ms": round(total * 1000, 3),
+                    "stages": {
+                        stage: stats.to_dict() for stage, stats in per_stage.items()
+                    },
+                }
+                for automation_id, total, per_stage in automation_totals
+            ],
+            "counters": dict(sorted(last["counters"].items())),
+        }
+
+
+# Shared instance for components constructed without a profiler.
+DISABLED_PROFILER = ValidationProfiler(enabled=False)
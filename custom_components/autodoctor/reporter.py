@@ -117,51 +117,87 @@ class IssueReporter:
 
         # Create one repair per automation
         for automation_id, automation_issues in issues_by_automation.items():
-            issue_id = self._automation_issue_id(automation_id)
-            current_issue_ids.add(issue_id)
+            current_issue_ids.add(
+                self._create_automation_repair(automation_id, automation_issues)
+            )
 
-            automation_name = automation_issues[0].automation_name
-            issue_count = len(automation_issues)
+        # Clear resolved issues before updating active set
+        self._clear_resolved_issues(current_issue_ids)
+        # Atomic assignment - sensors read this set, so assign complete set at once
+        self._active_issues = frozenset(current_issue_ids)
 
-            # Use highest severity among all issues for this automation
-            has_error = any(i.severity == Severity.ERROR for i in automation_issues)
-            severity = Severity.ERROR if has_error else Severity.WARNING
+    async def async_report_automation_issues(
+        self, automation_id: str, issues: list[ValidationIssue]
+    ) -> None:
+        """Report the issues of a single automation, leaving other repairs intact.
 
-            # Format all issues for this automation
-            issues_text = self._format_issues_for_repair(automation_issues)
+        Used after single-automation revalidation so only the repair entry of
+        the revalidated automation is created, updated or deleted.
+        """
+        if not has_issue_registry:
+            _LOGGER.warning(
+                "Issue registry unavailable; cannot update Repairs entry for %s",
+                automation_id,
+            )
+            return
 
-            # Note: ir.async_create_issue is synchronous despite the name
-            _LOGGER.debug(
-                "Creating repair issue: domain=%s, issue_id=%s, severity=%s, automation=%s",
+        if issues:
+            issue_id = self._create_automation_repair(automation_id, issues)
+            # Atomic assignment - sensors read this set, so assign complete set at once
+            self._active_issues = self._active_issues | {issue_id}
+            return
+
+        issue_id = self._automation_issue_id(automation_id)
+        try:
+            # Note: ir.async_delete_issue is synchronous despite the name
+            ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+        except Exception as err:
+            _LOGGER.warning("Failed to delete issue %s: %s", issue_id, err)
+        self._active_issues = self._active_issues - {issue_id}
+
+    def _create_automation_repair(
+        self, automation_id: str, automation_issues: list[ValidationIssue]
+    ) -> str:
+        """Create or update the repair entry for one automation and return its id."""
+        issue_id = self._automation_issue_id(automation_id)
+        automation_name = automation_issues[0].automation_name
+        issue_count = len(automation_issues)
+
+        # Use highest severity among all issues for this automation
+        has_error = any(i.severity == Severity.ERROR for i in automation_issues)
+        severity = Severity.ERROR if has_error else Severity.WARNING
+
+        # Format all issues for this automation
+        issues_text = self._format_issues_for_repair(automation_issues)
+
+        # Note: ir.async_create_issue is synchronous despite the name
+        _LOGGER.debug(
+            "Creating repair issue: domain=%s, issue_id=%s, severity=%s, automation=%s",
+            DOMAIN,
+            issue_id,
+            severity,
+            automation_name,
+        )
+        try:
+            ir.async_create_issue(
+                self.hass,
                 DOMAIN,
                 issue_id,
-                severity,
-                automation_name,
+                is_fixable=False,
+                is_persistent=True,
+                issue_domain=DOMAIN,
+                severity=self._severity_to_repair(severity),
+                translation_key="automation_issues",
+                translation_placeholders={
+                    "automation": automation_name,
+                    "count": str(issue_count),
+                    "issues": issues_text,
+                },
             )
-            try:
-                ir.async_create_issue(
-                    self.hass,
-                    DOMAIN,
-                    issue_id,
-                    is_fixable=False,
-                    is_persistent=True,
-                    issue_domain=DOMAIN,
-                    severity=self._severity_to_repair(severity),
-                    translation_key="automation_issues",
-                    translation_placeholders={
-                        "automation": automation_name,
-                        "count": str(issue_count),
-                        "issues": issues_text,
-                    },
-                )
-                _LOGGER.debug("Repair issue created: %s", issue_id)
-            except Exception as err:
-                _LOGGER.error("Failed to create repair issue %s: %s", issue_id, err)
-
-        # Clear resolved issues before updating active set
-        self._clear_resolved_issues(current_issue_ids)
-        # Atomic assignment - sensors read this set, so assign complete set at once
-        self._active_issues = frozenset(current_issue_ids)
+            _LOGGER.debug("Repair issue created: %s", issue_id)
+        except Exception as err:
+            _LOGGER.error("Failed to create repair issue %s: %s", issue_id, err)
+        return issue_id
 
     def _clear_resolved_issues(self, current_ids: set[str]) -> None:
         """Clear issues that have been resolved."""
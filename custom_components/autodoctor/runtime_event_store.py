@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import json
+import math
+import queue
 import sqlite3
 import threading
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -20,6 +24,26 @@ _BUCKET_MORNING_START_HOUR = 5
 _BUCKET_AFTERNOON_START_HOUR = 12
 _BUCKET_EVENING_START_HOUR = 17
 
+# Stay well below SQLite's default limit of 999 bound parameters per query.
+_SCORE_QUERY_CHUNK_SIZE = 500
+
+# Score-history compaction rewrites at most this many rows per transaction so
+# live trigger writes never wait long on the store lock.
+_SCORE_COMPACTION_CHUNK_SIZE = 1000
+# Trigger rows deleted per trim transaction.
+_TRIM_CHUNK_SIZE = 1000
+# Raw trigger rows rolled into hourly counts per compaction transaction.
+_TRIGGER_COMPACTION_CHUNK_SIZE = 1000
+_HOUR_SECONDS = 3600
+# Free pages returned to the filesystem per incremental vacuum pass.
+_INCREMENTAL_VACUUM_PAGES = 2000
+
+# Read-only connections shared by query methods. WAL lets them read while the
+# writer connection commits, so scans do not block live trigger writes.
+_READ_POOL_SIZE = 4
+
+RUNTIME_EVENT_STORE_SCHEMA_VERSION = 3
+
 
 def classify_time_bucket(timestamp: datetime) -> str:
     """Map timestamp into weekday/weekend x daypart bucket."""
@@ -47,15 +71,47 @@ class ScoreHistoryRow:
     features: dict[str, float]
 
 
+@dataclass(frozen=True)
+class HourlyTriggerCount:
+    """Triggers of one automation rolled up into one hour by compaction.
+
+    Only the count and the first and last trigger time of the hour are kept.
+    """
+
+    hour_start: float
+    count: int
+    first_at: float
+    last_at: float
+
+
 class RuntimeEventStore:
-    """Local SQLite store for runtime automation events and score history."""
+    """Local SQLite store for runtime automation events and score history.
+
+    Writes go through one connection serialized by ``_lock``. Queries borrow
+    a read-only connection from a small pool and never take ``_lock``.
+
+    From schema v3 trigger history is tiered: recent triggers stay one row
+    each in ``trigger_events`` and ``compact_trigger_events`` rolls older
+    ones into per-automation hourly counts. Count queries read both tiers.
+    ``get_events`` only returns the raw tier, because the individual times
+    of rolled-up triggers are gone; ``get_rolled_up_hours`` returns the rest.
+    """
 
     def __init__(self, db_path: str | Path) -> None:
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
         self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._read_pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._read_slots = threading.BoundedSemaphore(_READ_POOL_SIZE)
+        self._read_conns: list[sqlite3.Connection] = []
+        self._trace_callback: Callable[[str], None] | None = None
+        # Set by ensure_schema once trigger_hourly_counts exists.
+        self._hourly_tier = False
         with self._lock:
+            # Only takes effect on a new database file; older files keep
+            # reusing freed pages internally instead of shrinking.
+            self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
             self._conn.execute("PRAGMA journal_mode=WAL")
             self._conn.execute("PRAGMA synchronous=NORMAL")
             self._conn.execute("PRAGMA foreign_keys=ON")
@@ -74,6 +130,7 @@ class RuntimeEventStore:
                 """
             )
             current_version = int(self._get_metadata_unlocked("schema_version") or "0")
+            self._hourly_tier = current_version >= 3
             if current_version >= desired:
                 return current_version
 
@@ -91,6 +148,15 @@ class RuntimeEventStore:
                         self._apply_schema_v1()
                         current_version = 1
                         continue
+                    if next_version == 2:
+                        self._apply_schema_v2()
+                        current_version = 2
+                        continue
+                    if next_version == 3:
+                        self._apply_schema_v3()
+                        current_version = 3
+                        self._hourly_tier = True
+                        continue
                     raise RuntimeError(f"Unsupported target schema version: {desired}")
 
                 self._set_metadata_unlocked("schema_version", str(current_version))
@@ -112,6 +178,20 @@ class RuntimeEventStore:
         with self._lock:
             return self._get_metadata_unlocked(key)
 
+    def get_metadata_batch(self, keys: list[str]) -> dict[str, str]:
+        """Read metadata values for many keys; missing keys are left out."""
+        values: dict[str, str] = {}
+        with self._lock:
+            for offset in range(0, len(keys), _SCORE_QUERY_CHUNK_SIZE):
+                chunk = keys[offset : offset + _SCORE_QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM metadata WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                values.update((str(key), str(value)) for key, value in rows)
+        return values
+
     def set_metadata(self, key: str, value: str) -> None:
         """Upsert metadata value for key."""
         with self._lock:
@@ -148,9 +228,38 @@ class RuntimeEventStore:
         self._conn.commit()
 
     def close(self) -> None:
-        """Close the SQLite connection."""
+        """Close the writer connection and any pooled read connections."""
         with self._lock:
             self._conn.close()
+        for conn in self._read_conns:
+            conn.close()
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection, opening one if the pool is empty."""
+        with self._read_slots:
+            try:
+                conn = self._read_pool.get_nowait()
+            except queue.Empty:
+                conn = sqlite3.connect(
+                    f"{self._db_path.resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                )
+                conn.set_trace_callback(self._trace_callback)
+                self._read_conns.append(conn)
+            try:
+                yield conn
+            finally:
+                self._read_pool.put(conn)
+
+    def set_trace_callback(self, callback: Callable[[str], None] | None) -> None:
+        """Install a statement trace callback on the writer and all readers."""
+        self._trace_callback = callback
+        with self._lock:
+            self._conn.set_trace_callback(callback)
+        for conn in self._read_conns:
+            conn.set_trace_callback(callback)
 
     def record_trigger(self, automation_id: str, triggered_at: datetime) -> None:
         """Record a single trigger event, deduplicated by primary key."""
@@ -208,106 +317,307 @@ class RuntimeEventStore:
         after: datetime | None = None,
         before: datetime | None = None,
     ) -> list[float]:
-        """Return event epochs for automation within optional bounds."""
+        """Return raw event epochs for automation within optional bounds.
+
+        Triggers in rolled-up hours are not included; read them with
+        ``get_rolled_up_hours``.
+        """
         if not automation_id:
             return []
+        after_epoch = self._to_utc(after).timestamp() if after is not None else None
+        before_epoch = self._to_utc(before).timestamp() if before is not None else None
         query = "SELECT triggered_at FROM trigger_events WHERE automation_id = ?"
         params: list[object] = [automation_id]
-        if after is not None:
+        if after_epoch is not None:
             query += " AND triggered_at >= ?"
-            params.append(self._to_utc(after).timestamp())
-        if before is not None:
+            params.append(after_epoch)
+        if before_epoch is not None:
             query += " AND triggered_at <= ?"
-            params.append(self._to_utc(before).timestamp())
+            params.append(before_epoch)
         query += " ORDER BY triggered_at ASC"
-        with self._lock:
-            rows = self._conn.execute(query, params).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(query, params).fetchall()
         return [float(row[0]) for row in rows]
 
+    def get_rolled_up_hours(
+        self,
+        automation_id: str,
+        after: datetime | None = None,
+        before: datetime | None = None,
+    ) -> list[HourlyTriggerCount]:
+        """Return rolled-up hours with a trigger inside the bounds, oldest first.
+
+        An hour that straddles a bound is returned whole.
+        """
+        if not automation_id or not self._hourly_tier:
+            return []
+        query = (
+            "SELECT hour_start, trigger_count, first_at, last_at "
+            "FROM trigger_hourly_counts WHERE automation_id = ?"
+        )
+        params: list[object] = [automation_id]
+        # The hour_start terms keep the lookup on the primary key range.
+        if after is not None:
+            after_epoch = self._to_utc(after).timestamp()
+            query += " AND hour_start > ? AND last_at >= ?"
+            params.extend((after_epoch - _HOUR_SECONDS, after_epoch))
+        if before is not None:
+            before_epoch = self._to_utc(before).timestamp()
+            query += " AND hour_start <= ? AND first_at <= ?"
+            params.extend((before_epoch, before_epoch))
+        query += " ORDER BY hour_start ASC"
+        with self._reader() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            HourlyTriggerCount(
+                hour_start=float(row[0]),
+                count=int(row[1]),
+                first_at=float(row[2]),
+                last_at=float(row[3]),
+            )
+            for row in rows
+        ]
+
     def get_daily_counts(
         self,
         automation_id: str,
         after: datetime | None = None,
         before: datetime | None = None,
     ) -> dict[str, int]:
-        """Return day_date -> count for one automation."""
+        """Return day_date -> count for one automation.
+
+        Rolled-up hours inside the bounds are counted whole.
+        """
         if not automation_id:
             return {}
         query = (
             "SELECT date(triggered_at, 'unixepoch') AS day_date, COUNT(*) "
             "FROM trigger_events WHERE automation_id = ?"
         )
+        hourly_query = (
+            "SELECT date(hour_start, 'unixepoch') AS day_date, SUM(trigger_count) "
+            "FROM trigger_hourly_counts WHERE automation_id = ?"
+        )
         params: list[object] = [automation_id]
         if after is not None:
             query += " AND triggered_at >= ?"
+            hourly_query += " AND last_at >= ?"
             params.append(self._to_utc(after).timestamp())
         if before is not None:
             query += " AND triggered_at <= ?"
+            hourly_query += " AND first_at <= ?"
             params.append(self._to_utc(before).timestamp())
-        query += " GROUP BY day_date ORDER BY day_date ASC"
-        with self._lock:
-            rows = self._conn.execute(query, params).fetchall()
-        return {str(row[0]): int(row[1]) for row in rows}
+        query += " GROUP BY day_date"
+        hourly_query += " GROUP BY day_date"
+        counts: dict[str, int] = defaultdict(int)
+        with self._reader() as conn:
+            rows = conn.execute(query, params).fetchall()
+            if self._hourly_tier:
+                rows += conn.execute(hourly_query, params).fetchall()
+        for day_date, count in rows:
+            counts[str(day_date)] += int(count)
+        return dict(sorted(counts.items()))
 
     def get_last_trigger(self, automation_id: str) -> float | None:
         """Return epoch timestamp of most recent trigger for automation."""
         if not automation_id:
             return None
-        with self._lock:
-            row = self._conn.execute(
+        with self._reader() as conn:
+            rows = conn.execute(
                 "SELECT MAX(triggered_at) FROM trigger_events WHERE automation_id = ?",
                 (automation_id,),
-            ).fetchone()
-        if row is None or row[0] is None:
-            return None
-        return float(row[0])
+            ).fetchall()
+            if self._hourly_tier:
+                rows += conn.execute(
+                    """
+                    SELECT MAX(last_at) FROM trigger_hourly_counts
+                    WHERE automation_id = ?
+                    """,
+                    (automation_id,),
+                ).fetchall()
+        latest = [float(row[0]) for row in rows if row[0] is not None]
+        return max(latest) if latest else None
 
     def get_automation_ids(self) -> list[str]:
         """Return automation IDs with at least one event."""
-        with self._lock:
-            rows = self._conn.execute(
-                "SELECT DISTINCT automation_id FROM trigger_events ORDER BY automation_id"
-            ).fetchall()
+        query = "SELECT DISTINCT automation_id FROM trigger_events"
+        if self._hourly_tier:
+            query += " UNION SELECT DISTINCT automation_id FROM trigger_hourly_counts"
+        with self._reader() as conn:
+            rows = conn.execute(f"{query} ORDER BY automation_id").fetchall()
         return [str(row[0]) for row in rows]
 
     def count_events(self, automation_id: str) -> int:
-        """Return total trigger row count for one automation."""
+        """Return total trigger count for one automation across both tiers."""
         if not automation_id:
             return 0
-        with self._lock:
-            row = self._conn.execute(
+        with self._reader() as conn:
+            rows = conn.execute(
                 "SELECT COUNT(*) FROM trigger_events WHERE automation_id = ?",
                 (automation_id,),
-            ).fetchone()
-        if row is None:
-            return 0
-        return int(row[0])
+            ).fetchall()
+            if self._hourly_tier:
+                rows += conn.execute(
+                    """
+                    SELECT SUM(trigger_count) FROM trigger_hourly_counts
+                    WHERE automation_id = ?
+                    """,
+                    (automation_id,),
+                ).fetchall()
+        return sum(int(row[0]) for row in rows if row[0] is not None)
 
     def has_data(self, automation_id: str) -> bool:
         """Check whether automation has at least one trigger event."""
         if not automation_id:
             return False
-        with self._lock:
-            row = self._conn.execute(
+        with self._reader() as conn:
+            row = conn.execute(
                 "SELECT 1 FROM trigger_events WHERE automation_id = ? LIMIT 1",
                 (automation_id,),
             ).fetchone()
+            if row is None and self._hourly_tier:
+                row = conn.execute(
+                    "SELECT 1 FROM trigger_hourly_counts WHERE automation_id = ? LIMIT 1",
+                    (automation_id,),
+                ).fetchone()
         return row is not None
 
     def trim(self, retention_days: int = 90, now: datetime | None = None) -> int:
-        """Delete trigger rows older than retention cutoff and return deleted count."""
+        """Delete trigger rows older than retention cutoff and return deleted count.
+
+        Rows are deleted oldest first in chunks of ``_TRIM_CHUNK_SIZE`` found
+        through ``idx_trigger_events_time``. Each chunk is its own transaction,
+        so live trigger writes only wait for one chunk. Progress is kept in
+        the ``trim:*`` metadata keys. Rolled-up hours that ended before the
+        cutoff are dropped in one statement and counted as one row each.
+        """
         retention = max(1, int(retention_days))
         current = self._to_utc(now or datetime.now(UTC))
         cutoff = (current.timestamp()) - float(retention * 24 * 60 * 60)
         with self._lock:
-            before = self._conn.total_changes
-            self._conn.execute(
-                "DELETE FROM trigger_events WHERE triggered_at < ?",
-                (cutoff,),
-            )
-            self._conn.commit()
-            deleted = self._conn.total_changes - before
-        return max(0, int(deleted))
+            self._set_metadata_unlocked("trim:state", "running")
+            self._set_metadata_unlocked("trim:cutoff", str(cutoff))
+            self._set_metadata_unlocked("trim:deleted", "0")
+
+        deleted = 0
+        while True:
+            with self._lock:
+                row = self._conn.execute(
+                    """
+                    SELECT triggered_at FROM trigger_events
+                    WHERE triggered_at < ?
+                    ORDER BY triggered_at
+                    LIMIT 1 OFFSET ?
+                    """,
+                    (cutoff, _TRIM_CHUNK_SIZE - 1),
+                ).fetchone()
+                chunk_end = (
+                    cutoff if row is None else math.nextafter(float(row[0]), math.inf)
+                )
+                cursor = self._conn.execute(
+                    "DELETE FROM trigger_events WHERE triggered_at < ?",
+                    (chunk_end,),
+                )
+                deleted += max(0, cursor.rowcount)
+                # Commits the delete together with its progress marker.
+                self._set_metadata_unlocked("trim:deleted", str(deleted))
+            if chunk_end >= cutoff or cursor.rowcount <= 0:
+                break
+
+        with self._lock:
+            if self._hourly_tier:
+                cursor = self._conn.execute(
+                    "DELETE FROM trigger_hourly_counts WHERE hour_start <= ?",
+                    (cutoff - _HOUR_SECONDS,),
+                )
+                deleted += max(0, cursor.rowcount)
+                self._set_metadata_unlocked("trim:deleted", str(deleted))
+            self._set_metadata_unlocked("trim:state", "idle")
+            self._set_metadata_unlocked("trim:updated_at", current.isoformat())
+        return deleted
+
+    def compact_trigger_events(
+        self, *, raw_retention_days: int, now: datetime | None = None
+    ) -> int:
+        """Roll raw trigger rows older than the raw window into hourly counts.
+
+        The cutoff is aligned to the start of an hour. Rows are folded oldest
+        first in chunks of ``_TRIGGER_COMPACTION_CHUNK_SIZE``; each chunk adds
+        its counts to ``trigger_hourly_counts`` and deletes the raw rows in
+        one transaction, so an interrupted run loses nothing and the next one
+        carries on. Returns the number of raw rows rolled up; does nothing
+        before schema v3.
+        """
+        if not self._hourly_tier:
+            return 0
+        current = self._to_utc(now or datetime.now(UTC)).timestamp()
+        cutoff = current - float(max(1, int(raw_retention_days)) * 24 * 60 * 60)
+        cutoff -= cutoff % _HOUR_SECONDS
+
+        compacted = 0
+        while True:
+            with self._lock:
+                row = self._conn.execute(
+                    """
+                    SELECT triggered_at FROM trigger_events
+                    WHERE triggered_at < ?
+                    ORDER BY triggered_at
+                    LIMIT 1 OFFSET ?
+                    """,
+                    (cutoff, _TRIGGER_COMPACTION_CHUNK_SIZE - 1),
+                ).fetchone()
+                chunk_end = (
+                    cutoff if row is None else math.nextafter(float(row[0]), math.inf)
+                )
+                self._conn.execute(
+                    """
+                    INSERT INTO trigger_hourly_counts
+                        (automation_id, hour_start, trigger_count, first_at, last_at)
+                    SELECT automation_id, hour_start, COUNT(*),
+                        MIN(triggered_at), MAX(triggered_at)
+                    FROM (
+                        SELECT
+                            automation_id,
+                            triggered_at,
+                            CAST(triggered_at / ? AS INTEGER) * ? AS hour_start
+                        FROM trigger_events
+                        WHERE triggered_at < ?
+                    )
+                    WHERE true
+                    GROUP BY automation_id, hour_start
+                    ON CONFLICT(automation_id, hour_start) DO UPDATE SET
+                        trigger_count = trigger_count + excluded.trigger_count,
+                        first_at = MIN(first_at, excluded.first_at),
+                        last_at = MAX(last_at, excluded.last_at)
+                    """,
+                    (_HOUR_SECONDS, _HOUR_SECONDS, chunk_end),
+                )
+                cursor = self._conn.execute(
+                    "DELETE FROM trigger_events WHERE triggered_at < ?",
+                    (chunk_end,),
+                )
+                compacted += max(0, cursor.rowcount)
+                self._conn.commit()
+            if chunk_end >= cutoff or cursor.rowcount <= 0:
+                break
+        return compacted
+
+    def optimize(self) -> None:
+        """Run ``PRAGMA optimize``, which re-analyzes only tables that need it."""
+        with self._lock:
+            self._conn.execute("PRAGMA optimize")
+
+    def checkpoint_wal(self) -> tuple[int, int]:
+        """Run a passive WAL checkpoint; returns (wal frames, frames checkpointed).
+
+        A passive checkpoint copies what it can without waiting on readers or
+        blocking writers, so it is safe to run on every periodic scan.
+        """
+        with self._lock:
+            row = self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+        if row is None:
+            return (0, 0)
+        return (max(0, int(row[1])), max(0, int(row[2])))
 
     def record_score(
         self,
@@ -334,12 +644,39 @@ class RuntimeEventStore:
             )
             self._conn.commit()
 
+    def record_scores_many(self, rows: list[ScoreHistoryRow]) -> int:
+        """Persist several score rows in one transaction. Returns rows written."""
+        params = [
+            (
+                row.automation_id,
+                float(row.scored_at),
+                float(row.score),
+                float(row.ema_score),
+                json.dumps(row.features or {}, separators=(",", ":"), sort_keys=True),
+            )
+            for row in rows
+            if row.automation_id
+        ]
+        if not params:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO score_history
+                    (automation_id, scored_at, score, ema_score, features_json)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                params,
+            )
+            self._conn.commit()
+        return len(params)
+
     def get_last_score(self, automation_id: str) -> ScoreHistoryRow | None:
         """Return the most recent score row for one automation."""
         if not automation_id:
             return None
-        with self._lock:
-            row = self._conn.execute(
+        with self._reader() as conn:
+            row = conn.execute(
                 """
                 SELECT automation_id, scored_at, score, ema_score, features_json
                 FROM score_history
@@ -351,6 +688,39 @@ class RuntimeEventStore:
             ).fetchone()
         if row is None:
             return None
+        return self._score_row_from_db(row)
+
+    def get_last_scores(self, automation_ids: list[str]) -> dict[str, ScoreHistoryRow]:
+        """Return the most recent score row for each automation that has one."""
+        ids = list(dict.fromkeys(aid for aid in automation_ids if aid))
+        result: dict[str, ScoreHistoryRow] = {}
+        for start in range(0, len(ids), _SCORE_QUERY_CHUNK_SIZE):
+            chunk = ids[start : start + _SCORE_QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" for _ in chunk)
+            with self._reader() as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT s.automation_id, s.scored_at, s.score, s.ema_score,
+                        s.features_json
+                    FROM score_history AS s
+                    JOIN (
+                        SELECT automation_id, MAX(scored_at) AS scored_at
+                        FROM score_history
+                        WHERE automation_id IN ({placeholders})
+                        GROUP BY automation_id
+                    ) AS latest
+                        ON s.automation_id = latest.automation_id
+                        AND s.scored_at = latest.scored_at
+                    """,
+                    chunk,
+                ).fetchall()
+            for row in rows:
+                parsed = self._score_row_from_db(row)
+                result[parsed.automation_id] = parsed
+        return result
+
+    @staticmethod
+    def _score_row_from_db(row: tuple[Any, ...]) -> ScoreHistoryRow:
         features_raw: str | None = row[4]
         parsed_obj: object
         try:
@@ -375,6 +745,177 @@ class RuntimeEventStore:
             features=features,
         )
 
+    def compact_score_history(
+        self,
+        *,
+        full_resolution_days: int,
+        features_days: int,
+        now: datetime | None = None,
+    ) -> dict[str, int]:
+        """Downsample old score rows to daily summaries and drop old feature blobs.
+
+        Rows scored before UTC midnight ``full_resolution_days`` ago are folded
+        into ``score_history_daily`` and deleted. Rows older than
+        ``features_days`` keep their scores but lose ``features_json``. The
+        newest row of every automation is left intact so EMA state survives a
+        long pause. Each chunk of rows is its own short transaction, and a
+        bounded incremental vacuum runs at the end.
+        """
+        current = self._to_utc(now or datetime.now(UTC))
+        midnight = current.replace(hour=0, minute=0, second=0, microsecond=0)
+        rollup_cutoff = (
+            midnight - timedelta(days=max(1, int(full_resolution_days)))
+        ).timestamp()
+        features_cutoff = (
+            current - timedelta(days=max(0, int(features_days)))
+        ).timestamp()
+
+        downsampled = 0
+        features_cleared = 0
+        automation_id = ""
+        while True:
+            with self._lock:
+                row = self._conn.execute(
+                    """
+                    SELECT automation_id FROM score_history
+                    WHERE automation_id > ?
+                    ORDER BY automation_id
+                    LIMIT 1
+                    """,
+                    (automation_id,),
+                ).fetchone()
+                if row is None:
+                    break
+                automation_id = str(row[0])
+                latest = self._conn.execute(
+                    "SELECT MAX(scored_at) FROM score_history WHERE automation_id = ?",
+                    (automation_id,),
+                ).fetchone()[0]
+            latest_at = float(latest)
+            downsampled += self._downsample_scores(
+                automation_id, min(rollup_cutoff, latest_at)
+            )
+            features_cleared += self._clear_score_features(
+                automation_id, min(features_cutoff, latest_at)
+            )
+
+        return {
+            "downsampled_rows": downsampled,
+            "features_cleared": features_cleared,
+            "vacuumed_pages": self.incremental_vacuum(),
+        }
+
+    def _score_chunk_end_unlocked(
+        self, automation_id: str, before: float, *, with_features: bool
+    ) -> float:
+        """Return an exclusive upper bound covering at most one chunk of rows."""
+        features_clause = "AND features_json IS NOT NULL" if with_features else ""
+        row = self._conn.execute(
+            f"""
+            SELECT scored_at FROM score_history
+            WHERE automation_id = ? AND scored_at < ? {features_clause}
+            ORDER BY scored_at
+            LIMIT 1 OFFSET ?
+            """,
+            (automation_id, before, _SCORE_COMPACTION_CHUNK_SIZE - 1),
+        ).fetchone()
+        if row is None:
+            return before
+        return math.nextafter(float(row[0]), math.inf)
+
+    def _downsample_scores(self, automation_id: str, before: float) -> int:
+        """Fold one automation's rows before ``before`` into daily summaries."""
+        deleted = 0
+        while True:
+            with self._lock:
+                chunk_end = self._score_chunk_end_unlocked(
+                    automation_id, before, with_features=False
+                )
+                self._conn.execute(
+                    """
+                    INSERT INTO score_history_daily (
+                        automation_id, day_date, sample_count,
+                        min_score, max_score, mean_score,
+                        min_ema_score, max_ema_score, mean_ema_score
+                    )
+                    SELECT
+                        automation_id,
+                        date(scored_at, 'unixepoch') AS day_date,
+                        COUNT(*),
+                        MIN(score), MAX(score), AVG(score),
+                        MIN(ema_score), MAX(ema_score), AVG(ema_score)
+                    FROM score_history
+                    WHERE automation_id = ? AND scored_at < ?
+                    GROUP BY day_date
+                    ON CONFLICT(automation_id, day_date) DO UPDATE SET
+                        sample_count = sample_count + excluded.sample_count,
+                        min_score = MIN(min_score, excluded.min_score),
+                        max_score = MAX(max_score, excluded.max_score),
+                        mean_score = (
+                            mean_score * sample_count
+                            + excluded.mean_score * excluded.sample_count
+                        ) / (sample_count + excluded.sample_count),
+                        min_ema_score = MIN(min_ema_score, excluded.min_ema_score),
+                        max_ema_score = MAX(max_ema_score, excluded.max_ema_score),
+                        mean_ema_score = (
+                            mean_ema_score * sample_count
+                            + excluded.mean_ema_score * excluded.sample_count
+                        ) / (sample_count + excluded.sample_count)
+                    """,
+                    (automation_id, chunk_end),
+                )
+                cursor = self._conn.execute(
+                    """
+                    DELETE FROM score_history
+                    WHERE automation_id = ? AND scored_at < ?
+                    """,
+                    (automation_id, chunk_end),
+                )
+                self._conn.commit()
+            deleted += max(0, cursor.rowcount)
+            if chunk_end >= before or cursor.rowcount <= 0:
+                return deleted
+
+    def _clear_score_features(self, automation_id: str, before: float) -> int:
+        """Drop ``features_json`` from one automation's rows before ``before``."""
+        cleared = 0
+        while True:
+            with self._lock:
+                chunk_end = self._score_chunk_end_unlocked(
+                    automation_id, before, with_features=True
+                )
+                cursor = self._conn.execute(
+                    """
+                    UPDATE score_history SET features_json = NULL
+                    WHERE automation_id = ? AND scored_at < ?
+                        AND features_json IS NOT NULL
+                    """,
+                    (automation_id, chunk_end),
+                )
+                self._conn.commit()
+            cleared += max(0, cursor.rowcount)
+            if chunk_end >= before or cursor.rowcount <= 0:
+                return cleared
+
+    def incremental_vacuum(self, max_pages: int = _INCREMENTAL_VACUUM_PAGES) -> int:
+        """Release up to ``max_pages`` free pages and return how many were freed.
+
+        A no-op for database files created before incremental auto-vacuum was
+        enabled; their free pages are still reused by later writes.
+        """
+        with self._lock:
+            mode = self._conn.execute("PRAGMA auto_vacuum").fetchone()
+            if mode is None or int(mode[0]) != 2:
+                return 0
+            before = int(self._conn.execute("PRAGMA freelist_count").fetchone()[0])
+            # executescript steps the pragma to completion; execute() stops
+            # after the first freed page because the pragma returns no rows.
+            self._conn.executescript(
+                f"PRAGMA incremental_vacuum({max(1, int(max_pages))});"
+            )
+            after = int(self._conn.execute("PRAGMA freelist_count").fetchone()[0])
+        return max(0, before - after)
+
     def migrate_legacy_runtime_health_scores(self, legacy_db_path: str | Path) -> bool:
         """Migrate legacy runtime_health_scores rows into score_history."""
         legacy_path = Path(legacy_db_path)
@@ -466,7 +1007,7 @@ class RuntimeEventStore:
         self.set_metadata(f"backfill_status:{automation_id}", "success")
 
     def rebuild_daily_summaries(self, automation_id: str) -> None:
-        """Recompute daily rollup cache from trigger_events for one automation."""
+        """Recompute daily rollup cache from both trigger tiers for one automation."""
         if not automation_id:
             return
         with self._lock:
@@ -489,6 +1030,31 @@ class RuntimeEventStore:
                 """,
                 (automation_id,),
             )
+            if self._hourly_tier:
+                bucket_counts: dict[tuple[str, str], int] = defaultdict(int)
+                for hour_start, count in self._conn.execute(
+                    """
+                    SELECT hour_start, trigger_count FROM trigger_hourly_counts
+                    WHERE automation_id = ?
+                    """,
+                    (automation_id,),
+                ):
+                    hour = datetime.fromtimestamp(float(hour_start), tz=UTC)
+                    key = (hour.date().isoformat(), self._classify_time_bucket(hour))
+                    bucket_counts[key] += int(count)
+                self._conn.executemany(
+                    """
+                    INSERT INTO daily_bucket_counts
+                        (automation_id, day_date, time_bucket, trigger_count)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(automation_id, day_date, time_bucket) DO UPDATE SET
+                        trigger_count = trigger_count + excluded.trigger_count
+                    """,
+                    [
+                        (automation_id, day_date, time_bucket, count)
+                        for (day_date, time_bucket), count in bucket_counts.items()
+                    ],
+                )
             self._conn.commit()
 
     def get_daily_bucket_counts(
@@ -497,8 +1063,8 @@ class RuntimeEventStore:
         """Return day_date -> trigger_count for one automation and time bucket."""
         if not automation_id or not time_bucket:
             return {}
-        with self._lock:
-            rows = self._conn.execute(
+        with self._reader() as conn:
+            rows = conn.execute(
                 """
                 SELECT day_date, trigger_count
                 FROM daily_bucket_counts
@@ -509,6 +1075,36 @@ class RuntimeEventStore:
             ).fetchall()
         return {str(row[0]): int(row[1]) for row in rows}
 
+    def get_daily_score_summaries(
+        self, automation_id: str
+    ) -> dict[str, dict[str, float]]:
+        """Return day_date -> downsampled score summary for one automation."""
+        if not automation_id:
+            return {}
+        with self._reader() as conn:
+            rows = conn.execute(
+                """
+                SELECT day_date, sample_count, min_score, max_score, mean_score,
+                    min_ema_score, max_ema_score, mean_ema_score
+                FROM score_history_daily
+                WHERE automation_id = ?
+                ORDER BY day_date ASC
+                """,
+                (automation_id,),
+            ).fetchall()
+        return {
+            str(row[0]): {
+                "sample_count": float(row[1]),
+                "min_score": float(row[2]),
+                "max_score": float(row[3]),
+                "mean_score": float(row[4]),
+                "min_ema_score": float(row[5]),
+                "max_ema_score": float(row[6]),
+                "mean_ema_score": float(row[7]),
+            }
+            for row in rows
+        }
+
     def _apply_schema_v1(self) -> None:
         self._conn.execute(
             """
@@ -558,6 +1154,48 @@ class RuntimeEventStore:
         )
         self._conn.commit()
 
+    def _apply_schema_v2(self) -> None:
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS score_history_daily (
+                automation_id TEXT NOT NULL,
+                day_date TEXT NOT NULL,
+                sample_count INTEGER NOT NULL,
+                min_score REAL NOT NULL,
+                max_score REAL NOT NULL,
+                mean_score REAL NOT NULL,
+                min_ema_score REAL NOT NULL,
+                max_ema_score REAL NOT NULL,
+                mean_ema_score REAL NOT NULL,
+                PRIMARY KEY (automation_id, day_date)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    def _apply_schema_v3(self) -> None:
+        # Existing raw rows move over at the next compaction, not here, so the
+        # migration itself stays quick on large stores.
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS trigger_hourly_counts (
+                automation_id TEXT NOT NULL,
+                hour_start REAL NOT NULL,
+                trigger_count INTEGER NOT NULL,
+                first_at REAL NOT NULL,
+                last_at REAL NOT NULL,
+                PRIMARY KEY (automation_id, hour_start)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_trigger_hourly_time
+                ON trigger_hourly_counts (hour_start)
+            """
+        )
+        self._conn.commit()
+
     @staticmethod
     def _to_utc(value: datetime) -> datetime:
         if value.tzinfo is None:
@@ -626,3 +1264,17 @@ class AsyncRuntimeEventStore:
             before,
         )
         return [float(value) for value in result]
+
+    async def async_get_rolled_up_hours(
+        self,
+        automation_id: str,
+        after: datetime | None = None,
+        before: datetime | None = None,
+    ) -> list[HourlyTriggerCount]:
+        result = await self._run_in_executor(
+            self._store.get_rolled_up_hours,
+            automation_id,
+            after,
+            before,
+        )
+        return list(result)
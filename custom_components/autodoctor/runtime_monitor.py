@@ -6,30 +6,42 @@ import asyncio
 import contextlib
 import json
 import logging
+import math
 from collections import defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from copy import deepcopy
 from datetime import UTC, date, datetime, timedelta
 from functools import partial
 from statistics import fmean, median
 from typing import TYPE_CHECKING, Any, cast
 
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_utc_time
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .suppression_store import SuppressionStore
 
+from .activity_index import ActivitySlotIndex
 from .bocpd_detector import (
     DEFAULT_RUNTIME_HEALTH_HAZARD_RATE,
     DEFAULT_RUNTIME_HEALTH_MAX_RUN_LENGTH,
     BOCPDDetector,
     Detector,
 )
-from .const import DOMAIN
+from .bounded_cache import LRUCache
+from .burst_window import BurstWindow
+from .const import DEFAULT_RUNTIME_STATE_CACHE_SIZE, DOMAIN, SIGNAL_ISSUES_UPDATED
 from .models import IssueType, Severity, ValidationIssue
+from .overdue_history import OverdueHistory
+from .profiler import DISABLED_PROFILER, ValidationProfiler
 from .runtime_event_store import (
+    RUNTIME_EVENT_STORE_SCHEMA_VERSION,
     AsyncRuntimeEventStore,
+    HourlyTriggerCount,
     RuntimeEventStore,
+    ScoreHistoryRow,
     classify_time_bucket,
 )
 
@@ -40,6 +52,18 @@ _LOGGER = logging.getLogger(__name__)
 # Event store write failure logging threshold
 _WRITE_FAILURE_LOG_THRESHOLD = 3
 
+# Score rows kept for retry when the store is unavailable; oldest dropped first
+_MAX_PENDING_SCORE_ROWS = 10000
+
+# Trigger history keeps one row per trigger for this many days, then hourly
+# counts only
+_RAW_EVENT_RETENTION_DAYS = 7
+
+# Score history keeps every row for this many days, then daily summaries only
+_SCORE_FULL_RESOLUTION_DAYS = 30
+# Feature snapshots are only kept on recent score rows (days)
+_SCORE_FEATURES_RETENTION_DAYS = 7
+
 # Bootstrap history minimum horizon (days)
 _BOOTSTRAP_MIN_HISTORY_DAYS = 90
 
@@ -60,9 +84,14 @@ _MIN_MEDIAN_GAP_MINUTES = 1.0
 _OVERDUE_MIN_COMPARABLE_ACTIVE_DAYS = 4
 _OVERDUE_PREDICTABLE_SCORE_THRESHOLD = 0.7
 _OVERDUE_PROBABILITY_THRESHOLD = 0.85
-_BUCKET_GRANULARITY_MINUTES = 5
 _RECORDER_QUERY_CHUNK_SIZE = 200
 _EVENT_STORE_OBS_START_KEY = "observation:start_at"
+_OVERDUE_HISTORY_KEY_PREFIX = "overdue_history:"
+_RUNTIME_ISSUE_TYPE_VALUES: tuple[str, ...] = (
+    IssueType.RUNTIME_AUTOMATION_OVERDUE.value,
+    IssueType.RUNTIME_AUTOMATION_OVERACTIVE.value,
+    IssueType.RUNTIME_AUTOMATION_BURST.value,
+)
 
 # BOCPD anomaly score sensitivity thresholds
 _SENSITIVITY_THRESHOLDS: dict[str, float] = {
@@ -72,11 +101,10 @@ _SENSITIVITY_THRESHOLDS: dict[str, float] = {
 }
 
 
-def _linear_percentile(values: list[float], quantile: float) -> float | None:
-    """Return linear-interpolated percentile from sorted numeric values."""
-    if not values:
+def _linear_percentile(ordered: list[float], quantile: float) -> float | None:
+    """Return linear-interpolated percentile from already sorted values."""
+    if not ordered:
         return None
-    ordered = sorted(float(value) for value in values)
     if len(ordered) == 1:
         return ordered[0]
     clamped = min(1.0, max(0.0, float(quantile)))
@@ -113,8 +141,11 @@ class RuntimeHealthMonitor:
         runtime_event_store: RuntimeEventStore | None = None,
         async_runtime_event_store: AsyncRuntimeEventStore | None = None,
         now_factory: Callable[[], datetime] | None = None,
+        profiler: ValidationProfiler | None = None,
+        max_tracked_automations: int | None = DEFAULT_RUNTIME_STATE_CACHE_SIZE,
     ) -> None:
         self.hass = hass
+        self.profiler = profiler or DISABLED_PROFILER
         self.baseline_days = baseline_days
         self.min_coverage_days = max(
             1,
@@ -147,21 +178,47 @@ class RuntimeHealthMonitor:
             async_runtime_event_store
         )
         self._runtime_event_store_tasks: set[asyncio.Task[Any]] = set()
+        # Write-behind buffer: score rows are persisted in one transaction at
+        # the end of a scan, and survive an interrupted scan until next flush.
+        self._pending_score_rows: list[ScoreHistoryRow] = []
         self._detector: Detector = detector or BOCPDDetector(
             hazard_rate=self.hazard_rate,
             max_run_length=self.max_run_length,
         )
         self._now_factory = now_factory or (lambda: datetime.now(UTC))
         self._started_at = self._now_factory()
-        self._score_history: dict[str, list[float]] = {}
+        self.max_tracked_automations = max_tracked_automations
+        # Per-automation state is LRU-bounded; evicted entries fall back to
+        # their persisted EMA/adaptation values on next use.
+        self._score_history: LRUCache[str, list[float]] = LRUCache(
+            max_tracked_automations
+        )
+        # Baseline triggers/day per automation from its last scoring, used by
+        # the scoring scheduler to pick how often to come back to it.
+        self._expected_daily_rates: LRUCache[str, float] = LRUCache(
+            max_tracked_automations
+        )
+        # Closed-day timing summaries for overdue prediction, persisted as
+        # event-store metadata whenever a scan folds in a new day.
+        self._overdue_histories: LRUCache[str, OverdueHistory] = LRUCache(
+            max_tracked_automations
+        )
+        self._dirty_overdue_histories: set[str] = set()
+        # Pending overdue deadline timers: automation -> (deadline, name, cancel)
+        self._overdue_checks: dict[str, tuple[datetime, str, Callable[[], None]]] = {}
         self._last_run_stats: dict[str, int] = {}
+        # Cross-automation 5-minute activity, kept current from live triggers
+        # and store imports instead of being rebuilt on every scan.
+        self._activity_index = ActivitySlotIndex()
+        self._activity_pruned_at: datetime | None = None
         self._runtime_state: dict[str, Any] = {
             "schema_version": 2,
-            "automations": {},
+            "automations": self._new_automation_state_cache(),
             "alerts": {"date": "", "global_count": 0},
             "updated_at": "",
         }
         self._active_runtime_alerts: dict[str, ValidationIssue] = {}
+        self._runtime_alerts_revision = 0
         self._loaded_adaptation_ids: set[str] = set()
         self._runtime_event_store_db_path: str | None = None
         if self._runtime_event_store is None:
@@ -205,9 +262,57 @@ class RuntimeHealthMonitor:
         """Return telemetry from the most recent run."""
         return dict(self._last_run_stats)
 
+    def get_expected_daily_rate(self, automation_id: str) -> float | None:
+        """Return baseline triggers per day seen when the automation was last scored."""
+        return self._expected_daily_rates.get(automation_id)
+
+    def _new_automation_state_cache(self) -> LRUCache[str, dict[str, Any]]:
+        return LRUCache(
+            self.max_tracked_automations,
+            on_evict=lambda automation_id, _state: self._loaded_adaptation_ids.discard(
+                automation_id
+            ),
+        )
+
+    def get_cache_diagnostics(self) -> dict[str, Any]:
+        """Return size and hit-rate diagnostics for per-automation caches."""
+        automations = self._runtime_state.get("automations")
+        return {
+            "score_history": self._score_history.stats(),
+            "automation_state": (
+                automations.stats() if isinstance(automations, LRUCache) else None
+            ),
+            "activity_index": self._activity_index.stats(),
+            "overdue_history": self._overdue_histories.stats(),
+        }
+
     def get_runtime_state(self) -> dict[str, Any]:
-        """Return a snapshot of persisted runtime model state."""
-        return deepcopy(self._runtime_state)
+        """Return a snapshot of persisted runtime model state.
+
+        Burst windows are kept as epoch ring buffers in memory and only turned
+        into ISO timestamp lists here.
+        """
+        snapshot = deepcopy(self._runtime_state)
+        automations = snapshot.get("automations")
+        if isinstance(automations, dict):
+            for state in cast(dict[str, Any], automations).values():
+                burst_model = (
+                    state.get("burst_model") if isinstance(state, dict) else None
+                )
+                if not isinstance(burst_model, dict):
+                    continue
+                window = burst_model.get("recent_triggers")
+                if isinstance(window, BurstWindow):
+                    burst_model["recent_triggers"] = [
+                        datetime.fromtimestamp(epoch, tz=UTC).isoformat()
+                        for epoch in window.epochs()
+                    ]
+        return snapshot
+
+    @property
+    def runtime_alerts_revision(self) -> int:
+        """Return a counter bumped whenever the active runtime alerts change."""
+        return self._runtime_alerts_revision
 
     def get_active_runtime_alerts(self) -> list[ValidationIssue]:
         """Return currently tracked runtime alerts."""
@@ -247,6 +352,9 @@ class RuntimeHealthMonitor:
             return []
 
         automation_state["last_trigger"] = event_time.isoformat()
+        self._activity_index.add(automation_entity_id, event_time)
+        # It fired, so today's deadline no longer needs checking.
+        self.cancel_overdue_check(automation_entity_id)
 
         self._enqueue_runtime_event_store_write(
             automation_entity_id=automation_entity_id,
@@ -291,14 +399,12 @@ class RuntimeHealthMonitor:
                     event_time,
                 )
                 if result is False:
-                    self._runtime_event_store_degraded = True
-                    self._runtime_event_store_dropped_events += 1
+                    self._note_event_store_failure(dropped_events=1)
                 self._runtime_event_store_pending_jobs = int(
                     getattr(async_store, "pending_jobs", 0)
                 )
             except Exception as err:
-                self._runtime_event_store_degraded = True
-                self._runtime_event_store_write_failures += 1
+                self._note_event_store_failure(write_failures=1)
                 self._runtime_event_store_pending_jobs = int(
                     getattr(async_store, "pending_jobs", 0)
                 )
@@ -326,6 +432,15 @@ class RuntimeHealthMonitor:
             self._runtime_event_store_tasks.add(task)
             task.add_done_callback(self._runtime_event_store_tasks.discard)
 
+    def _note_event_store_failure(
+        self, *, dropped_events: int = 0, write_failures: int = 0
+    ) -> None:
+        """Count an event-store failure and let sensors pick up the counters."""
+        self._runtime_event_store_degraded = True
+        self._runtime_event_store_dropped_events += dropped_events
+        self._runtime_event_store_write_failures += write_failures
+        async_dispatcher_send(self.hass, SIGNAL_ISSUES_UPDATED)
+
     def get_event_store_diagnostics(self) -> dict[str, Any]:
         """Return runtime event-store operational diagnostics."""
         return {
@@ -377,9 +492,14 @@ class RuntimeHealthMonitor:
             store.set_metadata("bootstrap:complete", "true")
 
         await self.hass.async_add_executor_job(_import_history)
+        for aid, timestamps in history.items():
+            self._activity_index.add_many(aid, timestamps)
 
     async def async_close_event_store(self) -> None:
         """Drain pending event-store tasks and close the SQLite connection."""
+        self.cancel_overdue_checks()
+        await self.async_flush_score_rows()
+        await self.async_flush_overdue_histories()
         # Await all in-flight write tasks before closing the connection
         tasks = list(self._runtime_event_store_tasks)
         for task in tasks:
@@ -403,7 +523,7 @@ class RuntimeHealthMonitor:
 
         def _create_store() -> RuntimeEventStore:
             store = RuntimeEventStore(db_path)
-            store.ensure_schema(target_version=1)
+            store.ensure_schema(target_version=RUNTIME_EVENT_STORE_SCHEMA_VERSION)
             if store.get_metadata(_EVENT_STORE_OBS_START_KEY) is None:
                 store.set_metadata(_EVENT_STORE_OBS_START_KEY, now.isoformat())
             return store
@@ -419,27 +539,96 @@ class RuntimeHealthMonitor:
             _LOGGER.warning("Failed initializing runtime event store: %s", err)
             self._runtime_event_store = None
 
+    def run_store_maintenance(self, *, now: datetime | None = None) -> None:
+        """Roll up and trim old events, refresh planner stats and checkpoint the WAL.
+
+        Runs in an executor after every periodic scan. Roll-up and trim are
+        chunked, so handling a few hours of history at a time keeps every
+        transaction short.
+        """
+        store = self._runtime_event_store
+        if store is None:
+            return
+        maintenance_time = now or self._now_factory()
+        try:
+            compacted = store.compact_trigger_events(
+                raw_retention_days=_RAW_EVENT_RETENTION_DAYS, now=maintenance_time
+            )
+            if compacted > 0:
+                _LOGGER.debug(
+                    "Store maintenance: rolled %d events older than %d days "
+                    "into hourly counts",
+                    compacted,
+                    _RAW_EVENT_RETENTION_DAYS,
+                )
+        except Exception:
+            _LOGGER.debug(
+                "Store maintenance: failed to roll up event store", exc_info=True
+            )
+        try:
+            retention = self.baseline_days + 7
+            deleted = store.trim(retention_days=retention, now=maintenance_time)
+            if deleted > 0:
+                _LOGGER.info(
+                    "Store maintenance: trimmed %d events older than %d days",
+                    deleted,
+                    retention,
+                )
+        except Exception:
+            _LOGGER.debug(
+                "Store maintenance: failed to trim event store", exc_info=True
+            )
+        try:
+            store.optimize()
+            wal_frames, checkpointed = store.checkpoint_wal()
+            _LOGGER.debug(
+                "Store maintenance: checkpointed %d of %d WAL frames",
+                checkpointed,
+                wal_frames,
+            )
+        except Exception:
+            _LOGGER.debug(
+                "Store maintenance: failed to optimize event store", exc_info=True
+            )
+
     def run_weekly_maintenance(self, *, now: datetime | None = None) -> None:
-        """Record maintenance tick and trim old events from the store."""
+        """Record maintenance tick and compact score history."""
         maintenance_time = now or self._now_factory()
         self._runtime_state["last_weekly_maintenance"] = maintenance_time.isoformat()
         if self._runtime_event_store is not None:
             try:
-                retention = self.baseline_days + 7
-                deleted = self._runtime_event_store.trim(
-                    retention_days=retention, now=maintenance_time
+                compacted = self._runtime_event_store.compact_score_history(
+                    full_resolution_days=_SCORE_FULL_RESOLUTION_DAYS,
+                    features_days=_SCORE_FEATURES_RETENTION_DAYS,
+                    now=maintenance_time,
                 )
-                if deleted > 0:
+                if any(compacted.values()):
                     _LOGGER.info(
-                        "Weekly maintenance: trimmed %d events older than %d days",
-                        deleted,
-                        retention,
+                        "Weekly maintenance: downsampled %d score rows, cleared "
+                        "features on %d, released %d free pages",
+                        compacted["downsampled_rows"],
+                        compacted["features_cleared"],
+                        compacted["vacuumed_pages"],
                     )
             except Exception:
                 _LOGGER.debug(
-                    "Weekly maintenance: failed to trim event store", exc_info=True
+                    "Weekly maintenance: failed to compact score history",
+                    exc_info=True,
                 )
 
+    def _prune_activity_index(self, now: datetime) -> None:
+        """Drop activity slots past event-store retention, at most once a day.
+
+        Runs on the event loop with the scan rather than in weekly maintenance,
+        which executes in a worker thread while live triggers update the index.
+        """
+        if self._activity_pruned_at is not None and now - self._activity_pruned_at < (
+            timedelta(days=1)
+        ):
+            return
+        self._activity_pruned_at = now
+        self._activity_index.prune(now - timedelta(days=self.baseline_days + 7))
+
     @staticmethod
     def _empty_automation_state() -> dict[str, Any]:
         """Return default in-memory state for an automation runtime model."""
@@ -461,12 +650,15 @@ class RuntimeHealthMonitor:
         }
 
     def _ensure_automation_state(self, automation_entity_id: str) -> dict[str, Any]:
-        automations = self._runtime_state.setdefault("automations", {})
-        if not isinstance(automations, dict):
-            automations = {}
+        automations = self._runtime_state.get("automations")
+        if not isinstance(automations, LRUCache):
+            cache = self._new_automation_state_cache()
+            if isinstance(automations, dict):
+                cache.update(cast(dict[str, Any], automations))
+            automations = cache
             self._runtime_state["automations"] = automations
-        automations_dict = cast(dict[str, Any], automations)
-        state_raw = automations_dict.get(automation_entity_id)
+        automations_dict = cast(LRUCache[str, Any], automations)
+        state_raw = automations_dict.lookup(automation_entity_id)
         if not isinstance(state_raw, dict):
             state: dict[str, Any] = self._empty_automation_state()
             automations_dict[automation_entity_id] = state
@@ -519,31 +711,14 @@ class RuntimeHealthMonitor:
         if not isinstance(burst_model, dict):
             burst_model = {}
             automation_state["burst_model"] = burst_model
-        recent_raw = cast(Any, burst_model.get("recent_triggers"))
-        recent_values = (
-            cast(list[Any], recent_raw) if isinstance(recent_raw, list) else []
-        )
-        recent_triggers = [self._coerce_datetime(value) for value in recent_values]
-        recent = [
-            ts
-            for ts in recent_triggers
-            if ts is not None and ts >= (now - timedelta(hours=_BURST_WINDOW_HOURS))
-        ]
-        recent.append(now)
-        recent.sort()
-
-        current_5m_count = sum(
-            1
-            for ts in recent
-            if ts >= (now - timedelta(minutes=_BURST_SHORT_WINDOW_MINUTES))
-        )
-        baseline_segment_count = sum(
-            1
-            for ts in recent
-            if (now - timedelta(hours=_BURST_WINDOW_HOURS))
-            <= ts
-            < (now - timedelta(minutes=_BURST_SHORT_WINDOW_MINUTES))
-        )
+        window = self._burst_window(burst_model)
+        event_epoch = now.timestamp()
+        window.append(event_epoch)
+        window.advance(event_epoch)
+
+        recent_count = window.long_count
+        current_5m_count = window.short_count
+        baseline_segment_count = recent_count - current_5m_count
         baseline_from_history = (
             baseline_segment_count / _BURST_BASELINE_SEGMENT_COUNT
             if baseline_segment_count
@@ -557,7 +732,6 @@ class RuntimeHealthMonitor:
         )
         threshold = max(_BURST_THRESHOLD_FLOOR, baseline_rate * self.burst_multiplier)
 
-        burst_model["recent_triggers"] = [ts.isoformat() for ts in recent]
         if baseline_from_history > 0:
             burst_model["baseline_rate_5m"] = (
                 _BURST_BASELINE_EMA_DECAY * baseline_rate
@@ -568,7 +742,7 @@ class RuntimeHealthMonitor:
         if not allow_alerts:
             return []
         if (
-            len(recent) < _BURST_MIN_RECENT_TRIGGERS
+            recent_count < _BURST_MIN_RECENT_TRIGGERS
             or float(current_5m_count) < threshold
         ):
             self._clear_runtime_alert(automation_entity_id, issue_type)
@@ -593,6 +767,25 @@ class RuntimeHealthMonitor:
 
         return [issue]
 
+    def _burst_window(self, burst_model: dict[str, Any]) -> BurstWindow:
+        """Return the burst ring buffer, converting a persisted ISO list once."""
+        recent_raw = burst_model.get("recent_triggers")
+        if isinstance(recent_raw, BurstWindow):
+            return recent_raw
+        epochs: list[float] = []
+        if isinstance(recent_raw, list):
+            for value in cast(list[Any], recent_raw):
+                ts = self._coerce_datetime(value)
+                if ts is not None:
+                    epochs.append(ts.timestamp())
+        window = BurstWindow.from_epochs(
+            epochs,
+            long_seconds=_BURST_WINDOW_HOURS * 3600.0,
+            short_seconds=_BURST_SHORT_WINDOW_MINUTES * 60.0,
+        )
+        burst_model["recent_triggers"] = window
+        return window
+
     def _score_threshold_for(self, automation_id: str) -> float:
         """Return effective anomaly score threshold for an automation."""
         base = _SENSITIVITY_THRESHOLDS.get(self.sensitivity, 2.0)
@@ -602,11 +795,20 @@ class RuntimeHealthMonitor:
         return base * max(1.0, multiplier)
 
     def _register_runtime_alert(self, issue: ValidationIssue) -> None:
-        self._active_runtime_alerts[issue.get_suppression_key()] = issue
+        key = issue.get_suppression_key()
+        previous = self._active_runtime_alerts.get(key)
+        self._active_runtime_alerts[key] = issue
+        if (
+            previous is None
+            or previous.message != issue.message
+            or previous.severity != issue.severity
+        ):
+            self._runtime_alerts_revision += 1
 
     def _clear_runtime_alert(self, automation_id: str, issue_type: IssueType) -> None:
         key = f"{automation_id}:{automation_id}:{issue_type.value}"
-        self._active_runtime_alerts.pop(key, None)
+        if self._active_runtime_alerts.pop(key, None) is not None:
+            self._runtime_alerts_revision += 1
 
     def _allow_alert(self, automation_id: str, *, now: datetime) -> bool:
         alerts = self._runtime_state.setdefault("alerts", {})
@@ -644,20 +846,24 @@ class RuntimeHealthMonitor:
         automation_id: str,
         suppression_store: SuppressionStore | None,
     ) -> bool:
-        if suppression_store is None or not hasattr(suppression_store, "is_suppressed"):
+        if suppression_store is None or not hasattr(
+            suppression_store, "is_suppressed_for"
+        ):
             return False
-        prefixes = (
-            f"{automation_id}:{automation_id}:{IssueType.RUNTIME_AUTOMATION_OVERDUE.value}",
-            f"{automation_id}:{automation_id}:{IssueType.RUNTIME_AUTOMATION_OVERACTIVE.value}",
-            f"{automation_id}:{automation_id}:{IssueType.RUNTIME_AUTOMATION_BURST.value}",
-        )
-        for prefix in prefixes:
+        for issue_type in _RUNTIME_ISSUE_TYPE_VALUES:
             try:
-                if bool(suppression_store.is_suppressed(prefix)):
+                if bool(
+                    suppression_store.is_suppressed_for(
+                        automation_id, automation_id, issue_type
+                    )
+                ):
                     return True
             except Exception:
                 _LOGGER.debug(
-                    "Suppression check failed for '%s'", prefix, exc_info=True
+                    "Suppression check failed for '%s' (%s)",
+                    automation_id,
+                    issue_type,
+                    exc_info=True,
                 )
                 continue
         return False
@@ -740,6 +946,11 @@ class RuntimeHealthMonitor:
         except (TypeError, ValueError):
             return fallback
 
+    @staticmethod
+    def resolve_automation_entity_id(automation: dict[str, Any]) -> str | None:
+        """Return the ``automation.*`` entity id of an automation config."""
+        return RuntimeHealthMonitor._resolve_automation_entity_id(automation)
+
     @staticmethod
     def _resolve_automation_entity_id(automation: dict[str, Any]) -> str | None:
         """Resolve canonical automation entity_id for runtime history matching."""
@@ -797,15 +1008,37 @@ class RuntimeHealthMonitor:
         baseline_start_by_automation: dict[str, datetime] = dict.fromkeys(
             automation_ids, effective_baseline_start
         )
-        history = await self._async_fetch_trigger_history_from_store(
-            automation_ids=automation_ids,
-            start=baseline_start,
-            end=now,
-        )
+        with self.profiler.span("runtime.fetch"):
+            history = await self._async_fetch_trigger_history_from_store(
+                automation_ids=automation_ids,
+                start=baseline_start,
+                end=now,
+            )
+            rolled_up_hours = await self._async_fetch_rolled_up_hours_from_store(
+                automation_ids=automation_ids,
+                start=baseline_start,
+                end=now,
+            )
+
+        persisted_scores = await self._async_prefetch_persisted_scores(automation_ids)
+        await self._async_prefetch_overdue_histories(automation_ids)
 
         issues: list[ValidationIssue] = []
         all_events_by_automation = history
-        bucket_index = self._build_5m_bucket_index(all_events_by_automation)
+        # Raw triggers plus the exact first and last trigger of each rolled-up
+        # hour. Timing features use these; counts also include the rest of
+        # each rolled-up hour.
+        known_times_by_automation = {
+            automation_id: self._known_trigger_times(
+                events, rolled_up_hours.get(automation_id, ())
+            )
+            for automation_id, events in history.items()
+        }
+        with self.profiler.span("runtime.activity_index"):
+            self._prune_activity_index(now)
+            for automation_id, known_times in known_times_by_automation.items():
+                self._activity_index.sync(automation_id, known_times)
+        activity_index = self._activity_index
         suppression_store = self._runtime_suppression_store()
         observed_coverage_days: float | None = (
             max(0.0, (now - observed_start).total_seconds() / 86400)
@@ -824,25 +1057,37 @@ class RuntimeHealthMonitor:
                 baseline_start,
             )
             timestamps = sorted(history.get(automation_entity_id, []))
+            hours = rolled_up_hours.get(automation_entity_id, [])
+            known_times = known_times_by_automation.get(automation_entity_id, [])
 
             baseline_events = [
                 t for t in timestamps if automation_baseline_start <= t < recent_start
             ]
+            baseline_hours = [
+                hour
+                for hour in hours
+                if automation_baseline_start.timestamp()
+                <= hour.hour_start
+                < recent_start.timestamp()
+            ]
             recent_events = [t for t in timestamps if recent_start <= t <= now]
             day_counts = self._build_daily_counts(
                 baseline_events,
                 automation_baseline_start,
                 recent_start,
+                rolled_up_hours=baseline_hours,
             )
             expected = fmean(day_counts) if day_counts else 0.0
+            self._expected_daily_rates[automation_entity_id] = expected
             active_days = sum(1 for c in day_counts if c > 0)
             required_warmup = self._effective_warmup_samples(
                 expected_daily=expected,
                 baseline_days=len(day_counts),
-                baseline_event_count=len(baseline_events),
+                baseline_event_count=len(baseline_events)
+                + sum(hour.count for hour in baseline_hours),
                 oldest_event_age_days=(
-                    (now - timestamps[0]).total_seconds() / 86400
-                    if timestamps
+                    (now - known_times[0]).total_seconds() / 86400
+                    if known_times
                     else None
                 ),
             )
@@ -865,13 +1110,13 @@ class RuntimeHealthMonitor:
                 stats["insufficient_warmup"] += 1
                 continue
 
-            if timestamps and (now - timestamps[0]) < timedelta(
+            if known_times and (now - known_times[0]) < timedelta(
                 days=self.cold_start_days
             ):
                 _LOGGER.debug(
                     "Automation '%s': skipped (cold start: %.1f days < %d required)",
                     automation_name,
-                    (now - timestamps[0]).total_seconds() / 86400,
+                    (now - known_times[0]).total_seconds() / 86400,
                     self.cold_start_days,
                 )
                 stats["cold_start"] += 1
@@ -900,35 +1145,42 @@ class RuntimeHealthMonitor:
                 stats["insufficient_baseline"] += 1
                 continue
 
-            median_gap = self._median_gap_minutes(baseline_events)
-            train_rows = self._build_training_rows_from_events(
-                automation_id=automation_entity_id,
-                baseline_events=baseline_events,
-                baseline_start=automation_baseline_start,
-                baseline_end=recent_start,
-                expected_daily=expected,
-                all_events_by_automation=all_events_by_automation,
-                cold_start_days=self.cold_start_days,
-                hour_ratio_days=self.hour_ratio_days,
-                median_gap_override=median_gap,
-                bucket_index=bucket_index,
-            )
-            current_row = self._build_feature_row(
-                automation_id=automation_entity_id,
-                now=now,
-                automation_events=timestamps,
-                baseline_events=baseline_events,
-                expected_daily=expected,
-                all_events_by_automation=all_events_by_automation,
-                hour_ratio_days=self.hour_ratio_days,
-                median_gap_override=median_gap,
-                bucket_index=bucket_index,
-            )
-            overdue_decision = self._predict_overdue(
-                automation_events=timestamps,
-                now=now,
-                baseline_start=automation_baseline_start,
-            )
+            with self.profiler.span("runtime.features", automation_entity_id):
+                # Gaps need individual triggers, so the median only covers
+                # the raw part of the baseline.
+                median_gap = self._median_gap_minutes(baseline_events)
+                train_rows = self._build_training_rows_from_events(
+                    automation_id=automation_entity_id,
+                    baseline_events=baseline_events,
+                    baseline_start=automation_baseline_start,
+                    baseline_end=recent_start,
+                    expected_daily=expected,
+                    all_events_by_automation=all_events_by_automation,
+                    cold_start_days=self.cold_start_days,
+                    hour_ratio_days=self.hour_ratio_days,
+                    median_gap_override=median_gap,
+                    activity_index=activity_index,
+                    rolled_up_hours=baseline_hours,
+                )
+                current_row = self._build_feature_row(
+                    automation_id=automation_entity_id,
+                    now=now,
+                    automation_events=timestamps,
+                    baseline_events=baseline_events,
+                    expected_daily=expected,
+                    all_events_by_automation=all_events_by_automation,
+                    hour_ratio_days=self.hour_ratio_days,
+                    median_gap_override=median_gap,
+                    activity_index=activity_index,
+                    rolled_up_hours=hours,
+                )
+            with self.profiler.span("runtime.overdue", automation_entity_id):
+                overdue_decision = self._predict_overdue(
+                    automation_events=known_times,
+                    now=now,
+                    baseline_start=automation_baseline_start,
+                    automation_id=automation_entity_id,
+                )
             current_row["predictability_score"] = self._coerce_float(
                 overdue_decision.get("predictability_score"),
                 0.0,
@@ -954,53 +1206,29 @@ class RuntimeHealthMonitor:
                 expected,
                 len(recent_events),
             )
-            score = self._score_current(automation_entity_id, train_rows)
+            with self.profiler.span("runtime.score", automation_entity_id):
+                score = self._score_current(automation_entity_id, train_rows)
             prefetched_ema: float | None = None
-            if (
-                not self._score_history.get(automation_entity_id)
-                and self._runtime_event_store is not None
-            ):
-                try:
-                    persisted = await self.hass.async_add_executor_job(
-                        self._runtime_event_store.get_last_score,
-                        automation_entity_id,
-                    )
-                    if persisted is not None:
-                        prefetched_ema = self._coerce_float(
-                            getattr(persisted, "ema_score", 0.0), 0.0
-                        )
-                except Exception as err:
-                    _LOGGER.debug(
-                        "Failed reading persisted runtime EMA for '%s': %s",
-                        automation_entity_id,
-                        err,
-                    )
+            if not self._score_history.lookup(automation_entity_id):
+                persisted = persisted_scores.get(automation_entity_id)
+                if persisted is not None:
+                    prefetched_ema = self._coerce_float(persisted.ema_score, 0.0)
             smoothed_score = self._smoothed_score(
                 automation_entity_id, score, persisted_ema=prefetched_ema
             )
             if self._runtime_event_store is not None:
-                try:
-                    feature_payload = dict(current_row)
-                    feature_payload["raw_bocpd_score"] = score
-                    feature_payload["bocpd_ema_score"] = smoothed_score
-                    await self.hass.async_add_executor_job(
-                        partial(
-                            self._runtime_event_store.record_score,
-                            automation_entity_id,
-                            scored_at=now,
-                            score=score,
-                            ema_score=smoothed_score,
-                            features=feature_payload,
-                        )
-                    )
-                except Exception as err:
-                    self._runtime_event_store_write_failures += 1
-                    self._runtime_event_store_degraded = True
-                    _LOGGER.debug(
-                        "Failed persisting runtime score history for '%s': %s",
-                        automation_entity_id,
-                        err,
+                feature_payload = dict(current_row)
+                feature_payload["raw_bocpd_score"] = score
+                feature_payload["bocpd_ema_score"] = smoothed_score
+                self._buffer_score_row(
+                    ScoreHistoryRow(
+                        automation_id=automation_entity_id,
+                        scored_at=now.timestamp(),
+                        score=score,
+                        ema_score=smoothed_score,
+                        features=feature_payload,
                     )
+                )
             _LOGGER.debug(
                 "Automation '%s': anomaly score=%.3f ema=%.3f",
                 automation_name,
@@ -1008,43 +1236,22 @@ class RuntimeHealthMonitor:
                 smoothed_score,
             )
 
-            overdue_issue_type = IssueType.RUNTIME_AUTOMATION_OVERDUE
             issue_type = IssueType.RUNTIME_AUTOMATION_OVERACTIVE
             threshold = self._score_threshold_for(automation_entity_id)
             is_suppressed = self._is_runtime_suppressed(
                 automation_entity_id, suppression_store
             )
 
-            overdue_status = str(overdue_decision.get("status", "abstain"))
-            overdue_probability = self._coerce_float(
-                overdue_decision.get("overdue_probability"),
-                0.0,
+            overdue_issue = self._apply_overdue_decision(
+                automation_entity_id,
+                automation_name,
+                overdue_decision,
+                now=now,
+                is_suppressed=is_suppressed,
             )
-            if overdue_status == "overdue" and not is_suppressed:
-                if self._allow_alert(automation_entity_id, now=now):
-                    overdue_confidence = (
-                        "high" if overdue_probability >= 0.95 else "medium"
-                    )
-                    issue = ValidationIssue(
-                        severity=Severity.WARNING,
-                        automation_id=automation_entity_id,
-                        automation_name=automation_name,
-                        entity_id=automation_entity_id,
-                        location="runtime.health.overdue",
-                        message=str(
-                            overdue_decision.get(
-                                "reason",
-                                "Automation appears overdue based on recent timing history.",
-                            )
-                        ),
-                        issue_type=overdue_issue_type,
-                        confidence=overdue_confidence,
-                    )
-                    self._register_runtime_alert(issue)
-                    issues.append(issue)
-                    stats["overdue_alerts"] += 1
-            else:
-                self._clear_runtime_alert(automation_entity_id, overdue_issue_type)
+            if overdue_issue is not None:
+                issues.append(overdue_issue)
+                stats["overdue_alerts"] += 1
 
             if smoothed_score >= threshold and not is_suppressed:
                 if self._allow_alert(automation_entity_id, now=now):
@@ -1083,9 +1290,128 @@ class RuntimeHealthMonitor:
             issues.append(issue)
             existing_keys.add(key)
 
+        with self.profiler.span("runtime.persist"):
+            await self.async_flush_score_rows()
+            await self.async_flush_overdue_histories()
+
         self._last_run_stats = dict(stats)
         return issues
 
+    async def _async_prefetch_persisted_scores(
+        self, automation_ids: list[str]
+    ) -> dict[str, ScoreHistoryRow]:
+        """Load persisted EMA seeds for automations without in-memory history."""
+        store = self._runtime_event_store
+        if store is None:
+            return {}
+        missing = [aid for aid in automation_ids if not self._score_history.get(aid)]
+        if not missing:
+            return {}
+        try:
+            return await self.hass.async_add_executor_job(
+                store.get_last_scores, missing
+            )
+        except Exception as err:
+            _LOGGER.debug("Failed reading persisted runtime EMA scores: %s", err)
+            return {}
+
+    async def _async_prefetch_overdue_histories(
+        self, automation_ids: list[str]
+    ) -> None:
+        """Load persisted overdue summaries for automations not cached yet."""
+        store = self._runtime_event_store
+        if store is None or self.baseline_days < _BOOTSTRAP_MIN_HISTORY_DAYS:
+            return
+        missing = [aid for aid in automation_ids if aid not in self._overdue_histories]
+        if not missing:
+            return
+        try:
+            raw_by_key = await self.hass.async_add_executor_job(
+                store.get_metadata_batch,
+                [f"{_OVERDUE_HISTORY_KEY_PREFIX}{aid}" for aid in missing],
+            )
+        except Exception as err:
+            _LOGGER.debug("Failed reading persisted overdue histories: %s", err)
+            return
+        for automation_id in missing:
+            raw = raw_by_key.get(f"{_OVERDUE_HISTORY_KEY_PREFIX}{automation_id}")
+            if raw is None:
+                continue
+            try:
+                self._overdue_histories[automation_id] = OverdueHistory.from_dict(
+                    json.loads(raw)
+                )
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                _LOGGER.debug(
+                    "Discarding unreadable overdue history for '%s'", automation_id
+                )
+
+    def _overdue_history_for(
+        self,
+        automation_id: str,
+        automation_events: list[datetime],
+        *,
+        now: datetime,
+        baseline_start: datetime,
+    ) -> OverdueHistory:
+        """Return the automation's overdue summaries, caught up to yesterday."""
+        history = self._overdue_histories.lookup(automation_id)
+        if history is None:
+            history = OverdueHistory()
+            self._overdue_histories[automation_id] = history
+        if history.catch_up(
+            automation_events,
+            today=now.date(),
+            window_start=baseline_start.date(),
+        ):
+            self._dirty_overdue_histories.add(automation_id)
+        return history
+
+    async def async_flush_overdue_histories(self) -> None:
+        """Persist overdue summaries that changed since the last flush."""
+        store = self._runtime_event_store
+        if store is None or not self._dirty_overdue_histories:
+            return
+        dirty = self._dirty_overdue_histories
+        self._dirty_overdue_histories = set()
+        pairs = {
+            f"{_OVERDUE_HISTORY_KEY_PREFIX}{aid}": json.dumps(history.as_dict())
+            for aid in dirty
+            if (history := self._overdue_histories.get(aid)) is not None
+        }
+        try:
+            await self.hass.async_add_executor_job(store.set_metadata_batch, pairs)
+        except Exception as err:
+            self._dirty_overdue_histories |= dirty
+            _LOGGER.debug("Failed persisting %d overdue histories: %s", len(pairs), err)
+
+    def _buffer_score_row(self, row: ScoreHistoryRow) -> None:
+        self._pending_score_rows.append(row)
+        overflow = len(self._pending_score_rows) - _MAX_PENDING_SCORE_ROWS
+        if overflow > 0:
+            del self._pending_score_rows[:overflow]
+            self._note_event_store_failure(dropped_events=overflow)
+
+    async def async_flush_score_rows(self) -> None:
+        """Persist buffered score rows in a single transaction.
+
+        Rows stay buffered when the write fails so the next flush retries them.
+        """
+        store = self._runtime_event_store
+        if store is None or not self._pending_score_rows:
+            return
+        rows = self._pending_score_rows
+        self._pending_score_rows = []
+        try:
+            await self.hass.async_add_executor_job(store.record_scores_many, rows)
+        except asyncio.CancelledError:
+            self._pending_score_rows = rows + self._pending_score_rows
+            raise
+        except Exception as err:
+            self._pending_score_rows = rows + self._pending_score_rows
+            self._note_event_store_failure(write_failures=1)
+            _LOGGER.debug("Failed persisting %d runtime score rows: %s", len(rows), err)
+
     def _score_current(
         self,
         automation_id: str,
@@ -1169,6 +1495,35 @@ class RuntimeHealthMonitor:
     ) -> int:
         return sum(1 for ts in events if start <= ts <= end)
 
+    @staticmethod
+    def _count_hours_in_range(
+        hours: Iterable[HourlyTriggerCount],
+        start: datetime,
+        end: datetime,
+    ) -> int:
+        """Count rolled-up triggers, each hour whole in the range it starts in."""
+        start_epoch = start.timestamp()
+        end_epoch = end.timestamp()
+        return sum(
+            hour.count for hour in hours if start_epoch <= hour.hour_start <= end_epoch
+        )
+
+    @staticmethod
+    def _known_trigger_times(
+        events: list[datetime], hours: Iterable[HourlyTriggerCount]
+    ) -> list[datetime]:
+        """Return raw triggers and the first and last trigger of rolled-up hours.
+
+        These are the trigger times that are actually known; the result is
+        sorted. Rolled-up hours keep nothing in between.
+        """
+        anchors = {epoch for hour in hours for epoch in (hour.first_at, hour.last_at)}
+        if not anchors:
+            return sorted(events)
+        return sorted(
+            [*events, *(datetime.fromtimestamp(epoch, tz=UTC) for epoch in anchors)]
+        )
+
     @staticmethod
     def _median_gap_minutes(events: list[datetime]) -> float:
         if len(events) < 2:
@@ -1186,38 +1541,40 @@ class RuntimeHealthMonitor:
         automation_events: list[datetime],
         now: datetime,
         baseline_start: datetime,
+        automation_id: str | None = None,
     ) -> dict[str, Any]:
-        """Summarize 90-day timing regularity for overdue prediction."""
-        baseline_events = sorted(
-            ts for ts in automation_events if baseline_start <= ts < now
-        )
+        """Summarize 90-day timing regularity for overdue prediction.
+
+        With ``automation_id`` the cached per-day summaries of that automation
+        are brought up to date and reused, and ``automation_events`` must be
+        sorted; without it they are built from the events for this call only.
+        """
+        if automation_id is not None:
+            history = self._overdue_history_for(
+                automation_id,
+                automation_events,
+                now=now,
+                baseline_start=baseline_start,
+            )
+        else:
+            history = OverdueHistory()
+            history.catch_up(
+                sorted(automation_events),
+                today=now.date(),
+                window_start=baseline_start.date(),
+            )
         total_days = max(0, (now.date() - baseline_start.date()).days)
         full_weeks, remaining = divmod(total_days, 7)
         offset = (now.weekday() - baseline_start.date().weekday()) % 7
         comparable_days = full_weeks + (1 if offset < remaining else 0)
-        comparable_events = [
-            ts for ts in baseline_events if ts.weekday() == now.weekday()
-        ]
-        comparable_by_day: dict[date, list[datetime]] = defaultdict(list)
-        for ts in comparable_events:
-            comparable_by_day[ts.date()].append(ts)
-
-        first_trigger_minutes = sorted(
-            float(ts.hour * 60 + ts.minute + (ts.second / 60.0))
-            for ts_list in comparable_by_day.values()
-            for ts in [min(ts_list)]
-        )
+        first_trigger_minutes = history.first_trigger_minutes(now.weekday())
         active_comparable_days = len(first_trigger_minutes)
 
-        gap_days = [
-            (baseline_events[idx] - baseline_events[idx - 1]).total_seconds() / 86400.0
-            for idx in range(1, len(baseline_events))
-        ]
-        median_gap_days = float(median(gap_days)) if gap_days else None
-        gap_p90_days = _linear_percentile(gap_days, 0.9)
+        median_gap_days = history.gap_quantile(0.5)
+        gap_p90_days = history.gap_quantile(0.9)
 
         timing_spread = (
-            (max(first_trigger_minutes) - min(first_trigger_minutes))
+            (first_trigger_minutes[-1] - first_trigger_minutes[0])
             if len(first_trigger_minutes) >= 2
             else 0.0
         )
@@ -1242,8 +1599,8 @@ class RuntimeHealthMonitor:
         return {
             "comparable_days": float(comparable_days),
             "active_comparable_days": float(active_comparable_days),
-            "first_trigger_median_minute": (
-                float(median(first_trigger_minutes)) if first_trigger_minutes else None
+            "first_trigger_median_minute": _linear_percentile(
+                first_trigger_minutes, 0.5
             ),
             "first_trigger_p90_minute": _linear_percentile(first_trigger_minutes, 0.9),
             "first_trigger_minutes": first_trigger_minutes,
@@ -1259,6 +1616,7 @@ class RuntimeHealthMonitor:
         automation_events: list[datetime],
         now: datetime,
         baseline_start: datetime,
+        automation_id: str | None = None,
     ) -> dict[str, float | str | bool | None]:
         """Return an overdue decision for predictable automations."""
         observed_days = max(0, (now.date() - baseline_start.date()).days)
@@ -1272,10 +1630,8 @@ class RuntimeHealthMonitor:
                 "predictability_score": 0.0,
                 "reason": "Overdue detection requires a full 90-day timing baseline.",
             }
-        today_events = sorted(
-            ts for ts in automation_events if ts.date() == now.date() and ts <= now
-        )
-        if today_events:
+        today = now.date()
+        if any(ts.date() == today and ts <= now for ts in automation_events):
             return {
                 "status": "not_due",
                 "overdue_probability": 0.0,
@@ -1287,6 +1643,7 @@ class RuntimeHealthMonitor:
             automation_events=automation_events,
             now=now,
             baseline_start=baseline_start,
+            automation_id=automation_id,
         )
         predictability_score = float(profile["predictability_score"] or 0.0)
         if not bool(profile["is_predictable"]):
@@ -1329,6 +1686,7 @@ class RuntimeHealthMonitor:
                 "status": "not_due",
                 "overdue_probability": overdue_probability,
                 "predictability_score": predictability_score,
+                "deadline_minute": deadline_minute,
                 "reason": (
                     f"Typical firing window remains open until about "
                     f"{int(deadline_minute // 60):02d}:{int(deadline_minute % 60):02d}."
@@ -1354,22 +1712,161 @@ class RuntimeHealthMonitor:
             ),
         }
 
+    def _apply_overdue_decision(
+        self,
+        automation_entity_id: str,
+        automation_name: str,
+        decision: dict[str, float | str | bool | None],
+        *,
+        now: datetime,
+        is_suppressed: bool,
+    ) -> ValidationIssue | None:
+        """Raise or clear the overdue alert and keep its deadline timer in step."""
+        issue_type = IssueType.RUNTIME_AUTOMATION_OVERDUE
+        status = str(decision.get("status", "abstain"))
+        deadline_minute = decision.get("deadline_minute")
+        if status == "not_due" and isinstance(deadline_minute, float):
+            # Whole seconds, so the check never lands just short of the deadline.
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            self._schedule_overdue_check(
+                automation_entity_id,
+                automation_name,
+                midnight + timedelta(seconds=math.ceil(deadline_minute * 60.0)),
+            )
+        else:
+            self.cancel_overdue_check(automation_entity_id)
+
+        if status != "overdue" or is_suppressed:
+            self._clear_runtime_alert(automation_entity_id, issue_type)
+            return None
+        if not self._allow_alert(automation_entity_id, now=now):
+            return None
+        overdue_probability = self._coerce_float(
+            decision.get("overdue_probability"), 0.0
+        )
+        issue = ValidationIssue(
+            severity=Severity.WARNING,
+            automation_id=automation_entity_id,
+            automation_name=automation_name,
+            entity_id=automation_entity_id,
+            location="runtime.health.overdue",
+            message=str(
+                decision.get(
+                    "reason",
+                    "Automation appears overdue based on recent timing history.",
+                )
+            ),
+            issue_type=issue_type,
+            confidence="high" if overdue_probability >= 0.95 else "medium",
+        )
+        self._register_runtime_alert(issue)
+        return issue
+
+    def _schedule_overdue_check(
+        self, automation_entity_id: str, automation_name: str, deadline: datetime
+    ) -> None:
+        """Arm one timer that re-checks this automation when its window closes."""
+        pending = self._overdue_checks.get(automation_entity_id)
+        if pending is not None and pending[0] == deadline:
+            return
+        self.cancel_overdue_check(automation_entity_id)
+        cancel = async_track_point_in_utc_time(
+            self.hass,
+            partial(self._async_run_overdue_check, automation_entity_id),
+            deadline,
+        )
+        self._overdue_checks[automation_entity_id] = (
+            deadline,
+            automation_name,
+            cancel,
+        )
+
+    def cancel_overdue_check(self, automation_entity_id: str) -> None:
+        """Cancel the pending overdue deadline timer of one automation."""
+        pending = self._overdue_checks.pop(automation_entity_id, None)
+        if pending is not None:
+            pending[2]()
+
+    def cancel_overdue_checks(self) -> None:
+        """Cancel every pending overdue deadline timer."""
+        for automation_entity_id in list(self._overdue_checks):
+            self.cancel_overdue_check(automation_entity_id)
+
+    async def _async_run_overdue_check(
+        self, automation_entity_id: str, _fired_at: datetime
+    ) -> None:
+        pending = self._overdue_checks.pop(automation_entity_id, None)
+        if pending is None:
+            return
+        revision = self._runtime_alerts_revision
+        try:
+            await self.async_check_overdue(automation_entity_id, pending[1])
+        except Exception as err:
+            _LOGGER.warning(
+                "Overdue check for '%s' failed: %s", automation_entity_id, err
+            )
+            return
+        if self._runtime_alerts_revision != revision:
+            async_dispatcher_send(self.hass, SIGNAL_ISSUES_UPDATED)
+
+    async def async_check_overdue(
+        self, automation_entity_id: str, automation_name: str
+    ) -> ValidationIssue | None:
+        """Re-evaluate only the overdue prediction of one automation.
+
+        Runs when a deadline timer fires, so an overdue alert is raised at
+        the deadline instead of at the next scoring pass. Anomaly scoring
+        and score history are left to ``validate_automations``.
+        """
+        now = self._now_factory()
+        baseline_start = now - timedelta(
+            hours=_RECENT_WINDOW_HOURS, days=self.baseline_days
+        )
+        observed_start = self._observed_coverage_start()
+        effective_baseline_start = baseline_start
+        if observed_start is not None and observed_start > baseline_start:
+            effective_baseline_start = observed_start
+        history = await self._async_fetch_trigger_history_from_store(
+            automation_ids=[automation_entity_id],
+            start=baseline_start,
+            end=now,
+        )
+        rolled_up_hours = await self._async_fetch_rolled_up_hours_from_store(
+            automation_ids=[automation_entity_id],
+            start=baseline_start,
+            end=now,
+        )
+        await self._async_prefetch_overdue_histories([automation_entity_id])
+        decision = self._predict_overdue(
+            automation_events=self._known_trigger_times(
+                history.get(automation_entity_id, []),
+                rolled_up_hours.get(automation_entity_id, ()),
+            ),
+            now=now,
+            baseline_start=effective_baseline_start,
+            automation_id=automation_entity_id,
+        )
+        issue = self._apply_overdue_decision(
+            automation_entity_id,
+            automation_name,
+            decision,
+            now=now,
+            is_suppressed=self._is_runtime_suppressed(
+                automation_entity_id, self._runtime_suppression_store()
+            ),
+        )
+        await self.async_flush_overdue_histories()
+        return issue
+
     @staticmethod
-    def _build_5m_bucket_index(
+    def _build_activity_index(
         all_events_by_automation: dict[str, list[datetime]],
-    ) -> dict[datetime, set[str]]:
-        """Build an index mapping 5-minute bucket starts to automation IDs with events."""
-        index: dict[datetime, set[str]] = defaultdict(set)
+    ) -> ActivitySlotIndex:
+        """Build a 5-minute activity index from scratch for a set of histories."""
+        index = ActivitySlotIndex()
         for automation_id, events in all_events_by_automation.items():
-            for ts in events:
-                bucket_start = ts.replace(
-                    minute=(ts.minute // _BUCKET_GRANULARITY_MINUTES)
-                    * _BUCKET_GRANULARITY_MINUTES,
-                    second=0,
-                    microsecond=0,
-                )
-                index[bucket_start].add(automation_id)
-        return dict(index)
+            index.add_many(automation_id, events)
+        return index
 
     @staticmethod
     def _count_other_automations_same_5m(
@@ -1402,18 +1899,27 @@ class RuntimeHealthMonitor:
         all_events_by_automation: dict[str, list[datetime]],
         hour_ratio_days: int = 30,
         median_gap_override: float | None = None,
-        bucket_index: dict[datetime, set[str]] | None = None,
+        activity_index: ActivitySlotIndex | None = None,
+        rolled_up_hours: Sequence[HourlyTriggerCount] = (),
     ) -> dict[str, float]:
+        """Build one feature row at ``now``.
+
+        ``rolled_up_hours`` are counted whole in the window their hour starts
+        in, and only their first and last trigger count as trigger times.
+        """
+        count_hours = RuntimeHealthMonitor._count_hours_in_range
         events_up_to_now = [ts for ts in automation_events if ts <= now]
         rolling_24h_count = float(
             RuntimeHealthMonitor._count_events_in_range(
                 events_up_to_now, now - timedelta(hours=24), now
             )
+            + count_hours(rolled_up_hours, now - timedelta(hours=24), now)
         )
         rolling_7d_count = float(
             RuntimeHealthMonitor._count_events_in_range(
                 events_up_to_now, now - timedelta(days=7), now
             )
+            + count_hours(rolled_up_hours, now - timedelta(days=7), now)
         )
 
         baseline_window_days = max(1, hour_ratio_days)
@@ -1428,16 +1934,36 @@ class RuntimeHealthMonitor:
                 current_hour_start,
                 now,
             )
+            + count_hours(rolled_up_hours, current_hour_start, now)
+        )
+        hour_match_count = sum(1 for ts in baseline_30d if ts.hour == now.hour) + sum(
+            hour.count
+            for hour in rolled_up_hours
+            if baseline_window_start.timestamp() <= hour.hour_start < now.timestamp()
+            and int(hour.hour_start // 3600) % 24 == now.hour
         )
-        hour_matches = [ts for ts in baseline_30d if ts.hour == now.hour]
-        hour_avg = float(len(hour_matches)) / float(baseline_window_days)
+        hour_avg = float(hour_match_count) / float(baseline_window_days)
         hour_ratio_30d = (
             current_hour_count / hour_avg if hour_avg > 0 else current_hour_count
         )
 
+        now_epoch = now.timestamp()
+        last_rolled_up = max(
+            (
+                hour.last_at if hour.last_at <= now_epoch else hour.first_at
+                for hour in rolled_up_hours
+                if hour.first_at <= now_epoch
+            ),
+            default=None,
+        )
+        last_trigger = max(events_up_to_now, default=None)
+        if last_rolled_up is not None and (
+            last_trigger is None or last_rolled_up > last_trigger.timestamp()
+        ):
+            last_trigger = datetime.fromtimestamp(last_rolled_up, tz=UTC)
         minutes_since_last = (
-            (now - max(events_up_to_now)).total_seconds() / 60.0
-            if events_up_to_now
+            (now - last_trigger).total_seconds() / 60.0
+            if last_trigger is not None
             else 24 * 60.0
         )
         median_gap = (
@@ -1447,12 +1973,8 @@ class RuntimeHealthMonitor:
         )
         gap_vs_median = minutes_since_last / median_gap if median_gap > 0 else 0.0
 
-        if bucket_index is not None:
-            bucket_key = now.replace(
-                minute=(now.minute // 5) * 5, second=0, microsecond=0
-            )
-            bucket_members = bucket_index.get(bucket_key, set())
-            other_5m = float(sum(1 for aid in bucket_members if aid != automation_id))
+        if activity_index is not None:
+            other_5m = float(activity_index.other_count(automation_id, now))
         else:
             other_5m = RuntimeHealthMonitor._count_other_automations_same_5m(
                 automation_id=automation_id,
@@ -1481,7 +2003,8 @@ class RuntimeHealthMonitor:
         cold_start_days: int,
         hour_ratio_days: int = 30,
         median_gap_override: float | None = None,
-        bucket_index: dict[datetime, set[str]] | None = None,
+        activity_index: ActivitySlotIndex | None = None,
+        rolled_up_hours: Sequence[HourlyTriggerCount] = (),
     ) -> list[dict[str, float]]:
         rows: list[dict[str, float]] = []
         current = baseline_start + timedelta(days=max(0, cold_start_days))
@@ -1496,7 +2019,8 @@ class RuntimeHealthMonitor:
                     all_events_by_automation=all_events_by_automation,
                     hour_ratio_days=hour_ratio_days,
                     median_gap_override=median_gap_override,
-                    bucket_index=bucket_index,
+                    activity_index=activity_index,
+                    rolled_up_hours=rolled_up_hours,
                 )
             )
             current += timedelta(days=1)
@@ -1507,12 +2031,19 @@ class RuntimeHealthMonitor:
         events: list[datetime],
         start: datetime,
         end: datetime,
+        *,
+        rolled_up_hours: Iterable[HourlyTriggerCount] = (),
     ) -> list[int]:
         counts = [0] * max(0, (end.date() - start.date()).days)
         for ts in events:
             day_idx = (ts.date() - start.date()).days
             if 0 <= day_idx < len(counts):
                 counts[day_idx] += 1
+        for hour in rolled_up_hours:
+            hour_date = datetime.fromtimestamp(hour.hour_start, tz=UTC).date()
+            day_idx = (hour_date - start.date()).days
+            if 0 <= day_idx < len(counts):
+                counts[day_idx] += hour.count
         return counts
 
     async def _async_fetch_trigger_history(
@@ -1654,3 +2185,32 @@ class RuntimeHealthMonitor:
                 datetime.fromtimestamp(float(ts), tz=UTC) for ts in epochs
             ]
         return history
+
+    async def _async_fetch_rolled_up_hours_from_store(
+        self,
+        *,
+        automation_ids: list[str],
+        start: datetime,
+        end: datetime,
+    ) -> dict[str, list[HourlyTriggerCount]]:
+        """Fetch hourly trigger counts that compaction rolled up in the window."""
+        if self._async_runtime_event_store is None:
+            return {}
+        hours: dict[str, list[HourlyTriggerCount]] = {}
+        for automation_id in automation_ids:
+            try:
+                rows = await self._async_runtime_event_store.async_get_rolled_up_hours(
+                    automation_id,
+                    start,
+                    end,
+                )
+            except Exception as err:
+                _LOGGER.debug(
+                    "Failed reading rolled-up trigger counts for '%s': %s",
+                    automation_id,
+                    err,
+                )
+                continue
+            if rows:
+                hours[automation_id] = rows
+        return hours
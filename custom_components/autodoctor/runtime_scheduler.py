@@ -0,0 +1,204 @@
+"""Staggered runtime health scoring spread across the scan interval."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import SIGNAL_ISSUES_UPDATED
+from .profiler import RUNTIME_BATCH_RUN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .models import ValidationIssue
+    from .runtime_monitor import RuntimeHealthMonitor
+
+_LOGGER = logging.getLogger(__name__)
+
+# --- Tuning constants (not user-configurable) ---
+
+# How often the scheduler wakes up to score automations that are due
+_TICK_SECONDS = 60
+# Upper bound on automations scored in one tick
+_MAX_BATCH_SIZE = 25
+
+# Scoring cadence relative to the scan interval
+_ALERTING_INTERVAL_FACTOR = 0.25
+_HIGH_FREQUENCY_INTERVAL_FACTOR = 0.5
+_QUIET_INTERVAL_FACTOR = 2.0
+
+# Expected triggers per day that make an automation high-frequency / quiet
+_HIGH_FREQUENCY_DAILY_EVENTS = 24.0
+_QUIET_DAILY_EVENTS = 1.0
+
+
+class RuntimeScoringScheduler:
+    """Score automations continuously in small batches ordered by due time.
+
+    Every automation sits in a min-heap keyed by the epoch it is next due.
+    Newly seen automations are spread evenly across one scan interval, so
+    scoring load is flat instead of one spike per periodic scan. After an
+    automation is scored its next turn depends on how it behaves: automations
+    with an active runtime alert come back after a quarter interval,
+    high-frequency ones after half, quiet ones after two intervals.
+
+    Alerts are registered on the monitor as each batch is scored. Whenever a
+    batch changes them, ``on_alerts_changed`` is awaited with the batch's
+    automation ids and ``SIGNAL_ISSUES_UPDATED`` is sent.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        monitor: RuntimeHealthMonitor,
+        *,
+        interval: timedelta,
+        get_automations: Callable[[], list[dict[str, Any]]],
+        on_alerts_changed: Callable[[list[str]], Awaitable[None]] | None = None,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._monitor = monitor
+        self._interval = max(float(_TICK_SECONDS), interval.total_seconds())
+        self._get_automations = get_automations
+        self._on_alerts_changed = on_alerts_changed
+        self._heap: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}
+        self._not_before = 0.0
+        self._running = False
+        self._batch_stats: deque[tuple[float, dict[str, int]]] = deque()
+
+    def async_start(self, *, delay: timedelta = timedelta()) -> Callable[[], None]:
+        """Start ticking; scoring begins once ``delay`` has passed."""
+        self._not_before = (datetime.now(UTC) + delay).timestamp()
+        return async_track_time_interval(
+            self.hass, self._async_tick, timedelta(seconds=_TICK_SECONDS)
+        )
+
+    async def _async_tick(self, now: datetime) -> None:
+        try:
+            await self.async_run_due(now)
+        except Exception as err:
+            _LOGGER.warning("Runtime scoring batch failed: %s", err)
+
+    async def async_run_due(self, now: datetime) -> int:
+        """Score the automations whose turn has come; returns how many ran."""
+        epoch = now.timestamp()
+        if self._running or epoch < self._not_before:
+            return 0
+
+        configs: dict[str, dict[str, Any]] = {}
+        for automation in self._get_automations():
+            automation_id = self._monitor.resolve_automation_entity_id(automation)
+            if automation_id and automation_id not in configs:
+                configs[automation_id] = automation
+        self._sync_members(configs, epoch)
+        batch = self._pop_due(epoch)
+        if not batch:
+            return 0
+
+        revision = self._monitor.runtime_alerts_revision
+        profiler = self._monitor.profiler
+        self._running = True
+        # Batches run outside full validations, so they get their own run for
+        # the runtime.* spans.
+        profiler.start_run(RUNTIME_BATCH_RUN)
+        try:
+            await self._monitor.validate_automations([configs[aid] for aid in batch])
+            self._record_stats(epoch, self._monitor.get_last_run_stats())
+            profiler.finish_run(len(batch))
+        finally:
+            self._running = False
+            alerting = {
+                issue.automation_id
+                for issue in self._monitor.get_active_runtime_alerts()
+            }
+            for automation_id in batch:
+                self._push(
+                    automation_id,
+                    epoch + self._interval * self._cadence(automation_id, alerting),
+                )
+        _LOGGER.debug("Scored %d automations, %d queued", len(batch), len(self._due))
+        if self._monitor.runtime_alerts_revision != revision:
+            if self._on_alerts_changed is not None:
+                await self._on_alerts_changed(batch)
+            async_dispatcher_send(self.hass, SIGNAL_ISSUES_UPDATED)
+        return len(batch)
+
+    def _sync_members(self, configs: dict[str, dict[str, Any]], epoch: float) -> None:
+        """Forget removed automations and stagger new ones over one interval."""
+        for automation_id in [aid for aid in self._due if aid not in configs]:
+            # Its heap entry is skipped when popped.
+            del self._due[automation_id]
+            self._monitor.cancel_overdue_check(automation_id)
+        new_ids = sorted(aid for aid in configs if aid not in self._due)
+        for index, automation_id in enumerate(new_ids):
+            self._push(automation_id, epoch + self._interval * index / len(new_ids))
+
+    def _push(self, automation_id: str, due: float) -> None:
+        self._due[automation_id] = due
+        heapq.heappush(self._heap, (due, automation_id))
+
+    def _pop_due(self, epoch: float) -> list[str]:
+        batch: list[str] = []
+        while self._heap and len(batch) < _MAX_BATCH_SIZE:
+            due, automation_id = self._heap[0]
+            if due > epoch:
+                break
+            heapq.heappop(self._heap)
+            if self._due.get(automation_id) == due:
+                batch.append(automation_id)
+        return batch
+
+    def _cadence(self, automation_id: str, alerting: set[str]) -> float:
+        """Return the next scoring delay as a multiple of the scan interval."""
+        if automation_id in alerting:
+            return _ALERTING_INTERVAL_FACTOR
+        rate = self._monitor.get_expected_daily_rate(automation_id)
+        if rate is None:
+            return 1.0
+        if rate >= _HIGH_FREQUENCY_DAILY_EVENTS:
+            return _HIGH_FREQUENCY_INTERVAL_FACTOR
+        if rate < _QUIET_DAILY_EVENTS:
+            return _QUIET_INTERVAL_FACTOR
+        return 1.0
+
+    def _record_stats(self, epoch: float, stats: dict[str, int]) -> None:
+        self._batch_stats.append((epoch, dict(stats)))
+        while self._batch_stats and self._batch_stats[0][0] <= epoch - self._interval:
+            self._batch_stats.popleft()
+
+    def get_run_stats(self) -> dict[str, int]:
+        """Return monitor run stats summed over the batches of the last interval."""
+        totals: dict[str, int] = defaultdict(int)
+        for _, stats in self._batch_stats:
+            for key, value in stats.items():
+                totals[key] += int(value)
+        return dict(totals)
+
+    def get_active_issues(
+        self, automations: list[dict[str, Any]]
+    ) -> list[ValidationIssue]:
+        """Return the monitor's current runtime alerts for these automations."""
+        automation_ids = {
+            self._monitor.resolve_automation_entity_id(automation)
+            for automation in automations
+        }
+        return [
+            issue
+            for issue in self._monitor.get_active_runtime_alerts()
+            if issue.automation_id in automation_ids
+        ]
+
+    def next_due(self, automation_id: str) -> datetime | None:
+        """Return when an automation is next scored, if it is queued."""
+        due = self._due.get(automation_id)
+        return datetime.fromtimestamp(due, tz=UTC) if due is not None else None
@@ -6,12 +6,13 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, VERSION
+from .const import DOMAIN, MAX_SENSOR_ATTRIBUTE_ITEMS, SIGNAL_ISSUES_UPDATED, VERSION
 
 
 async def async_setup_entry(
@@ -28,7 +29,49 @@ async def async_setup_entry(
     )
 
 
-class ValidationIssuesSensor(SensorEntity):
+class _IssueSignalSensor(SensorEntity):
+    """Sensor whose state is recomputed only when issues or alerts change.
+
+    Subclasses override ``_compute_state``; the result is cached in the
+    ``_attr_*`` fields and a state write happens only when it differs.
+    """
+
+    _attr_should_poll = False
+
+    async def async_added_to_hass(self) -> None:
+        """Compute initial state and subscribe to issue updates."""
+        await super().async_added_to_hass()
+        self._refresh_state()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_ISSUES_UPDATED, self._async_handle_issues_updated
+            )
+        )
+
+    @callback
+    def _async_handle_issues_updated(self) -> None:
+        """Write state only when the computed value or attributes changed."""
+        if self._refresh_state():
+            self.async_write_ha_state()
+
+    def _refresh_state(self) -> bool:
+        """Recompute cached state; return True when it changed."""
+        value, attrs = self._compute_state(self.hass.data.get(DOMAIN, {}))
+        if (
+            value == self._attr_native_value
+            and attrs == self._attr_extra_state_attributes
+        ):
+            return False
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = attrs
+        return True
+
+    def _compute_state(self, data: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        """Return (native value, extra attributes) from integration data."""
+        return 0, {}
+
+
+class ValidationIssuesSensor(_IssueSignalSensor):
     """Sensor showing count of validation issues."""
 
     _attr_has_entity_name = True
@@ -42,6 +85,7 @@ class ValidationIssuesSensor(SensorEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_issues_count"
         self._attr_native_value = 0
+        self._attr_extra_state_attributes = {}
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
             name="Autodoctor",
@@ -51,41 +95,36 @@ class ValidationIssuesSensor(SensorEntity):
             entry_type=DeviceEntryType.SERVICE,
         )
 
-    @property
-    def native_value(self) -> int:
-        """Return the issue count."""
-        data = self.hass.data.get(DOMAIN, {})
+    def _compute_state(self, data: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        """Return the issue count and bounded issue metadata."""
+        reporter = data.get("reporter")
+        runtime_monitor = data.get("runtime_monitor")
+
         validation_issues = data.get("validation_issues")
         if isinstance(validation_issues, list):
-            return len(validation_issues)
-
-        reporter = data.get("reporter")
-        if reporter:
+            value = len(validation_issues)
+        elif reporter:
             # Backward compatibility fallback for older in-memory shape.
-            return len(reporter.active_issues)
-        return 0
+            value = len(reporter.active_issues)
+        else:
+            value = 0
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        data = self.hass.data.get(DOMAIN, {})
-        reporter = data.get("reporter")
-        runtime_monitor = data.get("runtime_monitor")
         attrs: dict[str, Any] = {}
         if reporter:
-            # Take snapshot - frozenset is immutable so this is safe
-            issues = reporter.active_issues
-            attrs["issue_ids"] = list(issues)
+            # Sorted so an unchanged frozenset never looks like a change
+            issue_ids = sorted(reporter.active_issues)
+            attrs["issue_ids"] = issue_ids[:MAX_SENSOR_ATTRIBUTE_ITEMS]
+            attrs["issue_ids_truncated"] = len(issue_ids) > MAX_SENSOR_ATTRIBUTE_ITEMS
 
         if runtime_monitor:
             attrs["runtime_alert_count"] = len(
                 runtime_monitor.get_active_runtime_alerts()
             )
 
-        return attrs
+        return value, attrs
 
 
-class RuntimeHealthAlertsSensor(SensorEntity):
+class RuntimeHealthAlertsSensor(_IssueSignalSensor):
     """Sensor showing count of active runtime health alerts."""
 
     _attr_has_entity_name = True
@@ -99,6 +138,7 @@ class RuntimeHealthAlertsSensor(SensorEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_runtime_alerts"
         self._attr_native_value = 0
+        self._attr_extra_state_attributes = {}
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
             name="Autodoctor",
@@ -108,22 +148,11 @@ class RuntimeHealthAlertsSensor(SensorEntity):
             entry_type=DeviceEntryType.SERVICE,
         )
 
-    @property
-    def native_value(self) -> int:
-        """Return the active runtime alert count."""
-        data = self.hass.data.get(DOMAIN, {})
-        runtime_monitor = data.get("runtime_monitor")
-        if runtime_monitor:
-            return len(runtime_monitor.get_active_runtime_alerts())
-        return 0
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return runtime alert metadata for diagnostics."""
-        data = self.hass.data.get(DOMAIN, {})
+    def _compute_state(self, data: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        """Return the active runtime alert count and bounded alert metadata."""
         runtime_monitor = data.get("runtime_monitor")
         if not runtime_monitor:
-            return {}
+            return 0, {}
 
         runtime_alerts = runtime_monitor.get_active_runtime_alerts()
         attrs: dict[str, Any] = {
@@ -135,13 +164,17 @@ class RuntimeHealthAlertsSensor(SensorEntity):
                     "message": issue.message,
                     "location": issue.location,
                 }
-                for issue in runtime_alerts
-            ]
+                for issue in runtime_alerts[:MAX_SENSOR_ATTRIBUTE_ITEMS]
+            ],
+            "active_runtime_alerts_truncated": (
+                len(runtime_alerts) > MAX_SENSOR_ATTRIBUTE_ITEMS
+            ),
         }
         if hasattr(runtime_monitor, "get_event_store_diagnostics"):
             store_diag = runtime_monitor.get_event_store_diagnostics()
+            # pending_jobs moves with every trigger and stays in diagnostics;
+            # the failure counters below are signalled when they change.
             attrs["runtime_event_store_degraded"] = store_diag["degraded"]
-            attrs["runtime_event_store_pending_jobs"] = store_diag["pending_jobs"]
             attrs["runtime_event_store_write_failures"] = store_diag["write_failures"]
             attrs["runtime_event_store_dropped_events"] = store_diag["dropped_events"]
-        return attrs
+        return len(runtime_alerts), attrs
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from dataclasses import dataclass
 from difflib import get_close_matches
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, cast
 
 from .models import IssueType, Severity, ValidationIssue
+from .profiler import DISABLED_PROFILER, ValidationProfiler
+from .suggestion_index import SuggestionIndex
 from .template_utils import is_template_value as _is_template_value
-from .validator import get_entity_suggestion
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -141,6 +145,328 @@ _CAPABILITY_DEPENDENT_PARAMS: dict[str, frozenset[str]] = {
 }
 
 
+def _check_input_datetime_semantics(
+    call: ServiceCall, data: dict[str, Any]
+) -> list[ValidationIssue]:
+    """Flag mixed input_datetime.set_datetime modes.
+
+    The service accepts either a date/time pair, a datetime, or a timestamp.
+    Mixing datetime/timestamp with other modes is ambiguous/misleading.
+    """
+    present = {k for k in ("date", "time", "datetime", "timestamp") if k in data}
+
+    conflicting: set[str] = set()
+    if "datetime" in present:
+        conflicting.update(present.intersection({"date", "time", "timestamp"}))
+        if conflicting:
+            conflicting.add("datetime")
+    elif "timestamp" in present:
+        conflicting.update(present.intersection({"date", "time"}))
+        if conflicting:
+            conflicting.add("timestamp")
+
+    if not conflicting:
+        return []
+    return [
+        ValidationIssue(
+            severity=Severity.WARNING,
+            confidence="medium",
+            automation_id=call.automation_id,
+            automation_name=call.automation_name,
+            entity_id="",
+            location=call.location,
+            message=(
+                "Service 'input_datetime.set_datetime' has conflicting "
+                f"parameters: {sorted(conflicting)}"
+            ),
+            issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
+        )
+    ]
+
+
+def _check_climate_set_temperature_semantics(
+    call: ServiceCall, data: dict[str, Any]
+) -> list[ValidationIssue]:
+    """Flag mixed single-setpoint and range climate.set_temperature modes.
+
+    The service supports either a single setpoint (`temperature`) or range
+    mode (`target_temp_high` + `target_temp_low`). Mixed mode is ambiguous and
+    usually indicates a misconfiguration.
+    """
+    has_temperature = "temperature" in data
+    has_range = "target_temp_high" in data or "target_temp_low" in data
+    if not (has_temperature and has_range):
+        return []
+    conflicting_params = sorted(
+        {k for k in ("temperature", "target_temp_high", "target_temp_low") if k in data}
+    )
+    return [
+        ValidationIssue(
+            severity=Severity.WARNING,
+            confidence="medium",
+            automation_id=call.automation_id,
+            automation_name=call.automation_name,
+            entity_id="",
+            location=call.location,
+            message=(
+                "Service 'climate.set_temperature' has conflicting "
+                f"parameters: {conflicting_params}"
+            ),
+            issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
+        )
+    ]
+
+
+def _check_play_media_semantics(
+    call: ServiceCall, data: dict[str, Any]
+) -> list[ValidationIssue]:
+    """Require media_content_id and media_content_type together, non-empty."""
+    issues: list[ValidationIssue] = []
+    has_content_id = "media_content_id" in data
+    has_content_type = "media_content_type" in data
+    if has_content_id and not has_content_type:
+        issues.append(
+            ValidationIssue(
+                severity=Severity.ERROR,
+                confidence="medium",
+                automation_id=call.automation_id,
+                automation_name=call.automation_name,
+                entity_id="",
+                location=call.location,
+                message=(
+                    "Missing required parameter 'media_content_type' "
+                    "for service 'media_player.play_media' when "
+                    "'media_content_id' is provided"
+                ),
+                issue_type=IssueType.SERVICE_MISSING_REQUIRED_PARAM,
+            )
+        )
+    elif has_content_type and not has_content_id:
+        issues.append(
+            ValidationIssue(
+                severity=Severity.ERROR,
+                confidence="medium",
+                automation_id=call.automation_id,
+                automation_name=call.automation_name,
+                entity_id="",
+                location=call.location,
+                message=(
+                    "Missing required parameter 'media_content_id' "
+                    "for service 'media_player.play_media' when "
+                    "'media_content_type' is provided"
+                ),
+                issue_type=IssueType.SERVICE_MISSING_REQUIRED_PARAM,
+            )
+        )
+    for param_name, present in (
+        ("media_content_id", has_content_id),
+        ("media_content_type", has_content_type),
+    ):
+        if not present:
+            continue
+        value = data.get(param_name)
+        if (
+            isinstance(value, str)
+            and not _is_template_value(value)
+            and value.strip() == ""
+        ):
+            issues.append(
+                ValidationIssue(
+                    severity=Severity.WARNING,
+                    confidence="medium",
+                    automation_id=call.automation_id,
+                    automation_name=call.automation_name,
+                    entity_id="",
+                    location=call.location,
+                    message=(
+                        "Service 'media_player.play_media' has invalid parameter "
+                        f"'{param_name}': value must not be empty"
+                    ),
+                    issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
+                )
+            )
+    return issues
+
+
+def _check_remote_send_command_semantics(
+    call: ServiceCall, data: dict[str, Any]
+) -> list[ValidationIssue]:
+    """Require a non-empty command when auxiliary transport params are given."""
+    issues: list[ValidationIssue] = []
+    has_command = "command" in data
+    has_aux = any(key in data for key in ("device", "delay_secs", "num_repeats"))
+    if has_aux and not has_command:
+        issues.append(
+            ValidationIssue(
+                severity=Severity.ERROR,
+                confidence="medium",
+                automation_id=call.automation_id,
+                automation_name=call.automation_name,
+                entity_id="",
+                location=call.location,
+                message=(
+                    "Missing required parameter 'command' for service "
+                    "'remote.send_command' when auxiliary parameters are provided"
+                ),
+                issue_type=IssueType.SERVICE_MISSING_REQUIRED_PARAM,
+            )
+        )
+    if has_command:
+        command_value = data.get("command")
+        empty_command = (
+            isinstance(command_value, str) and command_value.strip() == ""
+        ) or (isinstance(command_value, list) and len(command_value) == 0)
+        if empty_command:
+            issues.append(
+                ValidationIssue(
+                    severity=Severity.WARNING,
+                    confidence="medium",
+                    automation_id=call.automation_id,
+                    automation_name=call.automation_name,
+                    entity_id="",
+                    location=call.location,
+                    message=(
+                        "Service 'remote.send_command' has invalid parameter "
+                        "'command': value must not be empty"
+                    ),
+                    issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
+                )
+            )
+    return issues
+
+
+def _check_tts_speak_semantics(
+    call: ServiceCall, data: dict[str, Any]
+) -> list[ValidationIssue]:
+    """Require a non-empty tts.speak message payload."""
+    message = data.get("message")
+    if (
+        not isinstance(message, str)
+        or _is_template_value(message)
+        or message.strip() != ""
+    ):
+        return []
+    return [
+        ValidationIssue(
+            severity=Severity.WARNING,
+            confidence="medium",
+            automation_id=call.automation_id,
+            automation_name=call.automation_name,
+            entity_id="",
+            location=call.location,
+            message=(
+                "Service 'tts.speak' has invalid parameter "
+                "'message': value must not be empty"
+            ),
+            issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
+        )
+    ]
+
+
+# High-confidence service-specific semantic rules, keyed by service name
+_SEMANTIC_CHECKS: dict[
+    str, Callable[[ServiceCall, dict[str, Any]], list[ValidationIssue]]
+] = {
+    "input_datetime.set_datetime": _check_input_datetime_semantics,
+    "climate.set_temperature": _check_climate_set_temperature_semantics,
+    "media_player.play_media": _check_play_media_semantics,
+    "remote.send_command": _check_remote_send_command_semantics,
+    "tts.speak": _check_tts_speak_semantics,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _SelectCheck:
+    """Precomputed select-selector options for one service field.
+
+    ``valid_values`` keeps the option order for messages; ``value_set`` is
+    what membership checks use.
+    """
+
+    valid_values: tuple[Any, ...]
+    value_set: frozenset[Any]
+    multiple: bool
+
+    def accepts(self, value: Any) -> bool:
+        """Return True when ``value`` is one of the select options."""
+        return isinstance(value, Hashable) and value in self.value_set
+
+
+@dataclass(frozen=True, slots=True)
+class _ServicePlan:
+    """Validation facts for one service, compiled once from its description."""
+
+    field_names: tuple[str, ...]
+    known_fields: frozenset[str]
+    required_fields: tuple[str, ...]
+    select_checks: Mapping[str, _SelectCheck]
+    capability_params: frozenset[str]
+
+
+def _compile_select_check(selector: dict[str, Any]) -> _SelectCheck | None:
+    """Build a select check from a field selector.
+
+    Only select options (discrete enums) are validated as these are
+    deterministic. Basic type checking (number, boolean, text) is skipped due
+    to YAML type coercion making it unreliable.
+    """
+    select_config = selector.get("select")
+    if not isinstance(select_config, dict):
+        return None
+    select_config = cast(dict[str, Any], select_config)
+
+    options = select_config.get("options", [])
+    if not options or not isinstance(options, list):
+        return None
+
+    # Normalize options — they can be strings or dicts with 'value' key
+    valid_values: list[Any] = []
+    typed_options: list[Any] = list(options)
+    for opt in typed_options:
+        if isinstance(opt, str):
+            valid_values.append(opt)
+        elif (
+            isinstance(opt, dict)
+            and "value" in opt
+            and isinstance(opt["value"], Hashable)
+        ):
+            valid_values.append(opt["value"])
+
+    if not valid_values:
+        return None
+    return _SelectCheck(
+        valid_values=tuple(valid_values),
+        value_set=frozenset(valid_values),
+        multiple=bool(select_config.get("multiple", False)),
+    )
+
+
+def _compile_service_plan(service_name: str, fields: dict[str, Any]) -> _ServicePlan:
+    """Compile a service's field definitions into a validation plan."""
+    required_fields: list[str] = []
+    select_checks: dict[str, _SelectCheck] = {}
+    for field_name, field_schema in fields.items():
+        if not isinstance(field_schema, dict):
+            continue
+        field_schema = cast(dict[str, Any], field_schema)
+        if field_schema.get("required", False):
+            required_fields.append(field_name)
+        selector = field_schema.get("selector")
+        if not selector or not isinstance(selector, dict):
+            continue
+        check = _compile_select_check(cast(dict[str, Any], selector))
+        if check is not None:
+            select_checks[field_name] = check
+
+    return _ServicePlan(
+        field_names=tuple(fields),
+        known_fields=frozenset(fields),
+        required_fields=tuple(required_fields),
+        select_checks=MappingProxyType(select_checks),
+        capability_params=_CAPABILITY_DEPENDENT_PARAMS.get(service_name, frozenset()),
+    )
+
+
 class ServiceCallValidator:
     """Validates service calls against the Home Assistant service registry."""
 
@@ -148,6 +474,8 @@ class ServiceCallValidator:
         self,
         hass: HomeAssistant,
         strict_service_validation: bool = False,
+        suggestion_index: SuggestionIndex | None = None,
+        profiler: ValidationProfiler | None = None,
     ) -> None:
         """Initialize the service call validator.
 
@@ -155,23 +483,60 @@ class ServiceCallValidator:
             hass: Home Assistant instance
             strict_service_validation: If True, warn about unknown service params.
                 Disable if using custom components with non-standard params.
+            suggestion_index: Shared entity/service name index used for
+                "did you mean" suggestions. A private one is created if omitted.
+            profiler: Optional span recorder for per-call timings.
         """
         self.hass = hass
+        self.profiler = profiler or DISABLED_PROFILER
+        self.suggestion_index = suggestion_index or SuggestionIndex(
+            hass, profiler=self.profiler
+        )
         self._strict_validation = strict_service_validation
-        self._service_descriptions: dict[str, dict[str, Any]] | None = None
+        self._descriptions: dict[str, dict[str, Any]] | None = None
+        self._descriptions_generation = 0
+        self._descriptions_stale = True
+        self._service_plans: dict[str, _ServicePlan | None] = {}
         self._last_run_stats: dict[str, Any] = {
             "total_calls": 0,
             "skipped_calls_by_reason": {},
         }
 
+    @property
+    def _service_descriptions(self) -> dict[str, dict[str, Any]] | None:
+        """Return the loaded service descriptions."""
+        return self._descriptions
+
+    @_service_descriptions.setter
+    def _service_descriptions(self, value: dict[str, dict[str, Any]] | None) -> None:
+        """Replace descriptions, starting a new generation of compiled plans."""
+        self._descriptions = value
+        self._descriptions_generation += 1
+        self._service_plans = {}
+
+    def invalidate_descriptions(self) -> None:
+        """Mark cached descriptions stale (services registered/removed, component loaded)."""
+        self._descriptions_stale = True
+
     async def async_load_descriptions(self) -> None:
-        """Load service descriptions from Home Assistant."""
+        """Load service descriptions from Home Assistant.
+
+        Descriptions are cached until invalidate_descriptions() is called, so
+        repeated scans reuse them (and their compiled plans) without
+        re-fetching descriptions for every integration.
+        """
+        if not self._descriptions_stale and self._service_descriptions is not None:
+            return
+        # Cleared before the fetch so an invalidation that arrives while it
+        # is in flight marks the result stale again.
+        self._descriptions_stale = False
         try:
             from homeassistant.helpers.service import async_get_all_descriptions
 
             self._service_descriptions = await async_get_all_descriptions(self.hass)
         except Exception as err:
             _LOGGER.warning("Failed to load service descriptions: %s", err)
+            self._descriptions_stale = True
             self._service_descriptions = None
 
     def _get_service_fields(self, domain: str, service: str) -> dict[str, Any] | None:
@@ -196,6 +561,21 @@ class ServiceCallValidator:
             return cast(dict[str, Any], fields)
         return {}
 
+    def _get_service_plan(
+        self, service_name: str, domain: str, service: str
+    ) -> _ServicePlan | None:
+        """Return the compiled plan for a service, compiling it on first use.
+
+        Returns None when no description is available for the service.
+        """
+        plans = self._service_plans
+        if service_name in plans:
+            return plans[service_name]
+        fields = self._get_service_fields(domain, service)
+        plan = None if fields is None else _compile_service_plan(service_name, fields)
+        plans[service_name] = plan
+        return plan
+
     def validate_service_calls(
         self,
         service_calls: list[ServiceCall],
@@ -208,71 +588,78 @@ class ServiceCallValidator:
         issues: list[ValidationIssue] = []
 
         for call in service_calls:
-            # Skip templated service names
-            if call.is_template:
-                self._increment_skip_reason("templated_service_name")
-                continue
+            with self.profiler.span("services.validate_call", call.automation_id):
+                issues.extend(self._validate_service_call(call))
 
-            # Parse domain.service
-            if "." not in call.service:
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.ERROR,
-                        automation_id=call.automation_id,
-                        automation_name=call.automation_name,
-                        entity_id="",
-                        location=call.location,
-                        message=f"Invalid service format: '{call.service}' (expected 'domain.service')",
-                        issue_type=IssueType.SERVICE_NOT_FOUND,
-                    )
-                )
-                continue
+        return issues
 
-            domain, service = call.service.split(".", 1)
+    def _validate_service_call(self, call: ServiceCall) -> list[ValidationIssue]:
+        """Validate a single service call and return its issues."""
+        issues: list[ValidationIssue] = []
+        # Skip templated service names
+        if call.is_template:
+            self._increment_skip_reason("templated_service_name")
+            return issues
 
-            # Check if service exists
-            if not self.hass.services.has_service(domain, service):
-                msg = f"Service '{call.service}' not found"
-                suggestion = self._suggest_service(call.service)
-                if suggestion:
-                    msg += f". Did you mean '{suggestion}'?"
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.ERROR,
-                        automation_id=call.automation_id,
-                        automation_name=call.automation_name,
-                        entity_id="",
-                        location=call.location,
-                        message=msg,
-                        issue_type=IssueType.SERVICE_NOT_FOUND,
-                        suggestion=suggestion,
-                    )
+        # Parse domain.service
+        if "." not in call.service:
+            issues.append(
+                ValidationIssue(
+                    severity=Severity.ERROR,
+                    automation_id=call.automation_id,
+                    automation_name=call.automation_name,
+                    entity_id="",
+                    location=call.location,
+                    message=f"Invalid service format: '{call.service}' (expected 'domain.service')",
+                    issue_type=IssueType.SERVICE_NOT_FOUND,
                 )
-                continue
+            )
+            return issues
 
-            # Validate payload shapes before field-level checks.
-            issues.extend(self._validate_payload_shapes(call))
-            issues.extend(self._validate_conflicting_targets(call))
+        domain, service = call.service.split(".", 1)
 
-            # Get field definitions for parameter validation
-            fields = self._get_service_fields(domain, service)
-            if fields is None:
-                # No descriptions available, skip parameter validation
-                self._increment_skip_reason("missing_service_descriptions")
-                continue
+        # Check if service exists
+        if not self.hass.services.has_service(domain, service):
+            msg = f"Service '{call.service}' not found"
+            suggestion = self._suggest_service(call.service)
+            if suggestion:
+                msg += f". Did you mean '{suggestion}'?"
+            issues.append(
+                ValidationIssue(
+                    severity=Severity.ERROR,
+                    automation_id=call.automation_id,
+                    automation_name=call.automation_name,
+                    entity_id="",
+                    location=call.location,
+                    message=msg,
+                    issue_type=IssueType.SERVICE_NOT_FOUND,
+                    suggestion=suggestion,
+                )
+            )
+            return issues
 
-            # Validate target entity IDs
-            issues.extend(self._validate_target_entities(call))
+        # Validate payload shapes before field-level checks.
+        issues.extend(self._validate_payload_shapes(call))
+        issues.extend(self._validate_conflicting_targets(call))
 
-            # Validate parameters
-            issues.extend(self._validate_required_params(call, fields))
-            # Unknown param checking is opt-in — custom components may
-            # add service params that don't appear in the schema
-            if self._strict_validation:
-                issues.extend(self._validate_unknown_params(call, fields))
-            issues.extend(self._validate_param_types(call, fields))
-            issues.extend(self._validate_service_semantics(call))
+        # Get the compiled plan for parameter validation
+        plan = self._get_service_plan(call.service, domain, service)
+        if plan is None:
+            # No descriptions available, skip parameter validation
+            self._increment_skip_reason("missing_service_descriptions")
+            return issues
 
+        # Validate target entity IDs
+        issues.extend(self._validate_target_entities(call))
+
+        # Validate parameters
+        issues.extend(self._validate_required_params(call, plan))
+        # Unknown param checking is opt-in — custom components may
+        # add service params that don't appear in the schema
+        if self._strict_validation:
+            issues.extend(self._validate_unknown_params(call, plan))
+        issues.extend(self._validate_param_types(call, plan))
+        issues.extend(self._validate_service_semantics(call))
         return issues
 
     def _increment_skip_reason(self, reason: str) -> None:
@@ -382,7 +769,7 @@ class ServiceCallValidator:
     def _validate_required_params(
         self,
         call: ServiceCall,
-        fields: dict[str, Any],
+        plan: _ServicePlan,
     ) -> list[ValidationIssue]:
         """Check that all required parameters are provided."""
         issues: list[ValidationIssue] = []
@@ -402,12 +789,7 @@ class ServiceCallValidator:
             target = {}
             target_uninspectable = True
 
-        for field_name, field_schema in fields.items():
-            if not isinstance(field_schema, dict):
-                continue
-            if not field_schema.get("required", False):
-                continue
-
+        for field_name in plan.required_fields:
             # Check in both data and target
             if field_name in data or field_name in target:
                 continue
@@ -435,234 +817,18 @@ class ServiceCallValidator:
 
     def _validate_service_semantics(self, call: ServiceCall) -> list[ValidationIssue]:
         """Validate high-confidence service-specific semantic constraints."""
-        issues: list[ValidationIssue] = []
         data = call.data
         if not isinstance(data, dict):
-            return issues
-
-        # input_datetime.set_datetime accepts either:
-        # - date/time pair
-        # - datetime
-        # - timestamp
-        # Mixing datetime/timestamp with other modes is ambiguous/misleading.
-        if call.service == "input_datetime.set_datetime":
-            present = {
-                k for k in ("date", "time", "datetime", "timestamp") if k in data
-            }
-
-            conflicting: set[str] = set()
-            if "datetime" in present:
-                conflicting.update(present.intersection({"date", "time", "timestamp"}))
-                if conflicting:
-                    conflicting.add("datetime")
-            elif "timestamp" in present:
-                conflicting.update(present.intersection({"date", "time"}))
-                if conflicting:
-                    conflicting.add("timestamp")
-
-            if conflicting:
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.WARNING,
-                        confidence="medium",
-                        automation_id=call.automation_id,
-                        automation_name=call.automation_name,
-                        entity_id="",
-                        location=call.location,
-                        message=(
-                            "Service 'input_datetime.set_datetime' has conflicting "
-                            f"parameters: {sorted(conflicting)}"
-                        ),
-                        issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
-                    )
-                )
-
-        # climate.set_temperature supports either a single setpoint
-        # (`temperature`) or range mode (`target_temp_high` + `target_temp_low`).
-        # Mixed mode is ambiguous and usually indicates a misconfiguration.
-        if call.service == "climate.set_temperature":
-            has_temperature = "temperature" in data
-            has_range = "target_temp_high" in data or "target_temp_low" in data
-            if has_temperature and has_range:
-                conflicting_params = sorted(
-                    {
-                        k
-                        for k in ("temperature", "target_temp_high", "target_temp_low")
-                        if k in data
-                    }
-                )
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.WARNING,
-                        confidence="medium",
-                        automation_id=call.automation_id,
-                        automation_name=call.automation_name,
-                        entity_id="",
-                        location=call.location,
-                        message=(
-                            "Service 'climate.set_temperature' has conflicting "
-                            f"parameters: {conflicting_params}"
-                        ),
-                        issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
-                    )
-                )
-
-        # media_player.play_media requires media_content_id and
-        # media_content_type to be provided together.
-        if call.service == "media_player.play_media":
-            has_content_id = "media_content_id" in data
-            has_content_type = "media_content_type" in data
-            if has_content_id and not has_content_type:
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.ERROR,
-                        confidence="medium",
-                        automation_id=call.automation_id,
-                        automation_name=call.automation_name,
-                        entity_id="",
-                        location=call.location,
-                        message=(
-                            "Missing required parameter 'media_content_type' "
-                            "for service 'media_player.play_media' when "
-                            "'media_content_id' is provided"
-                        ),
-                        issue_type=IssueType.SERVICE_MISSING_REQUIRED_PARAM,
-                    )
-                )
-            elif has_content_type and not has_content_id:
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.ERROR,
-                        confidence="medium",
-                        automation_id=call.automation_id,
-                        automation_name=call.automation_name,
-                        entity_id="",
-                        location=call.location,
-                        message=(
-                            "Missing required parameter 'media_content_id' "
-                            "for service 'media_player.play_media' when "
-                            "'media_content_type' is provided"
-                        ),
-                        issue_type=IssueType.SERVICE_MISSING_REQUIRED_PARAM,
-                    )
-                )
-            if has_content_id:
-                media_content_id = data.get("media_content_id")
-                if (
-                    isinstance(media_content_id, str)
-                    and not _is_template_value(media_content_id)
-                    and media_content_id.strip() == ""
-                ):
-                    issues.append(
-                        ValidationIssue(
-                            severity=Severity.WARNING,
-                            confidence="medium",
-                            automation_id=call.automation_id,
-                            automation_name=call.automation_name,
-                            entity_id="",
-                            location=call.location,
-                            message=(
-                                "Service 'media_player.play_media' has invalid parameter "
-                                "'media_content_id': value must not be empty"
-                            ),
-                            issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
-                        )
-                    )
-            if has_content_type:
-                media_content_type = data.get("media_content_type")
-                if (
-                    isinstance(media_content_type, str)
-                    and not _is_template_value(media_content_type)
-                    and media_content_type.strip() == ""
-                ):
-                    issues.append(
-                        ValidationIssue(
-                            severity=Severity.WARNING,
-                            confidence="medium",
-                            automation_id=call.automation_id,
-                            automation_name=call.automation_name,
-                            entity_id="",
-                            location=call.location,
-                            message=(
-                                "Service 'media_player.play_media' has invalid parameter "
-                                "'media_content_type': value must not be empty"
-                            ),
-                            issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
-                        )
-                    )
-
-        # remote.send_command requires command when auxiliary transport
-        # parameters are provided.
-        if call.service == "remote.send_command":
-            has_command = "command" in data
-            has_aux = any(
-                key in data for key in ("device", "delay_secs", "num_repeats")
-            )
-            if has_aux and not has_command:
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.ERROR,
-                        confidence="medium",
-                        automation_id=call.automation_id,
-                        automation_name=call.automation_name,
-                        entity_id="",
-                        location=call.location,
-                        message=(
-                            "Missing required parameter 'command' for service "
-                            "'remote.send_command' when auxiliary parameters are provided"
-                        ),
-                        issue_type=IssueType.SERVICE_MISSING_REQUIRED_PARAM,
-                    )
-                )
-            if has_command:
-                command_value = data.get("command")
-                empty_command = (
-                    isinstance(command_value, str) and command_value.strip() == ""
-                ) or (isinstance(command_value, list) and len(command_value) == 0)
-                if empty_command:
-                    issues.append(
-                        ValidationIssue(
-                            severity=Severity.WARNING,
-                            confidence="medium",
-                            automation_id=call.automation_id,
-                            automation_name=call.automation_name,
-                            entity_id="",
-                            location=call.location,
-                            message=(
-                                "Service 'remote.send_command' has invalid parameter "
-                                "'command': value must not be empty"
-                            ),
-                            issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
-                        )
-                    )
-
-        # tts.speak requires a non-empty message payload.
-        if call.service == "tts.speak":
-            message = data.get("message")
-            if isinstance(message, str):
-                if not _is_template_value(message) and message.strip() == "":
-                    issues.append(
-                        ValidationIssue(
-                            severity=Severity.WARNING,
-                            confidence="medium",
-                            automation_id=call.automation_id,
-                            automation_name=call.automation_name,
-                            entity_id="",
-                            location=call.location,
-                            message=(
-                                "Service 'tts.speak' has invalid parameter "
-                                "'message': value must not be empty"
-                            ),
-                            issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
-                        )
-                    )
-
-        return issues
+            return []
+        check = _SEMANTIC_CHECKS.get(call.service)
+        if check is None:
+            return []
+        return check(call, data)
 
     def _validate_unknown_params(
         self,
         call: ServiceCall,
-        fields: dict[str, Any],
+        plan: _ServicePlan,
     ) -> list[ValidationIssue]:
         """Check for parameters not in service schema."""
         issues: list[ValidationIssue] = []
@@ -675,7 +841,8 @@ class ServiceCallValidator:
 
         # If service has no fields defined at all, skip — it may accept
         # arbitrary extra keys
-        if not fields:
+        known_fields = plan.known_fields
+        if not known_fields:
             return issues
 
         for param_name in data:
@@ -683,15 +850,12 @@ class ServiceCallValidator:
             if param_name in _TARGET_FIELDS:
                 continue
 
-            if param_name not in fields:
+            if param_name not in known_fields:
                 # Check if this is a known capability-dependent parameter
-                capability_params = _CAPABILITY_DEPENDENT_PARAMS.get(
-                    call.service, frozenset()
-                )
-                if param_name in capability_params:
+                if param_name in plan.capability_params:
                     continue
 
-                suggestion = self._suggest_param(param_name, list(fields.keys()))
+                suggestion = self._suggest_param(param_name, plan.field_names)
                 issues.append(
                     ValidationIssue(
                         severity=Severity.WARNING,
@@ -734,9 +898,9 @@ class ServiceCallValidator:
     def _validate_param_types(
         self,
         call: ServiceCall,
-        fields: dict[str, Any],
+        plan: _ServicePlan,
     ) -> list[ValidationIssue]:
-        """Validate parameter value types match schema selectors."""
+        """Validate parameter values against precomputed select options."""
         issues: list[ValidationIssue] = []
         data = call.data or {}
 
@@ -744,25 +908,19 @@ class ServiceCallValidator:
         if not isinstance(data, dict):
             return issues
 
+        select_checks = plan.select_checks
+        if not select_checks:
+            return issues
+
         for param_name, value in data.items():
+            check = select_checks.get(param_name)
+            if check is None:
+                continue
             # Skip templated values
             if _is_template_value(value):
                 continue
 
-            # Only check params that exist in the schema
-            if param_name not in fields:
-                continue
-
-            field_schema = fields[param_name]
-            if not isinstance(field_schema, dict):
-                continue
-            field_schema = cast(dict[str, Any], field_schema)
-
-            selector = field_schema.get("selector")
-            if not selector or not isinstance(selector, dict):
-                continue
-
-            issue = self._check_selector_type(call, param_name, value, selector)
+            issue = self._check_selector_type(call, param_name, value, check)
             if issue:
                 issues.append(issue)
 
@@ -773,48 +931,17 @@ class ServiceCallValidator:
         call: ServiceCall,
         param_name: str,
         value: Any,
-        selector: dict[str, Any],
+        check: _SelectCheck,
     ) -> ValidationIssue | None:
-        """Check if a value matches the expected selector type.
-
-        Only validates select options (discrete enums) as these are
-        deterministic. Basic type checking (number, boolean, text) is
-        skipped due to YAML type coercion making it unreliable.
-        """
-        # Only validate select options (discrete enum — high confidence)
-        if "select" not in selector:
-            return None
-
-        select_config = selector["select"]
-        if not isinstance(select_config, dict):
-            return None
-        select_config = cast(dict[str, Any], select_config)
-
-        options = select_config.get("options", [])
-        if not options or not isinstance(options, list):
-            return None
-
-        # Normalize options — they can be strings or dicts with 'value' key
-        valid_values: list[Any] = []
-        typed_options: list[Any] = list(options)
-        for opt in typed_options:
-            if isinstance(opt, str):
-                valid_values.append(opt)
-            elif isinstance(opt, dict) and "value" in opt:
-                valid_values.append(opt["value"])
-
-        if not valid_values:
-            return None
-
-        # Check if selector allows multiple values
-        is_multiple = select_config.get("multiple", False)
+        """Check if a value is one of a select selector's options."""
+        valid_values = list(check.valid_values)
 
         # For list parameters with multiple=True, validate each item
-        if is_multiple and isinstance(value, list):
+        if check.multiple and isinstance(value, list):
             invalid_items: list[Any] = []
             typed_values: list[Any] = list(value)
             for item in typed_values:
-                if item not in valid_values:
+                if not check.accepts(item):
                     invalid_items.append(item)
             if invalid_items:
                 return ValidationIssue(
@@ -831,7 +958,7 @@ class ServiceCallValidator:
                     issue_type=IssueType.SERVICE_INVALID_PARAM_TYPE,
                 )
         # For single values, check directly
-        elif value not in valid_values:
+        elif not check.accepts(value):
             return ValidationIssue(
                 severity=Severity.WARNING,
                 automation_id=call.automation_id,
@@ -1016,19 +1143,9 @@ class ServiceCallValidator:
 
     def _suggest_target_entity(self, invalid: str) -> str | None:
         """Suggest a correction for an invalid entity ID in target."""
-        if "." not in invalid:
-            return None
-        domain = invalid.split(".", 1)[0]
-        same_domain = [
-            s.entity_id
-            for s in self.hass.states.async_all()
-            if s.entity_id.startswith(f"{domain}.")
-        ]
-        if not same_domain:
-            return None
-        return get_entity_suggestion(invalid, same_domain)
+        return self.suggestion_index.suggest_entity(invalid)
 
-    def _suggest_param(self, invalid: str, valid_params: list[str]) -> str | None:
+    def _suggest_param(self, invalid: str, valid_params: Sequence[str]) -> str | None:
         """Suggest a correction for an unknown parameter name."""
         matches = get_close_matches(invalid, valid_params, n=1, cutoff=0.75)
         return matches[0] if matches else None
@@ -1039,13 +1156,4 @@ class ServiceCallValidator:
         Looks up services in the same domain and uses fuzzy matching
         to find the closest service name.
         """
-        if "." not in invalid_service:
-            return None
-        domain, service = invalid_service.split(".", 1)
-        domain_services = list(
-            self.hass.services.async_services().get(domain, {}).keys()
-        )
-        if not domain_services:
-            return None
-        matches = get_close_matches(service, domain_services, n=1, cutoff=0.6)
-        return f"{domain}.{matches[0]}" if matches else None
+        return self.suggestion_index.suggest_service(invalid_service)
@@ -0,0 +1,169 @@
+"""Domain-partitioned index of entity and service names for fuzzy suggestions."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from difflib import get_close_matches
+from typing import TYPE_CHECKING
+
+from .profiler import DISABLED_PROFILER, ValidationProfiler
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+_ENTITY_CUTOFF = 0.75
+_SERVICE_CUTOFF = 0.6
+
+
+@dataclass(frozen=True)
+class _DomainPartition:
+    """Object names for one domain, precomputed for fuzzy matching."""
+
+    names: tuple[str, ...]
+    full_ids: dict[str, str]
+
+
+def _partition_ids(ids: list[str]) -> dict[str, _DomainPartition]:
+    """Group full ``domain.object`` IDs into per-domain partitions."""
+    grouped: dict[str, dict[str, str]] = {}
+    for full_id in ids:
+        if "." not in full_id:
+            continue
+        domain, name = full_id.split(".", 1)
+        grouped.setdefault(domain, {})[name] = full_id
+    return {
+        domain: _DomainPartition(names=tuple(full_ids), full_ids=full_ids)
+        for domain, full_ids in grouped.items()
+    }
+
+
+class SuggestionIndex:
+    """Shared lookup of entity and service names partitioned by domain.
+
+    Both partitions are built lazily and kept until the matching registry
+    changes, so suggesting fixes for many broken targets costs one scan of
+    the state machine instead of one scan per target. Results are memoized
+    per invalid ID because the same typo usually appears in several places.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, *, profiler: ValidationProfiler | None = None
+    ) -> None:
+        """Initialize the suggestion index."""
+        self.hass = hass
+        self.profiler = profiler or DISABLED_PROFILER
+        self._entities: dict[str, _DomainPartition] | None = None
+        self._entity_count: int | None = None
+        self._services: dict[str, _DomainPartition] | None = None
+        self._entity_suggestions: dict[str, str | None] = {}
+        self._service_suggestions: dict[str, str | None] = {}
+
+    def invalidate_entities(self) -> None:
+        """Drop the entity partition so it is rebuilt on next use."""
+        self._entities = None
+        self._entity_count = None
+        self._entity_suggestions.clear()
+
+    def invalidate_services(self) -> None:
+        """Drop the service partition so it is rebuilt on next use."""
+        self._services = None
+        self._service_suggestions.clear()
+
+    def _current_entity_count(self) -> int | None:
+        """Return the state machine size when it can be read cheaply."""
+        states = self.hass.states
+        if hasattr(states, "async_entity_ids_count"):
+            try:
+                return int(states.async_entity_ids_count())
+            except Exception:
+                return None
+        return None
+
+    def _ensure_entities(self) -> dict[str, _DomainPartition]:
+        """Build the entity partition if missing or visibly out of date.
+
+        Entities without a registry entry never fire registry events, so a
+        change in the state machine size also triggers a rebuild.
+        """
+        count = self._current_entity_count()
+        if self._entities is not None and count == self._entity_count:
+            return self._entities
+
+        try:
+            entity_ids = [state.entity_id for state in self.hass.states.async_all()]
+        except Exception as err:
+            _LOGGER.warning("Failed to build entity suggestion index: %s", err)
+            return {}
+        self._entities = _partition_ids(entity_ids)
+        self._entity_count = count
+        self._entity_suggestions.clear()
+        return self._entities
+
+    def _ensure_services(self) -> dict[str, _DomainPartition]:
+        """Build the service partition if missing."""
+        if self._services is not None:
+            return self._services
+
+        try:
+            services = self.hass.services.async_services()
+        except Exception as err:
+            _LOGGER.warning("Failed to build service suggestion index: %s", err)
+            return {}
+        self._services = {
+            domain: _DomainPartition(
+                names=tuple(domain_services),
+                full_ids={name: f"{domain}.{name}" for name in domain_services},
+            )
+            for domain, domain_services in services.items()
+            if domain_services
+        }
+        self._service_suggestions.clear()
+        return self._services
+
+    def entity_ids(self, domain: str) -> list[str]:
+        """Return known entity IDs in a domain."""
+        partition = self._ensure_entities().get(domain)
+        return list(partition.full_ids.values()) if partition else []
+
+    def suggest_entity(self, invalid: str) -> str | None:
+        """Suggest the closest existing entity ID in the same domain."""
+        if "." not in invalid:
+            return None
+        partitions = self._ensure_entities()
+        if invalid in self._entity_suggestions:
+            self.profiler.count("suggestions.entity_memo_hit")
+            return self._entity_suggestions[invalid]
+
+        domain, name = invalid.split(".", 1)
+        with self.profiler.span("suggestions.entity"):
+            suggestion = _closest(partitions.get(domain), name, _ENTITY_CUTOFF)
+        self._entity_suggestions[invalid] = suggestion
+        return suggestion
+
+    def suggest_service(self, invalid: str) -> str | None:
+        """Suggest the closest registered service in the same domain."""
+        if "." not in invalid:
+            return None
+        partitions = self._ensure_services()
+        if invalid in self._service_suggestions:
+            self.profiler.count("suggestions.service_memo_hit")
+            return self._service_suggestions[invalid]
+
+        domain, service = invalid.split(".", 1)
+        with self.profiler.span("suggestions.service"):
+            suggestion = _closest(partitions.get(domain), service, _SERVICE_CUTOFF)
+        self._service_suggestions[invalid] = suggestion
+        return suggestion
+
+
+def _closest(
+    partition: _DomainPartition | None, name: str, cutoff: float
+) -> str | None:
+    """Return the full ID of the best fuzzy match within a partition."""
+    if partition is None or not partition.names:
+        return None
+    matches = get_close_matches(name, partition.names, n=1, cutoff=cutoff)
+    return partition.full_ids[matches[0]] if matches else None
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
 
+from .const import STORE_SAVE_DELAY_SECONDS
 from .models import IssueType
 
 if TYPE_CHECKING:
@@ -19,6 +22,90 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "autodoctor.suppressions"
 STORAGE_VERSION = 1
 
+# Matches any value in a suppression key segment. Supported wildcard rules are
+# "<automation_id>:*:*" (every issue of one automation) and "*:*:<issue_type>"
+# (one issue type across all automations).
+SUPPRESSION_WILDCARD = "*"
+
+
+def _split_suppression_key(key: str) -> tuple[str, str, str] | None:
+    """Split an ``automation_id:entity_id:issue_type`` key into its parts.
+
+    Issue types never contain ``:``, so the last segment is split off first.
+    Entity ids may (time triggers use ``07:00:00``), so any remaining colons
+    are kept in the entity id.
+    """
+    head, sep, issue_type = key.rpartition(":")
+    if not sep:
+        return None
+    automation_id, sep, entity_id = head.partition(":")
+    if not sep:
+        return None
+    return automation_id, entity_id, issue_type
+
+
+def is_supported_suppression_rule(
+    automation_id: str, entity_id: str, issue_type: str
+) -> bool:
+    """Return whether a suppression's wildcard segments form a supported rule."""
+    wildcards = (
+        automation_id == SUPPRESSION_WILDCARD,
+        entity_id == SUPPRESSION_WILDCARD,
+        issue_type == SUPPRESSION_WILDCARD,
+    )
+    return wildcards in (
+        (False, False, False),
+        (False, True, True),
+        (True, True, False),
+    )
+
+
+@dataclass(frozen=True)
+class _SuppressionIndex:
+    """Structured, immutable view of suppression keys for membership checks."""
+
+    exact: frozenset[tuple[str, str, str]] = frozenset()
+    automations: frozenset[str] = frozenset()
+    issue_types: frozenset[str] = frozenset()
+    # Keys with extra colons cannot be split unambiguously, so they are also
+    # matched as whole strings.
+    ambiguous: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_keys(cls, keys: set[str]) -> _SuppressionIndex:
+        """Build the index from raw suppression keys."""
+        exact: set[tuple[str, str, str]] = set()
+        automations: set[str] = set()
+        issue_types: set[str] = set()
+        ambiguous: set[str] = set()
+        for key in keys:
+            parts = _split_suppression_key(key)
+            if parts is None:
+                continue
+            if key.count(":") > 2:
+                ambiguous.add(key)
+            automation_id, entity_id, issue_type = parts
+            if entity_id == SUPPRESSION_WILDCARD:
+                if (
+                    automation_id != SUPPRESSION_WILDCARD
+                    and issue_type == SUPPRESSION_WILDCARD
+                ):
+                    automations.add(automation_id)
+                    continue
+                if (
+                    automation_id == SUPPRESSION_WILDCARD
+                    and issue_type != SUPPRESSION_WILDCARD
+                ):
+                    issue_types.add(issue_type)
+                    continue
+            exact.add(parts)
+        return cls(
+            frozenset(exact),
+            frozenset(automations),
+            frozenset(issue_types),
+            frozenset(ambiguous),
+        )
+
 
 class SuppressionStore:
     """Persistent storage for suppressed issues."""
@@ -31,7 +118,9 @@ class SuppressionStore:
             STORAGE_KEY,
         )
         self._suppressions: set[str] = set()
+        self._index = _SuppressionIndex()
         self._lock = asyncio.Lock()
+        self._save_pending = False
 
     async def async_load(self) -> None:
         """Load suppressions from storage.
@@ -47,7 +136,11 @@ class SuppressionStore:
                 cleaned: set[str] = set()
                 for key in raw_keys:
                     parts = key.rsplit(":", 1)
-                    if len(parts) == 2 and parts[1] not in valid_issue_types:
+                    if (
+                        len(parts) == 2
+                        and parts[1] not in valid_issue_types
+                        and parts[1] != SUPPRESSION_WILDCARD
+                    ):
                         continue
                     cleaned.add(key)
                 if len(cleaned) < len(raw_keys):
@@ -55,57 +148,119 @@ class SuppressionStore:
                         "Cleaned %d orphaned suppressions referencing removed issue types",
                         len(raw_keys) - len(cleaned),
                     )
-                    self._suppressions = cleaned
+                    self._set_suppressions(cleaned)
                     await self._async_save()
                 else:
-                    self._suppressions = cleaned
+                    self._set_suppressions(cleaned)
+
+    def _set_suppressions(self, suppressions: set[str]) -> None:
+        """Replace the suppression set and rebuild the structured index."""
+        self._suppressions = suppressions
+        self._index = _SuppressionIndex.from_keys(suppressions)
+
+    def _data_to_save(self) -> dict[str, list[str]]:
+        """Return the storage payload; called by Store when a write happens."""
+        self._save_pending = False
+        return {"suppressions": list(self._suppressions)}
 
     async def _async_save(self) -> None:
-        """Save suppressions to storage (private).
+        """Save suppressions to storage immediately (private).
 
         MUST be called while holding self._lock. This method is private to
         enforce that callers use the public async methods which handle locking.
         """
-        await self._store.async_save({"suppressions": list(self._suppressions)})
+        await self._store.async_save(self._data_to_save())
+
+    def _schedule_save(self) -> None:
+        """Schedule a delayed save, coalescing changes made within the delay."""
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, STORE_SAVE_DELAY_SECONDS)
+
+    async def async_flush(self) -> None:
+        """Write any pending delayed save now (used on unload).
+
+        A failed write is re-raised and stays pending, so a later flush
+        retries it.
+        """
+        async with self._lock:
+            if not self._save_pending:
+                return
+            try:
+                await self._async_save()
+            except Exception:
+                self._save_pending = True
+                raise
 
     def is_suppressed(self, key: str) -> bool:
-        """Check if an issue is suppressed.
+        """Check if an issue is suppressed by its suppression key.
+
+        Keys in ``automation_id:entity_id:issue_type`` form are matched against
+        the structured index, so wildcard rules apply. Other keys fall back to
+        exact membership.
 
-        Thread-safety: Uses atomic reference read pattern. While set membership
-        checking is atomic, the set object itself can be replaced during
-        async_load(). This pattern captures a consistent reference to work with.
+        Thread-safety: Uses atomic reference read pattern. The set and index
+        objects are replaced (never mutated in place) on every change, so
+        capturing a reference gives a consistent view.
 
         Race window: During async_load() (integration startup/reload only),
         suppressions may briefly appear incorrect. This is acceptable - the
         window is microseconds and self-corrects immediately.
         """
-        # Atomic reference read - capture current set before checking
-        suppressions = self._suppressions
-        return key in suppressions
+        parts = _split_suppression_key(key)
+        if parts is None:
+            # Atomic reference read - capture current set before checking
+            suppressions = self._suppressions
+            return key in suppressions
+        return self.is_suppressed_for(*parts)
+
+    def is_suppressed_for(
+        self, automation_id: str, entity_id: str, issue_type: str
+    ) -> bool:
+        """Check suppression for structured key parts without building a key string."""
+        # Atomic reference read - capture current index before checking
+        index = self._index
+        return (
+            automation_id in index.automations
+            or issue_type in index.issue_types
+            or (automation_id, entity_id, issue_type) in index.exact
+            or (
+                bool(index.ambiguous)
+                and f"{automation_id}:{entity_id}:{issue_type}" in index.ambiguous
+            )
+        )
 
     async def async_suppress(self, key: str) -> None:
         """Add a suppression."""
+        await self.async_suppress_many([key])
+
+    async def async_suppress_many(self, keys: Iterable[str]) -> int:
+        """Add several suppressions with a single coalesced save.
+
+        Returns the number of newly added suppressions.
+        """
         async with self._lock:
-            if key in self._suppressions:
-                return
-            self._suppressions.add(key)
-            await self._async_save()
+            new_keys = set(keys) - self._suppressions
+            if not new_keys:
+                return 0
+            self._set_suppressions(self._suppressions | new_keys)
+            self._schedule_save()
+            return len(new_keys)
 
     async def async_unsuppress(self, key: str) -> None:
         """Remove a single suppression by key."""
         async with self._lock:
             if key not in self._suppressions:
                 return
-            self._suppressions.discard(key)
-            await self._async_save()
+            self._set_suppressions(self._suppressions - {key})
+            self._schedule_save()
 
     async def async_clear_all(self) -> None:
         """Clear all suppressions."""
         async with self._lock:
             if not self._suppressions:
                 return
-            self._suppressions.clear()
-            await self._async_save()
+            self._set_suppressions(set())
+            self._schedule_save()
 
     @property
     def keys(self) -> frozenset[str]:
@@ -119,15 +274,37 @@ class SuppressionStore:
 
 
 def filter_suppressed_issues(
-    issues: list[ValidationIssue],
+    issues: Sequence[ValidationIssue],
     suppression_store: SuppressionStore | None,
 ) -> tuple[list[ValidationIssue], int]:
-    """Return visible issues and suppressed count."""
+    """Return visible issues and suppressed count in a single pass."""
     if not suppression_store:
         return list(issues), 0
+    is_suppressed_for = suppression_store.is_suppressed_for
     visible = [
         i
         for i in issues
-        if not suppression_store.is_suppressed(i.get_suppression_key())
+        if not is_suppressed_for(
+            i.automation_id,
+            i.entity_id,
+            i.issue_type.value if i.issue_type else "unknown",
+        )
     ]
     return visible, len(issues) - len(visible)
+
+
+def filter_suppressed_issues_by_group(
+    group_issues: Mapping[str, Sequence[ValidationIssue]],
+    suppression_store: SuppressionStore | None,
+    group_order: Sequence[str],
+) -> tuple[dict[str, list[ValidationIssue]], dict[str, int]]:
+    """Filter grouped issues, returning visible issues and suppressed count per group."""
+    visible_groups: dict[str, list[ValidationIssue]] = {}
+    suppressed_counts: dict[str, int] = {}
+    for gid in group_order:
+        visible, suppressed_count = filter_suppressed_issues(
+            group_issues.get(gid, []), suppression_store
+        )
+        visible_groups[gid] = visible
+        suppressed_counts[gid] = suppressed_count
+    return visible_groups, suppressed_counts
@@ -0,0 +1,181 @@
+"""Persistent snapshot of the latest validation results."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import STORE_SAVE_DELAY_SECONDS, VERSION
+from .models import VALIDATION_GROUP_ORDER, IssueType, Severity, ValidationIssue
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "autodoctor.validation_snapshot"
+STORAGE_VERSION = 1
+
+# Runtime alerts are owned by the runtime monitor and go stale across a
+# restart, so their issues are not restored from the snapshot.
+_NON_RESTORED_GROUPS = frozenset({"runtime_health"})
+
+
+def _issue_from_dict(raw: dict[str, Any]) -> ValidationIssue | None:
+    """Rebuild a ValidationIssue from its ``to_dict()`` form."""
+    try:
+        issue_type_raw = raw.get("issue_type")
+        return ValidationIssue(
+            severity=Severity[str(raw["severity"]).upper()],
+            automation_id=str(raw["automation_id"]),
+            automation_name=str(raw.get("automation_name", "")),
+            entity_id=str(raw.get("entity_id", "")),
+            location=str(raw.get("location", "")),
+            message=str(raw.get("message", "")),
+            issue_type=IssueType(issue_type_raw) if issue_type_raw else None,
+            confidence=str(raw.get("confidence", "high")),
+            suggestion=raw.get("suggestion"),
+            valid_states=tuple(raw.get("valid_states") or ()),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class ValidationSnapshotStore:
+    """Persist validation results so they survive a restart.
+
+    Saves are scheduled after full runs and after single-automation
+    revalidations. The snapshot holds raw (unsuppressed) group issues, group
+    durations, run stats and per-automation config digests. Snapshots written
+    by another integration version are ignored because validator rules may
+    differ.
+
+    Structure:
+        {
+            "integration_version": "2.x.y",
+            "timestamp": "2026-01-01T00:00:00+00:00",
+            "groups": {"entity_state": {"issues": [...], "duration_ms": 12}},
+            "run_stats": {"analyzed_automations": 10, ...},
+            "config_digests": {"<automation id>": "<md5 hex>"}
+        }
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the validation snapshot store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+        )
+        self._pending: dict[str, Any] | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the snapshot, rebuilding issues into model objects.
+
+        Returns None when there is no usable snapshot.
+        """
+        try:
+            data = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Failed to load validation snapshot: %s", err)
+            return None
+        if not isinstance(data, dict):
+            return None
+        if data.get("integration_version") != VERSION:
+            _LOGGER.debug(
+                "Ignoring validation snapshot from version %s",
+                data.get("integration_version"),
+            )
+            return None
+
+        raw_groups = data.get("groups")
+        if not isinstance(raw_groups, dict):
+            return None
+        groups: dict[str, dict[str, Any]] = {}
+        for gid in VALIDATION_GROUP_ORDER:
+            raw_group = raw_groups.get(gid)
+            raw_group = raw_group if isinstance(raw_group, dict) else {}
+            issues: list[ValidationIssue] = []
+            if gid not in _NON_RESTORED_GROUPS:
+                for raw_issue in raw_group.get("issues") or []:
+                    if not isinstance(raw_issue, dict):
+                        continue
+                    issue = _issue_from_dict(raw_issue)
+                    if issue is not None:
+                        issues.append(issue)
+            groups[gid] = {
+                "issues": issues,
+                "duration_ms": int(raw_group.get("duration_ms", 0) or 0),
+            }
+
+        digests = data.get("config_digests")
+        run_stats = data.get("run_stats")
+        return {
+            "timestamp": data.get("timestamp"),
+            "groups": groups,
+            "run_stats": run_stats if isinstance(run_stats, dict) else {},
+            "config_digests": digests if isinstance(digests, dict) else {},
+        }
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the storage payload; called by Store when a write happens.
+
+        Issues are serialized here rather than when the save is scheduled, so
+        a burst of single-automation revalidations costs one serialization.
+        """
+        pending = self._pending
+        self._pending = None
+        if pending is None:
+            return {}
+        return {
+            "integration_version": VERSION,
+            "timestamp": pending["timestamp"],
+            "groups": {
+                gid: {
+                    "issues": [issue.to_dict() for issue in group.get("issues", [])],
+                    "duration_ms": group.get("duration_ms", 0),
+                }
+                for gid, group in pending["groups"].items()
+            },
+            "run_stats": pending["run_stats"],
+            "config_digests": dict(pending["config_digests"]),
+        }
+
+    def async_schedule_save(
+        self,
+        *,
+        timestamp: str | None,
+        groups: dict[str, dict[str, Any]],
+        run_stats: dict[str, Any],
+        config_digests: dict[str, str],
+    ) -> None:
+        """Schedule a delayed write of the current validation results.
+
+        The arguments are read when the write happens, so callers may keep
+        updating them in place until then.
+        """
+        self._pending = {
+            "timestamp": timestamp,
+            "groups": groups,
+            "run_stats": run_stats,
+            "config_digests": config_digests,
+        }
+        self._store.async_delay_save(self._data_to_save, STORE_SAVE_DELAY_SECONDS)
+
+    async def async_flush(self) -> None:
+        """Write any pending delayed save now (used on unload).
+
+        A failed write is re-raised and stays pending, so a later flush
+        retries it.
+        """
+        pending = self._pending
+        if pending is None:
+            return
+        try:
+            await self._store.async_save(self._data_to_save())
+        except Exception:
+            if self._pending is None:
+                self._pending = pending
+            raise
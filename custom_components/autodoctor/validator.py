@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import logging
 from difflib import get_close_matches
+from typing import Any
 
 from homeassistant.helpers import device_registry as dr
 
+from .bounded_cache import mapping_stats
 from .const import STATE_VALIDATION_WHITELIST
 from .domain_attributes import get_domain_attributes
 from .knowledge_base import StateKnowledgeBase
 from .models import IssueType, Severity, StateReference, ValidationIssue
+from .profiler import DISABLED_PROFILER, ValidationProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,14 +31,23 @@ _NON_ENTITY_REFERENCE_TYPES = frozenset(
 class ValidationEngine:
     """Validates state references against known valid states."""
 
-    def __init__(self, knowledge_base: StateKnowledgeBase) -> None:
+    def __init__(
+        self,
+        knowledge_base: StateKnowledgeBase,
+        profiler: ValidationProfiler | None = None,
+    ) -> None:
         """Initialize the validation engine.
 
         Args:
             knowledge_base: The state knowledge base
+            profiler: Optional span recorder for suggestion timings
         """
         self.knowledge_base = knowledge_base
+        self.profiler = profiler or DISABLED_PROFILER
         self._entity_cache: dict[str, list[str]] | None = None
+        self._entity_cache_hits = 0
+        self._entity_cache_misses = 0
+        self._entity_cache_evictions = 0
 
     def validate_reference(self, ref: StateReference) -> list[ValidationIssue]:
         """Validate a single state reference."""
@@ -350,13 +362,32 @@ class ValidationEngine:
 
     def invalidate_entity_cache(self) -> None:
         """Clear the entity cache so it is rebuilt on next use."""
+        if self._entity_cache is not None:
+            self._entity_cache_evictions += 1
         self._entity_cache = None
 
+    def get_cache_diagnostics(self) -> dict[str, Any]:
+        """Return size and hit-rate diagnostics for the entity cache.
+
+        A miss is a full rebuild from the state machine; an eviction is an
+        invalidation that dropped a built cache.
+        """
+        return {
+            "entity_ids": mapping_stats(
+                self._entity_cache,
+                hits=self._entity_cache_hits,
+                misses=self._entity_cache_misses,
+                evictions=self._entity_cache_evictions,
+            )
+        }
+
     def _ensure_entity_cache(self) -> None:
         """Build entity cache if not present."""
         if self._entity_cache is not None:
+            self._entity_cache_hits += 1
             return
 
+        self._entity_cache_misses += 1
         self._entity_cache = {}
         try:
             for entity in self.knowledge_base.hass.states.async_all():
@@ -380,7 +411,8 @@ class ValidationEngine:
         if not same_domain:
             return None
 
-        return get_entity_suggestion(invalid, same_domain)
+        with self.profiler.span("suggestions.entity"):
+            return get_entity_suggestion(invalid, same_domain)
 
     def _suggest_attribute(self, invalid: str, valid_attrs: list[str]) -> str | None:
         """Suggest a correction for an invalid attribute."""
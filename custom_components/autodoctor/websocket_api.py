@@ -15,9 +15,11 @@ from homeassistant.components import websocket_api
 from homeassistant.config import AUTOMATION_CONFIG_PATH
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.storage import Store
+from homeassistant.util.file import WriteError, write_utf8_file_atomic
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_ISSUES_UPDATED
 from .models import (
     VALIDATION_GROUP_ORDER,
     VALIDATION_GROUPS,
@@ -25,7 +27,13 @@ from .models import (
     Severity,
     ValidationIssue,
 )
-from .suppression_store import filter_suppressed_issues
+from .profiler import DEFAULT_PROFILE_TOP_N
+from .suppression_store import (
+    SUPPRESSION_WILDCARD,
+    filter_suppressed_issues,
+    filter_suppressed_issues_by_group,
+    is_supported_suppression_rule,
+)
 from .validator import get_entity_suggestion
 
 if TYPE_CHECKING:
@@ -50,8 +58,13 @@ async def async_setup_websocket_api(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_unsuppress)
     websocket_api.async_register_command(hass, websocket_fix_preview)
     websocket_api.async_register_command(hass, websocket_fix_apply)
+    websocket_api.async_register_command(hass, websocket_fix_apply_batch)
     websocket_api.async_register_command(hass, websocket_fix_undo)
     websocket_api.async_register_command(hass, websocket_dismiss)
+    websocket_api.async_register_command(hass, websocket_suppress_many)
+    websocket_api.async_register_command(hass, websocket_dismiss_many)
+    websocket_api.async_register_command(hass, websocket_diagnostics_profile)
+    websocket_api.async_register_command(hass, websocket_diagnostics_caches)
 
 
 def _raw_config_get(raw_config: Any, key: str) -> Any:
@@ -409,91 +422,295 @@ def _resolve_config_file_path(hass: HomeAssistant, config_file: str) -> Path:
     return raw_path
 
 
-def _apply_fix_to_automation_yaml(
-    *,
-    file_path: Path,
-    automation_id: str,
-    location: str,
-    expected_current: str | None,
-    suggested_value: str,
-    candidate_ids: list[str] | None = None,
-) -> tuple[bool, str, str | None]:
-    """Apply a scalar replacement directly to automations.yaml."""
+def _load_automation_yaml(file_path: Path) -> tuple[list[Any] | None, str]:
+    """Read and parse automations.yaml, returning (payload, error reason)."""
     try:
         payload = yaml.safe_load(file_path.read_text(encoding="utf-8"))
     except OSError as err:
-        return False, f"Unable to read automation config file: {err}", None
+        return None, f"Unable to read automation config file: {err}"
     except yaml.YAMLError as err:
-        return False, f"Unable to parse automation config file: {err}", None
+        return None, f"Unable to parse automation config file: {err}"
 
     if payload is None:
         payload = []
     if not isinstance(payload, list):
-        return False, "Automation config file must contain a list of automations.", None
+        return None, "Automation config file must contain a list of automations."
+    return cast(list[Any], payload), ""
+
+
+def _index_automation_yaml(
+    payload: list[Any],
+) -> dict[str, tuple[int, dict[str, Any]]]:
+    """Index automations.yaml items by id, entity_id and __entity_id hint.
+
+    Values carry the item position so lookups can prefer the first match in
+    file order, as a linear scan would.
+    """
+    index: dict[str, tuple[int, dict[str, Any]]] = {}
+    for position, item in enumerate(payload):
+        if not isinstance(item, dict):
+            continue
+        item_dict = cast(dict[str, Any], item)
+        raw_id = item_dict.get("id")
+        if isinstance(raw_id, str) and raw_id:
+            index.setdefault(raw_id, (position, item_dict))
+            index.setdefault(f"automation.{raw_id}", (position, item_dict))
+        raw_entity_hint = item_dict.get("__entity_id")
+        if isinstance(raw_entity_hint, str):
+            index.setdefault(raw_entity_hint, (position, item_dict))
+    return index
 
-    path = _parse_location_path(location)
-    if path is None:
-        return False, "Unsupported location format.", None
 
+def _find_indexed_automation(
+    index: dict[str, tuple[int, dict[str, Any]]],
+    automation_id: str,
+    candidate_ids: list[str] | None = None,
+) -> dict[str, Any] | None:
+    """Find the automations.yaml item matching an automation id or its aliases."""
     short_id = automation_id.replace("automation.", "", 1)
     candidate_id_set = {short_id}
     if candidate_ids:
         candidate_id_set.update(candidate_ids)
-    candidate_entity_ids = {
+    lookup_keys = {automation_id, *candidate_id_set}
+    lookup_keys.update(
         cid if cid.startswith("automation.") else f"automation.{cid}"
         for cid in candidate_id_set
-    }
-    candidate_entity_ids.add(automation_id)
-    target_automation: dict[str, Any] | None = None
-    for item in cast(list[Any], payload):
-        if not isinstance(item, dict):
-            continue
-        item_dict = cast(dict[str, Any], item)
-        raw_id = item_dict.get("id")
-        raw_entity_id = (
-            f"automation.{raw_id}" if isinstance(raw_id, str) and raw_id else None
+    )
+    matches = [index[key] for key in lookup_keys if key in index]
+    if not matches:
+        return None
+    return min(matches, key=lambda match: match[0])[1]
+
+
+def _write_automation_yaml(file_path: Path, payload: list[Any]) -> None:
+    """Write automations.yaml atomically (temp file + rename)."""
+    write_utf8_file_atomic(
+        str(file_path),
+        yaml.safe_dump(payload, allow_unicode=True, sort_keys=False),
+    )
+
+
+def _apply_fixes_to_automation_yaml(
+    *,
+    file_path: Path,
+    fixes: list[dict[str, Any]],
+) -> tuple[bool, str, list[str | None]]:
+    """Apply several scalar replacements to automations.yaml in one write.
+
+    Each fix carries ``automation_id``, ``location``, ``expected_current``,
+    ``suggested_value`` and optional ``candidate_ids``. The file is parsed
+    once and written once; if any fix fails its checks nothing is written.
+    Returns (ok, reason, previous values in fix order).
+    """
+    payload, reason = _load_automation_yaml(file_path)
+    if payload is None:
+        return False, reason, []
+
+    index = _index_automation_yaml(payload)
+    previous_values: list[str | None] = []
+    for fix in fixes:
+        path = _parse_location_path(fix["location"])
+        if path is None:
+            return False, "Unsupported location format.", previous_values
+
+        target_automation = _find_indexed_automation(
+            index, fix["automation_id"], fix.get("candidate_ids")
         )
-        raw_entity_hint = item_dict.get("__entity_id")
-        if (
-            (isinstance(raw_id, str) and raw_id in candidate_id_set)
-            or (
-                isinstance(raw_entity_id, str) and raw_entity_id in candidate_entity_ids
+        if target_automation is None:
+            return False, "Automation not found in automations.yaml.", previous_values
+
+        resolved = _resolve_parent_and_key(target_automation, path)
+        if resolved is None:
+            return (
+                False,
+                "Location does not resolve in automations.yaml.",
+                previous_values,
             )
-            or (
-                isinstance(raw_entity_hint, str)
-                and raw_entity_hint in candidate_entity_ids
+
+        container, key, live_value = resolved
+        if not isinstance(live_value, str):
+            return False, "Target value is not a string.", previous_values
+        previous_values.append(live_value)
+        expected_current = fix.get("expected_current")
+        if expected_current is not None and live_value != expected_current:
+            return (
+                False,
+                "Current value mismatch; automation has changed.",
+                previous_values,
             )
-        ):
-            target_automation = item_dict
-            break
+        if live_value == fix["suggested_value"]:
+            return False, "Suggested value already applied.", previous_values
+        container[key] = fix["suggested_value"]
 
-    if target_automation is None:
-        return False, "Automation not found in automations.yaml.", None
+    try:
+        _write_automation_yaml(file_path, payload)
+    except WriteError as err:
+        return (
+            False,
+            f"Unable to write automation config file: {err}",
+            previous_values,
+        )
 
-    resolved = _resolve_parent_and_key(target_automation, path)
-    if resolved is None:
-        return False, "Location does not resolve in automations.yaml.", None
+    return True, "", previous_values
 
-    container, key, live_value = resolved
-    if not isinstance(live_value, str):
-        return False, "Target value is not a string.", None
-    if expected_current is not None and live_value != expected_current:
-        return False, "Current value mismatch; automation has changed.", live_value
-    if live_value == suggested_value:
-        return False, "Suggested value already applied.", live_value
 
-    previous_value = live_value
-    container[key] = suggested_value
-    try:
-        file_path.write_text(
-            yaml.safe_dump(payload, allow_unicode=True, sort_keys=False),
-            encoding="utf-8",
+def _apply_fix_to_automation_yaml(
+    *,
+    file_path: Path,
+    automation_id: str,
+    location: str,
+    expected_current: str | None,
+    suggested_value: str,
+    candidate_ids: list[str] | None = None,
+) -> tuple[bool, str, str | None]:
+    """Apply a scalar replacement directly to automations.yaml."""
+    ok, reason, previous_values = _apply_fixes_to_automation_yaml(
+        file_path=file_path,
+        fixes=[
+            {
+                "automation_id": automation_id,
+                "location": location,
+                "expected_current": expected_current,
+                "suggested_value": suggested_value,
+                "candidate_ids": candidate_ids,
+            }
+        ],
+    )
+    return ok, reason, previous_values[-1] if previous_values else None
+
+
+def _apply_fixes_to_automation_files(
+    file_fixes: dict[Path, list[dict[str, Any]]],
+) -> tuple[bool, str]:
+    """Apply fixes to several automations.yaml files as one batch.
+
+    Each file's current text is kept before it is rewritten. If a later file
+    cannot be fixed or written, the files already written are restored so a
+    batch never lands half applied.
+    """
+    written: list[tuple[Path, str]] = []
+    for file_path, fixes in file_fixes.items():
+        try:
+            original = file_path.read_text(encoding="utf-8")
+        except OSError as err:
+            _restore_automation_files(written)
+            return False, f"Unable to read automation config file: {err}"
+        ok, reason, _ = _apply_fixes_to_automation_yaml(
+            file_path=file_path, fixes=fixes
         )
-    except OSError as err:
-        container[key] = previous_value
-        return False, f"Unable to write automation config file: {err}", previous_value
+        if not ok:
+            _restore_automation_files(written)
+            return False, reason
+        written.append((file_path, original))
+    return True, ""
+
+
+def _restore_automation_files(originals: list[tuple[Path, str]]) -> None:
+    """Write back the original text of automations.yaml files."""
+    for file_path, original in originals:
+        try:
+            write_utf8_file_atomic(str(file_path), original)
+        except WriteError as err:
+            _LOGGER.error(
+                "Unable to restore %s after a failed fix batch: %s", file_path, err
+            )
+
+
+def _config_candidate_ids(config: dict[str, Any]) -> list[str]:
+    """Return the ids an in-memory automation config may use in automations.yaml."""
+    config_ids: list[str] = []
+    raw_id = config.get("id")
+    if isinstance(raw_id, str) and raw_id:
+        config_ids.append(raw_id)
+    raw_entity_id = config.get("__entity_id")
+    if isinstance(raw_entity_id, str) and raw_entity_id.startswith("automation."):
+        config_ids.append(raw_entity_id.replace("automation.", "", 1))
+    return config_ids
+
+
+async def _async_apply_config_replacements(
+    hass: HomeAssistant,
+    replacements: list[dict[str, Any]],
+) -> tuple[bool, str, list[str], bool]:
+    """Apply guarded scalar replacements to automation configs as one batch.
+
+    Each replacement carries ``automation_id``, ``location``,
+    ``expected_current`` and ``new_value``. Every target is resolved and
+    checked before anything changes, automations.yaml is parsed and written
+    once per file, and in-memory configs are only updated after the writes
+    succeed. When the targets span several files, files written before a
+    failing one are restored.
+
+    Returns (ok, reason, previous values, persisted_file_change).
+    """
+    targets: list[tuple[Any, str | int, str]] = []
+    file_fixes: dict[Path, list[dict[str, Any]]] = {}
+    seen: set[tuple[str, str]] = set()
+    for replacement in replacements:
+        automation_id = replacement["automation_id"]
+        location = replacement["location"]
+        if (automation_id, location) in seen:
+            return False, f"Duplicate fix for {automation_id} at {location}.", [], False
+        seen.add((automation_id, location))
+
+        config = _find_automation_config(hass, automation_id)
+        path = _parse_location_path(location)
+        resolved = (
+            _resolve_parent_and_key(config, path)
+            if config is not None and path is not None
+            else None
+        )
+        if config is None or resolved is None:
+            return False, f"Unable to resolve target for {automation_id}.", [], False
+
+        container, key, live_value = resolved
+        if not isinstance(live_value, str):
+            return False, "Target value is not a string.", [], False
+        expected_current = replacement.get("expected_current")
+        if expected_current is not None and live_value != expected_current:
+            return (
+                False,
+                f"Current value mismatch for {automation_id}; automation has changed.",
+                [],
+                False,
+            )
+        if live_value == replacement["new_value"]:
+            return False, "Suggested value already applied.", [], False
+
+        config_file_raw = config.get("__config_file__")
+        if isinstance(config_file_raw, str):
+            config_path = _resolve_config_file_path(hass, config_file_raw)
+            if config_path.name != AUTOMATION_CONFIG_PATH:
+                return (
+                    False,
+                    "Automation source is not safely persistable.",
+                    [],
+                    False,
+                )
+            file_fixes.setdefault(config_path, []).append(
+                {
+                    "automation_id": automation_id,
+                    "location": location,
+                    "expected_current": live_value,
+                    "suggested_value": replacement["new_value"],
+                    "candidate_ids": _config_candidate_ids(config),
+                }
+            )
+        elif not _is_dict_mode_automation_data(hass):
+            return False, "Automation source is not safely persistable.", [], False
+        targets.append((container, key, live_value))
+
+    if file_fixes:
+        ok, reason = await hass.async_add_executor_job(
+            _apply_fixes_to_automation_files, file_fixes
+        )
+        if not ok:
+            return False, reason, [], False
 
-    return True, "", previous_value
+    for (container, key, _), replacement in zip(targets, replacements, strict=True):
+        container[key] = replacement["new_value"]
+
+    return True, "", [live_value for _, _, live_value in targets], bool(file_fixes)
 
 
 def _get_fix_snapshot_store(hass: HomeAssistant) -> Store[dict[str, Any]]:
@@ -616,12 +833,14 @@ async def _async_reconcile_visible_issues(hass: HomeAssistant) -> None:
     )
     visible_issues, _ = filter_suppressed_issues(raw_issues, suppression_store)
 
-    data["issues"] = visible_issues
-    data["validation_issues"] = visible_issues
+    from . import store_validation_issue_state
+
+    store_validation_issue_state(data, visible_issues, raw_issues)
 
     reporter = data.get("reporter")
     if reporter is not None and hasattr(reporter, "async_report_issues"):
         await reporter.async_report_issues(visible_issues)
+    async_dispatcher_send(hass, SIGNAL_ISSUES_UPDATED)
 
 
 @websocket_api.websocket_command(
@@ -786,17 +1005,15 @@ async def websocket_run_validation_steps(
         # Build groups response with suppression filtering
         groups = []
         all_visible_issues = []
-        total_suppressed = 0
+        visible_groups, suppressed_counts = filter_suppressed_issues_by_group(
+            cast(dict[str, list[ValidationIssue]], result["group_issues"]),
+            suppression_store,
+            VALIDATION_GROUP_ORDER,
+        )
+        total_suppressed = sum(suppressed_counts.values())
 
         for gid in VALIDATION_GROUP_ORDER:
-            raw_issues = cast(
-                list[ValidationIssue], result["group_issues"].get(gid, [])
-            )
-            visible, suppressed_count = filter_suppressed_issues(
-                raw_issues, suppression_store
-            )
-            total_suppressed += suppressed_count
-
+            visible = visible_groups[gid]
             all_visible_issues.extend(visible)
             formatted = _format_issues_with_fixes(hass, visible, all_entity_ids)
 
@@ -881,14 +1098,21 @@ async def websocket_get_validation_steps(
             )
     else:
         # Apply suppression filtering at READ time (not from cache)
+        visible_groups, suppressed_counts = filter_suppressed_issues_by_group(
+            {
+                gid: cast(
+                    list[ValidationIssue],
+                    cast(dict[str, Any], cached_groups.get(gid, {})).get("issues", []),
+                )
+                for gid in VALIDATION_GROUP_ORDER
+            },
+            suppression_store,
+            VALIDATION_GROUP_ORDER,
+        )
+        total_suppressed = sum(suppressed_counts.values())
         for gid in VALIDATION_GROUP_ORDER:
             bucket = cast(dict[str, Any], cached_groups.get(gid, {}))
-            raw_issues = cast(list[ValidationIssue], bucket.get("issues", []))
-            visible, suppressed_count = filter_suppressed_issues(
-                raw_issues, suppression_store
-            )
-            total_suppressed += suppressed_count
-
+            visible = visible_groups[gid]
             all_visible_issues.extend(visible)
             formatted = _format_issues_with_fixes(hass, visible, all_entity_ids)
 
@@ -928,13 +1152,106 @@ async def websocket_get_validation_steps(
     )
 
 
+_SUPPRESS_ITEM_SCHEMA = {
+    vol.Required("automation_id"): str,
+    vol.Required("entity_id"): str,
+    vol.Required("issue_type"): vol.In(
+        [*(it.value for it in IssueType), SUPPRESSION_WILDCARD]
+    ),
+    vol.Optional("state"): str,  # State value for learning
+}
+
+_RUNTIME_DISMISSAL_ISSUE_TYPES = frozenset(
+    {
+        IssueType.RUNTIME_AUTOMATION_OVERACTIVE.value,
+        IssueType.RUNTIME_AUTOMATION_BURST.value,
+    }
+)
+
+
+def _has_unsupported_wildcard(items: list[dict[str, Any]]) -> bool:
+    """Return whether any item combines wildcards into an unsupported rule."""
+    return any(
+        not is_supported_suppression_rule(
+            item["automation_id"], item["entity_id"], item["issue_type"]
+        )
+        for item in items
+    )
+
+
+_UNSUPPORTED_WILDCARD_MESSAGE = (
+    "Wildcard suppressions must be '<automation_id>:*:*' or '*:*:<issue_type>'"
+)
+
+
+async def _async_suppress_items(
+    hass: HomeAssistant,
+    suppression_store: SuppressionStore,
+    items: list[dict[str, Any]],
+) -> None:
+    """Suppress issues in one batch, learning states and runtime dismissals.
+
+    Learned states and suppression keys are each persisted with a single
+    coalesced save, and visible issues are reconciled once for the batch.
+    """
+    from .learned_states_store import LearnedStatesStore
+
+    data = hass.data.get(DOMAIN, {})
+    learned_store: LearnedStatesStore | None = data.get("learned_states_store")
+
+    # Learn state for invalid_state issues that carry a state value
+    learnable = [
+        item
+        for item in items
+        if item["issue_type"] == "invalid_state" and "state" in item
+    ]
+    learn_entries: list[tuple[str, str, str]] = []
+    if learned_store and learnable:
+        # Get integration from entity registry
+        entity_registry = er.async_get(hass)
+        for item in learnable:
+            entity_id = item["entity_id"]
+            entry = entity_registry.async_get(entity_id)
+            if entry and entry.platform:
+                domain = entity_id.split(".")[0] if "." in entity_id else ""
+                learn_entries.append((domain, entry.platform, item["state"]))
+    if learned_store and learn_entries:
+        await learned_store.async_learn_states(learn_entries)
+        for domain, platform, state in learn_entries:
+            _LOGGER.info(
+                "Learned state '%s' for %s entities from %s integration",
+                state,
+                domain,
+                platform,
+            )
+
+    # Suppress the issues
+    await suppression_store.async_suppress_many(
+        [
+            f"{item['automation_id']}:{item['entity_id']}:{item['issue_type']}"
+            for item in items
+        ]
+    )
+    await _async_reconcile_visible_issues(hass)
+
+    runtime_monitor = data.get("runtime_monitor")
+    if runtime_monitor is None or not hasattr(
+        runtime_monitor, "record_issue_dismissed"
+    ):
+        return
+    for item in items:
+        if item["issue_type"] not in _RUNTIME_DISMISSAL_ISSUE_TYPES:
+            continue
+        try:
+            runtime_monitor.record_issue_dismissed(item["automation_id"])
+        except Exception as err:
+            _LOGGER.debug("Failed recording runtime dismissal learning: %s", err)
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "autodoctor/suppress",
-        vol.Required("automation_id"): str,
-        vol.Required("entity_id"): str,
-        vol.Required("issue_type"): vol.In([it.value for it in IssueType]),
-        vol.Optional("state"): str,  # State value for learning
+        **_SUPPRESS_ITEM_SCHEMA,
     }
 )
 @websocket_api.require_admin
@@ -944,12 +1261,15 @@ async def websocket_suppress(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Suppress an issue, optionally learning the state."""
-    from .learned_states_store import LearnedStatesStore
+    """Suppress an issue, optionally learning the state.
 
+    ``entity_id``/``issue_type`` may be ``*`` to suppress every issue of an
+    automation, and ``automation_id``/``entity_id`` may be ``*`` to suppress
+    one issue type across all automations. Other wildcard combinations are
+    rejected.
+    """
     data = hass.data.get(DOMAIN, {})
     suppression_store: SuppressionStore | None = data.get("suppression_store")
-    learned_store: LearnedStatesStore | None = data.get("learned_states_store")
 
     if not suppression_store:
         connection.send_error(
@@ -957,43 +1277,49 @@ async def websocket_suppress(
         )
         return
 
-    # Learn state if this is an invalid_state issue with a state value
-    if learned_store and msg["issue_type"] == "invalid_state" and "state" in msg:
-        entity_id = msg["entity_id"]
-        state = msg["state"]
+    if _has_unsupported_wildcard([msg]):
+        connection.send_error(
+            msg["id"], "invalid_format", _UNSUPPORTED_WILDCARD_MESSAGE
+        )
+        return
 
-        # Get integration from entity registry
-        entity_registry = er.async_get(hass)
-        entry = entity_registry.async_get(entity_id)
+    await _async_suppress_items(hass, suppression_store, [msg])
 
-        if entry and entry.platform:
-            domain = entity_id.split(".")[0] if "." in entity_id else ""
-            await learned_store.async_learn_state(domain, entry.platform, state)
-            _LOGGER.info(
-                "Learned state '%s' for %s entities from %s integration",
-                state,
-                domain,
-                entry.platform,
-            )
+    connection.send_result(
+        msg["id"], {"success": True, "suppressed_count": suppression_store.count}
+    )
 
-    # Suppress the issue
-    key = f"{msg['automation_id']}:{msg['entity_id']}:{msg['issue_type']}"
-    await suppression_store.async_suppress(key)
-    await _async_reconcile_visible_issues(hass)
 
-    runtime_issue_types = {
-        IssueType.RUNTIME_AUTOMATION_OVERACTIVE.value,
-        IssueType.RUNTIME_AUTOMATION_BURST.value,
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "autodoctor/suppress_many",
+        vol.Required("items"): [vol.Schema(_SUPPRESS_ITEM_SCHEMA)],
     }
-    if msg["issue_type"] in runtime_issue_types:
-        runtime_monitor = data.get("runtime_monitor")
-        if runtime_monitor is not None and hasattr(
-            runtime_monitor, "record_issue_dismissed"
-        ):
-            try:
-                runtime_monitor.record_issue_dismissed(msg["automation_id"])
-            except Exception as err:
-                _LOGGER.debug("Failed recording runtime dismissal learning: %s", err)
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def websocket_suppress_many(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Suppress several issues at once (multi-select in the card)."""
+    data = hass.data.get(DOMAIN, {})
+    suppression_store: SuppressionStore | None = data.get("suppression_store")
+
+    if not suppression_store:
+        connection.send_error(
+            msg["id"], "not_ready", "Suppression store not initialized"
+        )
+        return
+
+    if _has_unsupported_wildcard(msg["items"]):
+        connection.send_error(
+            msg["id"], "invalid_format", _UNSUPPORTED_WILDCARD_MESSAGE
+        )
+        return
+
+    await _async_suppress_items(hass, suppression_store, msg["items"])
 
     connection.send_result(
         msg["id"], {"success": True, "suppressed_count": suppression_store.count}
@@ -1111,13 +1437,36 @@ async def websocket_unsuppress(
     )
 
 
+_FIX_ITEM_SCHEMA = {
+    vol.Required("automation_id"): str,
+    vol.Required("location"): str,
+    vol.Optional("current_value"): vol.Any(str, None),
+    vol.Required("suggested_value"): str,
+}
+
+
+async def _async_reload_and_revalidate(
+    hass: HomeAssistant, persisted_file_change: bool, action: str
+) -> None:
+    """Reload automations after a file edit and refresh validation results."""
+    if persisted_file_change:
+        try:
+            await hass.services.async_call("automation", "reload", {}, blocking=True)
+        except Exception as err:
+            _LOGGER.warning("Automation reload after %s failed: %s", action, err)
+
+    try:
+        from . import async_validate_all_with_groups
+
+        await async_validate_all_with_groups(hass)
+    except Exception as err:
+        _LOGGER.warning("Post-%s validation failed: %s", action, err)
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "autodoctor/fix_preview",
-        vol.Required("automation_id"): str,
-        vol.Required("location"): str,
-        vol.Optional("current_value"): vol.Any(str, None),
-        vol.Required("suggested_value"): str,
+        **_FIX_ITEM_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -1140,10 +1489,7 @@ async def websocket_fix_preview(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "autodoctor/fix_apply",
-        vol.Required("automation_id"): str,
-        vol.Required("location"): str,
-        vol.Optional("current_value"): vol.Any(str, None),
-        vol.Required("suggested_value"): str,
+        **_FIX_ITEM_SCHEMA,
     }
 )
 @websocket_api.require_admin
@@ -1197,14 +1543,6 @@ async def websocket_fix_apply(
             )
             return
 
-        config_ids: list[str] = []
-        raw_id = config.get("id")
-        if isinstance(raw_id, str) and raw_id:
-            config_ids.append(raw_id)
-        raw_entity_id = config.get("__entity_id")
-        if isinstance(raw_entity_id, str) and raw_entity_id.startswith("automation."):
-            config_ids.append(raw_entity_id.replace("automation.", "", 1))
-
         ok, reason, persisted_previous = await hass.async_add_executor_job(
             partial(
                 _apply_fix_to_automation_yaml,
@@ -1213,7 +1551,7 @@ async def websocket_fix_apply(
                 location=msg["location"],
                 expected_current=preview.get("current_value"),
                 suggested_value=suggested_value,
-                candidate_ids=config_ids,
+                candidate_ids=_config_candidate_ids(config),
             )
         )
         if not ok:
@@ -1237,18 +1575,7 @@ async def websocket_fix_apply(
         )
         return
 
-    if persisted_file_change:
-        try:
-            await hass.services.async_call("automation", "reload", {}, blocking=True)
-        except Exception as err:
-            _LOGGER.warning("Automation reload after fix failed: %s", err)
-
-    try:
-        from . import async_validate_all_with_groups
-
-        await async_validate_all_with_groups(hass)
-    except Exception as err:
-        _LOGGER.warning("Post-fix validation failed: %s", err)
+    await _async_reload_and_revalidate(hass, persisted_file_change, "fix")
 
     snapshot = {
         "automation_id": msg["automation_id"],
@@ -1270,6 +1597,66 @@ async def websocket_fix_apply(
     )
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "autodoctor/fix_apply_batch",
+        vol.Required("fixes"): vol.All(
+            [vol.Schema(_FIX_ITEM_SCHEMA)], vol.Length(min=1)
+        ),
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def websocket_fix_apply_batch(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Apply several guarded scalar replacements with one write and one reload.
+
+    The batch is all-or-nothing: if any fix fails its checks, nothing is
+    changed. A single undo snapshot covers the whole batch.
+    """
+    fixes: list[dict[str, Any]] = msg["fixes"]
+    (
+        ok,
+        reason,
+        previous_values,
+        persisted_file_change,
+    ) = await _async_apply_config_replacements(
+        hass,
+        [
+            {
+                "automation_id": fix["automation_id"],
+                "location": fix["location"],
+                "expected_current": fix.get("current_value"),
+                "new_value": fix["suggested_value"],
+            }
+            for fix in fixes
+        ],
+    )
+    if not ok:
+        connection.send_error(msg["id"], "fix_not_applicable", reason)
+        return
+
+    await _async_reload_and_revalidate(hass, persisted_file_change, "fix")
+
+    applied = [
+        {
+            "automation_id": fix["automation_id"],
+            "location": fix["location"],
+            "previous_value": previous_value,
+            "new_value": fix["suggested_value"],
+        }
+        for fix, previous_value in zip(fixes, previous_values, strict=True)
+    ]
+    await _async_save_last_fix_snapshot(hass, {"fixes": applied})
+
+    connection.send_result(
+        msg["id"], {"applied": True, "count": len(applied), "fixes": applied}
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "autodoctor/fix_undo",
@@ -1290,6 +1677,11 @@ async def websocket_fix_undo(
         )
         return
 
+    batch = snapshot.get("fixes")
+    if batch is not None:
+        await _async_undo_fix_batch(hass, connection, msg, batch)
+        return
+
     automation_id = snapshot.get("automation_id")
     location = snapshot.get("location")
     previous_value = snapshot.get("previous_value")
@@ -1340,14 +1732,6 @@ async def websocket_fix_undo(
             )
             return
 
-        config_ids: list[str] = []
-        raw_id = config.get("id")
-        if isinstance(raw_id, str) and raw_id:
-            config_ids.append(raw_id)
-        raw_entity_id = config.get("__entity_id")
-        if isinstance(raw_entity_id, str) and raw_entity_id.startswith("automation."):
-            config_ids.append(raw_entity_id.replace("automation.", "", 1))
-
         ok, reason, _ = await hass.async_add_executor_job(
             partial(
                 _apply_fix_to_automation_yaml,
@@ -1356,7 +1740,7 @@ async def websocket_fix_undo(
                 location=location,
                 expected_current=new_value,
                 suggested_value=previous_value,
-                candidate_ids=config_ids,
+                candidate_ids=_config_candidate_ids(config),
             )
         )
         if not ok:
@@ -1372,18 +1756,7 @@ async def websocket_fix_undo(
         )
         return
 
-    if persisted_file_change:
-        try:
-            await hass.services.async_call("automation", "reload", {}, blocking=True)
-        except Exception as err:
-            _LOGGER.warning("Automation reload after undo failed: %s", err)
-
-    try:
-        from . import async_validate_all_with_groups
-
-        await async_validate_all_with_groups(hass)
-    except Exception as err:
-        _LOGGER.warning("Post-undo validation failed: %s", err)
+    await _async_reload_and_revalidate(hass, persisted_file_change, "undo")
 
     await _async_save_last_fix_snapshot(hass, None)
     connection.send_result(
@@ -1397,16 +1770,108 @@ async def websocket_fix_undo(
     )
 
 
+async def _async_undo_fix_batch(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    batch: Any,
+) -> None:
+    """Undo a batch snapshot recorded by fix_apply_batch in one write."""
+    if not isinstance(batch, list) or not batch:
+        connection.send_error(
+            msg["id"], "fix_undo_unavailable", "Invalid undo snapshot"
+        )
+        return
+
+    replacements: list[dict[str, Any]] = []
+    for entry in reversed(cast(list[Any], batch)):
+        if not isinstance(entry, dict) or not all(
+            isinstance(entry.get(field), str)
+            for field in ("automation_id", "location", "previous_value", "new_value")
+        ):
+            connection.send_error(
+                msg["id"], "fix_undo_unavailable", "Invalid undo snapshot"
+            )
+            return
+        replacements.append(
+            {
+                "automation_id": entry["automation_id"],
+                "location": entry["location"],
+                "expected_current": entry["new_value"],
+                "new_value": entry["previous_value"],
+            }
+        )
+
+    ok, reason, _, persisted_file_change = await _async_apply_config_replacements(
+        hass, replacements
+    )
+    if not ok:
+        connection.send_error(msg["id"], "fix_undo_failed", reason)
+        return
+
+    await _async_reload_and_revalidate(hass, persisted_file_change, "undo")
+
+    await _async_save_last_fix_snapshot(hass, None)
+    connection.send_result(
+        msg["id"],
+        {
+            "undone": True,
+            "count": len(replacements),
+            "fixes": [
+                {
+                    "automation_id": replacement["automation_id"],
+                    "location": replacement["location"],
+                    "restored_value": replacement["new_value"],
+                }
+                for replacement in reversed(replacements)
+            ],
+        },
+    )
+
+
+_DISMISS_ITEM_SCHEMA = {
+    vol.Required("automation_id"): str,
+    vol.Required("issue_type"): vol.In(sorted(_RUNTIME_DISMISSAL_ISSUE_TYPES)),
+}
+
+
+async def _async_dismiss_runtime_items(
+    hass: HomeAssistant,
+    runtime_monitor: Any,
+    items: list[dict[str, Any]],
+) -> None:
+    """Dismiss runtime alerts in one batch and reconcile visible issues once."""
+    data = hass.data.get(DOMAIN, {})
+    dismissed: set[tuple[str, str]] = set()
+    for item in items:
+        runtime_monitor.record_issue_dismissed(item["automation_id"])
+        dismissed.add((item["automation_id"], item["issue_type"]))
+
+    def _is_dismissed(issue: ValidationIssue) -> bool:
+        return (
+            issue.issue_type is not None
+            and (issue.automation_id, issue.issue_type.value) in dismissed
+        )
+
+    # Remove the dismissed issues from the raw cache and update repairs
+    raw_issues: list[ValidationIssue] = data.get("validation_issues_raw", [])
+    data["validation_issues_raw"] = [i for i in raw_issues if not _is_dismissed(i)]
+
+    # Remove from validation_groups_raw so /validation/steps reflects the change
+    groups_raw = data.get("validation_groups_raw")
+    if groups_raw is not None:
+        for bucket in groups_raw.values():
+            bucket["issues"] = [
+                i for i in bucket.get("issues", []) if not _is_dismissed(i)
+            ]
+
+    await _async_reconcile_visible_issues(hass)
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "autodoctor/dismiss",
-        vol.Required("automation_id"): str,
-        vol.Required("issue_type"): vol.In(
-            [
-                IssueType.RUNTIME_AUTOMATION_OVERACTIVE.value,
-                IssueType.RUNTIME_AUTOMATION_BURST.value,
-            ]
-        ),
+        **_DISMISS_ITEM_SCHEMA,
     }
 )
 @websocket_api.require_admin
@@ -1424,36 +1889,75 @@ async def websocket_dismiss(
         connection.send_error(msg["id"], "not_ready", "Runtime monitor not initialized")
         return
 
-    runtime_monitor.record_issue_dismissed(msg["automation_id"])
+    await _async_dismiss_runtime_items(hass, runtime_monitor, [msg])
 
-    # Remove the dismissed issue from the raw cache and update repairs
-    automation_id = msg["automation_id"]
-    issue_type_val = msg["issue_type"]
-    raw_issues: list[ValidationIssue] = data.get("validation_issues_raw", [])
-    data["validation_issues_raw"] = [
-        i
-        for i in raw_issues
-        if not (
-            i.automation_id == automation_id
-            and i.issue_type is not None
-            and i.issue_type.value == issue_type_val
-        )
-    ]
+    connection.send_result(msg["id"], {"success": True})
 
-    # Remove from validation_groups_raw so /validation/steps reflects the change
-    groups_raw = data.get("validation_groups_raw")
-    if groups_raw is not None:
-        for bucket in groups_raw.values():
-            bucket["issues"] = [
-                i
-                for i in bucket.get("issues", [])
-                if not (
-                    i.automation_id == automation_id
-                    and i.issue_type is not None
-                    and i.issue_type.value == issue_type_val
-                )
-            ]
 
-    await _async_reconcile_visible_issues(hass)
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "autodoctor/dismiss_many",
+        vol.Required("items"): [vol.Schema(_DISMISS_ITEM_SCHEMA)],
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def websocket_dismiss_many(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Dismiss several runtime health alerts at once (multi-select in the card)."""
+    data = hass.data.get(DOMAIN, {})
+    runtime_monitor = data.get("runtime_monitor")
+
+    if runtime_monitor is None:
+        connection.send_error(msg["id"], "not_ready", "Runtime monitor not initialized")
+        return
+
+    await _async_dismiss_runtime_items(hass, runtime_monitor, msg["items"])
 
     connection.send_result(msg["id"], {"success": True})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "autodoctor/diagnostics/profile",
+        vol.Optional("top_n", default=DEFAULT_PROFILE_TOP_N): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def websocket_diagnostics_profile(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the slowest automations and stages from the last profiled run."""
+    data = hass.data.get(DOMAIN, {})
+    profiler = data.get("profiler")
+    if profiler is None:
+        connection.send_error(msg["id"], "not_ready", "Profiler not initialized")
+        return
+
+    connection.send_result(msg["id"], profiler.get_last_run(msg["top_n"]))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "autodoctor/diagnostics/caches",
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def websocket_diagnostics_caches(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return entry counts, approximate sizes and hit rates for each cache."""
+    from .diagnostics import collect_cache_diagnostics
+
+    connection.send_result(msg["id"], collect_cache_diagnostics(hass))
@@ -0,0 +1,70 @@
+"""Tests for the 5-minute cross-automation activity index."""
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.autodoctor.activity_index import (
+    SLOT_SECONDS,
+    ActivitySlotIndex,
+    slot_of,
+)
+
+_NOW = datetime(2026, 2, 11, 12, 3, tzinfo=UTC)
+
+
+def test_slot_of_matches_five_minute_wall_clock_buckets() -> None:
+    """Slots should line up with :00, :05, ... boundaries."""
+    bucket_start = _NOW.replace(minute=0)
+    assert slot_of(_NOW) == slot_of(bucket_start)
+    assert slot_of(_NOW) == int(bucket_start.timestamp()) // SLOT_SECONDS
+    assert slot_of(_NOW + timedelta(minutes=2)) == slot_of(_NOW) + 1
+    assert slot_of(_NOW.timestamp()) == slot_of(_NOW)
+
+
+def test_other_count_excludes_the_queried_automation() -> None:
+    """Only other automations in the same slot should be counted."""
+    index = ActivitySlotIndex()
+    index.add("automation.a", _NOW - timedelta(minutes=1))
+    index.add("automation.b", _NOW - timedelta(minutes=2))
+    index.add("automation.c", _NOW - timedelta(minutes=7))
+
+    assert index.other_count("automation.a", _NOW) == 1
+    assert index.other_count("automation.c", _NOW) == 2
+    assert index.other_count("automation.c", _NOW - timedelta(minutes=7)) == 0
+
+
+def test_repeated_triggers_in_a_slot_count_once() -> None:
+    """Several triggers of one automation in a slot are one distinct automation."""
+    index = ActivitySlotIndex()
+    index.add_many(
+        "automation.a", [_NOW, _NOW + timedelta(seconds=30), _NOW.timestamp()]
+    )
+
+    assert len(index) == 1
+    assert index.other_count("automation.b", _NOW) == 1
+
+
+def test_sync_only_visits_events_newer_than_previous_sync() -> None:
+    """A second sync should walk only the new tail of the event list."""
+    index = ActivitySlotIndex()
+    events = [_NOW - timedelta(minutes=m) for m in (30, 20, 10)]
+    assert index.sync("automation.a", events) == 3
+    assert index.sync("automation.a", events) == 0
+
+    events.append(_NOW)
+    assert index.sync("automation.a", events) == 1
+    assert index.other_count("automation.b", _NOW) == 1
+
+
+def test_prune_drops_old_slots_and_empty_automations() -> None:
+    """Slots before the cutoff should be removed from counts and memberships."""
+    index = ActivitySlotIndex()
+    index.add("automation.old", _NOW - timedelta(days=40))
+    index.add("automation.a", _NOW - timedelta(days=40))
+    index.add("automation.a", _NOW)
+
+    assert index.prune(_NOW - timedelta(days=37)) == 1
+
+    assert len(index) == 1
+    assert index.stats()["automations"] == 1
+    assert index.other_count("automation.b", _NOW - timedelta(days=40)) == 0
+    assert index.other_count("automation.b", _NOW) == 1
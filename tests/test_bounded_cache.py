@@ -0,0 +1,92 @@
+"""Tests for the bounded LRU cache helpers."""
+
+from copy import deepcopy
+
+from custom_components.autodoctor.bounded_cache import (
+    LRUCache,
+    approximate_size,
+    mapping_stats,
+)
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """Entries beyond max_entries should be evicted oldest-first."""
+    evicted: list[str] = []
+    cache: LRUCache[str, int] = LRUCache(
+        2, on_evict=lambda key, _value: evicted.append(key)
+    )
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.lookup("a") == 1  # a becomes most recent
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+    assert evicted == ["b"]
+    assert cache.evictions == 1
+
+
+def test_lru_cache_setdefault_respects_bound() -> None:
+    """setdefault should go through the bounded insert path."""
+    cache: LRUCache[str, list[float]] = LRUCache(1)
+    cache.setdefault("a", []).append(1.0)
+    cache.setdefault("b", []).append(2.0)
+
+    assert dict(cache) == {"b": [2.0]}
+    assert cache.evictions == 1
+
+
+def test_lru_cache_counts_hits_and_misses() -> None:
+    """lookup should count hits and misses; plain reads should not."""
+    cache: LRUCache[str, int] = LRUCache()
+    cache["a"] = 1
+    cache.lookup("a")
+    cache.lookup("missing")
+    _ = cache["a"]
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["max_entries"] is None
+
+
+def test_lru_cache_resize_evicts_immediately() -> None:
+    """Shrinking the bound should evict down to the new size."""
+    cache: LRUCache[int, int] = LRUCache()
+    for i in range(5):
+        cache[i] = i
+    cache.resize(2)
+
+    assert list(cache) == [3, 4]
+    assert cache.evictions == 3
+
+
+def test_lru_cache_copies_are_plain_dicts() -> None:
+    """Snapshots should not carry the eviction callback or counters."""
+    cache: LRUCache[str, dict[str, int]] = LRUCache(5, on_evict=lambda k, v: None)
+    cache["a"] = {"x": 1}
+
+    shallow = cache.copy()
+    deep = deepcopy(cache)
+
+    assert type(shallow) is dict
+    assert type(deep) is dict
+    assert deep == {"a": {"x": 1}}
+    assert deep["a"] is not cache["a"]
+
+
+def test_approximate_size_counts_nested_values() -> None:
+    """Nested containers should add to the reported size."""
+    flat = {"a": set()}
+    nested = {"a": {"on", "off", "unavailable", "unknown"}}
+
+    assert approximate_size(nested) > approximate_size(flat)
+
+
+def test_mapping_stats_handles_missing_mapping() -> None:
+    """A cache that has not been built yet should report zero entries."""
+    stats = mapping_stats(None, misses=2)
+
+    assert stats["entries"] == 0
+    assert stats["approx_bytes"] == 0
+    assert stats["hit_rate"] == 0.0
@@ -0,0 +1,57 @@
+"""Tests for the burst-detection epoch ring buffer."""
+
+from custom_components.autodoctor.burst_window import BurstWindow
+
+
+def _window(capacity: int = 16) -> BurstWindow:
+    return BurstWindow(long_seconds=3600.0, short_seconds=300.0, capacity=capacity)
+
+
+def test_counts_follow_long_and_short_windows() -> None:
+    """advance() should drop expired epochs and split short vs long counts."""
+    window = _window()
+    for epoch in (0.0, 1000.0, 3400.0, 3500.0):
+        window.append(epoch)
+
+    window.advance(3600.0)
+    assert window.long_count == 4
+    assert window.short_count == 2
+
+    window.advance(4500.0)
+    assert window.long_count == 3  # epoch 0 is older than one hour
+    assert window.short_count == 0
+    assert window.epochs() == [1000.0, 3400.0, 3500.0]
+
+
+def test_capacity_overwrites_oldest_epochs() -> None:
+    """A full ring should keep only the newest ``capacity`` epochs."""
+    window = _window(capacity=4)
+    for epoch in range(10):
+        window.append(float(epoch))
+    window.advance(10.0)
+
+    assert window.epochs() == [6.0, 7.0, 8.0, 9.0]
+    assert window.long_count == 4
+    assert window.short_count == 4
+
+
+def test_out_of_order_append_keeps_epochs_sorted() -> None:
+    """A late epoch should be slotted into order rather than break the cursors."""
+    window = _window()
+    window.append(100.0)
+    window.append(300.0)
+    window.append(200.0)
+    window.advance(400.0)
+
+    assert window.epochs() == [100.0, 200.0, 300.0]
+    assert window.short_count == 3
+
+
+def test_from_epochs_sorts_input() -> None:
+    """from_epochs should accept epochs in any order."""
+    window = BurstWindow.from_epochs(
+        [30.0, 10.0, 20.0], long_seconds=3600.0, short_seconds=300.0
+    )
+
+    assert window.epochs() == [10.0, 20.0, 30.0]
+    assert len(window) == 3
@@ -14,7 +14,8 @@ Tests cover:
 import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
@@ -1365,6 +1366,24 @@ async def test_unload_entry_cancels_debounce_task() -> None:
     mock_task.cancel.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_unload_entry_cancels_running_warm_up_task() -> None:
+    """Unload should stop a history load or bootstrap still running."""
+    from custom_components.autodoctor import async_unload_entry
+
+    hass = MagicMock()
+    entry = MagicMock()
+    mock_task = MagicMock()
+    mock_task.done.return_value = False
+
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    hass.services.async_remove = MagicMock()
+    hass.data = {DOMAIN: {"warm_up_task": mock_task}}
+
+    assert await async_unload_entry(hass, entry) is True
+    mock_task.cancel.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_unload_entry_calls_unsub_listeners() -> None:
     """Test that unload calls unsubscribe callbacks for event listeners.
@@ -1924,6 +1943,35 @@ async def test_unload_entry_does_not_call_async_flush_runtime_state() -> None:
     assert result is True
 
 
+@pytest.mark.asyncio
+async def test_unload_entry_flushes_pending_store_saves() -> None:
+    """async_unload_entry should write out debounced suppression/learned saves."""
+    from custom_components.autodoctor import async_unload_entry
+
+    hass = MagicMock()
+    entry = MagicMock()
+    suppression_store = MagicMock()
+    suppression_store.async_flush = AsyncMock()
+    learned_states_store = MagicMock()
+    learned_states_store.async_flush = AsyncMock(side_effect=OSError("Disk full"))
+
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    hass.services.async_remove = MagicMock()
+    hass.data = {
+        DOMAIN: {
+            "suppression_store": suppression_store,
+            "learned_states_store": learned_states_store,
+        }
+    }
+
+    result = await async_unload_entry(hass, entry)
+
+    assert result is True
+    suppression_store.async_flush.assert_awaited_once()
+    learned_states_store.async_flush.assert_awaited_once()
+    assert DOMAIN not in hass.data
+
+
 @pytest.mark.asyncio
 async def test_async_setup_entry_full_lifecycle() -> None:
     """Test async_setup_entry complete setup flow with all components."""
@@ -1952,6 +2000,10 @@ async def test_async_setup_entry_full_lifecycle() -> None:
     with (
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
         patch(
             "custom_components.autodoctor._async_register_card", new_callable=AsyncMock
         ) as mock_register_card,
@@ -1977,8 +2029,20 @@ async def test_async_setup_entry_full_lifecycle() -> None:
         assert "validator" in data
         assert "unsub_reload_listener" in data
         assert data["unsub_initial_scan"] is None
+        assert data["runtime_scheduler"] is None
         hass.bus.async_listen_once.assert_called_once()
         mock_register_card.assert_called_once()
+        timing = data["setup_timing"]
+        assert timing["setup_ms"] >= 0
+        assert set(timing["phases"]) == {
+            "stores",
+            "components",
+            "runtime_monitor",
+            "snapshot",
+            "platforms",
+            "listeners",
+        }
+        assert timing["warm_up_ms"] is None
 
 
 @pytest.mark.asyncio
@@ -2004,6 +2068,10 @@ async def test_async_setup_entry_no_reload_listener() -> None:
     with (
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
         patch(
             "custom_components.autodoctor._async_register_card", new_callable=AsyncMock
         ),
@@ -2051,6 +2119,10 @@ async def test_async_setup_entry_registers_periodic_scan_listener_default_interv
     with (
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
         patch(
             "custom_components.autodoctor._setup_periodic_scan_listener",
             return_value=periodic_unsub,
@@ -2106,6 +2178,10 @@ async def test_async_setup_entry_registers_periodic_scan_listener_custom_interva
     with (
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
         patch(
             "custom_components.autodoctor._setup_periodic_scan_listener",
             return_value=periodic_unsub,
@@ -2162,7 +2238,13 @@ async def test_async_setup_entry_runtime_monitor_enabled() -> None:
     with (
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
-        patch("custom_components.autodoctor.RuntimeHealthMonitor") as mock_runtime_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
+        patch(
+            "custom_components.autodoctor.runtime_monitor.RuntimeHealthMonitor"
+        ) as mock_runtime_cls,
         patch(
             "custom_components.autodoctor._async_register_card", new_callable=AsyncMock
         ),
@@ -2191,6 +2273,9 @@ async def test_async_setup_entry_runtime_monitor_enabled() -> None:
     assert mock_runtime_cls.call_args.kwargs["max_alerts_per_day"] == 8
     # Event store init must happen asynchronously after construction
     mock_runtime_cls.return_value.async_init_event_store.assert_awaited_once()
+    runtime_scheduler = hass.data[DOMAIN]["runtime_scheduler"]
+    assert runtime_scheduler is not None
+    assert hass.data[DOMAIN]["unsub_runtime_scheduler"] is not None
 
 
 @pytest.mark.asyncio
@@ -2221,7 +2306,13 @@ async def test_async_setup_entry_schedules_initial_scan_after_recovery() -> None
     with (
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
-        patch("custom_components.autodoctor.RuntimeHealthMonitor") as mock_runtime_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
+        patch(
+            "custom_components.autodoctor.runtime_monitor.RuntimeHealthMonitor"
+        ) as mock_runtime_cls,
         patch(
             "custom_components.autodoctor._async_register_card", new_callable=AsyncMock
         ),
@@ -2278,8 +2369,10 @@ async def test_validate_all_with_groups_filters_suppressed_before_reporting_and_
     )
 
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(
-        side_effect=lambda key: key == suppressed_issue.get_suppression_key()
+    suppression_store.is_suppressed_for = MagicMock(
+        side_effect=lambda *parts: (
+            ":".join(parts) == suppressed_issue.get_suppression_key()
+        )
     )
 
     grouped_hass.data[DOMAIN]["validator"].validate_all.return_value = [
@@ -2335,7 +2428,7 @@ async def test_validate_all_with_groups_logs_visibility_when_all_suppressed(
     )
 
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(return_value=True)
+    suppression_store.is_suppressed_for = MagicMock(return_value=True)
 
     grouped_hass.data[DOMAIN]["validator"].validate_all.return_value = [
         suppressed_issue
@@ -2447,6 +2540,44 @@ async def test_run_validators_includes_runtime_health_stage(
     )
 
 
+@pytest.mark.asyncio
+async def test_run_validators_reports_scheduler_alerts_without_rescoring(
+    grouped_hass: MagicMock,
+) -> None:
+    """With the runtime scheduler running, full scans reuse its current alerts."""
+    from custom_components.autodoctor import _async_run_validators
+
+    runtime_issue = make_issue(
+        IssueType.RUNTIME_AUTOMATION_OVERACTIVE,
+        Severity.ERROR,
+    )
+    runtime_monitor = MagicMock()
+    runtime_monitor.validate_automations = AsyncMock(return_value=[])
+    runtime_scheduler = MagicMock()
+    runtime_scheduler.get_active_issues.return_value = [runtime_issue]
+    runtime_scheduler.get_run_stats.return_value = {"total_automations": 3}
+
+    grouped_hass.data[DOMAIN]["validator"].validate_all.return_value = []
+    grouped_hass.data[DOMAIN]["analyzer"].extract_state_references.return_value = []
+    grouped_hass.data[DOMAIN]["jinja_validator"].validate_automations.return_value = []
+    grouped_hass.data[DOMAIN][
+        "service_validator"
+    ].validate_service_calls.return_value = []
+    grouped_hass.data[DOMAIN]["service_validator"].async_load_descriptions = AsyncMock()
+    grouped_hass.data[DOMAIN]["analyzer"].extract_service_calls.return_value = []
+    grouped_hass.data[DOMAIN]["runtime_monitor"] = runtime_monitor
+    grouped_hass.data[DOMAIN]["runtime_scheduler"] = runtime_scheduler
+    grouped_hass.data[DOMAIN]["runtime_health_enabled"] = True
+
+    automations = [{"id": "test", "alias": "Test"}]
+    result = await _async_run_validators(grouped_hass, automations)
+
+    runtime_monitor.validate_automations.assert_not_awaited()
+    runtime_scheduler.get_active_issues.assert_called_once_with(automations)
+    assert result["group_issues"]["runtime_health"] == [runtime_issue]
+    assert result["skip_reasons"]["runtime_health"] == {"total_automations": 3}
+
+
 @pytest.mark.asyncio
 async def test_run_validators_logs_runtime_health_disabled(
     grouped_hass: MagicMock,
@@ -2782,12 +2913,13 @@ async def test_options_updated_no_notification_when_runtime_health_toggled() ->
 
 
 @pytest.mark.asyncio
-async def test_setup_calls_load_history_directly() -> None:
-    """Test that async_setup_entry loads knowledge base history immediately.
+async def test_setup_loads_history_in_background_task() -> None:
+    """Test that async_setup_entry starts the history load without awaiting it.
 
     This fixes INIT-01: On config reload, EVENT_HOMEASSISTANT_STARTED has
-    already fired, so the event listener never triggers. The knowledge base
-    must load history during setup, not just via the event listener.
+    already fired, so the event listener never triggers. Setup itself must
+    start the knowledge base history load, as a background task so setup
+    does not wait on the recorder.
 
     The event listener remains as a fallback for fresh HA starts.
     """
@@ -2802,6 +2934,9 @@ async def test_setup_calls_load_history_directly() -> None:
     hass.config_entries.async_forward_entry_setups = AsyncMock()
     hass.services = MagicMock()
     hass.services.async_register = MagicMock()
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.ensure_future(coro)
+    )
 
     entry = MagicMock()
     entry.options = {"validate_on_reload": False}
@@ -2811,6 +2946,10 @@ async def test_setup_calls_load_history_directly() -> None:
     with (
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
         patch("custom_components.autodoctor.StateKnowledgeBase") as mock_kb_cls,
         patch(
             "custom_components.autodoctor._async_register_card", new_callable=AsyncMock
@@ -2835,10 +2974,15 @@ async def test_setup_calls_load_history_directly() -> None:
 
         result = await async_setup_entry(hass, entry)
         assert result is True
+        await hass.data[DOMAIN]["warm_up_task"]
 
-        # The critical assertion: history should be loaded directly during setup
+        # The critical assertion: setup itself starts the history load
         # NOT via the event listener (which won't fire on reload)
         mock_kb.async_load_history.assert_called_once()
+        assert hass.async_create_background_task.call_args[0][1] == (
+            f"{DOMAIN}_warm_up"
+        )
+        assert hass.data[DOMAIN]["setup_timing"]["warm_up_ms"] >= 0
 
 
 @pytest.mark.asyncio
@@ -2846,9 +2990,9 @@ async def test_reload_reloads_knowledge_base_history() -> None:
     """Test that config reload triggers a fresh knowledge base history load.
 
     Simulates the reload scenario:
-    1. First setup - history loaded immediately
+    1. First setup - history load started in the background
     2. Unload
-    3. Second setup - history loaded again immediately
+    3. Second setup - history load started again
 
     This verifies the reload path works without EVENT_HOMEASSISTANT_STARTED.
     """
@@ -2864,6 +3008,9 @@ async def test_reload_reloads_knowledge_base_history() -> None:
     hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
     hass.services = MagicMock()
     hass.services.async_register = MagicMock()
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.ensure_future(coro)
+    )
     hass.services.async_remove = MagicMock()
 
     entry = MagicMock()
@@ -2874,6 +3021,10 @@ async def test_reload_reloads_knowledge_base_history() -> None:
     with (
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
         patch("custom_components.autodoctor.StateKnowledgeBase") as mock_kb_cls,
         patch(
             "custom_components.autodoctor._async_register_card", new_callable=AsyncMock
@@ -2899,6 +3050,7 @@ async def test_reload_reloads_knowledge_base_history() -> None:
         # First setup
         result1 = await async_setup_entry(hass, entry)
         assert result1 is True
+        await hass.data[DOMAIN]["warm_up_task"]
         assert mock_kb.async_load_history.call_count == 1
 
         # Simulate unload
@@ -2910,6 +3062,7 @@ async def test_reload_reloads_knowledge_base_history() -> None:
         # Second setup (reload scenario)
         result2 = await async_setup_entry(hass, entry)
         assert result2 is True
+        await hass.data[DOMAIN]["warm_up_task"]
 
         # History should have been loaded again during the second setup
         assert mock_kb.async_load_history.call_count == 2
@@ -2922,12 +3075,13 @@ async def test_reload_reloads_knowledge_base_history() -> None:
 async def test_validate_automation_reports_merged_issues(
     grouped_hass: MagicMock,
 ) -> None:
-    """Test that async_validate_automation reports merged issues to prevent repair deletion.
+    """Test that async_validate_automation merges issues without touching other repairs.
 
-    When a single automation is re-validated, the reporter should receive ALL
-    issues (from the target automation plus all other automations), not just
-    the target automation's issues. Otherwise, reporter._clear_resolved_issues
-    deletes repairs for all other automations.
+    When a single automation is re-validated, the stored issue state must keep
+    ALL issues (from the target automation plus all other automations), while
+    the reporter is told only about the target automation's change. Reporting
+    a partial list through async_report_issues would delete repairs for all
+    other automations.
 
     This is the fix for INIT-02 defect.
     """
@@ -3006,12 +3160,16 @@ async def test_validate_automation_reports_merged_issues(
 
         await async_validate_automation(grouped_hass, "automation.auto_b")
 
-    # Critical assertion: reporter.async_report_issues should have been called with
-    # ALL 4 issues (2 from auto_a, 1 new from auto_b, 1 from auto_c)
-    reporter_call_args = grouped_hass.data[DOMAIN][
-        "reporter"
-    ].async_report_issues.call_args
-    reported_issues = reporter_call_args[0][0]
+    # Critical assertion: only auto_b's repair is updated; the full-list report
+    # (which clears repairs missing from the list) must not be used.
+    reporter = grouped_hass.data[DOMAIN]["reporter"]
+    reporter.async_report_issues.assert_not_awaited()
+    reporter.async_report_automation_issues.assert_awaited_once_with(
+        "automation.auto_b", [new_auto_b_issue]
+    )
+
+    # Stored state holds ALL 4 issues (2 from auto_a, 1 new from auto_b, 1 from auto_c)
+    reported_issues = grouped_hass.data[DOMAIN]["validation_issues"]
 
     assert len(reported_issues) == 4, f"Expected 4 issues, got {len(reported_issues)}"
 
@@ -3040,9 +3198,10 @@ async def test_validate_automation_preserves_other_repairs(
 ) -> None:
     """Test that validating an automation with no issues doesn't wipe other repairs.
 
-    When an automation is re-validated and has NO issues (empty result), the
-    reporter should still receive issues from all OTHER automations, preserving
-    their repair entries. This is an edge case of the INIT-02 fix.
+    When an automation is re-validated and has NO issues (empty result), only
+    its own repair is cleared; issues from all OTHER automations stay in the
+    stored state and their repair entries are untouched. This is an edge case
+    of the INIT-02 fix.
     """
     # Set up existing issues from automations A and C
     existing_issues = [
@@ -3087,11 +3246,13 @@ async def test_validate_automation_preserves_other_repairs(
 
         await async_validate_automation(grouped_hass, "automation.auto_b")
 
-    # Reporter should still receive auto_a and auto_c issues
-    reporter_call_args = grouped_hass.data[DOMAIN][
-        "reporter"
-    ].async_report_issues.call_args
-    reported_issues = reporter_call_args[0][0]
+    # Reporter clears only auto_b; auto_a and auto_c issues stay stored
+    reporter = grouped_hass.data[DOMAIN]["reporter"]
+    reporter.async_report_issues.assert_not_awaited()
+    reporter.async_report_automation_issues.assert_awaited_once_with(
+        "automation.auto_b", []
+    )
+    reported_issues = grouped_hass.data[DOMAIN]["validation_issues"]
 
     assert len(reported_issues) == 2, (
         f"Expected 2 issues preserved, got {len(reported_issues)}"
@@ -3142,7 +3303,13 @@ async def test_async_setup_entry_logs_runtime_config_enabled(
         caplog.at_level(logging.DEBUG, logger="custom_components.autodoctor"),
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
-        patch("custom_components.autodoctor.RuntimeHealthMonitor") as mock_runtime_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
+        patch(
+            "custom_components.autodoctor.runtime_monitor.RuntimeHealthMonitor"
+        ) as mock_runtime_cls,
         patch(
             "custom_components.autodoctor._async_register_card", new_callable=AsyncMock
         ),
@@ -3194,6 +3361,10 @@ async def test_async_setup_entry_logs_runtime_config_disabled(
         caplog.at_level(logging.DEBUG, logger="custom_components.autodoctor"),
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
         patch(
             "custom_components.autodoctor._async_register_card", new_callable=AsyncMock
         ),
@@ -3237,6 +3408,9 @@ async def test_async_setup_entry_registers_runtime_trigger_listener_and_ingests_
     hass.config_entries.async_forward_entry_setups = AsyncMock()
     hass.services = MagicMock()
     hass.services.async_register = MagicMock()
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.ensure_future(coro)
+    )
 
     entry = MagicMock()
     entry.options = {
@@ -3249,7 +3423,14 @@ async def test_async_setup_entry_registers_runtime_trigger_listener_and_ingests_
     with (
         patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
         patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
-        patch("custom_components.autodoctor.RuntimeHealthMonitor") as mock_runtime_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
+        patch(
+            "custom_components.autodoctor.runtime_monitor.RuntimeHealthMonitor"
+        ) as mock_runtime_cls,
+        patch("custom_components.autodoctor.StateKnowledgeBase") as mock_kb_cls,
         patch(
             "custom_components.autodoctor._async_register_card", new_callable=AsyncMock
         ),
@@ -3259,6 +3440,8 @@ async def test_async_setup_entry_registers_runtime_trigger_listener_and_ingests_
         ),
     ):
         mock_runtime_cls.return_value.async_init_event_store = AsyncMock()
+        mock_runtime_cls.return_value.async_bootstrap_from_recorder = AsyncMock()
+        mock_kb_cls.return_value.async_load_history = AsyncMock()
         mock_suppression = AsyncMock()
         mock_suppression.async_load = AsyncMock()
         mock_suppression_cls.return_value = mock_suppression
@@ -3268,6 +3451,7 @@ async def test_async_setup_entry_registers_runtime_trigger_listener_and_ingests_
         mock_learned_cls.return_value = mock_learned
 
         await async_setup_entry(hass, entry)
+        await hass.data[DOMAIN]["warm_up_task"]
 
         assert "automation_triggered" in listener_callbacks
 
@@ -3286,6 +3470,97 @@ async def test_async_setup_entry_registers_runtime_trigger_listener_and_ingests_
         )
 
 
+@pytest.mark.asyncio
+async def test_runtime_triggers_before_bootstrap_are_ingested_after_it() -> None:
+    """Triggers fired during warm-up must not pre-empt the recorder import."""
+    from custom_components.autodoctor import async_setup_entry
+
+    hass = MagicMock()
+    hass.data = {}
+    hass.bus = MagicMock()
+    hass.bus.async_listen_once = MagicMock()
+    listener_callbacks: dict[str, object] = {}
+
+    def _capture_listener(event_type: str, callback: object) -> MagicMock:
+        listener_callbacks[event_type] = callback
+        return MagicMock()
+
+    hass.bus.async_listen = MagicMock(side_effect=_capture_listener)
+    hass.config_entries = MagicMock()
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+    hass.services = MagicMock()
+    hass.services.async_register = MagicMock()
+    warm_up: dict[str, Any] = {}
+
+    def _hold_warm_up(coro: Any, name: str) -> MagicMock:
+        warm_up["coro"] = coro
+        return MagicMock()
+
+    hass.async_create_background_task = MagicMock(side_effect=_hold_warm_up)
+
+    entry = MagicMock()
+    entry.options = {
+        "validate_on_reload": False,
+        "runtime_health_enabled": True,
+    }
+    entry.add_update_listener = MagicMock(return_value=None)
+    entry.async_on_unload = MagicMock()
+
+    with (
+        patch("custom_components.autodoctor.SuppressionStore") as mock_suppression_cls,
+        patch("custom_components.autodoctor.LearnedStatesStore") as mock_learned_cls,
+        patch(
+            "custom_components.autodoctor.ValidationSnapshotStore",
+            return_value=AsyncMock(async_load=AsyncMock(return_value=None)),
+        ),
+        patch(
+            "custom_components.autodoctor.runtime_monitor.RuntimeHealthMonitor"
+        ) as mock_runtime_cls,
+        patch("custom_components.autodoctor.StateKnowledgeBase") as mock_kb_cls,
+        patch(
+            "custom_components.autodoctor._async_register_card", new_callable=AsyncMock
+        ),
+        patch(
+            "custom_components.autodoctor.async_setup_websocket_api",
+            new_callable=AsyncMock,
+        ),
+    ):
+        mock_runtime_cls.return_value.async_init_event_store = AsyncMock()
+        mock_runtime = mock_runtime_cls.return_value
+
+        async def _bootstrap(_automations: list[dict[str, Any]]) -> None:
+            mock_runtime.ingest_trigger_event.assert_not_called()
+
+        mock_runtime.async_bootstrap_from_recorder = AsyncMock(side_effect=_bootstrap)
+        mock_kb_cls.return_value.async_load_history = AsyncMock()
+        mock_suppression = AsyncMock()
+        mock_suppression.async_load = AsyncMock()
+        mock_suppression_cls.return_value = mock_suppression
+
+        mock_learned = AsyncMock()
+        mock_learned.async_load = AsyncMock()
+        mock_learned_cls.return_value = mock_learned
+
+        await async_setup_entry(hass, entry)
+
+        event = MagicMock()
+        event.data = {"entity_id": "automation.kitchen_lights"}
+        event.time_fired = datetime(2026, 2, 13, 14, 30, tzinfo=UTC)
+        callback = listener_callbacks["automation_triggered"]
+        assert callable(callback)
+        callback(event)
+        mock_runtime.ingest_trigger_event.assert_not_called()
+
+        await warm_up["coro"]
+
+        mock_runtime.async_bootstrap_from_recorder.assert_awaited_once()
+        mock_runtime.ingest_trigger_event.assert_called_once_with(
+            "automation.kitchen_lights",
+            occurred_at=event.time_fired,
+            suppression_store=mock_suppression,
+        )
+
+
 @pytest.mark.asyncio
 async def test_runtime_trigger_closure_does_not_lookup_suppression_store_per_event() -> (
     None
@@ -3349,6 +3624,409 @@ async def test_periodic_scan_triggers_weekly_maintenance_when_due() -> None:
         callback = captured["action"]
         await callback(datetime.now(UTC))  # type: ignore[misc]
 
-    hass.async_add_executor_job.assert_awaited_once_with(
-        mock_runtime.run_weekly_maintenance
+    assert hass.async_add_executor_job.await_args_list == [
+        call(mock_runtime.run_weekly_maintenance),
+        call(mock_runtime.run_store_maintenance),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_validate_automation_replaces_only_target_index_bucket(
+    grouped_hass: MagicMock,
+) -> None:
+    """Single-automation revalidation swaps one bucket of the issue index.
+
+    Buckets for other automations must be the very same list objects after the
+    merge, proving they were not re-filtered or rebuilt.
+    """
+    issue_a = make_issue(
+        IssueType.ENTITY_NOT_FOUND,
+        Severity.ERROR,
+        automation_id="automation.auto_a",
+        entity_id="sensor.a",
+    )
+    old_issue_b = make_issue(
+        IssueType.ENTITY_NOT_FOUND,
+        Severity.ERROR,
+        automation_id="automation.auto_b",
+        entity_id="sensor.old_b",
+    )
+    new_issue_b = make_issue(
+        IssueType.ENTITY_NOT_FOUND,
+        Severity.ERROR,
+        automation_id="automation.auto_b",
+        entity_id="sensor.new_b",
+    )
+    bucket_a = [issue_a]
+    grouped_hass.data[DOMAIN]["validation_issues_by_automation"] = {
+        "automation.auto_a": bucket_a,
+        "automation.auto_b": [old_issue_b],
+    }
+    grouped_hass.data[DOMAIN]["validation_issues_raw_by_automation"] = {
+        "automation.auto_a": list(bucket_a),
+        "automation.auto_b": [old_issue_b],
+    }
+
+    with (
+        patch(
+            "custom_components.autodoctor._get_automation_configs",
+            return_value=[{"id": "auto_b", "alias": "Auto B"}],
+        ),
+        patch(
+            "custom_components.autodoctor._async_run_validators",
+            new_callable=AsyncMock,
+            return_value={
+                "all_issues": [new_issue_b],
+                "timestamp": "2026-02-06T00:00:00Z",
+            },
+        ),
+    ):
+        await async_validate_automation(grouped_hass, "automation.auto_b")
+
+    data = grouped_hass.data[DOMAIN]
+    assert data["validation_issues_by_automation"]["automation.auto_a"] is bucket_a
+    assert data["validation_issues_by_automation"]["automation.auto_b"] == [new_issue_b]
+    assert data["validation_issues"] == [issue_a, new_issue_b]
+    assert data["validation_issues_raw"] == [issue_a, new_issue_b]
+
+
+@pytest.mark.asyncio
+async def test_validate_clean_automation_keeps_flat_issue_lists(
+    grouped_hass: MagicMock,
+) -> None:
+    """Revalidating an automation without issues should not rebuild flat lists."""
+    issue_a = make_issue(
+        IssueType.ENTITY_NOT_FOUND,
+        Severity.ERROR,
+        automation_id="automation.auto_a",
+        entity_id="sensor.a",
+    )
+    flat = [issue_a]
+    grouped_hass.data[DOMAIN].update(
+        {
+            "validation_issues": flat,
+            "validation_issues_raw": flat,
+            "validation_issues_by_automation": {"automation.auto_a": [issue_a]},
+            "validation_issues_raw_by_automation": {"automation.auto_a": [issue_a]},
+        }
+    )
+
+    with (
+        patch(
+            "custom_components.autodoctor._get_automation_configs",
+            return_value=[{"id": "auto_b", "alias": "Auto B"}],
+        ),
+        patch(
+            "custom_components.autodoctor._async_run_validators",
+            new_callable=AsyncMock,
+            return_value={"all_issues": [], "timestamp": "2026-02-06T00:00:00Z"},
+        ),
+    ):
+        await async_validate_automation(grouped_hass, "automation.auto_b")
+
+    data = grouped_hass.data[DOMAIN]
+    assert data["validation_issues"] is flat
+    assert data["validation_issues_raw"] is flat
+    assert data["validation_last_run"] == "2026-02-06T00:00:00Z"
+
+
+# --- validation snapshot restore / lazy revalidation ---
+
+
+def _snapshot_with(issues_by_group: dict[str, list[ValidationIssue]]) -> dict[str, Any]:
+    return {
+        "timestamp": "2026-01-01T00:00:00+00:00",
+        "groups": {
+            gid: {"issues": issues_by_group.get(gid, []), "duration_ms": 7}
+            for gid in VALIDATION_GROUP_ORDER
+        },
+        "run_stats": {"analyzed_automations": 2, "failed_automations": 0},
+        "config_digests": {},
+    }
+
+
+def test_restore_validation_snapshot_reapplies_suppressions(
+    mock_hass: MagicMock,
+) -> None:
+    """Restored issues should be visible unless currently suppressed."""
+    from custom_components.autodoctor import _restore_validation_snapshot
+
+    kept = make_issue(IssueType.ENTITY_NOT_FOUND, Severity.ERROR)
+    suppressed = make_issue(
+        IssueType.SERVICE_NOT_FOUND,
+        Severity.ERROR,
+        automation_id="automation.other",
     )
+    suppression_store = MagicMock()
+    suppression_store.is_suppressed_for.side_effect = (
+        lambda automation_id, _entity_id, _issue_type: (
+            automation_id == "automation.other"
+        )
+    )
+    mock_hass.data[DOMAIN] = {"suppression_store": suppression_store}
+
+    _restore_validation_snapshot(
+        mock_hass, _snapshot_with({"entity_state": [kept], "services": [suppressed]})
+    )
+
+    data = mock_hass.data[DOMAIN]
+    assert data["validation_issues_raw"] == [kept, suppressed]
+    assert data["validation_issues"] == [kept]
+    assert data["validation_groups"]["services"]["issues"] == []
+    assert data["validation_groups_raw"]["services"]["issues"] == [suppressed]
+    assert data["validation_last_run"] == "2026-01-01T00:00:00+00:00"
+    assert data["validation_run_stats"]["analyzed_automations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_revalidation_only_checks_changed_automations(
+    mock_hass: MagicMock,
+) -> None:
+    """Changed automations are revalidated and removed ones are dropped."""
+    from custom_components.autodoctor import (
+        _async_revalidate_changed_automations,
+        _build_config_snapshot,
+        _restore_validation_snapshot,
+    )
+
+    configs = [
+        {"id": "same", "alias": "Same"},
+        {"id": "edited", "alias": "Edited v2"},
+        {"id": "other1", "alias": "Other 1"},
+        {"id": "other2", "alias": "Other 2"},
+    ]
+    previous = _build_config_snapshot(
+        [
+            {"id": "same", "alias": "Same"},
+            {"id": "edited", "alias": "Edited v1"},
+            {"id": "other1", "alias": "Other 1"},
+            {"id": "other2", "alias": "Other 2"},
+            {"id": "gone", "alias": "Gone"},
+        ]
+    )
+    gone_issue = make_issue(
+        IssueType.ENTITY_NOT_FOUND, Severity.ERROR, automation_id="automation.gone"
+    )
+    same_issue = make_issue(
+        IssueType.ENTITY_NOT_FOUND, Severity.ERROR, automation_id="automation.same"
+    )
+    reporter = AsyncMock()
+    snapshot_store = MagicMock()
+    mock_hass.data[DOMAIN] = {
+        "suppression_store": None,
+        "reporter": reporter,
+        "validation_snapshot_store": snapshot_store,
+    }
+    _restore_validation_snapshot(
+        mock_hass, _snapshot_with({"entity_state": [same_issue, gone_issue]})
+    )
+
+    with (
+        patch(
+            "custom_components.autodoctor._get_automation_configs",
+            return_value=configs,
+        ),
+        patch(
+            "custom_components.autodoctor.async_validate_automation",
+            new_callable=AsyncMock,
+        ) as mock_validate_one,
+        patch(
+            "custom_components.autodoctor.async_validate_all",
+            new_callable=AsyncMock,
+        ) as mock_validate_all,
+        patch("custom_components.autodoctor.async_dispatcher_send"),
+    ):
+        await _async_revalidate_changed_automations(mock_hass, previous)
+
+    mock_validate_all.assert_not_awaited()
+    mock_validate_one.assert_awaited_once_with(mock_hass, "automation.edited")
+    reporter.async_report_automation_issues.assert_awaited_once_with(
+        "automation.gone", []
+    )
+    data = mock_hass.data[DOMAIN]
+    assert data["validation_issues_raw"] == [same_issue]
+    assert data["validation_groups_raw"]["entity_state"]["issues"] == [same_issue]
+    assert data["_automation_snapshot"] == _build_config_snapshot(configs)
+    kwargs = snapshot_store.async_schedule_save.call_args.kwargs
+    assert kwargs["config_digests"] == _build_config_snapshot(configs)
+    assert kwargs["groups"]["entity_state"]["issues"] == [same_issue]
+
+
+@pytest.mark.asyncio
+async def test_validate_automation_updates_restored_snapshot(
+    grouped_hass: MagicMock,
+) -> None:
+    """Single revalidation should replace its issues in the persisted snapshot."""
+    from custom_components.autodoctor import (
+        _build_config_snapshot,
+        _restore_validation_snapshot,
+    )
+
+    old_issue = make_issue(
+        IssueType.ENTITY_NOT_FOUND, Severity.ERROR, automation_id="automation.test"
+    )
+    other_issue = make_issue(
+        IssueType.ENTITY_NOT_FOUND, Severity.ERROR, automation_id="automation.other"
+    )
+    new_issue = make_issue(
+        IssueType.SERVICE_NOT_FOUND, Severity.ERROR, automation_id="automation.test"
+    )
+    config = {"id": "test", "alias": "Test v2"}
+    snapshot_store = MagicMock()
+    data = grouped_hass.data[DOMAIN]
+    data["validation_snapshot_store"] = snapshot_store
+    snapshot = _snapshot_with({"entity_state": [old_issue, other_issue]})
+    snapshot["config_digests"] = {"test": "stale", "other": "unchanged"}
+    _restore_validation_snapshot(grouped_hass, snapshot)
+
+    with (
+        patch(
+            "custom_components.autodoctor._get_automation_configs",
+            return_value=[config],
+        ),
+        patch(
+            "custom_components.autodoctor._async_run_validators",
+            new_callable=AsyncMock,
+            return_value={
+                "group_issues": {"services": [new_issue]},
+                "all_issues": [new_issue],
+                "timestamp": "2026-02-06T00:00:00Z",
+            },
+        ),
+        patch("custom_components.autodoctor.async_dispatcher_send"),
+    ):
+        await async_validate_automation(grouped_hass, "automation.test")
+
+    assert data["validation_groups_raw"]["entity_state"]["issues"] == [other_issue]
+    assert data["validation_groups"]["services"]["issues"] == [new_issue]
+    kwargs = snapshot_store.async_schedule_save.call_args.kwargs
+    assert kwargs["timestamp"] == "2026-02-06T00:00:00Z"
+    assert kwargs["groups"]["services"]["issues"] == [new_issue]
+    assert kwargs["config_digests"] == {
+        "test": _build_config_snapshot([config])["test"],
+        "other": "unchanged",
+    }
+
+
+@pytest.mark.asyncio
+async def test_runtime_batch_alerts_replace_stored_runtime_issues(
+    grouped_hass: MagicMock,
+) -> None:
+    """Alerts from a scoring batch should reach stored issues and Repairs at once."""
+    from custom_components.autodoctor import (
+        _async_apply_runtime_alerts,
+        _restore_validation_snapshot,
+    )
+
+    static_issue = make_issue(
+        IssueType.ENTITY_NOT_FOUND, Severity.ERROR, automation_id="automation.test"
+    )
+    alert = make_issue(
+        IssueType.RUNTIME_AUTOMATION_OVERDUE,
+        Severity.WARNING,
+        automation_id="automation.test",
+        entity_id="automation.test",
+    )
+    unscored_alert = make_issue(
+        IssueType.RUNTIME_AUTOMATION_BURST,
+        Severity.WARNING,
+        automation_id="automation.other",
+        entity_id="automation.other",
+    )
+    data = grouped_hass.data[DOMAIN]
+    runtime_monitor = MagicMock()
+    runtime_monitor.get_active_runtime_alerts.return_value = [alert, unscored_alert]
+    data["runtime_monitor"] = runtime_monitor
+    _restore_validation_snapshot(
+        grouped_hass, _snapshot_with({"entity_state": [static_issue]})
+    )
+    reporter = data["reporter"]
+
+    await _async_apply_runtime_alerts(
+        grouped_hass, ["automation.test", "automation.quiet"]
+    )
+
+    assert data["validation_issues_raw"] == [static_issue, alert]
+    assert data["validation_issues"] == [static_issue, alert]
+    assert data["validation_groups"]["runtime_health"]["issues"] == [alert]
+    assert data["validation_groups_raw"]["entity_state"]["issues"] == [static_issue]
+    reporter.async_report_automation_issues.assert_awaited_once_with(
+        "automation.test", [static_issue, alert]
+    )
+
+    # An unchanged batch leaves Repairs alone; a cleared alert is removed.
+    reporter.async_report_automation_issues.reset_mock()
+    await _async_apply_runtime_alerts(grouped_hass, ["automation.test"])
+    reporter.async_report_automation_issues.assert_not_awaited()
+
+    runtime_monitor.get_active_runtime_alerts.return_value = []
+    await _async_apply_runtime_alerts(grouped_hass, ["automation.test"])
+
+    assert data["validation_issues"] == [static_issue]
+    assert data["validation_groups_raw"]["runtime_health"]["issues"] == []
+    reporter.async_report_automation_issues.assert_awaited_once_with(
+        "automation.test", [static_issue]
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_revalidation_falls_back_to_full_scan(
+    mock_hass: MagicMock,
+) -> None:
+    """When most automations changed, a single full scan is used instead."""
+    from custom_components.autodoctor import _async_revalidate_changed_automations
+
+    configs = [{"id": f"a{i}", "alias": f"A{i}"} for i in range(4)]
+    mock_hass.data[DOMAIN] = {}
+
+    with (
+        patch(
+            "custom_components.autodoctor._get_automation_configs",
+            return_value=configs,
+        ),
+        patch(
+            "custom_components.autodoctor.async_validate_automation",
+            new_callable=AsyncMock,
+        ) as mock_validate_one,
+        patch(
+            "custom_components.autodoctor.async_validate_all",
+            new_callable=AsyncMock,
+        ) as mock_validate_all,
+    ):
+        await _async_revalidate_changed_automations(mock_hass, {})
+
+    mock_validate_all.assert_awaited_once_with(mock_hass)
+    mock_validate_one.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_validate_all_with_groups_schedules_snapshot_save(
+    grouped_hass: MagicMock,
+) -> None:
+    """A full validation run should persist its result as the restart snapshot."""
+    from custom_components.autodoctor import async_validate_all_with_groups
+
+    entity_issue = make_issue(IssueType.ENTITY_NOT_FOUND, Severity.ERROR)
+    data = grouped_hass.data[DOMAIN]
+    data["analyzer"].extract_state_references.return_value = []
+    data["analyzer"].extract_service_calls.return_value = []
+    data["validator"].validate_all.return_value = [entity_issue]
+    data["jinja_validator"].validate_automations.return_value = []
+    data["service_validator"].validate_service_calls.return_value = []
+    snapshot_store = MagicMock()
+    data["validation_snapshot_store"] = snapshot_store
+    configs = [{"id": "test", "alias": "Test"}]
+
+    with (
+        patch(
+            "custom_components.autodoctor._get_automation_configs",
+            return_value=configs,
+        ),
+        patch("custom_components.autodoctor.async_dispatcher_send"),
+    ):
+        await async_validate_all_with_groups(grouped_hass)
+
+    snapshot_store.async_schedule_save.assert_called_once()
+    kwargs = snapshot_store.async_schedule_save.call_args.kwargs
+    assert kwargs["groups"]["entity_state"]["issues"] == [entity_issue]
+    assert set(kwargs["config_digests"]) == {"test"}
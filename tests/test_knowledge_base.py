@@ -1968,3 +1968,47 @@ async def test_has_confirmed_states_schema_introspection(hass: HomeAssistant) ->
     await hass.async_block_till_done()
 
     assert kb.has_confirmed_states("climate.thermostat") is True
+
+
+async def test_valid_states_cache_evicts_least_recently_used(
+    hass: HomeAssistant,
+) -> None:
+    """A bounded cache should evict the coldest entity and recompute it later."""
+    kb = StateKnowledgeBase(hass, max_cache_entries=2)
+    for entity_id in ("light.a", "light.b", "light.c"):
+        hass.states.async_set(entity_id, STATE_ON)
+    await hass.async_block_till_done()
+
+    kb.get_valid_states("light.a")
+    kb.get_valid_states("light.b")
+    kb.get_valid_states("light.a")  # refresh light.a
+    kb.get_valid_states("light.c")
+
+    assert set(kb._cache) == {"light.a", "light.c"}
+    assert "on" in (kb.get_valid_states("light.b") or set())
+
+    stats = kb.get_cache_diagnostics()["valid_states"]
+    assert stats["max_entries"] == 2
+    assert stats["entries"] == 2
+    assert stats["hits"] == 1
+    assert stats["misses"] == 4
+    assert stats["evictions"] == 2
+    assert stats["approx_bytes"] > 0
+
+
+async def test_cache_diagnostics_report_observed_states(hass: HomeAssistant) -> None:
+    """Observed-state diagnostics should count lookups with and without history."""
+    kb = StateKnowledgeBase(hass)
+    hass.states.async_set("light.a", STATE_ON)
+    hass.states.async_set("light.b", STATE_ON)
+    await hass.async_block_till_done()
+    kb._observed_states["light.a"] = {"on", "off"}
+
+    kb.get_valid_states("light.a")
+    kb.get_valid_states("light.b")
+
+    observed = kb.get_cache_diagnostics()["observed_states"]
+    assert observed["entries"] == 1
+    assert observed["hits"] == 1
+    assert observed["misses"] == 1
+    assert observed["max_entries"] is None
@@ -8,12 +8,14 @@ This module tests the core data models used throughout Autodoctor:
 - VALIDATION_GROUPS configuration
 """
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from typing import Any
 
 import pytest
 
 from custom_components.autodoctor.models import (
+    EMPTY_VALID_STATES,
     VALIDATION_GROUPS,
     IssueType,
     ServiceCall,
@@ -227,6 +229,102 @@ def test_validation_issue_set_deduplication() -> None:
     assert len(issues_set) == 2  # Only 2 unique issues
 
 
+def test_models_are_slotted_and_frozen() -> None:
+    """Models should not carry a per-instance __dict__ or allow mutation."""
+    ref = StateReference(
+        automation_id="automation.test",
+        automation_name="Test",
+        entity_id="light.kitchen",
+        expected_state="on",
+        expected_attribute=None,
+        location="trigger[0].to",
+    )
+    issue = ValidationIssue(
+        severity=Severity.ERROR,
+        automation_id="automation.test",
+        automation_name="Test",
+        entity_id="light.kitchen",
+        location="trigger[0].to",
+        message="Invalid state",
+    )
+    call = ServiceCall(
+        automation_id="automation.test",
+        automation_name="Test",
+        service="light.turn_on",
+        location="action[0]",
+    )
+
+    for model in (ref, issue, call):
+        assert not hasattr(model, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            model.location = "elsewhere"  # type: ignore[misc]
+
+
+def test_models_intern_repeated_identifiers() -> None:
+    """automation_id and location should be interned across instances."""
+    suffix = "test"
+    first = StateReference(
+        automation_id="automation." + suffix,
+        automation_name="Test",
+        entity_id="light.kitchen",
+        expected_state="on",
+        expected_attribute=None,
+        location="trigger[0]." + "to",
+    )
+    second = StateReference(
+        automation_id="".join(["automation.", suffix]),
+        automation_name="Test",
+        entity_id="light.kitchen",
+        expected_state="off",
+        expected_attribute=None,
+        location="".join(["trigger[0].", "to"]),
+    )
+
+    assert first.automation_id is second.automation_id
+    assert first.location is second.location
+
+
+def test_validation_issue_shares_empty_valid_states() -> None:
+    """Issues without valid states should share one empty tuple."""
+    kwargs: dict[str, Any] = {
+        "severity": Severity.WARNING,
+        "automation_id": "automation.test",
+        "automation_name": "Test",
+        "entity_id": "light.kitchen",
+        "location": "trigger[0]",
+        "message": "msg",
+    }
+    first = ValidationIssue(**kwargs)
+    second = ValidationIssue(**kwargs, valid_states=[])
+
+    assert first.valid_states is EMPTY_VALID_STATES
+    assert second.valid_states is EMPTY_VALID_STATES
+    assert first.to_dict()["valid_states"] == []
+
+
+def test_validation_issue_caches_serialized_forms() -> None:
+    """to_dict and the suppression key should be built once per issue."""
+    issue = ValidationIssue(
+        severity=Severity.ERROR,
+        automation_id="automation.test",
+        automation_name="Test",
+        entity_id="light.kitchen",
+        location="trigger[0]",
+        message="msg",
+        issue_type=IssueType.INVALID_STATE,
+        valid_states=["on", "off"],
+    )
+
+    first = issue.to_dict()
+    first["message"] = "mutated by caller"
+    second = issue.to_dict()
+
+    assert second["message"] == "msg"
+    assert second["valid_states"] == ["on", "off"]
+    assert issue.get_suppression_key() is issue.get_suppression_key()
+    assert issue.get_suppression_key() == "automation.test:light.kitchen:invalid_state"
+
+
 def test_service_call_dataclass() -> None:
     """Test ServiceCall captures service call details for validation.
 
@@ -0,0 +1,86 @@
+"""Tests for the incremental overdue timing summaries."""
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from custom_components.autodoctor.overdue_history import GapSketch, OverdueHistory
+
+_TODAY = date(2026, 3, 4)  # Wednesday
+
+
+def _daily_events(days: int, *, hour: int = 8) -> list[datetime]:
+    start = datetime(2026, 3, 4, hour, tzinfo=UTC) - timedelta(days=days)
+    return [
+        start + timedelta(days=offset, minutes=offset % 7) for offset in range(days)
+    ]
+
+
+def test_gap_sketch_quantiles_stay_within_relative_accuracy() -> None:
+    """Quantiles should be within the sketch accuracy and follow removals."""
+    sketch = GapSketch(accuracy=0.02)
+    keys = [sketch.key(float(value)) for value in range(1, 101)]
+    for key in keys:
+        sketch.add(key)
+
+    assert sketch.quantile(0.5) == pytest.approx(50.0, rel=0.03)
+    assert sketch.quantile(0.9) == pytest.approx(90.0, rel=0.03)
+
+    for key in keys[50:]:
+        sketch.discard(key)
+    assert sketch.count == 50
+    assert sketch.quantile(0.9) == pytest.approx(45.0, rel=0.03)
+
+
+def test_catch_up_folds_each_closed_day_once() -> None:
+    """Only days closed since the last call should be folded in."""
+    events = _daily_events(21)
+    history = OverdueHistory()
+
+    assert history.catch_up(events, today=_TODAY, window_start=date(2026, 1, 1))
+    assert history.closed_through == _TODAY - timedelta(days=1)
+    assert len(history) == 21
+    assert not history.catch_up(events, today=_TODAY, window_start=date(2026, 1, 1))
+
+    tomorrow_events = [*events, datetime(2026, 3, 4, 8, 3, tzinfo=UTC)]
+    assert history.catch_up(
+        tomorrow_events,
+        today=_TODAY + timedelta(days=1),
+        window_start=date(2026, 1, 1),
+    )
+    assert len(history) == 22
+    assert history.first_trigger_minutes(_TODAY.weekday())[-1] == pytest.approx(483.0)
+
+
+def test_days_leaving_the_window_are_subtracted() -> None:
+    """Sliding the window start should drop old days and their gaps."""
+    events = _daily_events(28)
+    history = OverdueHistory()
+    history.catch_up(events, today=_TODAY, window_start=_TODAY - timedelta(days=28))
+
+    window_start = _TODAY - timedelta(days=7)
+    assert history.catch_up(events, today=_TODAY, window_start=window_start)
+
+    fresh = OverdueHistory()
+    fresh.catch_up(events, today=_TODAY, window_start=window_start)
+    assert len(history) == len(fresh) == 7
+    for weekday in range(7):
+        assert history.first_trigger_minutes(weekday) == fresh.first_trigger_minutes(
+            weekday
+        )
+    assert history.gap_quantile(0.5) == fresh.gap_quantile(0.5)
+    assert history.gap_quantile(0.9) == fresh.gap_quantile(0.9)
+
+
+def test_round_trip_through_dict() -> None:
+    """as_dict/from_dict should preserve summaries and reject other accuracies."""
+    history = OverdueHistory()
+    history.catch_up(_daily_events(14), today=_TODAY, window_start=date(2026, 1, 1))
+
+    restored = OverdueHistory.from_dict(history.as_dict())
+
+    assert restored.closed_through == history.closed_through
+    assert restored.first_trigger_minutes(2) == history.first_trigger_minutes(2)
+    assert restored.gap_quantile(0.5) == history.gap_quantile(0.5)
+    with pytest.raises(ValueError, match="accuracy"):
+        OverdueHistory.from_dict({**history.as_dict(), "gap_accuracy": 0.05})
@@ -0,0 +1,162 @@
+"""Tests for the opt-in validation profiler."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.autodoctor.const import DOMAIN
+from custom_components.autodoctor.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.autodoctor.profiler import ValidationProfiler
+
+
+def test_disabled_profiler_records_nothing() -> None:
+    """A disabled profiler should ignore spans, records and counters."""
+    profiler = ValidationProfiler()
+    profiler.start_run()
+    with profiler.span("validator.validate_all", "automation.test"):
+        pass
+    profiler.record("jinja.parse", 1.0)
+    profiler.count("knowledge_base.cache_hit")
+    profiler.finish_run(1)
+
+    assert profiler.get_last_run() == {
+        "enabled": False,
+        "last_run": None,
+        "last_runtime_batch": None,
+    }
+
+
+def test_enabled_profiler_ranks_slowest_stages_and_automations() -> None:
+    """The last run should list stages and automations by total time."""
+    profiler = ValidationProfiler(enabled=True)
+    profiler.start_run()
+    profiler.record("jinja.parse", 0.05, automation_id="automation.a")
+    profiler.record("validator.validate_all", 0.3, automation_id="automation.b")
+    profiler.record("validator.validate_all", 0.1, automation_id="automation.a")
+    with profiler.span("services.validate_call", "automation.c"):
+        pass
+    profiler.count("knowledge_base.cache_hit")
+    profiler.count("knowledge_base.cache_hit", 2)
+    profiler.finish_run(3)
+
+    last_run = profiler.get_last_run(top_n=2)["last_run"]
+
+    assert last_run["automation_count"] == 3
+    stages = last_run["slowest_stages"]
+    assert [s["stage"] for s in stages] == ["validator.validate_all", "jinja.parse"]
+    assert stages[0]["count"] == 2
+    assert stages[0]["total_ms"] == pytest.approx(400.0)
+    assert stages[0]["max_ms"] == pytest.approx(300.0)
+    automations = last_run["slowest_automations"]
+    assert [a["automation_id"] for a in automations] == [
+        "automation.b",
+        "automation.a",
+    ]
+    assert set(automations[1]["stages"]) == {"jinja.parse", "validator.validate_all"}
+    assert last_run["counters"] == {"knowledge_base.cache_hit": 3}
+
+
+def test_start_run_discards_unfinished_data() -> None:
+    """Data from an abandoned run should not leak into the next one."""
+    profiler = ValidationProfiler(enabled=True)
+    profiler.start_run()
+    profiler.record("jinja.parse", 5.0, automation_id="automation.stale")
+    profiler.start_run()
+    profiler.record("jinja.parse", 0.01, automation_id="automation.fresh")
+    profiler.finish_run(1)
+
+    last_run = profiler.get_last_run()["last_run"]
+
+    assert [a["automation_id"] for a in last_run["slowest_automations"]] == [
+        "automation.fresh"
+    ]
+
+
+def test_records_outside_a_run_are_ignored() -> None:
+    """Timings recorded with no run in progress should not be kept."""
+    profiler = ValidationProfiler(enabled=True)
+    profiler.record("jinja.parse", 1.0, automation_id="automation.single")
+    profiler.count("knowledge_base.cache_hit")
+    profiler.finish_run(1)
+
+    assert profiler.get_last_run()["last_run"] is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_do_not_touch_the_running_full_run() -> None:
+    """Work in another task should neither wipe nor finish the full run."""
+    profiler = ValidationProfiler(enabled=True)
+    full_run_started = asyncio.Event()
+    other_task_done = asyncio.Event()
+
+    async def full_run() -> None:
+        profiler.start_run()
+        profiler.record("jinja.parse", 0.2, automation_id="automation.a")
+        full_run_started.set()
+        await other_task_done.wait()
+        profiler.record("jinja.parse", 0.1, automation_id="automation.b")
+        profiler.finish_run(2)
+
+    async def single_validation() -> None:
+        await full_run_started.wait()
+        profiler.record("jinja.parse", 9.0, automation_id="automation.single")
+        profiler.finish_run(1)
+        other_task_done.set()
+
+    await asyncio.gather(full_run(), single_validation())
+
+    last_run = profiler.get_last_run()["last_run"]
+    assert last_run["automation_count"] == 2
+    assert [a["automation_id"] for a in last_run["slowest_automations"]] == [
+        "automation.a",
+        "automation.b",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_config_entry_diagnostics_include_profile() -> None:
+    """Config entry diagnostics should embed options and the last profile."""
+    profiler = ValidationProfiler(enabled=True)
+    profiler.start_run()
+    profiler.record("validator.validate_all", 0.2, automation_id="automation.a")
+    profiler.finish_run(1)
+
+    hass = MagicMock()
+    hass.data = {
+        DOMAIN: {
+            "profiler": profiler,
+            "validation_last_run": "2026-01-01T00:00:00+00:00",
+            "validation_issues_raw": [MagicMock(), MagicMock()],
+            "setup_timing": {"setup_ms": 12.5, "phases": {}, "warm_up_ms": None},
+        }
+    }
+    entry = MagicMock()
+    entry.options = {"profiling_enabled": True}
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["options"] == {"profiling_enabled": True}
+    assert diagnostics["validation"]["issue_count"] == 2
+    assert diagnostics["runtime_event_store"] is None
+    assert diagnostics["setup"]["setup_ms"] == 12.5
+    assert diagnostics["profile"]["last_run"]["automation_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_without_profiler_matches_disabled_shape() -> None:
+    """Without a profiler the diagnostics profile has the disabled profiler's keys."""
+    hass = MagicMock()
+    hass.data = {DOMAIN: {}}
+    entry = MagicMock()
+    entry.options = {}
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["profile"] == {
+        "enabled": False,
+        "last_run": None,
+        "last_runtime_batch": None,
+    }
@@ -503,6 +503,58 @@ async def test_async_report_issues_empty_clears_existing_repairs(
     assert reporter._active_issues == frozenset()
 
 
+@pytest.mark.asyncio
+async def test_report_automation_issues_keeps_other_repairs(
+    hass: HomeAssistant,
+) -> None:
+    """Single-automation reports must not delete repairs of other automations."""
+    reporter = IssueReporter(hass)
+    reporter._active_issues = frozenset({"automation_other"})
+
+    issues = [
+        ValidationIssue(
+            severity=Severity.ERROR,
+            automation_id="automation.test",
+            automation_name="Test",
+            entity_id="sensor.a",
+            location="trigger[0]",
+            message="Entity not found",
+        )
+    ]
+
+    with (
+        patch(
+            "custom_components.autodoctor.reporter.ir.async_create_issue"
+        ) as mock_create,
+        patch(
+            "custom_components.autodoctor.reporter.ir.async_delete_issue"
+        ) as mock_delete,
+    ):
+        await reporter.async_report_automation_issues("automation.test", issues)
+
+    mock_create.assert_called_once()
+    assert mock_create.call_args[0][2] == "automation_test"
+    mock_delete.assert_not_called()
+    assert reporter._active_issues == frozenset({"automation_other", "automation_test"})
+
+
+@pytest.mark.asyncio
+async def test_report_automation_issues_empty_clears_only_that_repair(
+    hass: HomeAssistant,
+) -> None:
+    """An empty single-automation report deletes only that automation's repair."""
+    reporter = IssueReporter(hass)
+    reporter._active_issues = frozenset({"automation_other", "automation_test"})
+
+    with patch(
+        "custom_components.autodoctor.reporter.ir.async_delete_issue"
+    ) as mock_delete:
+        await reporter.async_report_automation_issues("automation.test", [])
+
+    mock_delete.assert_called_once_with(hass, "autodoctor", "automation_test")
+    assert reporter._active_issues == frozenset({"automation_other"})
+
+
 def test_format_issues_for_repair_includes_suggestion(hass: HomeAssistant) -> None:
     """Test that repair text includes suggestion hint when issue.suggestion is set."""
     reporter = IssueReporter(hass)
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
 
+from custom_components.autodoctor import runtime_event_store
 from custom_components.autodoctor.runtime_event_store import (
     AsyncRuntimeEventStore,
+    HourlyTriggerCount,
     RuntimeEventStore,
+    ScoreHistoryRow,
 )
 
 
@@ -85,7 +89,9 @@ def test_ensure_schema_unknown_target_marks_failed_without_downgrading(
     assert store.ensure_schema(target_version=1) == 1
 
     with pytest.raises(RuntimeError):
-        store.ensure_schema(target_version=2)
+        store.ensure_schema(
+            target_version=runtime_event_store.RUNTIME_EVENT_STORE_SCHEMA_VERSION + 1
+        )
 
     assert store.get_metadata("schema_version") == "1"
     assert store.get_metadata("migration:state") == "failed"
@@ -95,6 +101,143 @@ def test_ensure_schema_unknown_target_marks_failed_without_downgrading(
     store.close()
 
 
+def test_ensure_schema_v2_adds_daily_score_table_to_v1_database(
+    tmp_path: Path,
+) -> None:
+    """Upgrading a v1 store should add the downsampled score table."""
+    db_path = tmp_path / "autodoctor_runtime.db"
+    store = RuntimeEventStore(db_path)
+    assert store.ensure_schema(target_version=1) == 1
+    assert not _table_exists(db_path, "score_history_daily")
+
+    assert store.ensure_schema(target_version=2) == 2
+    assert store.get_metadata("schema_version") == "2"
+    store.close()
+    assert _table_exists(db_path, "score_history_daily")
+
+
+def test_ensure_schema_v3_adds_hourly_trigger_table(tmp_path: Path) -> None:
+    """Upgrading a v2 store should add the hourly trigger tier and its index."""
+    db_path = tmp_path / "autodoctor_runtime.db"
+    store = RuntimeEventStore(db_path)
+    assert store.ensure_schema(target_version=2) == 2
+    assert store.compact_trigger_events(raw_retention_days=7) == 0
+
+    assert store.ensure_schema(target_version=3) == 3
+    store.close()
+    assert _table_exists(db_path, "trigger_hourly_counts")
+    assert _index_exists(db_path, "idx_trigger_hourly_time")
+
+
+def _tiered_store(tmp_path: Path) -> RuntimeEventStore:
+    store = RuntimeEventStore(tmp_path / "autodoctor_runtime.db")
+    store.ensure_schema(
+        target_version=runtime_event_store.RUNTIME_EVENT_STORE_SCHEMA_VERSION
+    )
+    return store
+
+
+def test_compact_trigger_events_rolls_old_rows_into_hourly_counts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Old rows should move into hourly counts that the count reads still see."""
+    monkeypatch.setattr(runtime_event_store, "_TRIGGER_COMPACTION_CHUNK_SIZE", 2)
+    store = _tiered_store(tmp_path)
+    now = datetime(2026, 2, 18, 12, 0, tzinfo=UTC)
+    hour = datetime(2026, 2, 8, 9, 0, tzinfo=UTC)
+    store.bulk_import(
+        "automation.a",
+        [
+            hour + timedelta(minutes=5),
+            hour + timedelta(minutes=20),
+            hour + timedelta(minutes=50),
+            hour + timedelta(hours=5),
+            now - timedelta(hours=1),
+        ],
+    )
+    store.record_trigger("automation.b", hour)
+
+    assert store.compact_trigger_events(raw_retention_days=7, now=now) == 5
+
+    with sqlite3.connect(tmp_path / "autodoctor_runtime.db") as conn:
+        raw_rows = conn.execute("SELECT COUNT(*) FROM trigger_events").fetchone()[0]
+        hourly_rows = conn.execute(
+            "SELECT COUNT(*) FROM trigger_hourly_counts"
+        ).fetchone()[0]
+    assert raw_rows == 1
+    assert hourly_rows == 3
+
+    # Raw reads never make up times for rolled-up triggers.
+    assert store.get_events("automation.a") == [(now - timedelta(hours=1)).timestamp()]
+    assert store.get_rolled_up_hours("automation.a") == [
+        HourlyTriggerCount(
+            hour_start=hour.timestamp(),
+            count=3,
+            first_at=(hour + timedelta(minutes=5)).timestamp(),
+            last_at=(hour + timedelta(minutes=50)).timestamp(),
+        ),
+        HourlyTriggerCount(
+            hour_start=(hour + timedelta(hours=5)).timestamp(),
+            count=1,
+            first_at=(hour + timedelta(hours=5)).timestamp(),
+            last_at=(hour + timedelta(hours=5)).timestamp(),
+        ),
+    ]
+    # Hours with a trigger inside the bounds are returned whole.
+    assert [
+        row.count
+        for row in store.get_rolled_up_hours(
+            "automation.a",
+            after=hour + timedelta(minutes=30),
+            before=hour + timedelta(hours=1),
+        )
+    ] == [3]
+    assert (
+        store.get_rolled_up_hours(
+            "automation.a",
+            after=hour + timedelta(minutes=51),
+            before=hour + timedelta(hours=4),
+        )
+        == []
+    )
+    assert store.get_daily_counts("automation.a") == {
+        "2026-02-08": 4,
+        "2026-02-18": 1,
+    }
+    assert store.count_events("automation.a") == 5
+    assert store.get_last_trigger("automation.b") == hour.timestamp()
+    assert store.has_data("automation.b") is True
+    assert store.get_automation_ids() == ["automation.a", "automation.b"]
+
+    # A late import into a rolled-up hour is merged on the next compaction.
+    store.record_trigger("automation.a", hour + timedelta(minutes=1))
+    assert store.compact_trigger_events(raw_retention_days=7, now=now) == 1
+    assert store.count_events("automation.a") == 6
+    first_hour = store.get_rolled_up_hours("automation.a")[0]
+    assert first_hour.count == 4
+    assert first_hour.first_at == (hour + timedelta(minutes=1)).timestamp()
+    store.close()
+
+
+def test_trim_and_rebuild_cover_the_hourly_tier(tmp_path: Path) -> None:
+    """Trim should drop expired hours and daily rollups should include kept ones."""
+    store = _tiered_store(tmp_path)
+    now = datetime(2026, 2, 18, 12, 0, tzinfo=UTC)
+    store.record_trigger("automation.a", now - timedelta(days=120))
+    store.record_trigger("automation.a", datetime(2026, 2, 8, 9, 0, tzinfo=UTC))
+    store.record_trigger("automation.a", datetime(2026, 2, 8, 9, 30, tzinfo=UTC))
+    store.compact_trigger_events(raw_retention_days=7, now=now)
+
+    assert store.trim(retention_days=90, now=now) == 1
+    assert store.count_events("automation.a") == 2
+
+    store.rebuild_daily_summaries("automation.a")
+    assert store.get_daily_bucket_counts("automation.a", "weekend_morning") == {
+        "2026-02-08": 2
+    }
+    store.close()
+
+
 def test_record_trigger_deduplicates_and_stores_bucket_metadata(
     tmp_path: Path, store: RuntimeEventStore
 ) -> None:
@@ -196,6 +339,41 @@ def test_last_trigger_ids_counts_and_has_data(store: RuntimeEventStore) -> None:
     assert store.get_automation_ids() == ["automation.one", "automation.two"]
 
 
+def test_reads_use_pooled_connections_without_the_writer_lock(
+    store: RuntimeEventStore,
+) -> None:
+    """Queries should not wait on writes and should reuse read-only connections."""
+    triggered_at = datetime(2026, 2, 18, 9, 0, tzinfo=UTC)
+    store.record_trigger("automation.one", triggered_at)
+
+    with store._lock, ThreadPoolExecutor(max_workers=1) as pool:
+        events = pool.submit(store.get_events, "automation.one").result(timeout=5)
+        count = pool.submit(store.count_events, "automation.one").result(timeout=5)
+
+    assert events == [triggered_at.timestamp()]
+    assert count == 1
+    assert len(store._read_conns) == 1
+    with store._reader() as conn, pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM trigger_events")
+
+
+def test_set_trace_callback_covers_writer_and_readers(
+    store: RuntimeEventStore,
+) -> None:
+    """A trace callback should see statements from both connection kinds."""
+    statements: list[str] = []
+    store.set_trace_callback(statements.append)
+    store.record_trigger("automation.one", datetime(2026, 2, 18, 9, 0, tzinfo=UTC))
+    store.get_last_trigger("automation.one")
+    store.set_trace_callback(None)
+    store.has_data("automation.one")
+
+    verbs = [statement.split(None, 1)[0].upper() for statement in statements]
+    assert "INSERT" in verbs
+    assert "SELECT" in verbs
+    assert not any("LIMIT 1" in statement for statement in statements)
+
+
 def test_trim_deletes_rows_older_than_retention_days(store: RuntimeEventStore) -> None:
     """trim should remove events older than retention cutoff and keep newer rows."""
     now = datetime(2026, 2, 18, 12, 0, tzinfo=UTC)
@@ -209,6 +387,42 @@ def test_trim_deletes_rows_older_than_retention_days(store: RuntimeEventStore) -
     assert remaining == 1
 
 
+def test_trim_deletes_in_chunks_and_records_progress(
+    store: RuntimeEventStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Chunked trim should delete every expired row and leave progress metadata."""
+    monkeypatch.setattr(runtime_event_store, "_TRIM_CHUNK_SIZE", 3)
+    now = datetime(2026, 2, 18, 12, 0, tzinfo=UTC)
+    old = now - timedelta(days=120)
+    store.bulk_import("automation.a", [old + timedelta(minutes=m) for m in range(7)])
+    store.bulk_import("automation.b", [old + timedelta(minutes=m) for m in range(3)])
+    store.record_trigger("automation.a", now - timedelta(days=1))
+
+    statements: list[str] = []
+    store.set_trace_callback(statements.append)
+    deleted = store.trim(retention_days=90, now=now)
+    store.set_trace_callback(None)
+
+    assert deleted == 10
+    assert store.count_events("automation.a") == 1
+    assert store.count_events("automation.b") == 0
+    assert sum(s.startswith("DELETE FROM trigger_events") for s in statements) > 1
+    assert store.get_metadata("trim:state") == "idle"
+    assert store.get_metadata("trim:deleted") == "10"
+    assert store.get_metadata("trim:updated_at") == now.isoformat()
+
+
+def test_optimize_and_checkpoint_wal(store: RuntimeEventStore) -> None:
+    """Planner refresh and passive checkpoint should run on a live store."""
+    store.record_trigger("automation.a", datetime(2026, 2, 18, 12, 0, tzinfo=UTC))
+
+    store.optimize()
+    wal_frames, checkpointed = store.checkpoint_wal()
+
+    assert checkpointed <= wal_frames
+    assert store.count_events("automation.a") == 1
+
+
 def test_record_score_and_get_last_score(store: RuntimeEventStore) -> None:
     """Score history APIs should persist and return the latest score row."""
     t1 = datetime(2026, 2, 18, 9, 0, tzinfo=UTC)
@@ -238,6 +452,154 @@ def test_record_score_and_get_last_score(store: RuntimeEventStore) -> None:
     assert last.features["rolling_24h_count"] == pytest.approx(4.0)
 
 
+def test_record_scores_many_and_get_last_scores_in_bulk(
+    store: RuntimeEventStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Bulk score APIs should write one batch and return the latest row per id."""
+    monkeypatch.setattr(runtime_event_store, "_SCORE_QUERY_CHUNK_SIZE", 2)
+    t1 = datetime(2026, 2, 18, 9, 0, tzinfo=UTC).timestamp()
+    t2 = datetime(2026, 2, 18, 10, 0, tzinfo=UTC).timestamp()
+    written = store.record_scores_many(
+        [
+            ScoreHistoryRow("automation.a", t1, 0.5, 0.5, {"x": 1.0}),
+            ScoreHistoryRow("automation.a", t2, 0.9, 0.7, {"x": 2.0}),
+            ScoreHistoryRow("automation.b", t1, 0.1, 0.1, {}),
+            ScoreHistoryRow("automation.c", t2, 0.3, 0.2, {}),
+            ScoreHistoryRow("", t2, 0.3, 0.2, {}),
+        ]
+    )
+
+    last = store.get_last_scores(
+        ["automation.a", "automation.b", "automation.c", "automation.none"]
+    )
+
+    assert written == 4
+    assert set(last) == {"automation.a", "automation.b", "automation.c"}
+    assert last["automation.a"].scored_at == t2
+    assert last["automation.a"].ema_score == pytest.approx(0.7)
+    assert last["automation.a"].features == {"x": 2.0}
+    assert last["automation.b"].score == pytest.approx(0.1)
+
+
+def test_compact_score_history_downsamples_old_rows_in_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Old rows become daily summaries, mid-age rows lose features, newest stay."""
+    monkeypatch.setattr(runtime_event_store, "_SCORE_COMPACTION_CHUNK_SIZE", 2)
+    store = RuntimeEventStore(tmp_path / "autodoctor_runtime.db")
+    store.ensure_schema(target_version=2)
+    now = datetime(2026, 2, 11, 12, 0, tzinfo=UTC)
+    old_day = datetime(2026, 1, 1, tzinfo=UTC)
+    rows = [
+        ScoreHistoryRow(
+            automation_id="automation.kitchen",
+            scored_at=(old_day + timedelta(hours=4 * i)).timestamp(),
+            score=float(i),
+            ema_score=float(i) / 2,
+            features={"count_24h": float(i)},
+        )
+        for i in range(5)
+    ]
+    rows.append(
+        ScoreHistoryRow(
+            automation_id="automation.kitchen",
+            scored_at=(now - timedelta(days=10)).timestamp(),
+            score=9.0,
+            ema_score=4.5,
+            features={"count_24h": 9.0},
+        )
+    )
+    rows.append(
+        ScoreHistoryRow(
+            automation_id="automation.kitchen",
+            scored_at=(now - timedelta(hours=1)).timestamp(),
+            score=1.0,
+            ema_score=0.5,
+            features={"count_24h": 1.0},
+        )
+    )
+    # A long-idle automation keeps its only (and therefore newest) row.
+    rows.append(
+        ScoreHistoryRow(
+            automation_id="automation.idle",
+            scored_at=old_day.timestamp(),
+            score=2.0,
+            ema_score=1.0,
+            features={"count_24h": 2.0},
+        )
+    )
+    store.record_scores_many(rows)
+
+    result = store.compact_score_history(
+        full_resolution_days=30, features_days=7, now=now
+    )
+
+    assert result["downsampled_rows"] == 5
+    assert result["features_cleared"] == 1
+    summaries = store.get_daily_score_summaries("automation.kitchen")
+    assert list(summaries) == ["2026-01-01"]
+    day = summaries["2026-01-01"]
+    assert day["sample_count"] == 5
+    assert day["min_score"] == pytest.approx(0.0)
+    assert day["max_score"] == pytest.approx(4.0)
+    assert day["mean_score"] == pytest.approx(2.0)
+    assert day["mean_ema_score"] == pytest.approx(1.0)
+
+    last = store.get_last_score("automation.kitchen")
+    assert last is not None
+    assert last.features == {"count_24h": 1.0}
+    idle = store.get_last_score("automation.idle")
+    assert idle is not None
+    assert idle.features == {"count_24h": 2.0}
+    assert store.get_daily_score_summaries("automation.idle") == {}
+    with sqlite3.connect(tmp_path / "autodoctor_runtime.db") as conn:
+        remaining = conn.execute(
+            "SELECT scored_at, features_json FROM score_history "
+            "WHERE automation_id = 'automation.kitchen' ORDER BY scored_at"
+        ).fetchall()
+    assert [features for _, features in remaining] == [None, '{"count_24h":1.0}']
+
+    # A second pass finds nothing left to do.
+    again = store.compact_score_history(
+        full_resolution_days=30, features_days=7, now=now
+    )
+    assert again["downsampled_rows"] == 0
+    assert again["features_cleared"] == 0
+    store.close()
+
+
+def test_new_store_uses_incremental_auto_vacuum(tmp_path: Path) -> None:
+    """New database files should allow freed pages to be released incrementally."""
+    db_path = tmp_path / "autodoctor_runtime.db"
+    store = RuntimeEventStore(db_path)
+    store.ensure_schema(target_version=2)
+    store.record_scores_many(
+        [
+            ScoreHistoryRow(
+                automation_id="automation.chatty",
+                scored_at=float(i),
+                score=1.0,
+                ema_score=1.0,
+                features={f"feature_{n}": float(n) for n in range(50)},
+            )
+            for i in range(500)
+        ]
+    )
+    result = store.compact_score_history(
+        full_resolution_days=1,
+        features_days=0,
+        now=datetime(2026, 2, 11, tzinfo=UTC),
+    )
+    store.close()
+
+    assert result["downsampled_rows"] == 499
+    assert result["vacuumed_pages"] > 0
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
 def test_migrate_legacy_runtime_health_scores_into_score_history(
     tmp_path: Path,
 ) -> None:
@@ -318,6 +680,16 @@ def test_set_metadata_batch_writes_multiple_keys_atomically(
     assert store.get_metadata("backfill_last_error:automation.a") == ""
 
 
+def test_get_metadata_batch_reads_present_keys(store: RuntimeEventStore) -> None:
+    """get_metadata_batch should return only the keys that exist."""
+    store.set_metadata_batch({"overdue_history:a": "{}", "overdue_history:b": "[]"})
+
+    assert store.get_metadata_batch(
+        ["overdue_history:a", "overdue_history:b", "overdue_history:missing"]
+    ) == {"overdue_history:a": "{}", "overdue_history:b": "[]"}
+    assert store.get_metadata_batch([]) == {}
+
+
 def test_backfill_tracking_helpers(store: RuntimeEventStore) -> None:
     """mark_backfilled/is_backfilled should persist per-automation backfill state."""
     assert store.is_backfilled("automation.backfill") is False
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import sqlite3
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -11,8 +12,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from homeassistant.core import HomeAssistant
 
+from custom_components.autodoctor.const import SIGNAL_ISSUES_UPDATED
 from custom_components.autodoctor.models import IssueType
-from custom_components.autodoctor.runtime_event_store import RuntimeEventStore
+from custom_components.autodoctor.runtime_event_store import (
+    HourlyTriggerCount,
+    RuntimeEventStore,
+)
 from custom_components.autodoctor.runtime_monitor import RuntimeHealthMonitor
 from tests.conftest import build_runtime_monitor
 
@@ -291,11 +296,16 @@ async def test_ingest_trigger_event_marks_degraded_when_store_drops_event(
     mock_async_store.async_record_trigger = AsyncMock(return_value=False)
     monitor._async_runtime_event_store = mock_async_store
 
-    monitor.ingest_trigger_event("automation.runtime_drop", occurred_at=now)
-    await hass.async_block_till_done()
+    with patch(
+        "custom_components.autodoctor.runtime_monitor.async_dispatcher_send"
+    ) as mock_send:
+        monitor.ingest_trigger_event("automation.runtime_drop", occurred_at=now)
+        await hass.async_block_till_done()
 
     assert monitor._runtime_event_store_degraded is True
     assert monitor._runtime_event_store_dropped_events == 1
+    # Sensors only refresh on the issues signal, so counter changes send it.
+    mock_send.assert_called_once_with(hass, SIGNAL_ISSUES_UPDATED)
 
 
 @pytest.mark.asyncio
@@ -404,6 +414,43 @@ def test_build_overdue_profile_marks_weekly_pattern_predictable() -> None:
     assert profile["is_predictable"] is True
 
 
+def test_build_overdue_profile_reuses_cached_history_per_automation() -> None:
+    """Cached summaries should match a fresh build and only fold new days."""
+    now = datetime(2026, 3, 4, 9, 0, tzinfo=UTC)  # Wednesday
+    monitor = build_runtime_monitor(now, baseline_days=90)
+    baseline_start = now - timedelta(days=90)
+    events = [
+        (baseline_start + timedelta(days=offset)).replace(hour=8, minute=offset % 20)
+        for offset in range(1, 90)
+    ]
+
+    cached = monitor._build_overdue_profile(
+        automation_events=events,
+        now=now,
+        baseline_start=baseline_start,
+        automation_id="automation.daily",
+    )
+    fresh = monitor._build_overdue_profile(
+        automation_events=events,
+        now=now,
+        baseline_start=baseline_start,
+    )
+
+    assert cached == fresh
+    assert monitor._dirty_overdue_histories == {"automation.daily"}
+
+    # Later the same day nothing new has closed, so nothing is re-folded.
+    monitor._dirty_overdue_histories.clear()
+    later = monitor._build_overdue_profile(
+        automation_events=events,
+        now=now + timedelta(hours=2),
+        baseline_start=baseline_start,
+        automation_id="automation.daily",
+    )
+    assert later["first_trigger_minutes"] == cached["first_trigger_minutes"]
+    assert monitor._dirty_overdue_histories == set()
+
+
 def test_build_overdue_profile_abstains_for_sparse_inconsistent_history() -> None:
     """Sparse inconsistent timing should be treated as not predictable."""
     now = datetime(2026, 3, 4, 9, 0, tzinfo=UTC)
@@ -601,6 +648,89 @@ async def test_validate_automations_abstains_on_unpredictable_overdue_candidate(
     assert overdue == []
 
 
+def _weekly_overdue_monitor(hass: HomeAssistant, now: datetime) -> RuntimeHealthMonitor:
+    baseline_start = now - timedelta(days=90)
+    weekday_offset = (now.weekday() - baseline_start.weekday()) % 7
+    series_start = (baseline_start + timedelta(days=weekday_offset)).replace(
+        hour=8,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+    return _TestRuntimeMonitor(
+        hass,
+        history={
+            "weekly": [series_start + timedelta(days=(7 * idx)) for idx in range(12)]
+        },
+        now=now,
+        score=0.0,
+        baseline_days=90,
+        warmup_samples=0,
+        min_expected_events=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_overdue_deadline_timer_raises_alert_when_window_closes(
+    hass: HomeAssistant,
+) -> None:
+    """An open firing window should arm one timer that alerts at the deadline."""
+    now = datetime(2026, 3, 4, 7, 30, tzinfo=UTC)  # Wednesday, window still open
+    monitor = _weekly_overdue_monitor(hass, now)
+    cancel = MagicMock()
+
+    with patch(
+        "custom_components.autodoctor.runtime_monitor.async_track_point_in_utc_time",
+        return_value=cancel,
+    ) as mock_track:
+        issues = await monitor.validate_automations([_automation("weekly", "Weekly")])
+        # Rescoring before the deadline keeps the same timer.
+        await monitor.validate_automations([_automation("weekly", "Weekly")])
+
+    assert issues == []
+    mock_track.assert_called_once()
+    _, action, deadline = mock_track.call_args.args
+    assert deadline == now.replace(hour=8, minute=15)
+
+    monitor._now_factory = lambda: deadline
+    with patch(
+        "custom_components.autodoctor.runtime_monitor.async_dispatcher_send"
+    ) as mock_send:
+        await action(deadline)
+
+    overdue = monitor.get_active_runtime_alerts()
+    assert [issue.issue_type for issue in overdue] == [
+        IssueType.RUNTIME_AUTOMATION_OVERDUE
+    ]
+    mock_send.assert_called_once()
+    assert monitor._overdue_checks == {}
+    cancel.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_trigger_before_deadline_cancels_overdue_timer(
+    hass: HomeAssistant,
+) -> None:
+    """A trigger inside the window should cancel that automation's deadline timer."""
+    now = datetime(2026, 3, 4, 7, 30, tzinfo=UTC)
+    monitor = _weekly_overdue_monitor(hass, now)
+    cancel = MagicMock()
+
+    with patch(
+        "custom_components.autodoctor.runtime_monitor.async_track_point_in_utc_time",
+        return_value=cancel,
+    ):
+        await monitor.validate_automations([_automation("weekly", "Weekly")])
+    assert "automation.weekly" in monitor._overdue_checks
+
+    monitor.ingest_trigger_event(
+        "automation.weekly", occurred_at=now + timedelta(minutes=5)
+    )
+
+    cancel.assert_called_once()
+    assert monitor._overdue_checks == {}
+
+
 @pytest.mark.asyncio
 async def test_validate_automations_persists_raw_score_separately_from_ema(
     hass: HomeAssistant,
@@ -641,6 +771,54 @@ async def test_validate_automations_persists_raw_score_separately_from_ema(
     assert persisted.features["raw_bocpd_score"] == pytest.approx(1.0)
 
 
+@pytest.mark.asyncio
+async def test_validate_automations_batches_score_reads_and_writes(
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """A scan should prefetch EMAs in one query and persist scores in one batch."""
+    now = datetime(2026, 2, 18, 12, 0, tzinfo=UTC)
+    baseline = [now - timedelta(days=d, hours=1) for d in range(2, 31)]
+    history = {"first": baseline, "second": list(baseline)}
+    store = RuntimeEventStore(tmp_path / "autodoctor_runtime.db")
+    store.ensure_schema(target_version=1)
+    store.set_metadata("observation:start_at", (now - timedelta(days=120)).isoformat())
+    monitor = _TestRuntimeMonitor(
+        hass,
+        history=history,
+        now=now,
+        score=1.0,
+        runtime_event_store=store,
+        baseline_days=90,
+        warmup_samples=0,
+        min_expected_events=0,
+    )
+
+    with (
+        patch.object(
+            store, "get_last_scores", wraps=store.get_last_scores
+        ) as get_last_scores,
+        patch.object(
+            store, "record_scores_many", side_effect=OSError("disk busy")
+        ) as record_many,
+    ):
+        await monitor.validate_automations(
+            [_automation("first"), _automation("second")]
+        )
+        get_last_scores.assert_called_once()
+        record_many.assert_called_once()
+        # The failed batch stays buffered for the next flush
+        assert len(monitor._pending_score_rows) == 2
+        assert monitor.get_event_store_diagnostics()["write_failures"] == 1
+
+    await monitor.async_flush_score_rows()
+    persisted = store.get_last_scores(["automation.first", "automation.second"])
+    store.close()
+
+    assert monitor._pending_score_rows == []
+    assert set(persisted) == {"automation.first", "automation.second"}
+
+
 @pytest.mark.asyncio
 async def test_runtime_monitor_does_not_flag_overactive_for_bursty_reminder_baseline(
     hass: HomeAssistant,
@@ -914,6 +1092,41 @@ def test_runtime_monitor_default_detector_is_bocpd(
     assert isinstance(monitor._detector, BOCPDDetector)
 
 
+def test_runtime_alerts_revision_tracks_real_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Revision should bump only when the active runtime alert set changes."""
+    from custom_components.autodoctor.models import Severity, ValidationIssue
+
+    monitor = RuntimeHealthMonitor(hass)
+    issue = ValidationIssue(
+        severity=Severity.WARNING,
+        automation_id="automation.kitchen",
+        automation_name="Kitchen",
+        entity_id="automation.kitchen",
+        location="runtime.health.burst",
+        message="Burst detected",
+        issue_type=IssueType.RUNTIME_AUTOMATION_BURST,
+    )
+    start = monitor.runtime_alerts_revision
+
+    monitor._register_runtime_alert(issue)
+    assert monitor.runtime_alerts_revision == start + 1
+
+    monitor._register_runtime_alert(issue)
+    assert monitor.runtime_alerts_revision == start + 1
+
+    monitor._clear_runtime_alert(
+        "automation.kitchen", IssueType.RUNTIME_AUTOMATION_BURST
+    )
+    assert monitor.runtime_alerts_revision == start + 2
+
+    monitor._clear_runtime_alert(
+        "automation.kitchen", IssueType.RUNTIME_AUTOMATION_BURST
+    )
+    assert monitor.runtime_alerts_revision == start + 2
+
+
 @pytest.mark.asyncio
 async def test_fetch_trigger_history_uses_modern_schema(
     hass: HomeAssistant,
@@ -1396,7 +1609,7 @@ async def test_runtime_monitor_raises_threshold_when_runtime_issue_previously_su
     history = {"runtime_test": [now - timedelta(days=d, hours=2) for d in range(2, 31)]}
 
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(return_value=True)
+    suppression_store.is_suppressed_for = MagicMock(return_value=True)
     hass.data["autodoctor"] = {"suppression_store": suppression_store}
 
     monitor = _TestRuntimeMonitor(
@@ -1424,7 +1637,7 @@ async def test_runtime_monitor_suppresses_stalled_even_when_score_exceeds_multip
     history = {"runtime_test": [now - timedelta(days=d, hours=2) for d in range(2, 31)]}
 
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(return_value=True)
+    suppression_store.is_suppressed_for = MagicMock(return_value=True)
     hass.data["autodoctor"] = {"suppression_store": suppression_store}
 
     monitor = _TestRuntimeMonitor(
@@ -1578,6 +1791,81 @@ def test_build_feature_row_uses_precomputed_median_gap() -> None:
     assert row["gap_vs_median"] == pytest.approx(expected_gap_vs_median)
 
 
+def test_build_feature_row_counts_rolled_up_hours_by_hour() -> None:
+    """Rolled-up hours add to counts; only their real trigger times are used."""
+    now = datetime(2026, 2, 11, 12, 0, tzinfo=UTC)
+    hour_start = now - timedelta(days=3, hours=2)
+    hours = [
+        HourlyTriggerCount(
+            hour_start=hour_start.timestamp(),
+            count=5,
+            first_at=(hour_start + timedelta(minutes=10)).timestamp(),
+            last_at=(hour_start + timedelta(minutes=40)).timestamp(),
+        )
+    ]
+
+    row = RuntimeHealthMonitor._build_feature_row(
+        automation_id="automation.a",
+        now=now,
+        automation_events=[],
+        baseline_events=[],
+        expected_daily=1.0,
+        all_events_by_automation={},
+        median_gap_override=60.0,
+        rolled_up_hours=hours,
+    )
+
+    assert row["rolling_24h_count"] == 0.0
+    assert row["rolling_7d_count"] == 5.0
+    minutes_since_last = (
+        now - (hour_start + timedelta(minutes=40))
+    ).total_seconds() / 60.0
+    assert row["gap_vs_median"] == pytest.approx(minutes_since_last / 60.0)
+
+
+@pytest.mark.asyncio
+async def test_validate_automations_counts_rolled_up_hours_in_baseline(
+    hass: HomeAssistant,
+) -> None:
+    """The expected daily rate should include triggers that were rolled up."""
+    now = datetime(2026, 2, 11, 12, 0, tzinfo=UTC)
+    raw = [now - timedelta(days=d, hours=1) for d in range(2, 7)]
+    rolled_up = [
+        HourlyTriggerCount(
+            hour_start=(now - timedelta(days=d, hours=4)).timestamp(),
+            count=4,
+            first_at=(now - timedelta(days=d, hours=4)).timestamp(),
+            last_at=(now - timedelta(days=d, hours=3, minutes=30)).timestamp(),
+        )
+        for d in range(10, 30)
+    ]
+
+    class _TieredRuntimeMonitor(_TestRuntimeMonitor):
+        async def _async_fetch_rolled_up_hours_from_store(
+            self,
+            *,
+            automation_ids: list[str],
+            start: datetime,
+            end: datetime,
+        ) -> dict[str, list[HourlyTriggerCount]]:
+            return {"automation.tiered": rolled_up}
+
+    monitor = _TieredRuntimeMonitor(
+        hass,
+        history={"tiered": raw},
+        now=now,
+        baseline_days=30,
+        warmup_samples=0,
+        min_expected_events=0,
+    )
+
+    await monitor.validate_automations([_automation("tiered")])
+
+    assert monitor.get_expected_daily_rate("automation.tiered") == pytest.approx(
+        (len(raw) + 4 * len(rolled_up)) / 30
+    )
+
+
 def test_build_training_rows_passes_median_gap_override() -> None:
     """_build_training_rows_from_events should pass median_gap_override to _build_feature_row."""
     now = datetime(2026, 2, 11, 12, 0, tzinfo=UTC)
@@ -2181,8 +2469,8 @@ def test_dismiss_survives_monitor_restart(tmp_path: Path) -> None:
     store2.close()
 
 
-def test_run_weekly_maintenance_trims_old_events(tmp_path: Path) -> None:
-    """Weekly maintenance should trim events older than baseline_days + 7."""
+def test_run_store_maintenance_trims_old_events(tmp_path: Path) -> None:
+    """Store maintenance should trim events older than baseline_days + 7."""
     from custom_components.autodoctor.runtime_event_store import RuntimeEventStore
 
     now = datetime(2026, 2, 19, 12, 0, tzinfo=UTC)
@@ -2203,7 +2491,7 @@ def test_run_weekly_maintenance_trims_old_events(tmp_path: Path) -> None:
         min_expected_events=0,
         runtime_event_store=store,
     )
-    monitor.run_weekly_maintenance(now=now)
+    monitor.run_store_maintenance(now=now)
 
     # default baseline_days=30, retention = 30+7 = 37 days
     assert store.count_events("automation.old") == 0
@@ -2211,7 +2499,85 @@ def test_run_weekly_maintenance_trims_old_events(tmp_path: Path) -> None:
     store.close()
 
 
-def test_run_weekly_maintenance_retention_linked_to_baseline_days(
+def test_run_store_maintenance_rolls_up_events_past_the_raw_window(
+    tmp_path: Path,
+) -> None:
+    """Events older than the raw window should move to hourly counts, not vanish."""
+    from custom_components.autodoctor.runtime_event_store import (
+        RUNTIME_EVENT_STORE_SCHEMA_VERSION,
+        RuntimeEventStore,
+    )
+
+    now = datetime(2026, 2, 19, 12, 0, tzinfo=UTC)
+    db_path = tmp_path / "autodoctor_runtime.db"
+    store = RuntimeEventStore(db_path)
+    store.ensure_schema(target_version=RUNTIME_EVENT_STORE_SCHEMA_VERSION)
+    old = now - timedelta(days=10)
+    store.record_trigger("automation.chatty", old)
+    store.record_trigger("automation.chatty", old + timedelta(minutes=1))
+    store.record_trigger("automation.chatty", now - timedelta(hours=1))
+
+    monitor = RuntimeHealthMonitor(
+        MagicMock(), now_factory=lambda: now, runtime_event_store=store
+    )
+    monitor.run_store_maintenance(now=now)
+
+    with sqlite3.connect(db_path) as conn:
+        raw = conn.execute("SELECT COUNT(*) FROM trigger_events").fetchone()[0]
+    assert raw == 1
+    assert store.count_events("automation.chatty") == 3
+    assert store.get_events("automation.chatty", after=old) == [
+        (now - timedelta(hours=1)).timestamp()
+    ]
+    assert [
+        (hour.count, hour.first_at, hour.last_at)
+        for hour in store.get_rolled_up_hours("automation.chatty", after=old)
+    ] == [(2, old.timestamp(), (old + timedelta(minutes=1)).timestamp())]
+    store.close()
+
+
+def test_run_weekly_maintenance_compacts_score_history(tmp_path: Path) -> None:
+    """Weekly maintenance should downsample score rows past full resolution."""
+    from custom_components.autodoctor.runtime_event_store import (
+        RuntimeEventStore,
+        ScoreHistoryRow,
+    )
+
+    now = datetime(2026, 2, 19, 12, 0, tzinfo=UTC)
+    store = RuntimeEventStore(tmp_path / "autodoctor_runtime.db")
+    store.ensure_schema(target_version=2)
+    store.record_scores_many(
+        [
+            ScoreHistoryRow(
+                automation_id="automation.kitchen",
+                scored_at=(now - timedelta(days=days)).timestamp(),
+                score=1.0,
+                ema_score=1.0,
+                features={"count_24h": 1.0},
+            )
+            for days in (60, 59, 1)
+        ]
+    )
+
+    hass = MagicMock()
+    hass.create_task = MagicMock(side_effect=lambda coro, *a, **kw: coro.close())
+    monitor = RuntimeHealthMonitor(
+        hass,
+        now_factory=lambda: now,
+        warmup_samples=0,
+        min_expected_events=0,
+        runtime_event_store=store,
+    )
+    monitor.run_weekly_maintenance(now=now)
+
+    assert len(store.get_daily_score_summaries("automation.kitchen")) == 2
+    last = store.get_last_score("automation.kitchen")
+    assert last is not None
+    assert last.scored_at == (now - timedelta(days=1)).timestamp()
+    store.close()
+
+
+def test_run_store_maintenance_retention_linked_to_baseline_days(
     tmp_path: Path,
 ) -> None:
     """Trim retention should be baseline_days + 7, keeping data the model needs."""
@@ -2237,7 +2603,7 @@ def test_run_weekly_maintenance_retention_linked_to_baseline_days(
         min_expected_events=0,
         runtime_event_store=store,
     )
-    monitor.run_weekly_maintenance(now=now)
+    monitor.run_store_maintenance(now=now)
 
     # baseline_days=120, retention = 120+7 = 127 days
     assert store.count_events("automation.very_old") == 0
@@ -2620,7 +2986,7 @@ async def test_validate_automations_suppression_prevents_overactive(
     history = {"runtime_test": baseline}
 
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(return_value=True)
+    suppression_store.is_suppressed_for = MagicMock(return_value=True)
     hass.data["autodoctor"] = {"suppression_store": suppression_store}
 
     monitor = _TestRuntimeMonitor(
@@ -2856,3 +3222,84 @@ async def test_validate_automations_dismissal_adaptation_raises_threshold(
         i for i in issues if i.issue_type == IssueType.RUNTIME_AUTOMATION_OVERACTIVE
     ]
     assert overactive == []
+
+
+def test_evicted_automation_state_reloads_adaptation(tmp_path: Path) -> None:
+    """Evicted automation state should reload its adaptation from SQLite."""
+    now = datetime(2026, 2, 20, 12, 0, tzinfo=UTC)
+    store = RuntimeEventStore(tmp_path / "autodoctor_runtime.db")
+    store.ensure_schema(target_version=1)
+    store.set_metadata(
+        "adaptation:automation.a",
+        json.dumps({"dismissed_count": 2, "threshold_multiplier": 1.5625}),
+    )
+
+    hass = MagicMock()
+    hass.create_task = MagicMock(side_effect=lambda coro, *a, **kw: coro.close())
+    monitor = RuntimeHealthMonitor(
+        hass,
+        now_factory=lambda: now,
+        runtime_event_store=store,
+        max_tracked_automations=1,
+    )
+
+    monitor._ensure_automation_state("automation.a")
+    monitor._ensure_automation_state("automation.b")
+    assert "automation.a" not in monitor._loaded_adaptation_ids
+
+    state = monitor._ensure_automation_state("automation.a")
+    assert state["adaptation"]["dismissed_count"] == 2
+
+    caches = monitor.get_cache_diagnostics()
+    assert caches["automation_state"]["entries"] == 1
+    assert caches["automation_state"]["evictions"] == 2
+    store.close()
+
+
+def test_score_history_is_bounded() -> None:
+    """Score history should keep at most max_tracked_automations entries."""
+    monitor = RuntimeHealthMonitor(MagicMock(), max_tracked_automations=2)
+    for automation_id in ("automation.a", "automation.b", "automation.c"):
+        monitor._smoothed_score(automation_id, 1.0)
+
+    assert list(monitor._score_history) == ["automation.b", "automation.c"]
+    assert monitor.get_cache_diagnostics()["score_history"]["evictions"] == 1
+
+
+def test_live_triggers_feed_activity_index_until_pruned() -> None:
+    """Ingested triggers should update the 5-minute index until they age out."""
+    now = datetime(2026, 2, 11, 12, 3, tzinfo=UTC)
+    monitor = RuntimeHealthMonitor(MagicMock(), baseline_days=30)
+    monitor.ingest_trigger_event("automation.a", occurred_at=now)
+    monitor.ingest_trigger_event("automation.b", occurred_at=now + timedelta(minutes=1))
+
+    assert monitor._activity_index.other_count("automation.a", now) == 1
+    assert monitor.get_cache_diagnostics()["activity_index"]["slots"] == 1
+
+    # Retention is baseline_days + 7 = 37 days, checked at most once a day
+    monitor._prune_activity_index(now + timedelta(days=36, hours=23))
+    assert monitor._activity_index.other_count("automation.a", now) == 1
+    monitor._prune_activity_index(now + timedelta(days=37, hours=1))
+    assert monitor._activity_index.other_count("automation.a", now) == 1
+
+    monitor._prune_activity_index(now + timedelta(days=38))
+    assert monitor._activity_index.other_count("automation.a", now) == 0
+    assert monitor.get_cache_diagnostics()["activity_index"]["slots"] == 0
+
+
+def test_burst_triggers_are_kept_as_epochs_and_serialized_on_snapshot() -> None:
+    """Live triggers should feed an epoch ring; snapshots expose ISO strings."""
+    now = datetime(2026, 2, 11, 12, 0, tzinfo=UTC)
+    monitor = RuntimeHealthMonitor(MagicMock(), burst_multiplier=999.0)
+    triggers = [now - timedelta(minutes=90), now - timedelta(minutes=2), now]
+    for ts in triggers:
+        monitor.ingest_trigger_event("automation.chatty", occurred_at=ts)
+
+    in_memory = monitor._runtime_state["automations"]["automation.chatty"]
+    window = in_memory["burst_model"]["recent_triggers"]
+    assert window.epochs() == [triggers[1].timestamp(), now.timestamp()]
+
+    snapshot = monitor.get_runtime_state()
+    assert snapshot["automations"]["automation.chatty"]["burst_model"][
+        "recent_triggers"
+    ] == [triggers[1].isoformat(), now.isoformat()]
@@ -0,0 +1,188 @@
+"""Tests for the staggered runtime scoring scheduler."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.autodoctor.models import IssueType, Severity, ValidationIssue
+from custom_components.autodoctor.profiler import DISABLED_PROFILER, ValidationProfiler
+from custom_components.autodoctor.runtime_monitor import RuntimeHealthMonitor
+from custom_components.autodoctor.runtime_scheduler import RuntimeScoringScheduler
+
+_NOW = datetime(2026, 2, 11, 12, 0, tzinfo=UTC)
+_INTERVAL = timedelta(hours=4)
+
+
+def _automations(*names: str) -> list[dict[str, Any]]:
+    return [{"id": name, "alias": name.title()} for name in names]
+
+
+def _monitor(rates: dict[str, float] | None = None) -> MagicMock:
+    monitor = MagicMock()
+    monitor.resolve_automation_entity_id = (
+        RuntimeHealthMonitor.resolve_automation_entity_id
+    )
+    monitor.validate_automations = AsyncMock(return_value=[])
+    monitor.get_last_run_stats.return_value = {"total_automations": 1}
+    monitor.get_active_runtime_alerts.return_value = []
+    monitor.get_expected_daily_rate.side_effect = (rates or {}).get
+    monitor.runtime_alerts_revision = 0
+    monitor.profiler = DISABLED_PROFILER
+    return monitor
+
+
+def _scheduler(
+    monitor: MagicMock, automations: list[dict[str, Any]]
+) -> RuntimeScoringScheduler:
+    return RuntimeScoringScheduler(
+        MagicMock(),
+        monitor,
+        interval=_INTERVAL,
+        get_automations=lambda: automations,
+    )
+
+
+def _scored_ids(monitor: MagicMock) -> list[str]:
+    batch = monitor.validate_automations.await_args.args[0]
+    return [f"automation.{automation['id']}" for automation in batch]
+
+
+@pytest.mark.asyncio
+async def test_new_automations_are_staggered_across_the_interval() -> None:
+    """Four automations over four hours should be scored one per hour."""
+    monitor = _monitor()
+    scheduler = _scheduler(monitor, _automations("a", "b", "c", "d"))
+
+    assert await scheduler.async_run_due(_NOW) == 1
+    assert _scored_ids(monitor) == ["automation.a"]
+    assert scheduler.next_due("automation.b") == _NOW + timedelta(hours=1)
+    assert scheduler.next_due("automation.d") == _NOW + timedelta(hours=3)
+    assert scheduler.next_due("automation.a") == _NOW + _INTERVAL
+
+    assert await scheduler.async_run_due(_NOW + timedelta(minutes=30)) == 0
+    assert await scheduler.async_run_due(_NOW + timedelta(hours=2)) == 2
+    assert _scored_ids(monitor) == ["automation.b", "automation.c"]
+
+
+@pytest.mark.asyncio
+async def test_cadence_follows_alerts_and_trigger_rate() -> None:
+    """Alerting and chatty automations come back sooner, quiet ones later."""
+    monitor = _monitor(
+        rates={"automation.chatty": 96.0, "automation.quiet": 0.2, "automation.ok": 3}
+    )
+    monitor.get_active_runtime_alerts.return_value = [
+        ValidationIssue(
+            severity=Severity.WARNING,
+            automation_id="automation.alerting",
+            automation_name="Alerting",
+            entity_id="automation.alerting",
+            location="runtime.health.anomaly",
+            message="Anomalous trigger pattern detected",
+            issue_type=IssueType.RUNTIME_AUTOMATION_OVERACTIVE,
+        )
+    ]
+    automations = _automations("alerting", "chatty", "ok", "quiet")
+    scheduler = _scheduler(monitor, automations)
+
+    assert await scheduler.async_run_due(_NOW) == 1
+    # The rest are due by the end of the interval, and so is the alerting one.
+    assert await scheduler.async_run_due(_NOW + _INTERVAL) == 4
+
+    later = _NOW + _INTERVAL
+    assert scheduler.next_due("automation.alerting") == later + _INTERVAL / 4
+    assert scheduler.next_due("automation.chatty") == later + _INTERVAL / 2
+    assert scheduler.next_due("automation.ok") == later + _INTERVAL
+    assert scheduler.next_due("automation.quiet") == later + _INTERVAL * 2
+
+
+@pytest.mark.asyncio
+async def test_alert_changes_are_published_and_removed_automations_dropped() -> None:
+    """A batch that changes alerts should signal; deleted automations leave the queue."""
+    monitor = _monitor()
+    automations = _automations("a", "b")
+    scheduler = _scheduler(monitor, automations)
+
+    async def _raise_alert(_batch: list[dict[str, Any]]) -> list[ValidationIssue]:
+        monitor.runtime_alerts_revision += 1
+        return []
+
+    monitor.validate_automations.side_effect = _raise_alert
+    with patch(
+        "custom_components.autodoctor.runtime_scheduler.async_dispatcher_send"
+    ) as mock_send:
+        await scheduler.async_run_due(_NOW)
+    mock_send.assert_called_once()
+
+    automations.pop()
+    assert await scheduler.async_run_due(_NOW + timedelta(hours=3)) == 0
+    assert scheduler.next_due("automation.b") is None
+    monitor.cancel_overdue_check.assert_called_once_with("automation.b")
+    assert scheduler.get_run_stats() == {"total_automations": 1}
+
+
+@pytest.mark.asyncio
+async def test_alert_changes_are_handed_to_the_callback() -> None:
+    """Batches that change alerts pass their automation ids to on_alerts_changed."""
+    monitor = _monitor()
+    on_alerts_changed = AsyncMock()
+    scheduler = RuntimeScoringScheduler(
+        MagicMock(),
+        monitor,
+        interval=_INTERVAL,
+        get_automations=lambda: _automations("a", "b"),
+        on_alerts_changed=on_alerts_changed,
+    )
+
+    async def _raise_alert(_batch: list[dict[str, Any]]) -> list[ValidationIssue]:
+        monitor.runtime_alerts_revision += 1
+        return []
+
+    monitor.validate_automations.side_effect = _raise_alert
+    with patch("custom_components.autodoctor.runtime_scheduler.async_dispatcher_send"):
+        await scheduler.async_run_due(_NOW)
+    on_alerts_changed.assert_awaited_once_with(["automation.a"])
+
+    monitor.validate_automations.side_effect = None
+    with patch("custom_components.autodoctor.runtime_scheduler.async_dispatcher_send"):
+        await scheduler.async_run_due(_NOW + timedelta(hours=2))
+    on_alerts_changed.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_rescheduled() -> None:
+    """Automations in a failing batch should stay queued for their next turn."""
+    monitor = _monitor()
+    monitor.validate_automations.side_effect = RuntimeError("store locked")
+    scheduler = _scheduler(monitor, _automations("a"))
+
+    with pytest.raises(RuntimeError):
+        await scheduler.async_run_due(_NOW)
+
+    assert scheduler.next_due("automation.a") == _NOW + _INTERVAL
+    assert scheduler.get_run_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_batches_are_profiled_as_their_own_run() -> None:
+    """Runtime spans from a batch should land in the runtime-batch profile."""
+    monitor = _monitor()
+    monitor.profiler = ValidationProfiler(enabled=True)
+
+    async def _validate(batch: list[dict[str, Any]]) -> list[ValidationIssue]:
+        monitor.profiler.record("runtime.score", 0.02, automation_id="automation.a")
+        return []
+
+    monitor.validate_automations.side_effect = _validate
+    scheduler = _scheduler(monitor, _automations("a"))
+
+    assert await scheduler.async_run_due(_NOW) == 1
+
+    profile = monitor.profiler.get_last_run()
+    assert profile["last_run"] is None
+    batch_run = profile["last_runtime_batch"]
+    assert batch_run["automation_count"] == 1
+    assert [s["stage"] for s in batch_run["slowest_stages"]] == ["runtime.score"]
@@ -75,7 +75,7 @@ def test_suppressed_runtime_paths_continue_learning_without_alerts(
     now = datetime(2026, 2, 13, 12, 0, tzinfo=UTC)
     monitor = _build_monitor(tmp_path, now)
     suppression_store = MagicMock()
-    suppression_store.is_suppressed.return_value = True
+    suppression_store.is_suppressed_for.return_value = True
 
     monitor.ingest_trigger_event(
         "automation.suppressed",
@@ -1,11 +1,16 @@
 """Tests for Autodoctor sensor platform."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from custom_components.autodoctor.const import DOMAIN
+from custom_components.autodoctor.const import (
+    DOMAIN,
+    MAX_SENSOR_ATTRIBUTE_ITEMS,
+    SIGNAL_ISSUES_UPDATED,
+)
 from custom_components.autodoctor.models import IssueType, Severity, ValidationIssue
 from custom_components.autodoctor.sensor import (
     RuntimeHealthAlertsSensor,
@@ -89,6 +94,7 @@ async def test_native_value_with_issues(hass: HomeAssistant) -> None:
         ]
     }
 
+    assert sensor._refresh_state() is True
     assert sensor.native_value == 3
 
 
@@ -103,9 +109,11 @@ async def test_native_value_no_reporter(hass: HomeAssistant) -> None:
     sensor = ValidationIssuesSensor(hass, entry)
 
     hass.data[DOMAIN] = {}
+    sensor._refresh_state()
     assert sensor.native_value == 0
 
     hass.data.pop(DOMAIN, None)
+    sensor._refresh_state()
     assert sensor.native_value == 0
 
 
@@ -123,9 +131,11 @@ async def test_extra_state_attributes_with_issues(hass: HomeAssistant) -> None:
     mock_reporter.active_issues = frozenset({"issue_1", "issue_2"})
     hass.data[DOMAIN] = {"reporter": mock_reporter}
 
+    sensor._refresh_state()
     attrs = sensor.extra_state_attributes
     assert "issue_ids" in attrs
     assert set(attrs["issue_ids"]) == {"issue_1", "issue_2"}
+    assert attrs["issue_ids_truncated"] is False
 
 
 async def test_extra_state_attributes_no_reporter(hass: HomeAssistant) -> None:
@@ -139,9 +149,11 @@ async def test_extra_state_attributes_no_reporter(hass: HomeAssistant) -> None:
     sensor = ValidationIssuesSensor(hass, entry)
 
     hass.data[DOMAIN] = {}
+    sensor._refresh_state()
     assert sensor.extra_state_attributes == {}
 
     hass.data.pop(DOMAIN, None)
+    sensor._refresh_state()
     assert sensor.extra_state_attributes == {}
 
 
@@ -176,6 +188,7 @@ async def test_runtime_health_sensor_reports_active_runtime_alerts(
     ]
     hass.data[DOMAIN] = {"runtime_monitor": mock_runtime_monitor}
 
+    sensor._refresh_state()
     assert sensor.native_value == 2
     attrs = sensor.extra_state_attributes
     assert len(attrs["active_runtime_alerts"]) == 2
@@ -200,10 +213,75 @@ async def test_runtime_health_sensor_exposes_event_store_diagnostics(
     }
     hass.data[DOMAIN] = {"runtime_monitor": mock_runtime_monitor}
 
+    sensor._refresh_state()
     attrs = sensor.extra_state_attributes
     assert "runtime_event_store_enabled" not in attrs
     assert "runtime_event_store_cutover" not in attrs
     assert attrs["runtime_event_store_degraded"] is True
-    assert attrs["runtime_event_store_pending_jobs"] == 3
+    assert "runtime_event_store_pending_jobs" not in attrs
     assert attrs["runtime_event_store_write_failures"] == 2
     assert attrs["runtime_event_store_dropped_events"] == 1
+
+
+async def test_issue_sensors_do_not_poll(hass: HomeAssistant) -> None:
+    """Sensors are updated from the dispatcher signal, not by polling."""
+    entry = MagicMock()
+    entry.entry_id = "test"
+
+    assert ValidationIssuesSensor(hass, entry).should_poll is False
+    assert RuntimeHealthAlertsSensor(hass, entry).should_poll is False
+
+
+async def test_issue_signal_writes_state_only_on_change(hass: HomeAssistant) -> None:
+    """The issues-updated signal should write state only when it changed."""
+    entry = MagicMock()
+    entry.entry_id = "test"
+    sensor = ValidationIssuesSensor(hass, entry)
+    mock_reporter = MagicMock()
+    mock_reporter.active_issues = frozenset({"issue_1"})
+    hass.data[DOMAIN] = {"reporter": mock_reporter}
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        await sensor.async_added_to_hass()
+        assert sensor.extra_state_attributes["issue_ids"] == ["issue_1"]
+
+        async_dispatcher_send(hass, SIGNAL_ISSUES_UPDATED)
+        await hass.async_block_till_done()
+        mock_write.assert_not_called()
+
+        mock_reporter.active_issues = frozenset({"issue_1", "issue_2"})
+        async_dispatcher_send(hass, SIGNAL_ISSUES_UPDATED)
+        await hass.async_block_till_done()
+        mock_write.assert_called_once()
+
+    assert sensor.native_value == 2
+    assert sensor.extra_state_attributes["issue_ids"] == ["issue_1", "issue_2"]
+
+
+async def test_runtime_sensor_bounds_alert_attributes(hass: HomeAssistant) -> None:
+    """Runtime alert attributes are capped so recorder payloads stay small."""
+    entry = MagicMock()
+    entry.entry_id = "test"
+    sensor = RuntimeHealthAlertsSensor(hass, entry)
+
+    mock_runtime_monitor = MagicMock(spec=["get_active_runtime_alerts"])
+    mock_runtime_monitor.get_active_runtime_alerts.return_value = [
+        ValidationIssue(
+            severity=Severity.WARNING,
+            automation_id=f"automation.a{i}",
+            automation_name=f"A{i}",
+            entity_id=f"automation.a{i}",
+            location="runtime.health.burst",
+            message="Burst detected",
+            issue_type=IssueType.RUNTIME_AUTOMATION_BURST,
+        )
+        for i in range(MAX_SENSOR_ATTRIBUTE_ITEMS + 5)
+    ]
+    hass.data[DOMAIN] = {"runtime_monitor": mock_runtime_monitor}
+
+    sensor._refresh_state()
+
+    assert sensor.native_value == MAX_SENSOR_ATTRIBUTE_ITEMS + 5
+    attrs = sensor.extra_state_attributes
+    assert len(attrs["active_runtime_alerts"]) == MAX_SENSOR_ATTRIBUTE_ITEMS
+    assert attrs["active_runtime_alerts_truncated"] is True
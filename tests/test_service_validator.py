@@ -2461,6 +2461,59 @@ async def test_suggest_target_entity_with_multiple_same_domain(
     assert result == "light.kitchen"
 
 
+async def test_suggestion_index_scans_states_once_for_many_targets(
+    hass: HomeAssistant,
+) -> None:
+    """Test that repeated target suggestions reuse the domain-partitioned index.
+
+    The state machine is scanned once; it is rescanned only when its size
+    changes or the entity partition is explicitly invalidated.
+    """
+    from unittest.mock import patch
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("switch.kitchen", "on")
+
+    validator = ServiceCallValidator(hass)
+    async_all = hass.states.async_all
+
+    with patch.object(
+        hass.states, "async_all", side_effect=async_all
+    ) as mock_async_all:
+        for _ in range(50):
+            assert validator._suggest_target_entity("light.kitchn") == "light.kitchen"
+        assert validator._suggest_target_entity("switch.kitchn") == "switch.kitchen"
+        assert mock_async_all.call_count == 1
+
+        hass.states.async_set("light.hallway", "on")
+        assert validator._suggest_target_entity("light.halway") == "light.hallway"
+        assert mock_async_all.call_count == 2
+
+        validator.suggestion_index.invalidate_entities()
+        assert validator._suggest_target_entity("light.kitchn") == "light.kitchen"
+        assert mock_async_all.call_count == 3
+
+
+async def test_suggestion_index_refreshes_services_after_invalidation(
+    hass: HomeAssistant,
+) -> None:
+    """Test that service suggestions pick up services registered later."""
+
+    async def handler(call: HAServiceCall) -> None:
+        pass
+
+    hass.services.async_register("light", "turn_on", handler)
+
+    validator = ServiceCallValidator(hass)
+    assert validator._suggest_service("light.toggl") is None
+
+    hass.services.async_register("light", "toggle", handler)
+    validator.suggestion_index.invalidate_services()
+
+    assert validator._suggest_service("light.toggl") == "light.toggle"
+
+
 async def test_validate_required_param_from_inline_params(
     hass: HomeAssistant,
 ) -> None:
@@ -2508,3 +2561,145 @@ async def test_validate_required_param_from_inline_params(
         i for i in issues if i.issue_type == IssueType.SERVICE_MISSING_REQUIRED_PARAM
     ]
     assert len(missing_issues) == 0
+
+
+async def test_service_plans_compiled_once_per_description_generation(
+    hass: HomeAssistant,
+) -> None:
+    """Plans are reused across calls and rebuilt when descriptions are replaced."""
+    from unittest.mock import patch
+
+    from custom_components.autodoctor import service_validator as sv_module
+
+    hass.services.async_register("light", "turn_on", _noop_service_handler)
+    validator = ServiceCallValidator(hass)
+    validator._service_descriptions = {
+        "light": {
+            "turn_on": {
+                "fields": {
+                    "flash": {"selector": {"select": {"options": ["short", "long"]}}}
+                }
+            }
+        }
+    }
+    calls = [
+        ServiceCall(
+            automation_id=f"automation.test_{i}",
+            automation_name="Test",
+            service="light.turn_on",
+            location="action[0]",
+            data={"flash": "sometimes"},
+        )
+        for i in range(5)
+    ]
+
+    with patch.object(
+        sv_module,
+        "_compile_service_plan",
+        wraps=sv_module._compile_service_plan,
+    ) as mock_compile:
+        issues = validator.validate_service_calls(calls)
+        validator.validate_service_calls(calls)
+        assert mock_compile.call_count == 1
+
+        validator._service_descriptions = {
+            "light": {"turn_on": {"fields": {"flash": {}}}}
+        }
+        assert validator.validate_service_calls(calls) == []
+        assert mock_compile.call_count == 2
+
+    assert len(issues) == 5
+    assert all(i.issue_type == IssueType.SERVICE_INVALID_PARAM_TYPE for i in issues)
+
+
+def test_compiled_service_plan_is_immutable() -> None:
+    """Compiled plans hold only frozen containers, so scans cannot alter them."""
+    from custom_components.autodoctor.service_validator import _compile_service_plan
+
+    plan = _compile_service_plan(
+        "light.turn_on",
+        {
+            "flash": {
+                "required": True,
+                "selector": {
+                    "select": {"options": ["short", {"value": "long", "label": "L"}]}
+                },
+            },
+            "transition": {},
+        },
+    )
+
+    assert plan.field_names == ("flash", "transition")
+    assert plan.required_fields == ("flash",)
+    check = plan.select_checks["flash"]
+    assert check.valid_values == ("short", "long")
+    assert check.accepts("long")
+    assert not check.accepts(["long"])
+    with pytest.raises(TypeError):
+        plan.select_checks["transition"] = check  # type: ignore[index]
+
+
+async def test_async_load_descriptions_cached_until_invalidated(
+    hass: HomeAssistant,
+) -> None:
+    """Descriptions are fetched once and refreshed only after invalidation."""
+    from unittest.mock import AsyncMock, patch
+
+    validator = ServiceCallValidator(hass)
+    with patch(
+        "homeassistant.helpers.service.async_get_all_descriptions",
+        new_callable=AsyncMock,
+        return_value={"light": {"turn_on": {"fields": {}}}},
+    ) as mock_get:
+        await validator.async_load_descriptions()
+        await validator.async_load_descriptions()
+        assert mock_get.await_count == 1
+
+        validator.invalidate_descriptions()
+        await validator.async_load_descriptions()
+        assert mock_get.await_count == 2
+
+    assert validator._service_descriptions == {"light": {"turn_on": {"fields": {}}}}
+
+
+async def test_invalidation_during_description_load_is_kept(
+    hass: HomeAssistant,
+) -> None:
+    """A service registered while descriptions load must trigger a refetch."""
+    from unittest.mock import AsyncMock, patch
+
+    validator = ServiceCallValidator(hass)
+
+    async def _fetch_and_invalidate(_hass: HomeAssistant) -> dict[str, object]:
+        validator.invalidate_descriptions()
+        return {"light": {"turn_on": {"fields": {}}}}
+
+    with patch(
+        "homeassistant.helpers.service.async_get_all_descriptions",
+        new_callable=AsyncMock,
+        side_effect=_fetch_and_invalidate,
+    ) as mock_get:
+        await validator.async_load_descriptions()
+        await validator.async_load_descriptions()
+
+    assert mock_get.await_count == 2
+
+
+async def test_async_load_descriptions_retries_after_failure(
+    hass: HomeAssistant,
+) -> None:
+    """A failed load leaves the cache stale so the next scan retries."""
+    from unittest.mock import AsyncMock, patch
+
+    validator = ServiceCallValidator(hass)
+    with patch(
+        "homeassistant.helpers.service.async_get_all_descriptions",
+        new_callable=AsyncMock,
+        side_effect=[RuntimeError("boom"), {"light": {}}],
+    ) as mock_get:
+        await validator.async_load_descriptions()
+        assert validator._service_descriptions is None
+
+        await validator.async_load_descriptions()
+        assert validator._service_descriptions == {"light": {}}
+        assert mock_get.await_count == 2
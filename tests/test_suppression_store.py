@@ -59,7 +59,7 @@ async def test_async_clear_all_removes_all_suppressions(hass: HomeAssistant) ->
     2. Updates count to 0
     3. Returns empty frozenset from keys property
     4. Removes all suppressions (is_suppressed returns False)
-    5. Calls async_save to persist the empty state
+    5. Schedules a delayed save to persist the empty state
     """
     store = SuppressionStore(hass)
 
@@ -74,7 +74,7 @@ async def test_async_clear_all_removes_all_suppressions(hass: HomeAssistant) ->
     assert store.is_suppressed("automation.a:light.a:entity_not_found")
 
     # Clear all suppressions
-    with patch.object(store._store, "async_save", new_callable=AsyncMock) as mock_save:
+    with patch.object(store._store, "async_delay_save") as mock_save:
         await store.async_clear_all()
 
     # Verify all suppressions removed
@@ -84,17 +84,17 @@ async def test_async_clear_all_removes_all_suppressions(hass: HomeAssistant) ->
     assert not store.is_suppressed("automation.b:light.b:invalid_state")
     assert not store.is_suppressed("automation.c:sensor.c:attribute_not_found")
 
-    # Verify async_save was called to persist empty state
+    # Verify a delayed save was scheduled to persist empty state
     mock_save.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_async_save_data_verification(hass: HomeAssistant) -> None:
-    """Test that async_save is called with correct serialized data.
+    """Test that the delayed save produces correct serialized data.
 
-    Previous test only verified async_save was called, but didn't check WHAT
-    data was passed. This test verifies the actual data structure passed to
-    the Store.async_save method.
+    Previous test only verified a save was scheduled, but didn't check WHAT
+    data was written. This test verifies the data structure returned by the
+    callback handed to Store.async_delay_save.
     """
     store = SuppressionStore(hass)
 
@@ -103,12 +103,12 @@ async def test_async_save_data_verification(hass: HomeAssistant) -> None:
     await store.async_suppress("automation.b:sensor.b:invalid_state")
 
     # Suppress another and verify the saved data
-    with patch.object(store._store, "async_save", new_callable=AsyncMock) as mock_save:
+    with patch.object(store._store, "async_delay_save") as mock_save:
         await store.async_suppress("automation.c:switch.c:attribute_not_found")
 
-    # Verify async_save was called with correct data structure
+    # Verify a delayed save was scheduled with correct data structure
     mock_save.assert_called_once()
-    saved_data = mock_save.call_args[0][0]
+    saved_data = mock_save.call_args[0][0]()
 
     # Check data structure
     assert isinstance(saved_data, dict)
@@ -331,7 +331,7 @@ async def test_async_unsuppress_nonexistent_key(hass: HomeAssistant) -> None:
     assert store.count == 1
 
     # Unsuppress a key that doesn't exist (should not crash)
-    with patch.object(store._store, "async_save", new_callable=AsyncMock) as mock_save:
+    with patch.object(store._store, "async_delay_save") as mock_save:
         await store.async_unsuppress("automation.nonexistent:light.x:entity_not_found")
 
     # Count should remain 1
@@ -348,7 +348,7 @@ async def test_async_suppress_duplicate_key_skips_save(hass: HomeAssistant) -> N
     key = "automation.a:light.a:entity_not_found"
     await store.async_suppress(key)
 
-    with patch.object(store._store, "async_save", new_callable=AsyncMock) as mock_save:
+    with patch.object(store._store, "async_delay_save") as mock_save:
         await store.async_suppress(key)
 
     assert store.count == 1
@@ -361,7 +361,7 @@ async def test_async_clear_all_empty_skips_save(hass: HomeAssistant) -> None:
     store = SuppressionStore(hass)
     assert store.count == 0
 
-    with patch.object(store._store, "async_save", new_callable=AsyncMock) as mock_save:
+    with patch.object(store._store, "async_delay_save") as mock_save:
         await store.async_clear_all()
 
     mock_save.assert_not_called()
@@ -476,3 +476,143 @@ def test_no_duplicate_filter_in_init_or_websocket_api() -> None:
             f"{filename} still defines its own _filter_suppressed — "
             "use filter_suppressed_issues from suppression_store instead"
         )
+
+
+@pytest.mark.asyncio
+async def test_wildcard_rules_match_without_exact_keys(hass: HomeAssistant) -> None:
+    """Automation-wide and issue-type-wide wildcard rules suppress matching issues."""
+    store = SuppressionStore(hass)
+
+    with patch.object(store._store, "async_delay_save"):
+        await store.async_suppress("automation.noisy:*:*")
+        await store.async_suppress("*:*:invalid_state")
+
+    assert store.is_suppressed_for("automation.noisy", "light.a", "entity_not_found")
+    assert store.is_suppressed_for("automation.other", "light.b", "invalid_state")
+    assert not store.is_suppressed_for(
+        "automation.other", "light.b", "entity_not_found"
+    )
+    assert store.is_suppressed("automation.noisy:sensor.x:service_not_found")
+
+    with patch.object(store._store, "async_delay_save"):
+        await store.async_unsuppress("automation.noisy:*:*")
+
+    assert not store.is_suppressed_for(
+        "automation.noisy", "light.a", "entity_not_found"
+    )
+
+
+@pytest.mark.asyncio
+async def test_keys_with_colons_in_ids_still_match(hass: HomeAssistant) -> None:
+    """Ids containing ':' (e.g. time trigger values) must stay suppressible."""
+    store = SuppressionStore(hass)
+
+    with patch.object(store._store, "async_delay_save"):
+        await store.async_suppress("automation.wake:07:00:00:invalid_state")
+        await store.async_suppress("automation.odd:id:light.a:entity_not_found")
+
+    assert store.is_suppressed_for("automation.wake", "07:00:00", "invalid_state")
+    assert store.is_suppressed_for("automation.odd:id", "light.a", "entity_not_found")
+    assert store.is_suppressed("automation.wake:07:00:00:invalid_state")
+    assert not store.is_suppressed_for("automation.wake", "08:00:00", "invalid_state")
+
+
+@pytest.mark.asyncio
+async def test_async_load_keeps_wildcard_rules(hass: HomeAssistant) -> None:
+    """Orphan cleanup must not strip wildcard rules ending in '*'."""
+    store = SuppressionStore(hass)
+    stored_data: dict[str, Any] = {
+        "suppressions": ["automation.a:*:*", "*:*:entity_not_found"]
+    }
+
+    with (
+        patch.object(
+            store._store, "async_load", new_callable=AsyncMock, return_value=stored_data
+        ),
+        patch.object(store._store, "async_save", new_callable=AsyncMock) as mock_save,
+    ):
+        await store.async_load()
+
+    assert store.count == 2
+    assert store.is_suppressed_for("automation.a", "light.a", "invalid_state")
+    assert store.is_suppressed_for("automation.b", "light.b", "entity_not_found")
+    mock_save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_filter_suppressed_issues_by_group_counts(hass: HomeAssistant) -> None:
+    """Grouped filtering returns visible issues and per-group suppressed counts."""
+    from custom_components.autodoctor.models import (
+        IssueType,
+        Severity,
+        ValidationIssue,
+    )
+    from custom_components.autodoctor.suppression_store import (
+        filter_suppressed_issues_by_group,
+    )
+
+    def _issue(automation_id: str, issue_type: IssueType) -> ValidationIssue:
+        return ValidationIssue(
+            severity=Severity.WARNING,
+            automation_id=automation_id,
+            automation_name="Test",
+            entity_id="light.foo",
+            issue_type=issue_type,
+            message="issue",
+            location="trigger[0]",
+        )
+
+    hidden = _issue("automation.a", IssueType.ENTITY_NOT_FOUND)
+    shown = _issue("automation.b", IssueType.ENTITY_NOT_FOUND)
+    template = _issue("automation.a", IssueType.TEMPLATE_SYNTAX_ERROR)
+
+    store = SuppressionStore(hass)
+    with patch.object(store._store, "async_delay_save"):
+        await store.async_suppress("automation.a:*:*")
+
+    visible, counts = filter_suppressed_issues_by_group(
+        {"entity_state": [hidden, shown], "templates": [template]},
+        store,
+        ["entity_state", "templates", "services"],
+    )
+
+    assert visible == {"entity_state": [shown], "templates": [], "services": []}
+    assert counts == {"entity_state": 1, "templates": 1, "services": 0}
+
+
+@pytest.mark.asyncio
+async def test_async_suppress_many_schedules_single_save(hass: HomeAssistant) -> None:
+    """Batch suppression adds all keys and schedules one coalesced write."""
+    store = SuppressionStore(hass)
+    keys = [f"automation.{i}:light.{i}:entity_not_found" for i in range(5)]
+
+    with patch.object(store._store, "async_delay_save") as mock_delay_save:
+        added = await store.async_suppress_many([*keys, keys[0]])
+
+    assert added == 5
+    assert store.count == 5
+    mock_delay_save.assert_called_once()
+    saved_data = mock_delay_save.call_args[0][0]()
+    assert sorted(saved_data["suppressions"]) == sorted(keys)
+
+
+@pytest.mark.asyncio
+async def test_async_flush_writes_pending_save(hass: HomeAssistant) -> None:
+    """async_flush writes a pending delayed save and is a no-op otherwise."""
+    store = SuppressionStore(hass)
+
+    with (
+        patch.object(store._store, "async_delay_save"),
+        patch.object(store._store, "async_save", new_callable=AsyncMock) as mock_save,
+    ):
+        await store.async_flush()
+        mock_save.assert_not_called()
+
+        await store.async_suppress("automation.a:light.a:entity_not_found")
+        await store.async_flush()
+        mock_save.assert_awaited_once_with(
+            {"suppressions": ["automation.a:light.a:entity_not_found"]}
+        )
+
+        await store.async_flush()
+        mock_save.assert_awaited_once()
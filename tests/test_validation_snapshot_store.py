@@ -0,0 +1,144 @@
+"""Tests for ValidationSnapshotStore."""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.autodoctor.const import VERSION
+from custom_components.autodoctor.models import (
+    VALIDATION_GROUP_ORDER,
+    IssueType,
+    Severity,
+)
+from custom_components.autodoctor.validation_snapshot_store import (
+    ValidationSnapshotStore,
+)
+from tests.conftest import make_issue
+
+
+def _groups(**issues_by_group: Any) -> dict[str, dict[str, Any]]:
+    return {
+        gid: {"issues": issues_by_group.get(gid, []), "duration_ms": 5}
+        for gid in VALIDATION_GROUP_ORDER
+    }
+
+
+async def test_snapshot_round_trip(hass: HomeAssistant) -> None:
+    """A saved snapshot should load back into equal ValidationIssue objects."""
+    issue = make_issue(IssueType.ENTITY_NOT_FOUND, Severity.ERROR)
+    store = ValidationSnapshotStore(hass)
+    store.async_schedule_save(
+        timestamp="2026-01-01T00:00:00+00:00",
+        groups=_groups(entity_state=[issue]),
+        run_stats={"analyzed_automations": 1, "failed_automations": 0},
+        config_digests={"test": "abc"},
+    )
+    await store.async_flush()
+
+    snapshot = await ValidationSnapshotStore(hass).async_load()
+
+    assert snapshot is not None
+    assert snapshot["timestamp"] == "2026-01-01T00:00:00+00:00"
+    assert snapshot["groups"]["entity_state"]["issues"] == [issue]
+    assert snapshot["groups"]["entity_state"]["duration_ms"] == 5
+    assert snapshot["run_stats"]["analyzed_automations"] == 1
+    assert snapshot["config_digests"] == {"test": "abc"}
+
+
+async def test_snapshot_does_not_restore_runtime_alerts(hass: HomeAssistant) -> None:
+    """Runtime health issues go stale across restarts and are not restored."""
+    store = ValidationSnapshotStore(hass)
+    store.async_schedule_save(
+        timestamp="2026-01-01T00:00:00+00:00",
+        groups=_groups(
+            runtime_health=[
+                make_issue(IssueType.RUNTIME_AUTOMATION_OVERDUE, Severity.WARNING)
+            ]
+        ),
+        run_stats={},
+        config_digests={},
+    )
+    await store.async_flush()
+
+    snapshot = await ValidationSnapshotStore(hass).async_load()
+
+    assert snapshot is not None
+    assert snapshot["groups"]["runtime_health"]["issues"] == []
+
+
+async def test_snapshot_from_other_version_is_ignored(hass: HomeAssistant) -> None:
+    """Snapshots from another integration version should not be used."""
+    store = ValidationSnapshotStore(hass)
+    with patch(
+        "custom_components.autodoctor.validation_snapshot_store.VERSION",
+        f"{VERSION}-old",
+    ):
+        store.async_schedule_save(
+            timestamp="2026-01-01T00:00:00+00:00",
+            groups=_groups(),
+            run_stats={},
+            config_digests={},
+        )
+        await store.async_flush()
+
+    assert await ValidationSnapshotStore(hass).async_load() is None
+
+
+async def test_snapshot_skips_unreadable_issues(hass: HomeAssistant) -> None:
+    """Malformed issue entries should be dropped instead of failing the load."""
+    store = ValidationSnapshotStore(hass)
+    with patch.object(store._store, "async_load") as mock_load:
+        mock_load.return_value = {
+            "integration_version": VERSION,
+            "timestamp": "2026-01-01T00:00:00+00:00",
+            "groups": {
+                "entity_state": {
+                    "issues": [
+                        {"severity": "bogus", "automation_id": "automation.a"},
+                        "not a dict",
+                        make_issue(
+                            IssueType.ENTITY_NOT_FOUND, Severity.ERROR
+                        ).to_dict(),
+                    ],
+                    "duration_ms": 3,
+                }
+            },
+        }
+        snapshot = await store.async_load()
+
+    assert snapshot is not None
+    assert len(snapshot["groups"]["entity_state"]["issues"]) == 1
+    assert snapshot["groups"]["services"] == {"issues": [], "duration_ms": 0}
+    assert snapshot["config_digests"] == {}
+
+
+async def test_failed_flush_keeps_snapshot_pending(hass: HomeAssistant) -> None:
+    """A failed flush should re-raise and leave the snapshot pending for a retry."""
+    issue = make_issue(IssueType.ENTITY_NOT_FOUND, Severity.ERROR)
+    store = ValidationSnapshotStore(hass)
+    with patch.object(store._store, "async_delay_save"):
+        store.async_schedule_save(
+            timestamp="2026-01-01T00:00:00+00:00",
+            groups=_groups(entity_state=[issue]),
+            run_stats={},
+            config_digests={},
+        )
+
+    with (
+        patch.object(
+            store._store,
+            "async_save",
+            new_callable=AsyncMock,
+            side_effect=OSError("Disk full"),
+        ),
+        pytest.raises(OSError, match="Disk full"),
+    ):
+        await store.async_flush()
+
+    with patch.object(store._store, "async_save", new_callable=AsyncMock) as save:
+        await store.async_flush()
+    save.assert_awaited_once()
+    saved = save.await_args.args[0]
+    assert saved["groups"]["entity_state"]["issues"] == [issue.to_dict()]
@@ -1485,3 +1485,24 @@ async def test_input_select_dynamic_options_invalid(hass: HomeAssistant) -> None
     state_issues = [i for i in issues if i.issue_type == IssueType.INVALID_STATE]
     assert len(state_issues) == 1
     assert "blue" in state_issues[0].message
+
+
+def test_entity_cache_diagnostics_count_rebuilds() -> None:
+    """Entity cache diagnostics should count hits, rebuilds and invalidations."""
+    hass = MagicMock()
+    hass.states.async_all.return_value = [
+        MagicMock(entity_id="light.kitchen"),
+        MagicMock(entity_id="light.bedroom"),
+    ]
+    engine = ValidationEngine(StateKnowledgeBase(hass))
+
+    engine._suggest_entity("light.kitchn")
+    engine._suggest_entity("light.bedrom")
+    engine.invalidate_entity_cache()
+    engine._suggest_entity("light.kitchn")
+
+    stats = engine.get_cache_diagnostics()["entity_ids"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 1
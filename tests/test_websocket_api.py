@@ -7,6 +7,7 @@ step-based validation results.
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -16,6 +17,7 @@ import pytest
 from homeassistant.components.websocket_api import ActiveConnection
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import Unauthorized
+from homeassistant.util.file import WriteError, write_utf8_file_atomic
 
 from custom_components.autodoctor.const import DOMAIN
 from custom_components.autodoctor.models import (
@@ -29,8 +31,12 @@ from custom_components.autodoctor.websocket_api import (
     _resolve_automation_edit_config_id,
     async_setup_websocket_api,
     websocket_clear_suppressions,
+    websocket_diagnostics_caches,
+    websocket_diagnostics_profile,
     websocket_dismiss,
+    websocket_dismiss_many,
     websocket_fix_apply,
+    websocket_fix_apply_batch,
     websocket_fix_preview,
     websocket_fix_undo,
     websocket_get_issues,
@@ -41,6 +47,7 @@ from custom_components.autodoctor.websocket_api import (
     websocket_run_validation,
     websocket_run_validation_steps,
     websocket_suppress,
+    websocket_suppress_many,
     websocket_unsuppress,
 )
 from tests.conftest import invoke_command, make_issue
@@ -58,7 +65,7 @@ async def test_websocket_api_setup(hass: HomeAssistant) -> None:
     ) as mock_register:
         await async_setup_websocket_api(hass)
         # One call per handler in async_setup_websocket_api; update when adding/removing WS commands
-        assert mock_register.call_count == 14
+        assert mock_register.call_count == 19
 
 
 @pytest.mark.parametrize(
@@ -104,6 +111,21 @@ async def test_websocket_api_setup(hass: HomeAssistant) -> None:
             },
         ),
         (websocket_fix_undo, {"id": 8, "type": "autodoctor/fix_undo"}),
+        (
+            websocket_fix_apply_batch,
+            {
+                "id": 12,
+                "type": "autodoctor/fix_apply_batch",
+                "fixes": [
+                    {
+                        "automation_id": "automation.test",
+                        "location": "trigger[0].entity_id",
+                        "current_value": "light.Living_Room",
+                        "suggested_value": "light.living_room",
+                    }
+                ],
+            },
+        ),
         (
             websocket_dismiss,
             {
@@ -113,6 +135,41 @@ async def test_websocket_api_setup(hass: HomeAssistant) -> None:
                 "issue_type": "runtime_automation_overactive",
             },
         ),
+        (
+            websocket_suppress_many,
+            {
+                "id": 10,
+                "type": "autodoctor/suppress_many",
+                "items": [
+                    {
+                        "automation_id": "automation.test",
+                        "entity_id": "light.kitchen",
+                        "issue_type": "entity_not_found",
+                    }
+                ],
+            },
+        ),
+        (
+            websocket_dismiss_many,
+            {
+                "id": 11,
+                "type": "autodoctor/dismiss_many",
+                "items": [
+                    {
+                        "automation_id": "automation.test",
+                        "issue_type": "runtime_automation_overactive",
+                    }
+                ],
+            },
+        ),
+        (
+            websocket_diagnostics_profile,
+            {"id": 13, "type": "autodoctor/diagnostics/profile", "top_n": 10},
+        ),
+        (
+            websocket_diagnostics_caches,
+            {"id": 14, "type": "autodoctor/diagnostics/caches"},
+        ),
     ],
 )
 def test_mutating_websocket_commands_require_admin(
@@ -171,7 +228,7 @@ async def test_websocket_get_issues_applies_suppression_filtering_on_read(
         issue_type=IssueType.ENTITY_NOT_FOUND,
     )
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(return_value=True)
+    suppression_store.is_suppressed_for = MagicMock(return_value=True)
     hass.data[DOMAIN] = {
         "issues": [suppressed_issue],
         "validation_issues_raw": [suppressed_issue],
@@ -253,7 +310,7 @@ async def test_websocket_get_validation_uses_raw_cache_for_suppressed_count(
         issue_type=IssueType.ENTITY_NOT_FOUND,
     )
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(return_value=True)
+    suppression_store.is_suppressed_for = MagicMock(return_value=True)
 
     hass.data[DOMAIN] = {
         "validation_issues": [],
@@ -446,8 +503,8 @@ async def test_websocket_run_validation_steps_with_suppression(
 
     # Mock suppression store that suppresses issue1
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(
-        side_effect=lambda key: key == issue1.get_suppression_key()
+    suppression_store.is_suppressed_for = MagicMock(
+        side_effect=lambda *parts: ":".join(parts) == issue1.get_suppression_key()
     )
 
     hass.data[DOMAIN] = {
@@ -591,8 +648,8 @@ async def test_websocket_get_validation_steps_applies_suppression_at_read_time(
 
     # Mock suppression store that suppresses issue1
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(
-        side_effect=lambda key: key == issue1.get_suppression_key()
+    suppression_store.is_suppressed_for = MagicMock(
+        side_effect=lambda *parts: ":".join(parts) == issue1.get_suppression_key()
     )
 
     hass.data[DOMAIN] = {
@@ -636,8 +693,8 @@ async def test_websocket_get_validation_steps_prefers_raw_groups_for_suppression
     issue1 = make_issue(IssueType.ENTITY_NOT_FOUND, Severity.ERROR, entity_id="light.a")
     issue2 = make_issue(IssueType.ENTITY_NOT_FOUND, Severity.ERROR, entity_id="light.b")
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(
-        side_effect=lambda key: key == issue1.get_suppression_key()
+    suppression_store.is_suppressed_for = MagicMock(
+        side_effect=lambda *parts: ":".join(parts) == issue1.get_suppression_key()
     )
 
     hass.data[DOMAIN] = {
@@ -739,7 +796,7 @@ async def test_websocket_suppress_runtime_issue_records_dismissal(
 ) -> None:
     """Suppressing runtime issues should feed dismissal learning into runtime monitor."""
     suppression_store = MagicMock()
-    suppression_store.async_suppress = AsyncMock()
+    suppression_store.async_suppress_many = AsyncMock()
     suppression_store.count = 1
     runtime_monitor = MagicMock()
 
@@ -761,8 +818,10 @@ async def test_websocket_suppress_runtime_issue_records_dismissal(
 
     await invoke_command(websocket_suppress, hass, connection, msg)
 
-    suppression_store.async_suppress.assert_called_once_with(
-        "automation.runtime_test:automation.runtime_test:runtime_automation_overactive"
+    suppression_store.async_suppress_many.assert_called_once_with(
+        [
+            "automation.runtime_test:automation.runtime_test:runtime_automation_overactive"
+        ]
     )
     runtime_monitor.record_issue_dismissed.assert_called_once_with(
         "automation.runtime_test"
@@ -776,9 +835,9 @@ async def test_websocket_suppress_reconciles_visible_issue_cache_and_reporter(
     """Suppressing should update visible issue cache and repairs immediately."""
     issue = make_issue(IssueType.ENTITY_NOT_FOUND, Severity.ERROR, entity_id="light.a")
     suppression_store = MagicMock()
-    suppression_store.async_suppress = AsyncMock()
-    suppression_store.is_suppressed = MagicMock(
-        side_effect=lambda key: key == issue.get_suppression_key()
+    suppression_store.async_suppress_many = AsyncMock()
+    suppression_store.is_suppressed_for = MagicMock(
+        side_effect=lambda *parts: ":".join(parts) == issue.get_suppression_key()
     )
     suppression_store.count = 1
     reporter = MagicMock()
@@ -811,6 +870,100 @@ async def test_websocket_suppress_reconciles_visible_issue_cache_and_reporter(
     reporter.async_report_issues.assert_awaited_once_with([])
 
 
+@pytest.mark.asyncio
+async def test_websocket_suppress_many_saves_and_reconciles_once(
+    hass: HomeAssistant,
+) -> None:
+    """Multi-select suppression should batch the store write and reconcile once."""
+    issue_a = make_issue(
+        IssueType.ENTITY_NOT_FOUND, Severity.ERROR, entity_id="light.a"
+    )
+    issue_b = make_issue(
+        IssueType.ENTITY_NOT_FOUND, Severity.ERROR, entity_id="light.b"
+    )
+    suppression_store = MagicMock()
+    suppression_store.async_suppress_many = AsyncMock()
+    suppression_store.is_suppressed_for = MagicMock(return_value=True)
+    suppression_store.count = 2
+    reporter = MagicMock()
+    reporter.async_report_issues = AsyncMock()
+
+    hass.data[DOMAIN] = {
+        "suppression_store": suppression_store,
+        "learned_states_store": None,
+        "runtime_monitor": None,
+        "reporter": reporter,
+        "validation_issues_raw": [issue_a, issue_b],
+    }
+
+    connection = MagicMock(spec=ActiveConnection)
+    msg: dict[str, Any] = {
+        "id": 7,
+        "type": "autodoctor/suppress_many",
+        "items": [
+            {
+                "automation_id": issue.automation_id,
+                "entity_id": issue.entity_id,
+                "issue_type": issue.issue_type.value,
+            }
+            for issue in (issue_a, issue_b)
+        ],
+    }
+
+    await invoke_command(websocket_suppress_many, hass, connection, msg)
+
+    suppression_store.async_suppress_many.assert_awaited_once_with(
+        [issue_a.get_suppression_key(), issue_b.get_suppression_key()]
+    )
+    reporter.async_report_issues.assert_awaited_once_with([])
+    connection.send_result.assert_called_once_with(
+        7, {"success": True, "suppressed_count": 2}
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("automation_id", "entity_id", "issue_type"),
+    [
+        ("automation.a", "light.x", "*"),
+        ("*", "light.x", "invalid_state"),
+        ("automation.a", "*", "invalid_state"),
+        ("*", "*", "*"),
+    ],
+)
+async def test_websocket_suppress_many_rejects_unsupported_wildcards(
+    hass: HomeAssistant, automation_id: str, entity_id: str, issue_type: str
+) -> None:
+    """Wildcard combinations that can never match are rejected, not stored."""
+    suppression_store = MagicMock()
+    suppression_store.async_suppress_many = AsyncMock()
+    hass.data[DOMAIN] = {"suppression_store": suppression_store}
+
+    connection = MagicMock(spec=ActiveConnection)
+    msg: dict[str, Any] = {
+        "id": 8,
+        "type": "autodoctor/suppress_many",
+        "items": [
+            {
+                "automation_id": "automation.ok",
+                "entity_id": "*",
+                "issue_type": "*",
+            },
+            {
+                "automation_id": automation_id,
+                "entity_id": entity_id,
+                "issue_type": issue_type,
+            },
+        ],
+    }
+
+    await invoke_command(websocket_suppress_many, hass, connection, msg)
+
+    suppression_store.async_suppress_many.assert_not_called()
+    connection.send_error.assert_called_once()
+    assert connection.send_error.call_args.args[:2] == (8, "invalid_format")
+
+
 @pytest.mark.asyncio
 async def test_websocket_list_suppressions(hass: HomeAssistant) -> None:
     """Test that websocket_list_suppressions returns suppressed issues with metadata.
@@ -1449,7 +1602,7 @@ async def test_websocket_runtime_health_issue_can_be_suppressed(
         entity_id="automation.runtime_test",
     )
     suppression_store = MagicMock()
-    suppression_store.is_suppressed = MagicMock(return_value=True)
+    suppression_store.is_suppressed_for = MagicMock(return_value=True)
 
     hass.data[DOMAIN] = {
         "suppression_store": suppression_store,
@@ -1630,6 +1783,65 @@ async def test_websocket_dismiss_removes_issue_from_groups_raw(
     assert other_issue in groups_raw["entity_state"]["issues"]
 
 
+@pytest.mark.asyncio
+async def test_websocket_dismiss_many_removes_all_selected_alerts(
+    hass: HomeAssistant,
+) -> None:
+    """Multi-select dismiss should record each dismissal and reconcile once."""
+    runtime_monitor = MagicMock()
+    reporter = MagicMock()
+    reporter.async_report_issues = AsyncMock()
+
+    garage = make_issue(
+        IssueType.RUNTIME_AUTOMATION_OVERACTIVE,
+        Severity.WARNING,
+        automation_id="automation.garage",
+        entity_id="automation.garage",
+    )
+    porch = make_issue(
+        IssueType.RUNTIME_AUTOMATION_BURST,
+        Severity.WARNING,
+        automation_id="automation.porch",
+        entity_id="automation.porch",
+    )
+    kept = make_issue(
+        IssueType.RUNTIME_AUTOMATION_OVERACTIVE,
+        Severity.WARNING,
+        automation_id="automation.porch",
+        entity_id="automation.porch",
+    )
+
+    hass.data[DOMAIN] = {
+        "runtime_monitor": runtime_monitor,
+        "reporter": reporter,
+        "suppression_store": None,
+        "validation_issues_raw": [garage, porch, kept],
+    }
+
+    connection = MagicMock(spec=ActiveConnection)
+    msg: dict[str, Any] = {
+        "id": 1,
+        "type": "autodoctor/dismiss_many",
+        "items": [
+            {
+                "automation_id": "automation.garage",
+                "issue_type": "runtime_automation_overactive",
+            },
+            {
+                "automation_id": "automation.porch",
+                "issue_type": "runtime_automation_burst",
+            },
+        ],
+    }
+
+    await invoke_command(websocket_dismiss_many, hass, connection, msg)
+
+    assert runtime_monitor.record_issue_dismissed.call_count == 2
+    assert hass.data[DOMAIN]["validation_issues_raw"] == [kept]
+    reporter.async_report_issues.assert_awaited_once_with([kept])
+    connection.send_result.assert_called_once_with(1, {"success": True})
+
+
 @pytest.mark.asyncio
 async def test_websocket_fix_preview_returns_proposed_change(
     hass: HomeAssistant,
@@ -1988,6 +2200,226 @@ async def test_websocket_fix_apply_preserves_unicode_in_persisted_yaml(
     )
 
 
+def _yaml_automation_entities(yaml_path: Path, configs: list[dict[str, Any]]) -> Any:
+    """Build entity-mode automation data backed by an automations.yaml file."""
+    entities = [
+        SimpleNamespace(
+            entity_id=f"automation.{config['id']}",
+            raw_config={**copy.deepcopy(config), "__config_file__": str(yaml_path)},
+        )
+        for config in configs
+    ]
+    return SimpleNamespace(entities=entities)
+
+
+_BATCH_YAML = (
+    "- id: first\n  trigger:\n    - entity_id: light.Kitchen\n"
+    "- id: second\n  trigger:\n    - entity_id: light.Porch\n"
+)
+_BATCH_CONFIGS: list[dict[str, Any]] = [
+    {"id": "first", "trigger": [{"entity_id": "light.Kitchen"}]},
+    {"id": "second", "trigger": [{"entity_id": "light.Porch"}]},
+]
+_BATCH_FIXES: list[dict[str, Any]] = [
+    {
+        "automation_id": "automation.first",
+        "location": "trigger[0].entity_id",
+        "current_value": "light.Kitchen",
+        "suggested_value": "light.kitchen",
+    },
+    {
+        "automation_id": "automation.second",
+        "location": "trigger[0].entity_id",
+        "current_value": "light.Porch",
+        "suggested_value": "light.porch",
+    },
+]
+
+
+@pytest.mark.asyncio
+async def test_websocket_fix_apply_batch_writes_once_and_reloads_once(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Batch apply should persist every fix with one write and one reload."""
+    yaml_path = tmp_path / "automations.yaml"
+    yaml_path.write_text(_BATCH_YAML, encoding="utf-8")
+    hass.data["automation"] = _yaml_automation_entities(yaml_path, _BATCH_CONFIGS)
+    reload_handler = AsyncMock()
+    hass.services.async_register("automation", "reload", reload_handler)
+
+    connection = MagicMock(spec=ActiveConnection)
+    msg: dict[str, Any] = {
+        "id": 120,
+        "type": "autodoctor/fix_apply_batch",
+        "fixes": _BATCH_FIXES,
+    }
+
+    with (
+        patch(
+            "custom_components.autodoctor.websocket_api.write_utf8_file_atomic",
+            wraps=write_utf8_file_atomic,
+        ) as mock_write,
+        patch(
+            "custom_components.autodoctor.async_validate_all_with_groups",
+            new_callable=AsyncMock,
+        ) as mock_validate,
+    ):
+        await invoke_command(websocket_fix_apply_batch, hass, connection, msg)
+
+    connection.send_result.assert_called_once()
+    result = connection.send_result.call_args[0][1]
+    assert result["applied"] is True
+    assert result["count"] == 2
+    written = yaml_path.read_text(encoding="utf-8")
+    assert "light.kitchen" in written
+    assert "light.porch" in written
+    mock_write.assert_called_once()
+    reload_handler.assert_awaited_once()
+    mock_validate.assert_awaited_once_with(hass)
+    assert hass.data[DOMAIN]["last_applied_fix"] == {
+        "fixes": [
+            {
+                "automation_id": "automation.first",
+                "location": "trigger[0].entity_id",
+                "previous_value": "light.Kitchen",
+                "new_value": "light.kitchen",
+            },
+            {
+                "automation_id": "automation.second",
+                "location": "trigger[0].entity_id",
+                "previous_value": "light.Porch",
+                "new_value": "light.porch",
+            },
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_websocket_fix_apply_batch_is_all_or_nothing(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """A stale fix in the batch should leave the file and configs untouched."""
+    yaml_path = tmp_path / "automations.yaml"
+    yaml_path.write_text(_BATCH_YAML, encoding="utf-8")
+    hass.data["automation"] = _yaml_automation_entities(yaml_path, _BATCH_CONFIGS)
+
+    connection = MagicMock(spec=ActiveConnection)
+    connection.send_error = MagicMock()
+    stale = {**_BATCH_FIXES[1], "current_value": "light.Garage"}
+    msg: dict[str, Any] = {
+        "id": 121,
+        "type": "autodoctor/fix_apply_batch",
+        "fixes": [_BATCH_FIXES[0], stale],
+    }
+
+    await invoke_command(websocket_fix_apply_batch, hass, connection, msg)
+
+    connection.send_error.assert_called_once()
+    assert connection.send_error.call_args[0][1] == "fix_not_applicable"
+    assert yaml_path.read_text(encoding="utf-8") == _BATCH_YAML
+    first_entity = hass.data["automation"].entities[0]
+    assert first_entity.raw_config["trigger"][0]["entity_id"] == "light.Kitchen"
+
+
+@pytest.mark.asyncio
+async def test_websocket_fix_apply_batch_restores_earlier_files_on_write_failure(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """A failed write to a later file should restore the files already written."""
+    first_path = tmp_path / "a" / "automations.yaml"
+    second_path = tmp_path / "b" / "automations.yaml"
+    first_yaml = "- id: first\n  trigger:\n    - entity_id: light.Kitchen\n"
+    second_yaml = "- id: second\n  trigger:\n    - entity_id: light.Porch\n"
+    for path, text in ((first_path, first_yaml), (second_path, second_yaml)):
+        path.parent.mkdir()
+        path.write_text(text, encoding="utf-8")
+    hass.data["automation"] = SimpleNamespace(
+        entities=[
+            *_yaml_automation_entities(first_path, _BATCH_CONFIGS[:1]).entities,
+            *_yaml_automation_entities(second_path, _BATCH_CONFIGS[1:]).entities,
+        ]
+    )
+
+    def _write(path: str, content: str) -> None:
+        if path == str(second_path):
+            raise WriteError("Disk full")
+        write_utf8_file_atomic(path, content)
+
+    connection = MagicMock(spec=ActiveConnection)
+    connection.send_error = MagicMock()
+    msg: dict[str, Any] = {
+        "id": 123,
+        "type": "autodoctor/fix_apply_batch",
+        "fixes": _BATCH_FIXES,
+    }
+
+    with patch(
+        "custom_components.autodoctor.websocket_api.write_utf8_file_atomic",
+        side_effect=_write,
+    ) as mock_write:
+        await invoke_command(websocket_fix_apply_batch, hass, connection, msg)
+
+    connection.send_error.assert_called_once()
+    assert mock_write.call_count == 3
+    assert first_path.read_text(encoding="utf-8") == first_yaml
+    assert second_path.read_text(encoding="utf-8") == second_yaml
+    first_entity = hass.data["automation"].entities[0]
+    assert first_entity.raw_config["trigger"][0]["entity_id"] == "light.Kitchen"
+
+
+@pytest.mark.asyncio
+async def test_websocket_fix_undo_reverts_whole_batch(
+    hass: HomeAssistant,
+) -> None:
+    """Undo after a batch apply should restore every value in the batch."""
+    hass.data["automation"] = {
+        "config": [
+            {"id": "first", "trigger": [{"entity_id": "light.kitchen"}]},
+            {"id": "second", "trigger": [{"entity_id": "light.porch"}]},
+        ]
+    }
+    hass.data[DOMAIN] = {
+        "last_applied_fix": {
+            "fixes": [
+                {
+                    "automation_id": "automation.first",
+                    "location": "trigger[0].entity_id",
+                    "previous_value": "light.Kitchen",
+                    "new_value": "light.kitchen",
+                },
+                {
+                    "automation_id": "automation.second",
+                    "location": "trigger[0].entity_id",
+                    "previous_value": "light.Porch",
+                    "new_value": "light.porch",
+                },
+            ]
+        }
+    }
+    connection = MagicMock(spec=ActiveConnection)
+
+    with patch(
+        "custom_components.autodoctor.async_validate_all_with_groups",
+        new_callable=AsyncMock,
+    ) as mock_validate:
+        await invoke_command(
+            websocket_fix_undo,
+            hass,
+            connection,
+            {"id": 122, "type": "autodoctor/fix_undo"},
+        )
+
+    connection.send_result.assert_called_once()
+    result = connection.send_result.call_args[0][1]
+    assert result["undone"] is True
+    assert result["count"] == 2
+    configs = hass.data["automation"]["config"]
+    assert configs[0]["trigger"][0]["entity_id"] == "light.Kitchen"
+    assert configs[1]["trigger"][0]["entity_id"] == "light.Porch"
+    assert hass.data[DOMAIN].get("last_applied_fix") is None
+    mock_validate.assert_awaited_once_with(hass)
+
+
 @pytest.mark.asyncio
 async def test_websocket_fix_undo_loads_snapshot_from_store(
     hass: HomeAssistant,
@@ -2156,3 +2588,76 @@ async def test_count_automations_no_data(hass: HomeAssistant) -> None:
     from custom_components.autodoctor.websocket_api import _count_automations
 
     assert _count_automations(hass) == 0
+
+
+@pytest.mark.asyncio
+async def test_websocket_diagnostics_profile_returns_last_run(
+    hass: HomeAssistant,
+) -> None:
+    """The profile command should return the profiler's top-N summary."""
+    from custom_components.autodoctor.profiler import ValidationProfiler
+
+    profiler = ValidationProfiler(enabled=True)
+    profiler.start_run()
+    profiler.record("validator.validate_all", 0.2, automation_id="automation.slow")
+    profiler.record("validator.validate_all", 0.1, automation_id="automation.fast")
+    profiler.finish_run(2)
+    hass.data[DOMAIN] = {"profiler": profiler}
+
+    connection = MagicMock(spec=ActiveConnection)
+    connection.send_result = MagicMock()
+    msg: dict[str, Any] = {
+        "id": 1,
+        "type": "autodoctor/diagnostics/profile",
+        "top_n": 1,
+    }
+
+    await invoke_command(websocket_diagnostics_profile, hass, connection, msg)
+
+    result = connection.send_result.call_args[0][1]
+    assert result["enabled"] is True
+    assert result["last_run"]["automation_count"] == 2
+    assert [a["automation_id"] for a in result["last_run"]["slowest_automations"]] == [
+        "automation.slow"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_websocket_diagnostics_profile_not_ready(hass: HomeAssistant) -> None:
+    """The profile command should report not_ready before setup finishes."""
+    hass.data[DOMAIN] = {}
+
+    connection = MagicMock(spec=ActiveConnection)
+    connection.send_error = MagicMock()
+    msg: dict[str, Any] = {
+        "id": 1,
+        "type": "autodoctor/diagnostics/profile",
+        "top_n": 10,
+    }
+
+    await invoke_command(websocket_diagnostics_profile, hass, connection, msg)
+
+    assert connection.send_error.call_args[0][1] == "not_ready"
+
+
+@pytest.mark.asyncio
+async def test_websocket_diagnostics_caches_reports_components(
+    hass: HomeAssistant,
+) -> None:
+    """The caches command should collect diagnostics from each component."""
+    knowledge_base = MagicMock()
+    knowledge_base.get_cache_diagnostics.return_value = {"valid_states": {"entries": 3}}
+    hass.data[DOMAIN] = {
+        "knowledge_base": knowledge_base,
+        "validator": None,
+        "runtime_monitor": None,
+    }
+
+    connection = MagicMock(spec=ActiveConnection)
+    connection.send_result = MagicMock()
+    msg: dict[str, Any] = {"id": 1, "type": "autodoctor/diagnostics/caches"}
+
+    await invoke_command(websocket_diagnostics_caches, hass, connection, msg)
+
+    result = connection.send_result.call_args[0][1]
+    assert result == {"knowledge_base": {"valid_states": {"entries": 3}}}